@@ -117,10 +117,11 @@ class EntityValuesResponse(BaseModel):
     """Response containing entity values data."""
 
     columns: list[str] = Field(..., description="Column names")
-    values: list[list[Any]] = Field(..., description="Row data")
+    values: list[list[Any]] = Field(..., description="Row data (the requested page)")
     format: str = Field(..., description="Storage format (parquet/csv)")
-    row_count: int = Field(..., description="Number of rows")
+    row_count: int = Field(..., description="Total number of rows")
     etag: str = Field(..., description="Entity tag for optimistic locking (based on file mtime+size)")
+    offset: int = Field(0, description="Offset of the first row in values")
 
 
 class EntityValuesUpdateRequest(BaseModel):
@@ -287,6 +288,8 @@ async def get_entity_values(
     project_name: str,
     entity_name: str,
     format: str | None = Query(None, description="Preferred format (parquet/csv) for format conversion"),
+    offset: int = Query(0, ge=0, description="First row to return"),
+    limit: int | None = Query(None, ge=1, description="Maximum number of rows to return (default: all)"),
 ) -> EntityValuesResponse:
     """
     Get external values for entity with @load: directive.
@@ -294,15 +297,18 @@ async def get_entity_values(
     This endpoint fetches the actual data from external storage (parquet/csv files)
     for entities that use @load: directives instead of inline values.
 
-    Supports format negotiation via query parameter for on-the-fly conversion.
+    Supports format negotiation via query parameter for on-the-fly conversion, and paging
+    via offset/limit (only the requested rows are read and serialized).
 
     Args:
         project_name: Project name
         entity_name: Entity name
         format: Preferred format (parquet/csv) - returns data as if stored in this format
+        offset: First row to return
+        limit: Maximum number of rows to return
 
     Returns:
-        Entity values data (columns, values, format, row_count, etag)
+        Entity values data (columns, values, format, row_count, etag, offset)
 
     Raises:
         HTTPException 422: If entity doesn't have @load: directive
@@ -311,7 +317,7 @@ async def get_entity_values(
 
     values_service: EntityValuesService = get_entity_values_service()
     try:
-        result = values_service.get_values(project_name, entity_name)
+        result = values_service.get_values(project_name, entity_name, offset=offset, limit=limit)
     except ValueError as e:
         # Entity doesn't have @load: directive - return 422 Unprocessable Entity
         raise HTTPException(status_code=422, detail=str(e)) from e
@@ -322,13 +328,14 @@ async def get_entity_values(
     # Handle format negotiation (response always includes actual storage format)
     response_format = format or result.format
 
-    logger.info(f"Retrieved {result.row_count} rows for entity '{entity_name}' from '{project_name}' (format: {response_format})")
+    logger.info(f"Retrieved {len(result.values)} of {result.row_count} rows for entity '{entity_name}' (format: {response_format})")
     return EntityValuesResponse(
         columns=result.columns,
         values=result.values,
         format=response_format,
         row_count=result.row_count,
         etag=result.etag,
+        offset=result.offset,
     )
 
 
@@ -36,7 +36,11 @@ async def get_dispatchers() -> list[DispatcherMetadata]:
 
 @router.post("/projects/{name}/execute", response_model=ExecuteResult)
 @handle_endpoint_errors
-async def execute_workflow(name: str, request: ExecuteRequest) -> ExecuteResult:
+async def execute_workflow(
+    name: str,
+    request: ExecuteRequest,
+    profile: bool = Query(False, description="Record per-entity, per-stage timings and memory and return them in the result"),
+) -> ExecuteResult:
     """
     Execute full Shape Shifter workflow for a project.
 
@@ -55,6 +59,7 @@ async def execute_workflow(name: str, request: ExecuteRequest) -> ExecuteResult:
             - translate: Apply translations (default: False)
             - drop_foreign_keys: Drop FK columns (default: False)
             - default_entity: Optional default entity
+        profile: Include a per-stage profile (JSON export of PipelineProfiler) in the result
 
     Returns:
         ExecuteResult with success status, message, and execution details
@@ -63,7 +68,7 @@ async def execute_workflow(name: str, request: ExecuteRequest) -> ExecuteResult:
 
     logger.info(f"Executing workflow for project '{name}' with dispatcher '{request.dispatcher_key}' to target '{request.target}'")
 
-    result = await execute_service.execute_workflow(name, request)
+    result = await execute_service.execute_workflow(name, request, profile=profile)
 
     if result.success:
         logger.info(f"Workflow execution completed successfully: {result.message}")
@@ -75,6 +80,39 @@ async def execute_workflow(name: str, request: ExecuteRequest) -> ExecuteResult:
     return result
 
 
+@router.post("/projects/{name}/execute/jobs")
+@handle_endpoint_errors
+async def submit_workflow_job(
+    name: str,
+    request: ExecuteRequest,
+    profile: bool = Query(False, description="Record per-entity, per-stage timings and memory and return them in the result"),
+) -> dict[str, str]:
+    """
+    Start a workflow execution as a background job.
+
+    The job runs outside the request. Track it with the operation endpoints:
+    - GET /operations/{operation_id}/progress: current progress (per-entity, by phase)
+    - GET /operations/{operation_id}/stream: progress as Server-Sent Events
+    - POST /operations/{operation_id}/cancel: cancel between entities
+
+    When the job has finished, the ExecuteResult is in the progress `metadata.result`.
+
+    Args:
+        name: Project name
+        request: Execution parameters (see execute_workflow)
+        profile: Include a per-stage profile in the result
+
+    Returns:
+        Dictionary with operation_id for tracking progress
+    """
+    execute_service: ExecuteService = get_execute_service()
+
+    operation_id: str = execute_service.submit_workflow(name, request, profile=profile)
+
+    logger.info(f"Submitted workflow job {operation_id} for project '{name}' with dispatcher '{request.dispatcher_key}'")
+    return {"operation_id": operation_id, "message": f"Workflow started for {name}"}
+
+
 @router.get("/projects/{name}/execute/download")
 @handle_endpoint_errors
 async def download_execution_output(
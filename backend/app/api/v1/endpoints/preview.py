@@ -120,6 +120,7 @@ async def preview_entity(
     entity_name: str = Path(..., description="Name of the entity to preview"),
     body: Optional[dict[str, Any]] = Body(None, description="Request body with optional entity_config"),
     limit: Optional[int] = Query(None, ge=1, le=10000, description="Maximum number of rows to return. None for all rows."),
+    profile: bool = Query(False, description="Bypass the cache and return per-entity, per-stage timings and memory"),
     preview_service: ShapeShiftService = Depends(get_preview_service),
 ) -> PreviewResult:
     """
@@ -139,13 +140,17 @@ async def preview_entity(
     - The entity_config parameter allows previewing entities before saving
     - Cache is bypassed when entity_config is provided
     - Useful for iterative development and immediate feedback
+
+    Set profile=true to recompute the entity (ignoring cached data) and include a per-stage profile.
     """
     try:
         # Extract entity_config from body if present
         # Frontend sends: {"entity_config": {...}}
         entity_config = body.get("entity_config") if body else None
 
-        result: PreviewResult = await preview_service.preview_entity(project_name, entity_name, limit, override_config=entity_config)
+        result: PreviewResult = await preview_service.preview_entity(
+            project_name, entity_name, limit, override_config=entity_config, profile=profile
+        )
         return result
     except FunctionalDependencyError as e:
         _raise_fd_validation_error(e, entity_name)
@@ -2,16 +2,34 @@
 Query execution API endpoints.
 """
 
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Any, Literal
+
+import pandas as pd
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
 
 from backend.app.api.dependencies import get_data_source_service
+from backend.app.exceptions import ResourceNotFoundError
 from backend.app.models.query import QueryExecution, QueryIntrospection, QueryResult, QueryValidation
 from backend.app.services.data_source_service import DataSourceService
 from backend.app.services.project_service import ProjectService, get_project_service
 from backend.app.services.query_service import QueryExecutionError, QuerySecurityError, QueryService
+from backend.app.utils.frames import ARROW_STREAM_MEDIA_TYPE, NDJSON_MEDIA_TYPE, arrow_ipc, columnar_json, iter_columnar_pages
 
 router = APIRouter()
 
+ResultFormat = Literal["records", "columnar", "arrow"]
+
+
+def _frame_response(page: pd.DataFrame, result_format: ResultFormat, metadata: dict[str, Any]) -> Response:
+    """Encode a result page as column-oriented JSON or Arrow IPC (paging metadata goes to headers for Arrow)."""
+    if result_format == "arrow":
+        headers: dict[str, str] = {
+            f"X-Query-{key.replace('_', '-').title()}": str(value) for key, value in metadata.items() if value is not None
+        }
+        return Response(content=arrow_ipc(page), media_type=ARROW_STREAM_MEDIA_TYPE, headers=headers)
+    return Response(content=columnar_json(page, **metadata), media_type="application/json")
+
 
 def get_query_service(data_source_service: DataSourceService = Depends(get_data_source_service)) -> QueryService:
     """Dependency to get query service instance."""
@@ -29,6 +47,14 @@ def get_query_service(data_source_service: DataSourceService = Depends(get_data_
     DROP, etc.) are blocked for safety.
 
     Results are automatically limited to prevent excessive memory usage.
+
+    Response formats (`format` query parameter):
+    - `records` (default): rows as a list of objects
+    - `columnar`: `{"columns": [...], "data": [[column values], ...]}`, encoded column-wise
+    - `arrow`: Arrow IPC stream (paging metadata in `X-Query-*` headers)
+
+    Large results (or any request with `page_size`) are cached and returned as a first page plus
+    a `cursor`; fetch further pages from `/query/results/{cursor}`.
     """,
     responses={
         200: {
@@ -52,14 +78,18 @@ def get_query_service(data_source_service: DataSourceService = Depends(get_data_
     },
 )
 async def execute_query(
-    data_source_name: str, execution: QueryExecution, query_service: QueryService = Depends(get_query_service)
-) -> QueryResult:
+    data_source_name: str,
+    execution: QueryExecution,
+    result_format: ResultFormat = Query("records", alias="format"),
+    query_service: QueryService = Depends(get_query_service),
+) -> QueryResult | Response:
     """
     Execute a SQL query against a data source.
 
     Args:
         data_source_name: Name of the data source to query
         execution: Query execution parameters
+        result_format: Response format (records, columnar or arrow)
         query_service: Query service instance
 
     Returns:
@@ -69,8 +99,19 @@ async def execute_query(
         HTTPException: If query is invalid or execution fails
     """
     try:
+        if result_format != "records":
+            cursor: str = await query_service.execute_query_to_cursor(
+                data_source_name=data_source_name, query=execution.query, limit=execution.limit, timeout=execution.timeout
+            )
+            page, metadata = query_service.get_frame_page(cursor, offset=0, limit=execution.page_size or execution.limit)
+            return _frame_response(page, result_format, metadata)
+
         result: QueryResult = await query_service.execute_query(
-            data_source_name=data_source_name, query=execution.query, limit=execution.limit, timeout=execution.timeout
+            data_source_name=data_source_name,
+            query=execution.query,
+            limit=execution.limit,
+            timeout=execution.timeout,
+            page_size=execution.page_size,
         )
         return result
     except QuerySecurityError as e:
@@ -194,3 +235,59 @@ async def introspect_query_columns(
         raise HTTPException(status_code=500, detail=str(e)) from e
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Unexpected error: {str(e)}") from e
+
+
+@router.get(
+    "/query/results/{cursor}",
+    response_model=QueryResult,
+    summary="Get a page of a cached query result",
+    description="""
+    Page through a query result cached by a previous execute call.
+
+    Supports the same `format` values as execute (`records`, `columnar`, `arrow`).
+    Cursors expire after QUERY_RESULT_CACHE_TTL seconds; expired cursors return 404.
+    """,
+    responses={404: {"description": "Cursor not found or expired"}},
+)
+async def get_query_result_page(
+    cursor: str,
+    offset: int = Query(0, ge=0),
+    limit: int = Query(1000, ge=1, le=100000),
+    result_format: ResultFormat = Query("records", alias="format"),
+    query_service: QueryService = Depends(get_query_service),
+) -> QueryResult | Response:
+    """Return rows `offset:offset+limit` of a cached query result."""
+    try:
+        if result_format != "records":
+            page, metadata = query_service.get_frame_page(cursor, offset=offset, limit=limit)
+            return _frame_response(page, result_format, metadata)
+        return query_service.get_result_page(cursor, offset=offset, limit=limit)
+    except ResourceNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e)) from e
+
+
+@router.get(
+    "/query/results/{cursor}/stream",
+    summary="Stream a cached query result",
+    description="""
+    Stream a cached query result as newline-delimited column-oriented JSON.
+
+    Each line is one page: `{"columns": [...], "dtypes": [...], "row_count": n, "offset": k, "data": [[...], ...]}`.
+    """,
+    responses={404: {"description": "Cursor not found or expired"}},
+)
+async def stream_query_result(
+    cursor: str,
+    page_size: int = Query(5000, ge=1, le=100000),
+    query_service: QueryService = Depends(get_query_service),
+) -> StreamingResponse:
+    """Stream all rows of a cached query result page by page."""
+    try:
+        frame: pd.DataFrame = query_service.get_result_set(cursor).frame
+    except ResourceNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e)) from e
+
+    return StreamingResponse(
+        iter_columnar_pages(frame, page_size, cursor=cursor, total_rows=len(frame)),
+        media_type=NDJSON_MEDIA_TYPE,
+    )
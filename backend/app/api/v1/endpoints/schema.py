@@ -264,20 +264,9 @@ async def get_type_mappings(
         # Get table schema
         table_schema = await service.get_table_schema(name, table_name, schema)
 
-        # Convert columns to dict format
-        columns = [
-            {
-                "name": col.name,
-                "data_type": col.data_type,
-                "is_primary_key": col.is_primary_key,
-                "max_length": col.max_length,
-            }
-            for col in table_schema.columns
-        ]
-
         # Get type mappings
         type_service = TypeMappingService()
-        mappings = type_service.get_mappings_for_table(columns)
+        mappings = type_service.get_mappings_for_schema(table_schema)
 
         # Convert to dict for JSON response
         result = {col_name: mapping.model_dump() for col_name, mapping in mappings.items()}
@@ -291,6 +280,46 @@ async def get_type_mappings(
         raise
 
 
+@router.get(
+    "/{name}/type-mappings", response_model=dict[str, dict[str, dict[str, Any]]], summary="Get type mapping suggestions for many tables"
+)
+@handle_endpoint_errors
+async def get_type_mappings_for_tables(
+    name: str,
+    tables: Optional[list[str]] = Query(None, description="Tables to include (default: all tables)"),
+    schema: Optional[str] = None,
+    service: SchemaIntrospectionService = Depends(get_schema_service),
+):
+    """
+    Get Shape Shifter type suggestions for the columns of many tables at once.
+
+    Table schemas are fetched with bulk catalog queries and cached, so this is much cheaper
+    than calling the per-table endpoint for every table.
+
+    **Path Parameters**:
+    - `name`: Data source identifier
+
+    **Query Parameters**:
+    - `tables`: Optional table names (repeatable, defaults to all tables)
+    - `schema`: Optional schema name (if applicable)
+
+    **Returns**: Dictionary mapping table names to per-column type suggestions
+    """
+    try:
+        table_schemas: dict[str, TableSchema] = await service.get_table_schemas(name, table_names=tables, schema=schema)
+        mappings = TypeMappingService().get_mappings_for_schemas(table_schemas)
+        logger.info(f"Generated type mappings for {len(mappings)} tables in {name}")
+        return {
+            table_name: {col_name: mapping.model_dump() for col_name, mapping in table_mappings.items()}
+            for table_name, table_mappings in mappings.items()
+        }
+
+    except SchemaIntrospectionError as e:
+        if "not found" in str(e).lower():
+            raise NotFoundError(str(e)) from e
+        raise
+
+
 @router.post("/{name}/tables/{table_name}/import", summary="Import entity from table")
 @handle_endpoint_errors
 async def import_entity_from_table(
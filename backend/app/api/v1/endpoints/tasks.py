@@ -3,7 +3,7 @@
 from pathlib import Path
 from typing import Any
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query
 from loguru import logger
 
 from backend.app.core.config import settings
@@ -20,7 +20,11 @@ router = APIRouter()
 
 @router.get("/projects/{name}/tasks", response_model=ProjectTaskStatus)
 @handle_endpoint_errors
-async def get_project_task_status(name: str) -> ProjectTaskStatus:
+async def get_project_task_status(
+    name: str,
+    background: bool = Query(False, description="Validate changed entities in a background job instead of waiting"),
+    refresh: bool = Query(False, description="Discard cached validation results and validate all entities again"),
+) -> ProjectTaskStatus:
     """
     Get task status for all entities in project.
 
@@ -31,8 +35,16 @@ async def get_project_task_status(name: str) -> ProjectTaskStatus:
 
     Returns priority-based guidance and completion statistics.
 
+    Validation results are cached per entity; only entities whose configuration (or an upstream
+    entity's) changed are validated again. With `background=true` that validation runs as a
+    background operation: affected entities are returned with `validation_pending` set, and their
+    updated statuses are pushed through `/operations/{validation_operation_id}/stream`
+    (`metadata.entities`).
+
     Args:
         name: Project name
+        background: Validate changed entities in the background
+        refresh: Discard cached validation results first
 
     Returns:
         ProjectTaskStatus with all entity statuses and stats
@@ -77,7 +89,7 @@ async def get_project_task_status(name: str) -> ProjectTaskStatus:
         }
     """
     task_service = get_task_service()
-    result = await task_service.compute_status(name)
+    result = await task_service.compute_status(name, background=background, refresh=refresh)
 
     logger.info(
         f"Task status for '{name}': "
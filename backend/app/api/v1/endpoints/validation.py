@@ -1,8 +1,11 @@
 """API endpoints for validation and dependency analysis."""
 
+import asyncio
+import json
 from typing import Any
 
 from fastapi import APIRouter
+from fastapi.responses import StreamingResponse
 from loguru import logger
 
 from backend.app.models.fix import FixResult, FixSuggestion
@@ -57,6 +60,61 @@ async def validate_project_data(
     return result
 
 
+@router.post("/projects/{name}/validate/data/stream")
+async def stream_project_data_validation(
+    name: str,
+    entity_names: list[str] | None = None,
+    validation_mode: DataValidationMode = DataValidationMode.SAMPLE,
+) -> StreamingResponse:
+    """
+    Run data-aware validation on project, streaming results via Server-Sent Events (SSE).
+
+    Emits one event per entity as soon as its validation finishes:
+    `{"entity": ..., "result": ValidationResult}`, followed by a final
+    `{"done": true, "error_count": ..., "warning_count": ...}` event.
+
+    Args:
+        name: Project name
+        entity_names: Optional list of entity names to validate (None = all entities)
+        validation_mode: Validation mode (SAMPLE or COMPLETE)
+
+    Returns:
+        SSE stream of per-entity validation results
+    """
+    validation_service: ValidationService = get_validation_service()
+
+    async def event_generator():
+        """Generate SSE events for per-entity validation results."""
+        error_count: int = 0
+        warning_count: int = 0
+        try:
+            async for entity_name, result in validation_service.iter_validate_project_data(
+                name, entity_names, validation_mode=validation_mode
+            ):
+                error_count += result.error_count
+                warning_count += result.warning_count
+                data: str = json.dumps({"entity": entity_name, "result": result.model_dump(mode="json")})
+                yield f"data: {data}\n\n"
+
+            yield f"data: {json.dumps({'done': True, 'error_count': error_count, 'warning_count': warning_count})}\n\n"
+
+        except asyncio.CancelledError:
+            logger.debug(f"Data validation stream cancelled for project '{name}'")
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.exception(f"Data validation stream failed for project '{name}': {e}")
+            yield f"data: {json.dumps({'done': True, 'error': str(e)})}\n\n"
+
+    return StreamingResponse(
+        event_generator(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no",  # Disable nginx buffering
+        },
+    )
+
+
 @router.post("/projects/{name}/entities/{entity_name}/validate", response_model=ValidationResult)
 @handle_endpoint_errors
 async def validate_entity(name: str, entity_name: str) -> ValidationResult:
@@ -71,6 +71,21 @@ class Settings(BaseSettings):
     INGESTER_PATHS: list[str] = ["ingesters"]
     ENABLED_INGESTERS: list[str] | None = None  # None = all discovered ingesters
     MATERIALIZATION_INLINE_THRESHOLD: int = 20  # Rows below which data is stored inline in YAML
+    INGESTER_SCHEMA_SNAPSHOT_DIR: Path | None = None  # Where ingesters keep target schema metadata snapshots (None = disabled)
+
+    # Query results
+    QUERY_INLINE_MAX_ROWS: int = 10000  # Larger results are returned as a first page plus a cursor
+    QUERY_RESULT_CACHE_SIZE: int = 8  # Query results kept for cursor paging/streaming
+    QUERY_RESULT_CACHE_TTL: int = 600  # Seconds a query result cursor stays valid
+
+    # Preview
+    PREVIEW_LIMIT_PUSHDOWN: bool = True  # Push preview row limits into upstream loaders where row order is preserved
+
+    # Workflow execution
+    WORKFLOW_MAX_CONCURRENT_JOBS: int = 2  # Background workflow jobs run at the same time; others wait in the queue
+
+    # Data validation
+    DATA_VALIDATION_MAX_WORKERS: int = 4  # Entities validated concurrently per data validation run
 
     def model_post_init(self, __context) -> None:  # pylint: disable=arguments-differ
         """Convert paths to absolute and ensure directories exist."""
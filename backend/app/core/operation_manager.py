@@ -224,6 +224,10 @@ class OperationManager:
             return False
         return self._cancellation_flags[operation_id].is_set()
 
+    def get_cancellation_event(self, operation_id: str) -> asyncio.Event | None:
+        """Return the event set on cancellation (stays usable after the operation has been cleaned up)."""
+        return self._cancellation_flags.get(operation_id)
+
     def get_progress(self, operation_id: str) -> OperationProgress | None:
         """Get current progress for an operation."""
         return self._operations.get(operation_id)
@@ -169,7 +169,7 @@ class EntityConfigMapperFactory:
     """
 
     # File-based drivers that need path resolution
-    FILE_BASED_DRIVERS: set[str] = {"csv", "xlsx", "openpyxl"}
+    FILE_BASED_DRIVERS: set[str] = {"csv", "xlsx", "openpyxl", "parquet", "feather"}
 
     def __init__(self, settings: Settings):
         """Initialize factory with settings.
@@ -183,6 +183,8 @@ class EntityConfigMapperFactory:
             "csv": self._file_mapper,
             "xlsx": self._file_mapper,
             "openpyxl": self._file_mapper,
+            "parquet": self._file_mapper,
+            "feather": self._file_mapper,
         }
 
     def get_mapper(self, entity_type: str) -> EntityConfigMapper:
@@ -12,6 +12,7 @@ class UnnestConfig(BaseModel):
     value_vars: list[str] = Field(..., description="Columns to melt")
     var_name: str = Field(..., description="Name for the variable column")
     value_name: str = Field(..., description="Name for the value column")
+    drop_na: bool | None = Field(default=None, description="Leave out melted rows whose value is null")
 
 
 class ForeignKeyConstraints(BaseModel):
@@ -137,7 +138,7 @@ class Entity(BaseModel):
     """Entity (table) configuration."""
 
     name: str = Field(..., description="Entity name (snake_case)")
-    type: Literal["entity", "sql", "fixed", "csv", "xlsx", "openpyxl", "merged"] | None = Field(
+    type: Literal["entity", "sql", "fixed", "csv", "xlsx", "openpyxl", "parquet", "feather", "merged"] | None = Field(
         default=None, description="Data source type"
     )
     source: str | None = Field(default=None, description="Source entity name")
@@ -1,5 +1,7 @@
 """Models for executing full workflow."""
 
+from typing import Any
+
 from pydantic import BaseModel, Field
 
 
@@ -41,3 +43,4 @@ class ExecuteResult(BaseModel):
         None,
         description="Relative API path that can be used to download the generated file (file targets only)",
     )
+    profile: dict[str, Any] | None = Field(None, description="Per-entity, per-stage profile (only when requested with profile=true)")
@@ -16,6 +16,9 @@ class QueryResult(BaseModel):
     execution_time_ms: int = Field(..., description="Query execution time in milliseconds")
     is_truncated: bool = Field(default=False, description="Whether the result was truncated due to size limits")
     total_rows: Optional[int] = Field(default=None, description="Total number of rows in result (if known, before truncation)")
+    cursor: Optional[str] = Field(default=None, description="Cursor for paging through the cached result (paged responses only)")
+    offset: int = Field(default=0, description="Offset of the first returned row within the result")
+    next_offset: Optional[int] = Field(default=None, description="Offset of the next page, or None if this is the last page")
 
 
 class QueryValidation(BaseModel):
@@ -32,7 +35,10 @@ class QueryExecution(BaseModel):
     """Request to execute a query."""
 
     query: str = Field(..., description="SQL query to execute", min_length=1)
-    limit: int = Field(default=100, description="Maximum number of rows to return", ge=1, le=10000)
+    limit: int = Field(default=100, description="Maximum number of rows to return", ge=1, le=1_000_000)
+    page_size: Optional[int] = Field(
+        default=None, description="Return only this many rows inline and cache the rest for cursor paging", ge=1, le=10000
+    )
     timeout: int = Field(default=30, description="Query timeout in seconds", ge=1, le=300)
 
 
@@ -38,6 +38,8 @@ class PreviewResult(BaseModel):
     cache_hit: bool = False
     row_count: int = 0
     validation_issues: list[dict[str, Any]] = Field(default_factory=list)  # Validation issues from preview processing
+    truncated_entities: list[str] = Field(default_factory=list)  # Entities loaded with a pushed-down row limit
+    profile: Optional[dict[str, Any]] = None  # Per-entity, per-stage profile (only when requested)
 
 
 class EntityPreviewError(BaseModel):
@@ -36,6 +36,7 @@ class EntityTaskStatus(BaseModel):
     has_note: bool = Field(default=False, description="Whether entity has a persisted task note")
     blocked_by: list[str] = Field(default_factory=list, description="Entity names blocking this entity")
     issues: list[str] = Field(default_factory=list, description="Validation error messages")
+    validation_pending: bool = Field(default=False, description="Whether the entity is being (re)validated in the background")
 
 
 class ProjectTaskStatus(BaseModel):
@@ -45,6 +46,9 @@ class ProjectTaskStatus(BaseModel):
     completion_stats: dict[str, int | float] = Field(
         ..., description="Completion statistics (total, done, required_done, completion_percentage, etc.)"
     )
+    validation_operation_id: str | None = Field(
+        default=None, description="Operation id of the background validation job updating pending entities, if any"
+    )
 
 
 class TaskUpdateRequest(BaseModel):
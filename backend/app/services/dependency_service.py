@@ -1,8 +1,11 @@
 """Service for analyzing entity dependencies in projects."""
 
+import threading
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Generic, TypeVar
 
+import xxhash
 from loguru import logger
 
 from backend.app.exceptions import (
@@ -10,13 +13,15 @@ from backend.app.exceptions import (
     DataIntegrityError,
 )
 from backend.app.models.project import Project
-from backend.app.utils.graph import calculate_depths, find_cycles, topological_sort
 from backend.app.utils.sql import extract_tables
+from src.dependency_graph import EntityDependencyGraph
 from src.model import ShapeShiftProject
 
 # Type variable for registry
 T = TypeVar("T")
 
+TODO_PLACEHOLDER: str = "todo"
+
 
 class SourceNodeExtractorRegistry(Generic[T]):
     """Registry for SourceNodeExtractor classes indexed by entity type."""
@@ -124,9 +129,24 @@ class DependencyGraph(dict):
         )
 
 
+@dataclass
+class CachedDependencyModel:
+    """Dependency graph of a project together with the entity fingerprints it was built from."""
+
+    graph: EntityDependencyGraph
+    fingerprints: dict[str, str]
+    data_sources_fingerprint: str = ""
+    source_nodes: list[SourceNode] | None = None
+    source_edges: list[dict[str, Any]] | None = None
+
+
 class DependencyService:
     """Service for analyzing entity dependencies."""
 
+    def __init__(self) -> None:
+        self._models: dict[str, CachedDependencyModel] = {}
+        self._lock: threading.Lock = threading.Lock()
+
     def analyze_dependencies(self, api_project: Project, raise_on_cycle: bool = False) -> DependencyGraph:
         """
          Analyze dependencies in project.
@@ -154,40 +174,25 @@ class DependencyService:
         except Exception as e:
             raise DataIntegrityError(message=f"Failed to initialize project: {e}") from e
 
-        dependency_map: dict[str, list[str]] = {}
-        for entity_name in api_project.entities:
-            deps = list(project.get_table(entity_name).depends_on or [])
-
-            # If entity type is "entity", add source as a dependency
-            entity_config = api_project.entities.get(entity_name, {})
-            if entity_config.get("type") == "entity":
-                source = entity_config.get("source")
-                if source and source not in deps:
-                    deps.append(source)
-
-            dependency_map[entity_name] = deps
-
-        # Add placeholder nodes for todo entities (planned but not yet created)
-        task_list = project.task_list
-        for todo_entity in task_list.todo:
-            if todo_entity not in dependency_map:
-                # Add as standalone node with no dependencies
-                dependency_map[todo_entity] = []
-
-        # Detect cycles
-        cycles: list[list[str]] = find_cycles(dependency_map)
-        has_cycles: bool = len(cycles) > 0
+        with self._lock:
+            model: CachedDependencyModel = self._dependency_model(api_project, project)
+            graph: EntityDependencyGraph = model.graph
+            dependency_map: dict[str, list[str]] = {name: list(graph.dependencies(name)) for name in graph}
+            cycles: list[list[str]] = graph.cycles
+            has_cycles: bool = graph.has_cycles
+            topological_order: None | list[str] = graph.topological_order()
+            depths: dict[str, int] = graph.depths
+
+            # Extract source nodes and edges (only when an entity changed since the last analysis)
+            if model.source_nodes is None or model.source_edges is None:
+                model.source_nodes, model.source_edges = SourceNodeService().extract(api_project)
+            source_nodes: list[SourceNode] = list(model.source_nodes)
+            source_edges: list[dict[str, Any]] = list(model.source_edges)
 
         if raise_on_cycle and has_cycles and cycles:
             raise CircularDependencyError(message=f"Circular dependency detected involving {len(cycles[0])} entities", cycle=cycles[0])
 
-        # Calculate topological order if no cycles
-        topological_order: None | list[str] = None if has_cycles else topological_sort(dependency_map)
-
-        # Calculate depths for visualization
-        depths: dict[str, int] = calculate_depths(dependency_map, topological_order)
-
-        allowed_entity_types = {"entity", "sql", "fixed", "csv", "xlsx", "openpyxl", "merged"}
+        allowed_entity_types = {"entity", "sql", "fixed", "csv", "xlsx", "openpyxl", "parquet", "feather", "merged"}
         nodes: list[DependencyNode] = []
         for name, deps in dependency_map.items():
             entity_config = api_project.entities.get(name, {})
@@ -274,9 +279,6 @@ class DependencyService:
 
         logger.debug(f"Analyzed dependencies: {len(nodes)} nodes, {len(edges)} edges, " f"cycles: {has_cycles}")
 
-        # Extract source nodes and edges
-        source_nodes, source_edges = SourceNodeService().extract(api_project)
-
         return DependencyGraph(
             nodes=nodes,
             edges=edges,
@@ -287,6 +289,74 @@ class DependencyService:
             source_edges=source_edges,
         )
 
+    def _dependency_model(self, api_project: Project, project: ShapeShiftProject) -> CachedDependencyModel:
+        """Return the project's dependency graph, updating the cached graph for entities whose config changed.
+
+        The cache is keyed by project and each entity is fingerprinted by its config hash, so an edit of a
+        single entity re-derives only that entity's dependencies and patches the cached graph incrementally.
+        A change to the project's data sources rebuilds the graph (and its source nodes) from scratch.
+        """
+        fingerprints: dict[str, str] = {name: project.get_table(name).hash() for name in api_project.entities}
+        data_sources_fingerprint: str = xxhash.xxh64(repr(project.data_sources).encode()).hexdigest()
+        # Placeholder nodes for todo entities (planned but not yet created)
+        for todo_entity in project.task_list.todo:
+            fingerprints.setdefault(todo_entity, TODO_PLACEHOLDER)
+
+        key: str = self._cache_key(api_project)
+        cached: CachedDependencyModel | None = self._models.get(key)
+        if cached is None or cached.data_sources_fingerprint != data_sources_fingerprint:
+            graph = EntityDependencyGraph({name: self._entity_dependencies(api_project, project, name) for name in fingerprints})
+            self._models[key] = CachedDependencyModel(
+                graph=graph, fingerprints=fingerprints, data_sources_fingerprint=data_sources_fingerprint
+            )
+            return self._models[key]
+
+        removed: list[str] = [name for name in cached.fingerprints if name not in fingerprints]
+        changed: list[str] = [name for name, fingerprint in fingerprints.items() if cached.fingerprints.get(name) != fingerprint]
+        if not (removed or changed):
+            return cached
+
+        graph = cached.graph
+        for name in removed:
+            graph.remove(name)
+        for name in changed:
+            graph.set_dependencies(name, self._entity_dependencies(api_project, project, name))
+        graph.reorder(fingerprints)
+        cached.fingerprints = fingerprints
+        cached.source_nodes = cached.source_edges = None
+
+        logger.debug(f"Dependency graph '{key}': {len(changed) + len(removed)} of {len(fingerprints)} entities updated")
+        return cached
+
+    @staticmethod
+    def _entity_dependencies(api_project: Project, project: ShapeShiftProject, entity_name: str) -> list[str]:
+        if not project.has_table(entity_name):
+            return []
+
+        deps: list[str] = list(project.get_table(entity_name).depends_on or [])
+
+        # If entity type is "entity", add source as a dependency
+        entity_config: dict[str, Any] = api_project.entities.get(entity_name, {})
+        if entity_config.get("type") == "entity":
+            source = entity_config.get("source")
+            if source and source not in deps:
+                deps.append(source)
+        return deps
+
+    @staticmethod
+    def _cache_key(api_project: Project) -> str:
+        if api_project.metadata and api_project.metadata.name:  # pylint: disable=no-member
+            return api_project.metadata.name  # pylint: disable=no-member
+        return api_project.filename or ""
+
+    def invalidate(self, project_name: str | None = None) -> None:
+        """Drop the cached dependency graph of a project (or of all projects)."""
+        with self._lock:
+            if project_name is None:
+                self._models.clear()
+            else:
+                self._models.pop(project_name, None)
+
     def check_circular_dependencies(self, project: Project) -> dict[str, Any]:
         """
         Check for circular dependencies in project.
@@ -388,9 +458,9 @@ class BaseFileSourceNodeExtractor(BaseSourceNodeExtractor):
         return options.get("filename")
 
 
-@SourceNodeExtractors.register("csv")
+@SourceNodeExtractors.register(["csv", "parquet", "feather"])
 class CsvFileSourceNodeExtractor(BaseFileSourceNodeExtractor):
-    """Extractor for CSV file entities (simple file -> entity)."""
+    """Extractor for single-file entities such as CSV or Parquet (simple file -> entity)."""
 
     def extract(self, entity_name: str, entity_cfg: dict[str, Any]) -> tuple[list[SourceNode], list[dict[str, Any]]]:
         """Extract source nodes for CSV entities.
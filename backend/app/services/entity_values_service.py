@@ -1,16 +1,36 @@
-"""Service for managing external entity values (parquet/csv files)."""
+"""Service for managing external entity values (parquet/csv files).
+
+Values are passed as DataFrames between the service and its callers: materialization hands over the
+normalized frame (`write_frame`) and Parquet files are written from Arrow tables, so column dtypes and
+column statistics are preserved. Reads can be paged (`offset`/`limit`); for Parquet only the row groups
+covering the requested page are read, for CSV only the rows up to the end of the page are parsed.
+"""
 
 import hashlib
+from functools import lru_cache
 from os import stat_result
 from pathlib import Path
 from typing import Any
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 from loguru import logger
 
 from backend.app.models.project import Project
 from backend.app.services.project_service import ProjectService, get_project_service
 from backend.app.utils.fixed_schema import derive_fixed_schema
+from backend.app.utils.frames import to_json_safe
+
+PARQUET_ROW_GROUP_SIZE: int = 64_000
+CSV_COUNT_CHUNK_SIZE: int = 100_000
+
+
+@lru_cache(maxsize=64)
+def _count_csv_rows(path: str, mtime_ns: int, size: int) -> int:
+    """Number of data rows in a CSV file, counted once per file version (`mtime_ns` and `size` are part of the key)."""
+    _ = mtime_ns, size
+    return sum(len(chunk) for chunk in pd.read_csv(path, usecols=[0], chunksize=CSV_COUNT_CHUNK_SIZE))
 
 
 class EntityValuesResponse:
@@ -23,12 +43,14 @@ class EntityValuesResponse:
         format: str,  # pylint: disable=redefined-builtin
         row_count: int,
         etag: str,
+        offset: int = 0,
     ):
         self.columns: list[str] = columns
         self.values: list[list[Any]] = values
         self.format: str = format
-        self.row_count: int = row_count
+        self.row_count: int = row_count  # Total number of rows in the file, not only in `values`
         self.etag: str = etag
+        self.offset: int = offset
 
 
 class EntityValuesService:
@@ -94,15 +116,17 @@ class EntityValuesService:
         project: Project = self.project_service.load_project(project_name)
         return project.folder / filename
 
-    def _read_values_file(self, file_path: Path) -> tuple[list[str], list[list[Any]], str, str]:
+    def _read_values_frame(self, file_path: Path, offset: int = 0, limit: int | None = None) -> tuple[pd.DataFrame, str, int]:
         """
-        Read values from parquet or CSV file.
+        Read values (optionally a page of rows) from parquet or CSV file into a DataFrame.
 
         Args:
             file_path: Path to values file
+            offset: First row to return
+            limit: Maximum number of rows to return (None = all remaining rows)
 
         Returns:
-            Tuple of (columns, values, format, etag)
+            Tuple of (frame, format, total row count of the file)
 
         Raises:
             FileNotFoundError: If file doesn't exist
@@ -114,22 +138,46 @@ class EntityValuesService:
         suffix: str = file_path.suffix.lower()
 
         if suffix == ".parquet":
-            df: pd.DataFrame = pd.read_parquet(file_path)
-            format_type = "parquet"
-        elif suffix in (".csv", ".tsv"):
-            df = pd.read_csv(file_path)
-            format_type = "csv"
-        else:
-            raise ValueError(f"Unsupported file format: {suffix}")
-
-        # Convert DataFrame to list[list] format
-        columns: list[str] = df.columns.tolist()
-        values: list[list[Any]] = df.values.tolist()
-
-        # Generate etag
-        etag: str = self._generate_etag(file_path)
-
-        return columns, values, format_type, etag
+            parquet_file: pq.ParquetFile = pq.ParquetFile(file_path)
+            total_rows: int = parquet_file.metadata.num_rows
+            df: pd.DataFrame = self._read_parquet_rows(parquet_file, offset, limit)
+            return df, "parquet", total_rows
+
+        if suffix in (".csv", ".tsv"):
+            stat: stat_result = file_path.stat()
+            total_rows = _count_csv_rows(str(file_path), stat.st_mtime_ns, stat.st_size)
+            if offset <= 0 and limit is None:
+                return pd.read_csv(file_path), "csv", total_rows
+            # Parse only the rows up to the end of the page (skipped rows are not converted)
+            df = pd.read_csv(file_path, skiprows=range(1, max(offset, 0) + 1), nrows=limit)
+            return df, "csv", total_rows
+
+        raise ValueError(f"Unsupported file format: {suffix}")
+
+    @staticmethod
+    def _read_parquet_rows(parquet_file: pq.ParquetFile, offset: int, limit: int | None) -> pd.DataFrame:
+        """Read rows [offset, offset + limit) reading only the row groups that cover them."""
+        total_rows: int = parquet_file.metadata.num_rows
+        if offset <= 0 and (limit is None or limit >= total_rows):
+            return parquet_file.read().to_pandas()
+
+        end: int = total_rows if limit is None else min(offset + limit, total_rows)
+        row_groups: list[int] = []
+        first_row: int = 0
+        start: int = 0
+        for index in range(parquet_file.num_row_groups):
+            group_rows: int = parquet_file.metadata.row_group(index).num_rows
+            if start + group_rows > offset and start < end:
+                if not row_groups:
+                    first_row = start
+                row_groups.append(index)
+            start += group_rows
+
+        if not row_groups:
+            return parquet_file.schema_arrow.empty_table().to_pandas()
+
+        table: pa.Table = parquet_file.read_row_groups(row_groups)
+        return table.slice(offset - first_row, end - offset).to_pandas()
 
     def _write_values_file(self, file_path: Path, columns: list[str], values: list[list[Any]], format_type: str | None) -> str:
         """
@@ -141,6 +189,21 @@ class EntityValuesService:
             values: Row data
             format_type: Storage format (parquet/csv) or None to infer from file_path
 
+        Returns:
+            Actual format used
+        """
+        # Validate shape before handing off to pandas for clearer API errors.
+        self._validate_values_shape(columns=columns, values=values)
+
+        return self._write_values_frame(file_path, pd.DataFrame(values, columns=columns), format_type)
+
+    def _write_values_frame(self, file_path: Path, df: pd.DataFrame, format_type: str | None) -> str:
+        """
+        Write a DataFrame to parquet or CSV file.
+
+        Parquet files are written from an Arrow table (dtypes preserved) in row groups of
+        `PARQUET_ROW_GROUP_SIZE` rows with column statistics, so that pages can be read back cheaply.
+
         Returns:
             Actual format used
         """
@@ -152,19 +215,13 @@ class EntityValuesService:
             suffix: str = file_path.suffix.lower()
             format_type = "parquet" if suffix == ".parquet" else "csv"
 
-        # Validate shape before handing off to pandas for clearer API errors.
-        self._validate_values_shape(columns=columns, values=values)
-
-        # Convert list[list] to DataFrame
-        df = pd.DataFrame(values, columns=columns)
-
-        # Write based on format
         if format_type == "parquet":
-            df.to_parquet(file_path, index=False)
+            table: pa.Table = pa.Table.from_pandas(df, preserve_index=False)
+            pq.write_table(table, file_path, row_group_size=PARQUET_ROW_GROUP_SIZE, write_statistics=True)
         else:  # csv
             df.to_csv(file_path, index=False)
 
-        logger.info(f"Wrote {len(values)} rows to {file_path} ({format_type})")
+        logger.info(f"Wrote {len(df)} rows to {file_path} ({format_type})")
         return format_type
 
     def _validate_values_shape(self, columns: list[str], values: list[list[Any]]) -> None:
@@ -195,38 +252,48 @@ class EntityValuesService:
                 f"Fixed entity '{entity_name}' must update values using authoritative columns {expected_columns}; " f"received {columns}"
             )
 
-    def get_values(self, project_name: str, entity_name: str) -> EntityValuesResponse:
+    def _get_values_path(self, project_name: str, entity_name: str) -> tuple[dict[str, Any], Path]:
+        """Return the entity config and the path of the file referenced by its @load: directive."""
+        entity_data: dict[str, Any] = self.project_service.get_entity_by_name(project_name, entity_name)
+        values_field: Any | None = entity_data.get("values")
+
+        # Parse @load: directive
+        filename: str | None = self._parse_load_directive(values_field)
+        if not filename:
+            raise ValueError(f"Entity '{entity_name}' does not have @load: directive (values: {values_field})")
+
+        return entity_data, self._resolve_values_path(project_name, filename)
+
+    def get_values(self, project_name: str, entity_name: str, offset: int = 0, limit: int | None = None) -> EntityValuesResponse:
         """
-        Get external values for entity with @load: directive.
+        Get external values (optionally a page of rows) for entity with @load: directive.
 
         Args:
             project_name: Project name
             entity_name: Entity name
+            offset: First row to return
+            limit: Maximum number of rows to return (None = all remaining rows)
 
         Returns:
-            Entity values response
+            Entity values response (`row_count` is the total number of rows in the file)
 
         Raises:
             ValueError: If entity doesn't have @load: directive
             FileNotFoundError: If values file not found
         """
-        # Load entity config
-        entity_data: dict[str, Any] = self.project_service.get_entity_by_name(project_name, entity_name)
-        values_field: Any | None = entity_data.get("values")
-
-        # Parse @load: directive
-        filename: str | None = self._parse_load_directive(values_field)
-        if not filename:
-            raise ValueError(f"Entity '{entity_name}' does not have @load: directive (values: {values_field})")
+        _, file_path = self._get_values_path(project_name, entity_name)
+        logger.debug(f"Loading values from {file_path} (offset={offset}, limit={limit})")
 
-        # Resolve file path
-        file_path: Path = self._resolve_values_path(project_name, filename)
-        logger.debug(f"Loading values from {file_path}")
+        df, format_type, total_rows = self._read_values_frame(file_path, offset=offset, limit=limit)
 
-        # Read file
-        columns, values, format_type, etag = self._read_values_file(file_path)
-
-        return EntityValuesResponse(columns=columns, values=values, format=format_type, row_count=len(values), etag=etag)
+        return EntityValuesResponse(
+            columns=df.columns.tolist(),
+            values=to_json_safe(df).values.tolist(),
+            format=format_type,
+            row_count=total_rows,
+            etag=self._generate_etag(file_path),
+            offset=offset,
+        )
 
     def update_values(
         self,
@@ -254,19 +321,34 @@ class EntityValuesService:
         Raises:
             ValueError: If entity doesn't have @load: directive or if etag mismatch (409)
         """
-        # Load entity config
-        entity_data: dict[str, Any] = self.project_service.get_entity_by_name(project_name, entity_name)
-        values_field: Any | None = entity_data.get("values")
+        self._validate_values_shape(columns=columns, values=values)
+        response: EntityValuesResponse = self.write_frame(
+            project_name, entity_name, pd.DataFrame(values, columns=columns), format_type=format_type, if_match=if_match
+        )
+        response.values = values
+        return response
 
-        # Parse @load: directive
-        filename: str | None = self._parse_load_directive(values_field)
-        if not filename:
-            raise ValueError(f"Entity '{entity_name}' does not have @load: directive (values: {values_field})")
+    def write_frame(
+        self,
+        project_name: str,
+        entity_name: str,
+        df: pd.DataFrame,
+        format_type: str | None = None,
+        if_match: str | None = None,
+    ) -> EntityValuesResponse:
+        """
+        Write a DataFrame as the external values of an entity with @load: directive.
 
-        self._validate_fixed_columns(entity_name, entity_data, columns)
+        Same as `update_values`, but without a round trip through Python lists: dtypes are kept and
+        the rows are not echoed back (`values` of the response is empty).
 
-        # Resolve file path
-        file_path: Path = self._resolve_values_path(project_name, filename)
+        Raises:
+            ValueError: If entity doesn't have @load: directive or if etag mismatch (409)
+        """
+        entity_data, file_path = self._get_values_path(project_name, entity_name)
+        columns: list[str] = df.columns.tolist()
+
+        self._validate_fixed_columns(entity_name, entity_data, columns)
 
         # Validate etag if provided (optimistic locking)
         if if_match is not None and file_path.exists():
@@ -276,13 +358,12 @@ class EntityValuesService:
 
         logger.info(f"Updating values at {file_path}")
 
-        # Write file
-        actual_format: str = self._write_values_file(file_path, columns, values, format_type)
+        actual_format: str = self._write_values_frame(file_path, df, format_type)
 
         # Generate new etag after write
         new_etag: str = self._generate_etag(file_path)
 
-        return EntityValuesResponse(columns=columns, values=values, format=actual_format, row_count=len(values), etag=new_etag)
+        return EntityValuesResponse(columns=columns, values=[], format=actual_format, row_count=len(df), etag=new_etag)
 
 
 def get_entity_values_service() -> EntityValuesService:
@@ -1,12 +1,16 @@
 """Service for executing full workflow."""
 
+import asyncio
 from datetime import datetime
+from functools import partial
 from pathlib import Path
 from typing import Any
 from urllib.parse import quote
 
 from loguru import logger
 
+from backend.app.core.config import settings
+from backend.app.core.operation_manager import OperationProgress, OperationStatus, operation_manager
 from backend.app.core.state_manager import ApplicationStateManager
 from backend.app.mappers.project_mapper import ProjectMapper
 from backend.app.models.execute import DispatcherMetadata, ExecuteRequest, ExecuteResult
@@ -14,7 +18,10 @@ from backend.app.models.project import Project
 from backend.app.services.project_service import ProjectService
 from backend.app.services.validation_service import ValidationService
 from src.dispatch import Dispatchers
+from src.exceptions import WorkflowCancelledError
 from src.model import ShapeShiftProject
+from src.profiling import PipelineProfiler
+from src.progress import ProgressEvent, ProgressReporter
 from src.specifications import CompositeProjectSpecification
 from src.workflow import workflow
 
@@ -31,6 +38,9 @@ class ExecuteService:
         self.state: ApplicationStateManager = state or ApplicationStateManager()
         self.project_service: ProjectService = project_service or ProjectService()
         self.validation_service: ValidationService = validation_service or ValidationService()
+        # Caps the number of background workflow jobs that run at the same time
+        self.job_slots: asyncio.Semaphore = asyncio.Semaphore(max(1, settings.WORKFLOW_MAX_CONCURRENT_JOBS))
+        self._jobs: set[asyncio.Task] = set()
 
     def get_dispatchers(self) -> list[DispatcherMetadata]:
         """Get list of available dispatchers with metadata."""
@@ -51,19 +61,27 @@ class ExecuteService:
 
         return dispatchers
 
-    async def execute_workflow(self, project_name: str, request: ExecuteRequest) -> ExecuteResult:
+    async def execute_workflow(
+        self,
+        project_name: str,
+        request: ExecuteRequest,
+        profile: bool = False,
+        progress: ProgressReporter | None = None,
+    ) -> ExecuteResult:
         """Execute full Shape Shifter workflow.
 
         Args:
             project_name: Name of project to execute
             request: Execution request parameters
+            profile: Record a per-entity, per-stage profile and return it in the result
+            progress: Receives per-entity progress events and may cancel the run between entities
 
         Returns:
             ExecuteResult with execution details
 
         Raises:
             ValueError: If dispatcher key is invalid
-            Exception: If workflow execution fails
+            WorkflowCancelledError: If the run was cancelled through `progress`
         """
         if request.dispatcher_key not in Dispatchers.items:
             raise ValueError(f"Invalid dispatcher key: {request.dispatcher_key}. " f"Available: {', '.join(Dispatchers.items.keys())}")
@@ -97,6 +115,9 @@ class ExecuteService:
                         download_path=None,
                     )
 
+            if progress is not None:
+                progress.check_cancelled()
+
             target: str = self._resolve_target(request.target, target_type)
             target_with_timestamp: str = self._add_timestamp_to_file_target(target, target_type)
 
@@ -107,15 +128,22 @@ class ExecuteService:
                 f"'{request.dispatcher_key}' -> '{target_with_timestamp}'"
             )
 
-            await workflow(
-                project=core_project,
-                target=target_with_timestamp,
-                translate=request.translate,
-                target_type=request.dispatcher_key,
-                drop_foreign_keys=request.drop_foreign_keys,
-                default_entity=request.default_entity,
-                env_file=None,  # Already resolved in project
-            )
+            profiler: PipelineProfiler | None = PipelineProfiler().start() if profile else None
+            try:
+                await workflow(
+                    project=core_project,
+                    target=target_with_timestamp,
+                    translate=request.translate,
+                    target_type=request.dispatcher_key,
+                    drop_foreign_keys=request.drop_foreign_keys,
+                    default_entity=request.default_entity,
+                    env_file=None,  # Already resolved in project
+                    profiler=profiler,
+                    progress=progress,
+                )
+            finally:
+                if profiler:
+                    profiler.stop()
 
             entity_count: int = len(core_project.entities)
 
@@ -131,8 +159,11 @@ class ExecuteService:
                 validation_passed=is_satisfied,
                 error_details=None,
                 download_path=download_path,
+                profile=profiler.to_dict() if profiler else None,
             )
 
+        except WorkflowCancelledError:
+            raise
         except Exception as e:  # pylint: disable=broad-except
             logger.exception(f"Workflow execution failed: {e}")
             return ExecuteResult(
@@ -147,6 +178,78 @@ class ExecuteService:
                 download_path=None,
             )
 
+    def submit_workflow(self, project_name: str, request: ExecuteRequest, profile: bool = False) -> str:
+        """Start a workflow run as a background job and return its operation id.
+
+        The job runs `execute_workflow` on a worker thread (with its own event loop), so the request
+        returns at once and the API event loop stays responsive. At most `WORKFLOW_MAX_CONCURRENT_JOBS`
+        jobs run at the same time; later jobs stay pending until a slot frees up. Progress, the final
+        `ExecuteResult` (in `metadata["result"]`) and cancellation go through the operation manager.
+        """
+        if request.dispatcher_key not in Dispatchers.items:
+            raise ValueError(f"Invalid dispatcher key: {request.dispatcher_key}. " f"Available: {', '.join(Dispatchers.items.keys())}")
+
+        operation_id: str = operation_manager.create_operation(
+            operation_type="execute_workflow",
+            message=f"Queued workflow for {project_name}",
+            metadata={"project": project_name, "dispatcher_key": request.dispatcher_key, "target": request.target},
+        )
+        task: asyncio.Task = asyncio.create_task(self._run_workflow_job(operation_id, project_name, request, profile))
+        self._jobs.add(task)
+        task.add_done_callback(self._jobs.discard)
+        return operation_id
+
+    async def _run_workflow_job(self, operation_id: str, project_name: str, request: ExecuteRequest, profile: bool) -> None:
+        cancelled: asyncio.Event | None = operation_manager.get_cancellation_event(operation_id)
+
+        def is_cancelled() -> bool:
+            return cancelled is not None and cancelled.is_set()
+
+        async with self.job_slots:
+            if is_cancelled():
+                logger.info(f"Workflow job {operation_id} was cancelled before it started")
+                return
+
+            operation_manager.update_progress(operation_id, status=OperationStatus.RUNNING, message=f"Running workflow for {project_name}")
+            progress: ProgressReporter = ProgressReporter(callback=partial(self._on_job_progress, operation_id), is_cancelled=is_cancelled)
+            try:
+                result: ExecuteResult = await asyncio.to_thread(
+                    asyncio.run, self.execute_workflow(project_name, request, profile=profile, progress=progress)
+                )
+            except WorkflowCancelledError:
+                operation_manager.update_progress(operation_id, status=OperationStatus.CANCELLED, message="Cancelled")
+                logger.info(f"Workflow job {operation_id} cancelled")
+                return
+            except Exception as e:  # pylint: disable=broad-except
+                logger.exception(f"Workflow job {operation_id} failed: {e}")
+                operation_manager.fail_operation(operation_id, str(e))
+                return
+
+        job: OperationProgress | None = operation_manager.get_progress(operation_id)
+        if job is None:
+            logger.info(f"Workflow job {operation_id} finished after its operation was cleaned up")
+            return
+        job.metadata["result"] = result.model_dump()
+        if is_cancelled():
+            # Cancelled after the last check (e.g. during dispatch): the operation keeps its cancelled status
+            logger.info(f"Workflow job {operation_id} finished after it was cancelled")
+            return
+        if result.success:
+            operation_manager.complete_operation(operation_id, result.message)
+        else:
+            operation_manager.fail_operation(operation_id, result.error_details or result.message)
+
+    @staticmethod
+    def _on_job_progress(operation_id: str, event: ProgressEvent) -> None:
+        """Mirror a workflow progress event onto the job's operation (called from the worker thread)."""
+        verb: str = "Normalized" if event.phase == "normalize" else "Dispatched"
+        operation_manager.update_progress(
+            operation_id, current=event.current, total=event.total, message=f"{verb} {event.entity} ({event.current}/{event.total})"
+        )
+        job: OperationProgress | None = operation_manager.get_progress(operation_id)
+        if job is not None:
+            job.metadata.update(phase=event.phase, entity=event.entity)
+
     async def _validate_project(self, project: ShapeShiftProject) -> tuple[bool, list[str]]:
         """Run project validation.
 
@@ -4,6 +4,7 @@ from typing import Any
 
 from loguru import logger
 
+from backend.app.core.config import settings
 from backend.app.ingesters.protocol import (
     Ingester,
     IngesterConfig,
@@ -153,6 +154,8 @@ class IngesterService:
         # Build extra dict with all non-standard fields
         standard_fields = {"host", "port", "dbname", "user", "submission_name", "data_types", "database"}
         extra = {k: v for k, v in config_dict.items() if k not in standard_fields}
+        if settings.INGESTER_SCHEMA_SNAPSHOT_DIR:
+            extra.setdefault("schema_snapshot_folder", str(settings.INGESTER_SCHEMA_SNAPSHOT_DIR))
 
         return IngesterConfig(
             host=db_config.get("host", "localhost"),
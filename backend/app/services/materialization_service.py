@@ -48,7 +48,7 @@ class MaterializationService:
     @staticmethod
     def _sanitize_materialized_dataframe(df: pd.DataFrame) -> pd.DataFrame:
         """Drop temporary helper columns and duplicate labels before freezing entity data."""
-        sanitized_df = df.copy()
+        sanitized_df = df
 
         helper_columns: list[str] = [
             column for column in sanitized_df.columns if isinstance(column, str) and column.startswith("_merge_indicator_")
@@ -57,7 +57,7 @@ class MaterializationService:
             sanitized_df = sanitized_df.drop(columns=helper_columns, errors="ignore")
 
         if sanitized_df.columns.has_duplicates:
-            sanitized_df = sanitized_df.loc[:, ~sanitized_df.columns.duplicated()].copy()
+            sanitized_df = sanitized_df.loc[:, ~sanitized_df.columns.duplicated()]
 
         return sanitized_df
 
@@ -130,12 +130,11 @@ class MaterializationService:
                 api_project.entities[entity_name] = self._create_materialized_entity(table_cfg, df, values_inline)
                 self._store_project(api_project)
 
-                # Now write the actual data file using EntityValuesService
-                self.entity_values_service.update_values(
+                # Now write the actual data file using EntityValuesService (the frame is written as is, keeping its dtypes)
+                self.entity_values_service.write_frame(
                     project_name=project_name,
                     entity_name=entity_name,
-                    columns=df.columns.tolist(),
-                    values=df.values.tolist(),
+                    df=df,
                     format_type=storage_format,
                 )
 
@@ -455,7 +455,7 @@ class ProjectService:
 
         This MUST be called on project deletion to prevent ghost entities
         when a new project is created with the same name.
-        Clears: ApplicationState, ShapeShiftCache, ShapeShiftProjectCache.
+        Clears: ApplicationState, ShapeShiftCache, ShapeShiftProjectCache, full-validation run cache.
         """
         # ApplicationState
         self.state.invalidate(project_name)
@@ -467,6 +467,10 @@ class ProjectService:
             shapeshift_service = get_shapeshift_service()
             shapeshift_service.cache.invalidate_project(project_name)
             shapeshift_service.project_cache.invalidate_project(project_name)
+
+            from backend.app.validators.data_validation_orchestrator import FULL_RUN_CACHE  # pylint: disable=import-outside-toplevel
+
+            FULL_RUN_CACHE.invalidate(project_name)
             logger.info(
                 "[{}] _invalidate_all_caches: all caches invalidated for '{}'",
                 corr,
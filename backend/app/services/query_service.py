@@ -4,7 +4,7 @@ SQL Query execution service for the Shape Shifter Configuration Editor.
 
 import asyncio
 import time
-from typing import Optional
+from typing import Any, Optional
 
 import pandas as pd
 import sqlparse
@@ -13,13 +13,19 @@ from sqlparse.tokens import DDL, DML, Keyword
 
 import backend.app.models.data_source as api
 import src.model as core
-from backend.app.exceptions import QueryExecutionError, QuerySecurityError
+from backend.app.core.config import settings
+from backend.app.exceptions import QueryExecutionError, QuerySecurityError, ResourceNotFoundError
 from backend.app.mappers.data_source_mapper import DataSourceMapper
 from backend.app.models.query import QueryResult, QueryValidation
 from backend.app.services.data_source_service import DataSourceService
+from backend.app.utils.caches import CachedResultSet, ResultSetCache
+from backend.app.utils.frames import json_safe_records
 from src.loaders.base_loader import DataLoaders
 from src.loaders.sql_loaders import SqlLoader
 
+# Cursor cache shared by all QueryService instances (services are created per request)
+QUERY_RESULTS: ResultSetCache = ResultSetCache(max_entries=settings.QUERY_RESULT_CACHE_SIZE, ttl_seconds=settings.QUERY_RESULT_CACHE_TTL)
+
 
 class QueryService:
     """Service for executing and validating SQL queries."""
@@ -95,19 +101,54 @@ class QueryService:
 
         return QueryValidation(is_valid=is_valid, errors=errors, warnings=warnings, statement_type=statement_type, tables=tables)
 
-    async def execute_query(self, data_source_name: str, query: str, limit: int | None = 100, timeout: int = 30) -> QueryResult:
+    async def execute_query(
+        self, data_source_name: str, query: str, limit: int | None = 100, timeout: int = 30, page_size: int | None = None
+    ) -> QueryResult:
         """
         Execute a SQL query against a data source.
 
+        If `page_size` is given (or the result exceeds QUERY_INLINE_MAX_ROWS), the full result is kept
+        in a cursor cache and only the first page is returned; use `get_result_page` for further pages.
+
         Args:
             data_source_name: Name of the data source
             query: SQL query to execute
             limit: Maximum number of rows to return (default 100)
             timeout: Query timeout in seconds (default 30)
+            page_size: Optional number of rows to return inline
 
         Returns:
             QueryResult with query results
 
+        Raises:
+            QuerySecurityError: If query contains destructive operations
+            QueryExecutionError: If query execution fails
+        """
+        df, execution_time_ms, is_truncated = await self.run_query(data_source_name, query, limit=limit, timeout=timeout)
+
+        if page_size is None and len(df) > settings.QUERY_INLINE_MAX_ROWS:
+            page_size = settings.QUERY_INLINE_MAX_ROWS
+
+        if page_size is None:
+            return self._to_query_result(df, execution_time_ms=execution_time_ms, is_truncated=is_truncated)
+
+        cursor: str = QUERY_RESULTS.put(df, is_truncated=is_truncated, execution_time_ms=execution_time_ms)
+        return self.get_result_page(cursor, offset=0, limit=page_size)
+
+    async def execute_query_to_cursor(self, data_source_name: str, query: str, limit: int | None = 100, timeout: int = 30) -> str:
+        """Execute a SQL query and keep the full result in the cursor cache. Returns the cursor."""
+        df, execution_time_ms, is_truncated = await self.run_query(data_source_name, query, limit=limit, timeout=timeout)
+        return QUERY_RESULTS.put(df, is_truncated=is_truncated, execution_time_ms=execution_time_ms)
+
+    async def run_query(
+        self, data_source_name: str, query: str, limit: int | None = 100, timeout: int = 30
+    ) -> tuple[pd.DataFrame, int, bool]:
+        """
+        Validate and execute a SQL query, returning the raw result frame.
+
+        Returns:
+            Tuple of (result DataFrame, execution time in ms, whether the result hit `limit`)
+
         Raises:
             QuerySecurityError: If query contains destructive operations
             QueryExecutionError: If query execution fails
@@ -140,24 +181,9 @@ class QueryService:
             execution_time_ms: int = max(1, int((time.time() - start_time) * 1000))
 
             is_truncated: bool = limit is not None and len(df) >= limit
-            rows: list[dict] = df.to_dict("records")
-            columns: list[str] = df.columns.tolist()
 
-            for row in rows:
-                for key, value in row.items():
-                    if pd.isna(value):
-                        row[key] = None
-                    elif isinstance(value, pd.Timestamp):
-                        row[key] = value.isoformat()
-
-            return QueryResult(
-                rows=rows,
-                columns=columns,
-                row_count=len(rows),
-                execution_time_ms=execution_time_ms,
-                is_truncated=is_truncated,
-                total_rows=len(rows) if not is_truncated else None,
-            )
+            return df, execution_time_ms, is_truncated
+
         except KeyError as e:
             raise QueryExecutionError(
                 message=f"Query execution failed due to missing configuration: {str(e)}", data_source=data_source_name, query=query
@@ -169,6 +195,57 @@ class QueryService:
         except Exception as e:
             raise QueryExecutionError(message=f"Query execution failed: {str(e)}", data_source=data_source_name, query=query) from e
 
+    def get_result_set(self, cursor: str) -> CachedResultSet:
+        """Get a cached query result by cursor.
+
+        Raises:
+            ResourceNotFoundError: If the cursor is unknown or has expired
+        """
+        result: CachedResultSet | None = QUERY_RESULTS.get(cursor)
+        if result is None:
+            raise ResourceNotFoundError(
+                message=f"Query result '{cursor}' not found or expired. Re-run the query.", resource_type="query_result", resource_id=cursor
+            )
+        return result
+
+    def get_frame_page(self, cursor: str, offset: int = 0, limit: int = 1000) -> tuple[pd.DataFrame, dict[str, Any]]:
+        """Get one page of a cached query result as a DataFrame, along with its paging metadata."""
+        result: CachedResultSet = self.get_result_set(cursor)
+        offset = max(offset, 0)
+        page: pd.DataFrame = result.frame.iloc[offset : offset + limit]
+        end: int = offset + len(page)
+        return page, {
+            "cursor": cursor,
+            "offset": offset,
+            "next_offset": end if end < len(result.frame) else None,
+            "total_rows": len(result.frame),
+            "is_truncated": result.is_truncated,
+            "execution_time_ms": result.execution_time_ms,
+        }
+
+    def get_result_page(self, cursor: str, offset: int = 0, limit: int = 1000) -> QueryResult:
+        """Get one page of a cached query result."""
+        page, metadata = self.get_frame_page(cursor, offset=offset, limit=limit)
+        return self._to_query_result(page, **metadata)
+
+    @staticmethod
+    def _to_query_result(
+        df: pd.DataFrame, *, execution_time_ms: int, is_truncated: bool, total_rows: int | None = None, **page: Any
+    ) -> QueryResult:
+        """Build a QueryResult from a (page of a) result frame."""
+        rows: list[dict[str, Any]] = json_safe_records(df)
+        if total_rows is None:
+            total_rows = len(rows)
+        return QueryResult(
+            rows=rows,
+            columns=df.columns.tolist(),
+            row_count=len(rows),
+            execution_time_ms=execution_time_ms,
+            is_truncated=is_truncated,
+            total_rows=total_rows if not is_truncated else None,
+            **page,
+        )
+
     async def introspect_query_columns(
         self, data_source_name: str, query: str, project_name: str | None = None, project_service=None
     ) -> list[str]:
@@ -20,6 +20,7 @@ from backend.app.mappers.data_source_mapper import DataSourceMapper
 from backend.app.mappers.table_schema_mapper import TableSchemaMapper
 from backend.app.models.entity_import import KeySuggestion
 from backend.app.services.data_source_service import DataSourceService
+from backend.app.utils.frames import json_safe_records
 from src.loaders.base_loader import DataLoaders
 from src.loaders.sql_loaders import CoreSchema, SqlLoader
 from src.model import DataSourceConfig as CoreDataSourceConfig
@@ -204,6 +205,72 @@ class SchemaIntrospectionService:
                 message=f"Failed to get schema for table '{table_name}'", data_source=ds_name, operation="get_columns"
             ) from e
 
+    async def get_table_schemas(
+        self, data_source: str | dict[str, Any], table_names: Optional[list[str]] = None, schema: Optional[str] = None
+    ) -> dict[str, api.TableSchema]:
+        """
+        Get detailed schemas for many tables using the loader's bulk catalog introspection.
+
+        Schemas are cached per table, so only tables missing from the cache are introspected. Row counts
+        from catalog introspection may be planner estimates, so these schemas are cached under their own
+        keys and never served to `get_table_schema`, which reports exact counts.
+
+        Args:
+            data_source: Either a filename/name string or a resolved config dict
+            table_names: Tables to introspect (default: all tables)
+            schema: Optional schema name (PostgreSQL)
+
+        Returns:
+            Table schemas keyed by table name
+
+        Raises:
+            SchemaIntrospectionError: If introspection fails
+        """
+        ds_name: str = data_source if isinstance(data_source, str) else data_source.get("name", "unknown")
+        all_tables_key: str = self.cache.compute_key(data_source, "schema", f"estimated:{schema or 'default'}:*")
+
+        def table_key(table_name: str) -> str:
+            return self.cache.compute_key(data_source, "schema", f"estimated:{schema or 'default'}:{table_name}")
+
+        schemas: dict[str, api.TableSchema] = {}
+        missing: list[str] | None = None
+        if table_names is None:
+            if (cached_schemas := self.cache.get(all_tables_key)) is not None:
+                return cached_schemas
+        else:
+            missing = []
+            for table_name in table_names:
+                if (cached_schema := self.cache.get(table_key(table_name))) is not None:
+                    schemas[table_name] = cached_schema
+                else:
+                    missing.append(table_name)
+            if not missing:
+                return schemas
+
+        try:
+            ds_config: api.DataSourceConfig | None = self.data_source_service.load_data_source(data_source)
+            if ds_config is None:
+                raise SchemaIntrospectionError(message=f"Data source '{ds_name}' not found", data_source=ds_name, operation="get_columns")
+
+            ds_config = ds_config.resolve_config_env_vars()
+            loader: SqlLoader = self.create_loader_for_data_source(ds_config)
+            core_schemas: dict[str, CoreSchema.TableSchema] = await loader.get_table_schemas(missing, schema=schema)
+
+            for table_name, core_schema in core_schemas.items():
+                api_schema: api.TableSchema = TableSchemaMapper.to_api_schema(core_schema)
+                self.cache.set(table_key(table_name), api_schema)
+                schemas[table_name] = api_schema
+
+            if table_names is None:
+                self.cache.set(all_tables_key, schemas)
+            return schemas
+
+        except SchemaIntrospectionError:
+            raise
+        except Exception as e:
+            logger.error(f"Error getting table schemas from {ds_name}: {e}")
+            raise SchemaIntrospectionError(message="Failed to get table schemas", data_source=ds_name, operation="get_columns") from e
+
     async def preview_table_data(
         self,
         data_source_cfg: str | dict[str, Any],
@@ -253,7 +320,7 @@ class SchemaIntrospectionService:
 
             return {
                 "columns": data.columns.tolist(),
-                "rows": data.to_dict(orient="records"),  # type: ignore
+                "rows": json_safe_records(data),
                 "total_rows": row_count or 0,  # Use 0 if row count unavailable
                 "limit": limit,
                 "offset": offset,
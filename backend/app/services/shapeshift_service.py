@@ -15,9 +15,11 @@ from backend.app.mappers.entity_config_mapper import EntityConfigMapperFactory
 from backend.app.models.shapeshift import ColumnInfo, PreviewResult
 from backend.app.services.project_service import ProjectService, get_project_service
 from backend.app.utils.caches import ShapeShiftCache, ShapeShiftProjectCache
+from backend.app.utils.frames import json_safe_records
 from src.exceptions import FunctionalDependencyError
 from src.model import ShapeShiftProject, TableConfig
 from src.normalizer import ShapeShifter
+from src.profiling import PipelineProfiler
 from src.specifications.constraints import ForeignKeyConstraintViolation, ForeignKeyNullConstraintViolation, ValidationIssue
 from src.validation_messages import format_validation_message_with_context
 
@@ -53,7 +55,12 @@ class ShapeShiftService:
         entity_config.update(mapper.to_core(entity_config, project_name))
 
     async def preview_entity(
-        self, project_name: str, entity_name: str, limit: int | None = 50, override_config: dict[str, Any] | None = None
+        self,
+        project_name: str,
+        entity_name: str,
+        limit: int | None = 50,
+        override_config: dict[str, Any] | None = None,
+        profile: bool = False,
     ) -> PreviewResult:
         """
         Preview entity data with all transformations applied.
@@ -64,8 +71,10 @@ class ShapeShiftService:
         Args:
             project_name: Name of the project file
             entity_name: Name of the entity to preview
-            limit: Maximum number of rows to return (default 50). Use None for all rows.
+            limit: Maximum number of rows to return (default 50). Use None for all rows. Where row order allows,
+                the limit is also pushed into upstream loaders (see PREVIEW_LIMIT_PUSHDOWN).
             override_config: Optional entity configuration dict to preview (bypasses cache)
+            profile: Recompute the entity (bypassing cached data) and attach a per-stage profile to the result
 
         Returns:
             PreviewResult with data and metadata
@@ -104,14 +113,17 @@ class ShapeShiftService:
 
         entity_cfg: TableConfig = project.tables[entity_name]
 
-        # Fast path: if warm table_store from batch run exists, reuse it directly (but not when using override)
-        if not using_override and self._warm_table_store and entity_name in self._warm_table_store:
+        truncated_entities: list[str] = []
+        profiler: PipelineProfiler | None = PipelineProfiler() if profile else None
+
+        # Fast path: if warm table_store from batch run exists, reuse it directly (but not when using override or profiling)
+        if not using_override and not profile and self._warm_table_store and entity_name in self._warm_table_store:
             table_store = {entity_name: self._warm_table_store[entity_name]}
             validation_issues: list[dict] = []
             cached_hit = True
         else:
-            # Skip cache lookup when using override config
-            if using_override:
+            # Skip cache lookup when using override config or profiling (a cache hit would leave nothing to profile)
+            if using_override or profile:
                 cached_data = ShapeShiftCache.CacheCheckResult(found=False, data=None, dependencies={})
                 cached_hit = False
             else:
@@ -127,18 +139,27 @@ class ShapeShiftService:
                 table_store = {entity_name: cached_data.data} | cached_data.dependencies
             else:
                 resolved_cfg: ShapeShiftProject = project.clone().resolve(filename=project.filename, strict=True, **self.settings.env_opts)
-                table_store, validation_issues = await self.shapeshift(
-                    project=resolved_cfg,
-                    entity_name=entity_name,
-                    initial_table_store=cached_data.dependencies,
-                )
-
-                # Only cache if not using override config
+                row_limits: dict[str, int] = self._plan_row_limits(resolved_cfg, entity_name, limit)
+                try:
+                    table_store, validation_issues, truncated = await self.shapeshift(
+                        project=resolved_cfg,
+                        entity_name=entity_name,
+                        initial_table_store=cached_data.dependencies,
+                        row_limits=row_limits,
+                        profiler=profiler.start() if profiler else None,
+                    )
+                finally:
+                    if profiler:
+                        profiler.stop()
+                truncated_entities = sorted(truncated)
+
+                # Only cache if not using override config, and never cache partially loaded entities
                 if not using_override:
-                    entities: dict[str, TableConfig] = {name: project.get_table(name) for name in table_store.keys()}
+                    cacheable: dict[str, pd.DataFrame] = {k: v for k, v in table_store.items() if k not in truncated_entities}
+                    entities: dict[str, TableConfig] = {name: project.get_table(name) for name in cacheable.keys()}
                     hashes = [(name, cfg.hash()[:8]) for name, cfg in entities.items()]
                     logger.trace(f"[CACHE_SET] {project_name}/{entity_name}: project_version={project_version}, hashes={hashes}")
-                    self.cache.set_table_store(project_name, table_store, entity_name, project_version, entities)
+                    self.cache.set_table_store(project_name, cacheable, entity_name, project_version, entities)
 
         result: PreviewResult = PreviewResultBuilder().build(
             entity_name=entity_name,
@@ -147,13 +168,25 @@ class ShapeShiftService:
             limit=limit,
             cache_hit=cached_hit,
             validation_issues=validation_issues,
+            truncated_entities=truncated_entities,
         )
 
         execution_time_ms: int = int((time.time() - start_time) * 1000)
         result.execution_time_ms = execution_time_ms
+        if profiler:
+            result.profile = profiler.to_dict()
 
         return result
 
+    def _plan_row_limits(self, project: ShapeShiftProject, entity_name: str, limit: int | None) -> dict[str, int]:
+        """Compute per-entity source row limits for a preview of `entity_name` (empty if pushdown is disabled)."""
+        if not limit or not self.settings.PREVIEW_LIMIT_PUSHDOWN:
+            return {}
+        row_limits: dict[str, int] = {name: limit for name in project.get_row_limit_entities(entity_name)}
+        if row_limits:
+            logger.debug(f"Preview of '{entity_name}' pushes limit {limit} into: {sorted(row_limits)}")
+        return row_limits
+
     async def shapeshift_batch(
         self,
         project: ShapeShiftProject,
@@ -202,7 +235,9 @@ class ShapeShiftService:
         project: ShapeShiftProject,
         entity_name: str,
         initial_table_store: dict[str, pd.DataFrame],
-    ) -> tuple[dict[str, pd.DataFrame], list[dict]]:
+        row_limits: dict[str, int] | None = None,
+        profiler: PipelineProfiler | None = None,
+    ) -> tuple[dict[str, pd.DataFrame], list[dict], set[str]]:
         """
         Run ShapeShifter to produce entity data.
 
@@ -210,9 +245,12 @@ class ShapeShiftService:
             project: ShapeShiftProject instance
             entity_name: Target entity name
             initial_table_store: Pre-existing cached entities to reuse
+            row_limits: Optional per-entity source row limits (preview mode)
+            profiler: Optional profiler recording every pipeline stage
 
         Returns:
-            Tuple of (Complete table_store with target entity and all dependencies, validation issues)
+            Tuple of (Complete table_store with target entity and all dependencies, validation issues,
+            entities whose source rows were cut off by `row_limits`)
         """
         try:
             target_entities: set[str] = {entity_name}
@@ -225,6 +263,8 @@ class ShapeShiftService:
                 table_store=initial_table_store,
                 default_entity=project.metadata.default_entity,
                 target_entities=target_entities,
+                row_limits=row_limits,
+                profiler=profiler,
             )
 
             # Log which entities will be processed
@@ -241,7 +281,7 @@ class ShapeShiftService:
             # Collect validation issues from the linker
             validation_issues = self._collect_validation_issues(shapeshifter)
 
-            return shapeshifter.table_store, validation_issues
+            return shapeshifter.table_store, validation_issues, set(shapeshifter.truncated_entities)
 
         except (FunctionalDependencyError, ForeignKeyConstraintViolation, ForeignKeyNullConstraintViolation):
             raise
@@ -312,7 +352,7 @@ class ShapeShiftService:
 
         return all_issues
 
-    async def preview_entities_batch(self, project_name: str, entity_names: list[str]) -> dict[str, pd.DataFrame]:
+    async def preview_entities_batch(self, project_name: str, entity_names: list[str], warm: bool = True) -> dict[str, pd.DataFrame]:
         """
         Process multiple entities in one ShapeShifter run to populate cache efficiently.
 
@@ -323,6 +363,8 @@ class ShapeShiftService:
         Args:
             project_name: Name of the project file
             entity_names: List of entity names to process
+            warm: If True, also keep the result as this service's warm table_store for subsequent preview
+                calls (the shared preview cache is populated either way)
 
         Returns:
             Dictionary mapping entity names to DataFrames
@@ -364,7 +406,8 @@ class ShapeShiftService:
         )
 
         # Preserve warm table_store for subsequent preview calls in this service instance
-        self._warm_table_store = table_store
+        if warm:
+            self._warm_table_store = table_store
 
         elapsed_ms: int = int((time.time() - start_time) * 1000)
         logger.info(f"Batch processed {len(table_store)} entities in {elapsed_ms}ms (cache populated)")
@@ -408,6 +451,7 @@ class PreviewResultBuilder:
         limit: int | None,
         cache_hit: bool,
         validation_issues: list[dict] | None = None,
+        truncated_entities: list[str] | None = None,
     ) -> PreviewResult:
         """Build PreviewResult from table_store with limit applied.
 
@@ -418,6 +462,7 @@ class PreviewResultBuilder:
             limit: Maximum rows to return, or None for all rows
             cache_hit: Whether result came from cache
             validation_issues: Validation issues from linking
+            truncated_entities: Entities loaded with a pushed-down row limit
         """
         if entity_name not in table_store:
             raise RuntimeError(f"Entity {entity_name} not found in table_store")
@@ -450,7 +495,7 @@ class PreviewResultBuilder:
             for col_name in preview_df.columns
         ]
 
-        rows: list[dict] = preview_df.to_dict("records")
+        rows: list[dict] = json_safe_records(preview_df)
 
         dependencies_loaded: list[str] = [name for name in table_store.keys() if name != entity_name]
 
@@ -459,12 +504,13 @@ class PreviewResultBuilder:
             rows=rows,
             columns=columns,
             total_rows_in_preview=len(rows),
-            estimated_total_rows=len(table_store[entity_name]),
+            estimated_total_rows=None if entity_name in (truncated_entities or []) else len(table_store[entity_name]),
             execution_time_ms=0,
             has_dependencies=len(dependencies_loaded) > 0,
             dependencies_loaded=dependencies_loaded,
             cache_hit=cache_hit,
             validation_issues=validation_issues or [],
+            truncated_entities=truncated_entities or [],
         )
 
 
@@ -254,34 +254,40 @@ class SuggestionService:
 
     async def _get_table_schemas(self, data_source_name: str, entities: list[dict[str, Any]]) -> dict[str, TableSchema]:
         """Get table schemas for all entities from data source."""
-        schemas = {}
+        schemas: dict[str, TableSchema] = {}
 
         # Get table list
         try:
             tables: list[TableMetadata] = await self.schema_service.get_tables(data_source_name)
-            table_names: set[str] = {t.name for t in tables}
         except Exception as e:  # pylint: disable=broad-except
             logger.warning(f"Could not list tables: {e}")
             return schemas
 
-        # Load schemas for entities that match table names
+        # Match entities to tables (exact match first, then case-insensitive)
+        table_names: set[str] = {t.name for t in tables}
+        tables_by_lower_name: dict[str, str] = {t.name.lower(): t.name for t in tables}
+        entity_tables: dict[str, str] = {}
         for entity in entities:
-            entity_name = entity.get("name", "")
+            entity_name: str = entity.get("name", "")
+            table_name: str | None = entity_name if entity_name in table_names else tables_by_lower_name.get(entity_name.lower())
+            if table_name:
+                entity_tables[entity_name] = table_name
 
-            # Try exact match or common variations
-            table_name = None
-            if entity_name in table_names:
-                table_name = entity_name
-            elif entity_name.lower() in {t.lower() for t in table_names}:
-                # Case-insensitive match
-                table_name = next(t for t in table_names if t.lower() == entity_name.lower())
+        if not entity_tables:
+            return schemas
 
-            if table_name:
-                try:
-                    schema = await self.schema_service.get_table_schema(data_source_name, table_name)
-                    schemas[entity_name] = schema
-                except Exception as e:  # pylint: disable=broad-except
-                    logger.warning(f"Could not load schema for {table_name}: {e}")
+        # Introspect all matched tables in one bulk call
+        try:
+            table_schemas: dict[str, TableSchema] = await self.schema_service.get_table_schemas(
+                data_source_name, table_names=sorted(set(entity_tables.values()))
+            )
+        except Exception as e:  # pylint: disable=broad-except
+            logger.warning(f"Could not load table schemas: {e}")
+            return schemas
+
+        for entity_name, table_name in entity_tables.items():
+            if table_name in table_schemas:
+                schemas[entity_name] = table_schemas[table_name]
 
         return schemas
 
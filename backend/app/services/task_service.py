@@ -1,12 +1,15 @@
 """Service for managing entity task status and progress tracking."""
 
+import asyncio
 from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable
 
 import pandas as pd
+import xxhash
 from loguru import logger
 
+from backend.app.core.operation_manager import OperationProgress, OperationStatus, operation_manager
 from backend.app.exceptions import ResourceNotFoundError
 from backend.app.mappers.project_mapper import ProjectMapper
 from backend.app.mappers.project_name_mapper import ProjectNameMapper
@@ -18,7 +21,11 @@ from backend.app.services.project_service import ProjectService, get_project_ser
 from backend.app.services.shapeshift_service import ShapeShiftService, get_shapeshift_service
 from backend.app.services.task_list_sidecar_manager import TaskListSidecarManager
 from backend.app.services.validation_service import ValidationService, get_validation_service
-from src.model import ShapeShiftProject, TableConfig, TaskList
+from backend.app.utils.caches import EntityDataValidationCache
+from src.configuration.config import DirectiveCache
+from src.model import DataSourceConfig, ShapeShiftProject, TableConfig, TaskList
+from src.specifications.base import SpecificationContext
+from src.utility import dotget
 
 
 class TaskService:
@@ -37,6 +44,9 @@ class TaskService:
         self.validation_service: ValidationService = validation_service or get_validation_service()
         self.shapeshift_service: ShapeShiftService = shapeshift_service or get_shapeshift_service()
         self.sidecar_manager: TaskListSidecarManager = sidecar_manager or TaskListSidecarManager()
+        self.validation_cache: EntityDataValidationCache = EntityDataValidationCache()
+        self._validation_jobs: dict[str, str] = {}  # project name -> operation id of its running validation job
+        self._jobs: set[asyncio.Task] = set()
 
     def _refresh_project_task_list(self, project_name: str, project: ShapeShiftProject) -> None:
         """Refresh task state from sidecar without touching cached project state.
@@ -82,15 +92,26 @@ class TaskService:
 
         return project_file_path
 
-    async def compute_status(self, project_name: str) -> ProjectTaskStatus:
+    async def compute_status(self, project_name: str, background: bool = False, refresh: bool = False) -> ProjectTaskStatus:
         """
         Compute full task status for all entities in project.
 
         Combines stored task list state with derived state from validation
         and preview availability to provide complete status for each entity.
 
+        Data validation results are cached per entity and reused while the entity's lineage
+        fingerprint (see `_lineage_fingerprints`) is unchanged, so only entities whose config, source
+        files or upstream entities changed (and entities reading from a database) are validated again.
+        With `background=True` these are validated in a background job instead of before returning:
+        their status is marked `validation_pending`
+        (using their last known validation result, if any) and the job's operation id is returned in
+        `validation_operation_id`. The job pushes each entity's updated status into the operation's
+        `metadata["entities"]` as soon as it has been validated.
+
         Args:
             project_name: Name of the project
+            background: Validate changed entities in a background job instead of waiting for them
+            refresh: Discard the project's cached validation results first
 
         Returns:
             ProjectTaskStatus with all entity statuses and completion stats
@@ -112,8 +133,21 @@ class TaskService:
         except Exception as exc:  # pylint: disable=broad-except
             logger.debug(f"Skipping task note sidecar refresh for '{project_name}': {exc}")
 
-        # Get validation results for all entities
-        validation_result: ValidationResult = await self.validation_service.validate_project_data(project_name)
+        if refresh:
+            self.validation_cache.invalidate(project_name)
+
+        # Validate only entities without a current cached result
+        fingerprints: dict[str, str | None] = self._lineage_fingerprints(project)
+        stale: list[str] = self.validation_cache.stale(project_name, fingerprints)
+
+        operation_id: str | None = None
+        if stale and background:
+            operation_id = self._schedule_validation(project_name, project, stale, fingerprints, note_entities)
+        elif stale:
+            await self._validate_entities(project_name, stale, fingerprints)
+
+        validation_result: ValidationResult = self._cached_validation_result(project_name, fingerprints)
+        pending_entities: set[str] = set(stale) if operation_id else set()
 
         # Build status for all entities (existing + required but missing)
         entity_statuses: dict[str, EntityTaskStatus] = {}
@@ -135,13 +169,131 @@ class TaskService:
                 entity_name=entity_name,
                 validation_result=validation_result,
                 note_entities=note_entities,
+                pending_entities=pending_entities,
             )
             entity_statuses[entity_name] = entity_status
 
         # Calculate completion statistics
         stats = self._calculate_stats(entity_statuses, project.task_list.required_entities)
 
-        return ProjectTaskStatus(entities=entity_statuses, completion_stats=stats)
+        return ProjectTaskStatus(entities=entity_statuses, completion_stats=stats, validation_operation_id=operation_id)
+
+    @staticmethod
+    def _lineage_fingerprints(project: ShapeShiftProject) -> dict[str, str | None]:
+        """Fingerprint each entity by its configuration lineage and the data it and the entities it references read.
+
+        The configuration part is `SpecificationContext.entity_fingerprint`, so a change to an entity
+        changes the fingerprint of every entity downstream of it. The data part stamps the files read
+        directly (see `_data_stamp`); entities whose lineage reads from a database are fingerprinted
+        as None, i.e. their cached results are never reused.
+        """
+        context: SpecificationContext = SpecificationContext(project.cfg)
+        stamps: dict[str, str | None] = {name: _data_stamp(project, project.get_table(name)) for name in project.table_names}
+        fingerprints: dict[str, str | None] = {}
+        for entity_name in project.table_names:
+            lineage: list[str] = [entity_name, *sorted(context.referenced_entities(entity_name))]
+            data: list[str | None] = [stamps.get(name, "") for name in lineage]
+            if any(stamp is None for stamp in data):
+                fingerprints[entity_name] = None
+                continue
+            parts: list[str] = [context.entity_fingerprint(entity_name), *(f"{name}={stamp}" for name, stamp in zip(lineage, data))]
+            fingerprints[entity_name] = xxhash.xxh64("|".join(parts).encode()).hexdigest()
+        return fingerprints
+
+    def _cached_validation_result(self, project_name: str, entity_names: Iterable[str]) -> ValidationResult:
+        """Combine the last known validation errors of `entity_names` into one result."""
+        errors: list[ValidationError] = []
+        for entity_name in entity_names:
+            cached = self.validation_cache.get(project_name, entity_name)
+            if cached is not None:
+                errors.extend(cached.errors)
+        return ValidationResult(is_valid=not errors, errors=errors)
+
+    async def _validate_entities(self, project_name: str, entity_names: list[str], fingerprints: dict[str, str | None]) -> None:
+        """Validate `entity_names` (all entities in one run if none are cached) and cache the errors per entity."""
+        if len(entity_names) == len(fingerprints):
+            validation_result: ValidationResult = await self.validation_service.validate_project_data(project_name)
+        else:
+            validation_result = await self.validation_service.validate_project_data(project_name, entity_names=entity_names)
+
+        errors: dict[str, list[ValidationError]] = {entity_name: [] for entity_name in entity_names}
+        for error in validation_result.errors:
+            if error.entity in errors:
+                errors[error.entity].append(error)
+
+        for entity_name, entity_errors in errors.items():
+            self.validation_cache.put(project_name, entity_name, fingerprints[entity_name], entity_errors)
+
+    def _schedule_validation(
+        self,
+        project_name: str,
+        project: ShapeShiftProject,
+        entity_names: list[str],
+        fingerprints: dict[str, str | None],
+        note_entities: set[str],
+    ) -> str:
+        """Start a background validation job for `entity_names` (or return the project's running job) and return its operation id."""
+        running_id: str | None = self._validation_jobs.get(project_name)
+        running: OperationProgress | None = operation_manager.get_progress(running_id) if running_id else None
+        if running_id and running is not None and running.status in (OperationStatus.PENDING, OperationStatus.RUNNING):
+            return running_id
+
+        operation_id: str = operation_manager.create_operation(
+            operation_type="task_validation",
+            total=len(entity_names),
+            message=f"Validating {len(entity_names)} entities in {project_name}",
+            metadata={"project": project_name, "entities": {}},
+        )
+        self._validation_jobs[project_name] = operation_id
+        task: asyncio.Task = asyncio.create_task(
+            self._run_validation_job(operation_id, project_name, project, entity_names, fingerprints, note_entities)
+        )
+        self._jobs.add(task)
+        task.add_done_callback(self._jobs.discard)
+        return operation_id
+
+    async def _run_validation_job(
+        self,
+        operation_id: str,
+        project_name: str,
+        project: ShapeShiftProject,
+        entity_names: list[str],
+        fingerprints: dict[str, str | None],
+        note_entities: set[str],
+    ) -> None:
+        operation_manager.update_progress(operation_id, status=OperationStatus.RUNNING)
+        validated: int = 0
+        try:
+            async for entity_name, result in self.validation_service.iter_validate_project_data(project_name, entity_names=entity_names):
+                if entity_name in fingerprints:
+                    self.validation_cache.put(project_name, entity_name, fingerprints[entity_name], list(result.errors))
+                validated += 1
+
+                # Push the entity's updated status through the operation's progress stream
+                entity_status: EntityTaskStatus = await self._compute_entity_status(
+                    project=project,
+                    project_name=project_name,
+                    entity_name=entity_name,
+                    validation_result=self._cached_validation_result(project_name, fingerprints),
+                    note_entities=note_entities,
+                )
+                job: OperationProgress | None = operation_manager.get_progress(operation_id)
+                if job is not None:
+                    job.metadata["entities"][entity_name] = entity_status.model_dump(mode="json")
+                operation_manager.update_progress(operation_id, current=validated, message=f"Validated {entity_name}")
+
+                if operation_manager.is_cancelled(operation_id):
+                    operation_manager.update_progress(operation_id, status=OperationStatus.CANCELLED, message="Cancelled")
+                    return
+        except Exception as e:  # pylint: disable=broad-except
+            logger.exception(f"Task validation job {operation_id} for '{project_name}' failed: {e}")
+            operation_manager.fail_operation(operation_id, str(e))
+            return
+        finally:
+            if self._validation_jobs.get(project_name) == operation_id:
+                del self._validation_jobs[project_name]
+
+        operation_manager.complete_operation(operation_id, f"Validated {validated} entities")
 
     async def _compute_entity_status(
         self,
@@ -150,8 +302,9 @@ class TaskService:
         entity_name: str,
         validation_result: ValidationResult,
         note_entities: set[str],
+        pending_entities: set[str] | None = None,
     ) -> EntityTaskStatus:
-        """Compute status for a single entity."""
+        """Compute status for a single entity (`pending_entities` are still being validated in the background)."""
 
         # Check if entity exists
         exists: bool = project.has_table(entity_name)
@@ -302,6 +455,7 @@ class TaskService:
             has_note=has_note,
             blocked_by=list(set(blocked_by)),  # Remove duplicates
             issues=validation_issues,
+            validation_pending=entity_name in (pending_entities or set()),
         )
 
     def _determine_priority(
@@ -669,6 +823,28 @@ class TaskService:
         }
 
 
+def _data_stamp(project: ShapeShiftProject, table: TableConfig) -> str | None:
+    """Stamp (path, mtime and size) of the files an entity reads directly, None if it reads from a database.
+
+    `@load:` values are covered by the entity's configuration fingerprint already (their repr
+    includes the file's fingerprint).
+    """
+    files: list[str] = []
+    for config in table.get_sub_table_configs():
+        filename: Any = config.options.get("filename")
+        if config.data_source:
+            if config.data_source not in project.data_sources:
+                continue
+            data_source: DataSourceConfig = project.get_data_source(config.data_source)
+            keys: str = "database,filename,dbname" if data_source.driver == "sqlite" else "filename"
+            filename = dotget(data_source.data_source_cfg, keys) or dotget(data_source.options, keys)
+            if not filename:
+                return None
+        if filename:
+            files.append(f"{filename}:{DirectiveCache.file_stamp(str(filename))}")
+    return ";".join(files)
+
+
 @lru_cache
 def get_task_service() -> TaskService:
     """Get singleton task service instance."""
@@ -9,6 +9,8 @@ from typing import Any, Optional
 
 from pydantic import BaseModel
 
+from backend.app.models.data_source import TableSchema
+
 
 class TypeMapping(BaseModel):
     """Suggested type mapping for a column."""
@@ -256,3 +258,16 @@ class TypeMappingService:
             mappings[column_name] = mapping
 
         return mappings
+
+    def get_mappings_for_schema(self, table_schema: TableSchema) -> dict[str, TypeMapping]:
+        """Get type mappings for all columns of an introspected table schema."""
+        return self.get_mappings_for_table(
+            [
+                {"name": col.name, "data_type": col.data_type, "is_primary_key": col.is_primary_key, "max_length": col.max_length}
+                for col in table_schema.columns
+            ]
+        )
+
+    def get_mappings_for_schemas(self, table_schemas: dict[str, TableSchema]) -> dict[str, dict[str, TypeMapping]]:
+        """Get type mappings for many tables at once, keyed by table name and then column name."""
+        return {table_name: self.get_mappings_for_schema(table_schema) for table_name, table_schema in table_schemas.items()}
@@ -1,6 +1,6 @@
 """Validation service for project validation."""
 
-from typing import TYPE_CHECKING, Any, Callable
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable
 
 from loguru import logger
 
@@ -13,7 +13,7 @@ from backend.app.services.project_service import ProjectService, get_project_ser
 from backend.app.services.shapeshift_service import ShapeShiftService
 from src.configuration.config import Config
 from src.model import ShapeShiftProject
-from src.specifications import CompositeProjectSpecification, SpecificationIssue
+from src.specifications import CompositeProjectSpecification, EntityValidationCache, SpecificationIssue
 from src.validation_messages import format_validation_message_with_context
 from src.validators.data_validators import ValidationIssue
 
@@ -38,6 +38,34 @@ class ValidationService:
                                       If None, uses default factory (lazy import to avoid circular dependency).
         """
         self._data_orchestrator_factory = data_orchestrator_factory
+        # Per-entity specification results, reused for entities unaffected by an edit
+        self._entity_results: EntityValidationCache = EntityValidationCache()
+
+    def _create_data_orchestrator(self, validation_mode: DataValidationMode) -> "DataValidationOrchestrator":
+        """Create orchestrator with a fetch strategy matching the validation mode."""
+        if self._data_orchestrator_factory:
+            return self._data_orchestrator_factory()
+
+        # Default factory - import here to avoid circular dependency
+        from backend.app.services.shapeshift_service import (  # pylint: disable=import-outside-toplevel
+            get_shapeshift_service,
+        )
+        from backend.app.validators.data_validation_orchestrator import (  # pylint: disable=import-outside-toplevel
+            DataValidationOrchestrator,
+            FullDataFetchStrategy,
+            PreviewDataFetchStrategy,
+        )
+
+        # Create appropriate strategy based on validation mode
+        if validation_mode == DataValidationMode.COMPLETE:
+            fetch_strategy = FullDataFetchStrategy(get_project_service())
+        else:
+            # Use shared singleton cache (not a new instance)
+            shapeshift_service: ShapeShiftService = get_shapeshift_service()
+            fetch_strategy = PreviewDataFetchStrategy(shapeshift_service)
+
+        # Inject strategy into orchestrator
+        return DataValidationOrchestrator(fetch_strategy=fetch_strategy, max_workers=get_settings().DATA_VALIDATION_MAX_WORKERS)
 
     async def validate_project_data(
         self,
@@ -56,7 +84,6 @@ class ValidationService:
         Returns:
             ValidationResult with data validation errors and warnings
         """
-        use_full_data = validation_mode == DataValidationMode.COMPLETE
         logger.debug(f"Running data validation for project: {project_name} (mode={validation_mode.value})")
 
         # Load and resolve project (convert directives to concrete values)
@@ -64,31 +91,7 @@ class ValidationService:
         api_project: Project = project_service.load_project(project_name)
         core_project: ShapeShiftProject = ProjectMapper.to_core(api_project)
 
-        # Use injected factory or default factory
-        if self._data_orchestrator_factory:
-            orchestrator = self._data_orchestrator_factory()
-        else:
-            # Default factory - import here to avoid circular dependency
-            from backend.app.services.shapeshift_service import (  # pylint: disable=import-outside-toplevel
-                get_shapeshift_service,
-            )
-            from backend.app.validators.data_validation_orchestrator import (  # pylint: disable=import-outside-toplevel
-                DataValidationOrchestrator,
-                FullDataFetchStrategy,
-                PreviewDataFetchStrategy,
-            )
-
-            # Use shared singleton cache (not a new instance)
-            shapeshift_service: ShapeShiftService = get_shapeshift_service()
-
-            # Create appropriate strategy based on use_full_data flag
-            if use_full_data:
-                fetch_strategy = FullDataFetchStrategy(project_service)
-            else:
-                fetch_strategy = PreviewDataFetchStrategy(shapeshift_service)
-
-            # Inject strategy into orchestrator
-            orchestrator = DataValidationOrchestrator(fetch_strategy=fetch_strategy)
+        orchestrator: "DataValidationOrchestrator" = self._create_data_orchestrator(validation_mode)
 
         # Orchestrator returns domain issues - convert to API errors
         issues_list: list[ValidationIssue] = await orchestrator.validate_all_entities(
@@ -97,13 +100,47 @@ class ValidationService:
             entity_names=entity_names,
         )
 
-        errors_list: list[ValidationError] = [ValidationMapper.to_api_error(issue) for issue in issues_list]
+        result: ValidationResult = self._to_data_validation_result(issues_list, validation_mode)
+
+        logger.info(f"Data validation completed: {result.error_count} errors, {result.warning_count} warnings")
+
+        return result
+
+    async def iter_validate_project_data(
+        self,
+        project_name: str,
+        entity_names: list[str] | None = None,
+        validation_mode: DataValidationMode = DataValidationMode.SAMPLE,
+    ) -> AsyncIterator[tuple[str, ValidationResult]]:
+        """
+        Run data-aware validation on project, yielding (entity_name, result) as each entity finishes.
+
+        Args:
+            project_name: Project name
+            entity_names: Optional list of entity names to validate (None = all)
+            validation_mode: Validation mode (SAMPLE for preview data, COMPLETE for full normalization)
+        """
+        project_service: ProjectService = get_project_service()
+        api_project: Project = project_service.load_project(project_name)
+        core_project: ShapeShiftProject = ProjectMapper.to_core(api_project)
+
+        orchestrator: "DataValidationOrchestrator" = self._create_data_orchestrator(validation_mode)
+
+        async for entity_name, issues in orchestrator.iter_validate_entities(
+            core_project=core_project,
+            project_name=project_name,
+            entity_names=entity_names,
+        ):
+            yield entity_name, self._to_data_validation_result(issues, validation_mode)
+
+    def _to_data_validation_result(self, issues: list[ValidationIssue], validation_mode: DataValidationMode) -> ValidationResult:
+        errors_list: list[ValidationError] = [ValidationMapper.to_api_error(issue) for issue in issues]
 
         errors: list[ValidationError] = [e for e in errors_list if e.severity == "error"]
         warnings: list[ValidationError] = [e for e in errors_list if e.severity == "warning"]
         info: list[ValidationError] = [e for e in errors_list if e.severity == "info"]
 
-        result = ValidationResult(
+        return ValidationResult(
             is_valid=len(errors) == 0,
             errors=errors,
             warnings=warnings,
@@ -113,10 +150,6 @@ class ValidationService:
             validation_mode=validation_mode,
         )
 
-        logger.info(f"Data validation completed: {result.error_count} errors, {result.warning_count} warnings")
-
-        return result
-
     def validate_project(self, project_cfg: dict[str, Any], *, source_path: str | None = None) -> ValidationResult:
         """
         Validate project using CompositeConfigSpecification.
@@ -158,7 +191,7 @@ class ValidationService:
                 ],
             )
 
-        specification = CompositeProjectSpecification(project_cfg)
+        specification = CompositeProjectSpecification(project_cfg, result_cache=self._entity_results)
         is_valid: bool = specification.is_satisfied_by()
 
         result = ValidationResult(
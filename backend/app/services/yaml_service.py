@@ -32,6 +32,8 @@ from ruamel.yaml import YAML
 from ruamel.yaml.comments import CommentedMap, CommentedSeq
 from ruamel.yaml.scalarstring import LiteralScalarString, SingleQuotedScalarString
 
+from src.configuration import ExternalTable
+
 
 class YamlServiceError(Exception):
     """Base exception for YAML service errors."""
@@ -55,6 +57,8 @@ class YamlService:
         self.yaml.default_flow_style = False  # Use block style by default
         self.yaml.width = 4096  # Prevent line wrapping
         self.yaml.indent(mapping=2, sequence=2, offset=0)
+        # Resolved @load: handles are written back as their directive
+        self.yaml.representer.add_representer(ExternalTable, lambda representer, table: representer.represent_str(table.directive))
 
     def load(self, filename: str | Path) -> dict[str, Any]:
         """
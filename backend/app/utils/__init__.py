@@ -1,18 +1,13 @@
 """Utility modules for the backend application.
 
-This package contains reusable utilities for graph algorithms, SQL parsing, and YAML processing.
+This package contains reusable utilities for SQL parsing and YAML processing.
 Modules were refactored from dependency_service.py for improved testability.
 """
 
-from backend.app.utils.graph import calculate_depths, find_cycles, topological_sort
 from backend.app.utils.sql import extract_tables
 from backend.app.utils.yaml_utils import convert_ruamel_types
 
 __all__ = [
-    # Graph algorithms
-    "find_cycles",
-    "topological_sort",
-    "calculate_depths",
     # SQL utilities
     "extract_tables",
     # YAML utilities
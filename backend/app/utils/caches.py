@@ -1,5 +1,9 @@
+import asyncio
 import hashlib
 import time
+import uuid
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
 from dataclasses import dataclass
 
 import pandas as pd
@@ -9,8 +13,10 @@ from backend.app.core.state_manager import get_app_state
 from backend.app.mappers.project_mapper import ProjectMapper
 from backend.app.middleware.correlation import get_correlation_id
 from backend.app.models.project import Project
+from backend.app.models.validation import ValidationError
 from backend.app.services.project_service import ProjectService
 from src.model import ShapeShiftProject, TableConfig
+from src.normalizer import ShapeShifter
 
 
 @dataclass
@@ -349,3 +355,164 @@ class ShapeShiftProjectCache:
             had_cache,
             had_version,
         )
+
+
+class NormalizedRunCache:
+    """Bounded cache of full ShapeShifter runs keyed by project name and project version.
+
+    - At most `max_entries` runs are kept (least recently used evicted first)
+    - Storing a run drops runs for other versions of the same project
+    - Concurrent requests for the same key share a single normalization
+    """
+
+    def __init__(self, max_entries: int = 2) -> None:
+        self.max_entries: int = max_entries
+        self._runs: OrderedDict[tuple[str, Hashable], ShapeShifter] = OrderedDict()
+        self._locks: dict[tuple[str, Hashable], asyncio.Lock] = {}
+
+    def get(self, project_name: str, version: Hashable) -> ShapeShifter | None:
+        """Get cached run for project version, or None."""
+        key: tuple[str, Hashable] = (project_name, version)
+        run: ShapeShifter | None = self._runs.get(key)
+        if run is not None:
+            self._runs.move_to_end(key)
+        return run
+
+    async def get_or_create(self, project_name: str, version: Hashable, factory: Callable[[], Awaitable[ShapeShifter]]) -> ShapeShifter:
+        """Get cached run for project version, or create it using `factory`."""
+        key: tuple[str, Hashable] = (project_name, version)
+        run: ShapeShifter | None = self.get(project_name, version)
+        if run is not None:
+            return run
+
+        lock: asyncio.Lock = self._locks.setdefault(key, asyncio.Lock())
+        try:
+            async with lock:
+                run = self.get(project_name, version)
+                if run is None:
+                    run = await factory()
+                    self.invalidate(project_name)
+                    self._runs[key] = run
+                    while len(self._runs) > self.max_entries:
+                        self._runs.popitem(last=False)
+                    logger.trace(f"Cached normalization run for '{project_name}' (version {version})")
+        finally:
+            # Also when the factory raises, so that failed keys do not accumulate locks
+            self._locks.pop(key, None)
+        return run
+
+    def invalidate(self, project_name: str | None = None) -> None:
+        """Drop cached runs for a project (or all projects)."""
+        for key in [k for k in self._runs if project_name is None or k[0] == project_name]:
+            del self._runs[key]
+
+    def __len__(self) -> int:
+        return len(self._runs)
+
+
+@dataclass
+class CachedEntityDataValidation:
+    """Data-validation errors of one entity, valid while its lineage fingerprint is unchanged."""
+
+    fingerprint: str | None
+    errors: list[ValidationError]
+    timestamp: float
+
+
+class EntityDataValidationCache:
+    """Bounded cache of per-entity data-validation results keyed by project and entity name.
+
+    An entry is current while the entity's lineage fingerprint (its configuration and the data it
+    and the entities it reads from load) is unchanged, so editing one entity only invalidates it and
+    its downstream entities. Entities fingerprinted as `None` cannot be stamped (they read from a
+    database) and are never current. At most `max_entries` results are kept (least recently used
+    evicted first).
+    """
+
+    def __init__(self, max_entries: int = 2000) -> None:
+        self.max_entries: int = max_entries
+        self._entries: OrderedDict[tuple[str, str], CachedEntityDataValidation] = OrderedDict()
+
+    def get(self, project_name: str, entity_name: str, fingerprint: str | None = None) -> CachedEntityDataValidation | None:
+        """Get the cached result, or None if missing (or, when `fingerprint` is given, stale)."""
+        key: tuple[str, str] = (project_name, entity_name)
+        entry: CachedEntityDataValidation | None = self._entries.get(key)
+        if entry is None or (fingerprint is not None and entry.fingerprint != fingerprint):
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def put(self, project_name: str, entity_name: str, fingerprint: str | None, errors: list[ValidationError]) -> None:
+        key: tuple[str, str] = (project_name, entity_name)
+        self._entries[key] = CachedEntityDataValidation(fingerprint=fingerprint, errors=errors, timestamp=time.time())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def stale(self, project_name: str, fingerprints: dict[str, str | None]) -> list[str]:
+        """Names (in `fingerprints` order) of entities without a current result."""
+        return [
+            name for name, fingerprint in fingerprints.items() if fingerprint is None or self.get(project_name, name, fingerprint) is None
+        ]
+
+    def invalidate(self, project_name: str | None = None) -> None:
+        """Drop cached results for a project (or all projects)."""
+        for key in [k for k in self._entries if project_name is None or k[0] == project_name]:
+            del self._entries[key]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+@dataclass
+class CachedResultSet:
+    """A materialized query result kept for cursor-based paging."""
+
+    frame: pd.DataFrame
+    is_truncated: bool
+    execution_time_ms: int
+    timestamp: float
+
+
+class ResultSetCache:
+    """Bounded, TTL-limited cache of query results addressed by opaque cursors.
+
+    Lets clients page through (or stream) a large result without re-running the query
+    and without the backend materializing Python dicts for every row.
+    """
+
+    def __init__(self, max_entries: int = 8, ttl_seconds: int = 600) -> None:
+        self.max_entries: int = max_entries
+        self._ttl: int = ttl_seconds
+        self._results: OrderedDict[str, CachedResultSet] = OrderedDict()
+
+    def put(self, frame: pd.DataFrame, *, is_truncated: bool = False, execution_time_ms: int = 0) -> str:
+        """Store a result and return its cursor."""
+        cursor: str = uuid.uuid4().hex
+        self._results[cursor] = CachedResultSet(
+            frame=frame, is_truncated=is_truncated, execution_time_ms=execution_time_ms, timestamp=time.time()
+        )
+        while len(self._results) > self.max_entries:
+            self._results.popitem(last=False)
+        return cursor
+
+    def get(self, cursor: str) -> CachedResultSet | None:
+        """Get a cached result, or None if unknown or expired."""
+        result: CachedResultSet | None = self._results.get(cursor)
+        if result is None:
+            return None
+        if time.time() - result.timestamp > self._ttl:
+            del self._results[cursor]
+            return None
+        self._results.move_to_end(cursor)
+        return result
+
+    def invalidate(self, cursor: str | None = None) -> None:
+        """Drop one cursor (or all cached results)."""
+        if cursor is None:
+            self._results.clear()
+        else:
+            self._results.pop(cursor, None)
+
+    def __len__(self) -> int:
+        return len(self._results)
@@ -0,0 +1,90 @@
+"""Vectorized DataFrame serialization for API responses.
+
+Converting a result set with `df.to_dict("records")` and then patching every cell in Python
+(NaN -> None, Timestamp -> ISO string) dominates response time for large previews. The helpers
+here do the same conversions column-wise and offer two cheaper wire formats:
+
+- column-oriented JSON (`{"columns": [...], "data": [[col0...], [col1...]]}`) built with pandas' C JSON encoder
+- Arrow IPC stream bytes (for clients that can read Arrow directly)
+"""
+
+import json
+from typing import Any, Iterator
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from backend.app.core.utility import friendly_dtype
+
+ARROW_STREAM_MEDIA_TYPE: str = "application/vnd.apache.arrow.stream"
+NDJSON_MEDIA_TYPE: str = "application/x-ndjson"
+
+
+def iso_datetime_strings(series: pd.Series) -> pd.Series:
+    """Format a datetime64 column as ISO 8601 strings (NaT -> None), matching `Timestamp.isoformat()`."""
+    if isinstance(series.dtype, pd.DatetimeTZDtype):
+        return series.map(pd.Timestamp.isoformat, na_action="ignore").astype(object).where(series.notna(), None)
+
+    values: np.ndarray = series.to_numpy(dtype="datetime64[ns]")
+    missing: np.ndarray = np.isnat(values)
+    # isoformat() only prints microseconds when they are non-zero
+    has_fraction: np.ndarray = (values.astype("int64") % 1_000_000_000 != 0) & ~missing
+    formatted: np.ndarray = np.datetime_as_string(values, unit="s").astype(object)
+    if has_fraction.any():
+        formatted[has_fraction] = np.datetime_as_string(values[has_fraction], unit="us")
+    formatted[missing] = None
+    return pd.Series(formatted, index=series.index, name=series.name, dtype=object)
+
+
+def to_json_safe(df: pd.DataFrame) -> pd.DataFrame:
+    """Return an object-typed copy of `df` with missing values as None and datetimes as ISO strings."""
+    safe: pd.DataFrame = df.astype(object).where(df.notna(), None)
+    for column in df.columns[[pd.api.types.is_datetime64_any_dtype(dtype) for dtype in df.dtypes]]:
+        safe[column] = iso_datetime_strings(df[column])
+    return safe
+
+
+def json_safe_records(df: pd.DataFrame) -> list[dict[str, Any]]:
+    """Vectorized replacement for `df.to_dict("records")` followed by per-cell NaN/Timestamp fixups."""
+    if df.empty:
+        return []
+    return to_json_safe(df).to_dict("records")
+
+
+def columnar_json(df: pd.DataFrame, **metadata: Any) -> str:
+    """Serialize `df` as column-oriented JSON.
+
+    The payload is `{"columns": [...], "dtypes": [...], "data": [[...], ...], "row_count": n, **metadata}`
+    where `data[i]` holds the values of `columns[i]`. Values are encoded column by column with pandas'
+    JSON encoder (NaN/NaT -> null) so no per-row Python objects are created.
+    """
+    columns: list[str] = [str(column) for column in df.columns]
+    encoded: list[str] = []
+    for position, column in enumerate(df.columns):
+        series: pd.Series = df.iloc[:, position]
+        if pd.api.types.is_datetime64_any_dtype(series.dtype):
+            series = iso_datetime_strings(series)
+        encoded.append(series.to_json(orient="values", default_handler=str))
+    header: dict[str, Any] = {
+        "columns": columns,
+        "dtypes": [friendly_dtype(dtype) for dtype in df.dtypes],
+        "row_count": len(df),
+    } | metadata
+    return json.dumps(header, default=str)[:-1] + ', "data": [' + ",".join(encoded) + "]}"
+
+
+def iter_columnar_pages(df: pd.DataFrame, page_size: int, **metadata: Any) -> Iterator[str]:
+    """Yield newline-delimited column-oriented JSON pages of `df` (one line per page)."""
+    page_size = max(page_size, 1)
+    for offset in range(0, max(len(df), 1), page_size):
+        yield columnar_json(df.iloc[offset : offset + page_size], offset=offset, **metadata) + "\n"
+
+
+def arrow_ipc(df: pd.DataFrame) -> bytes:
+    """Serialize `df` as an Arrow IPC stream."""
+    table: pa.Table = pa.Table.from_pandas(df, preserve_index=False)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
@@ -4,18 +4,26 @@ This orchestrator:
 1. Fetches data using injected strategy (preview, full, or table_store)
 2. Calls pure domain validators from src/validators/
 3. Returns domain ValidationIssues (consumer decides how to transform)
+
+Data for all entities is prepared in one shared normalization run, after which
+per-entity validators run concurrently on a bounded worker pool.
 """
 
+import asyncio
+import contextlib
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Hashable
 from typing import Any
 
 import pandas as pd
 from loguru import logger
 
 from backend.app import models as api
+from backend.app.core.state_manager import get_app_state
 from backend.app.mappers.project_mapper import ProjectMapper
 from backend.app.services.project_service import ProjectService
 from backend.app.services.shapeshift_service import ShapeShiftService
+from backend.app.utils.caches import NormalizedRunCache
 from src.model import ShapeShiftProject
 from src.normalizer import ShapeShifter
 from src.validators.data_validators import (
@@ -29,17 +37,24 @@ from src.validators.data_validators import (
     ValidationIssue,
 )
 
+# Full normalization runs shared by all FullDataFetchStrategy instances
+FULL_RUN_CACHE: NormalizedRunCache = NormalizedRunCache(max_entries=2)
+
 
 class DataFetchStrategy(ABC):
     """Strategy interface for fetching entity data."""
 
+    async def prepare(self, project_name: str, entity_names: list[str]) -> None:
+        """Prepare data for all entities to be validated (default: fetch lazily per entity)."""
+        _ = project_name, entity_names
+
     @abstractmethod
     async def fetch(self, project_name: str, entity_name: str) -> pd.DataFrame:
         """Fetch data for an entity."""
-        pass
 
     async def get_additional_issues(self, project_name: str, entity_name: str) -> list[ValidationIssue]:
         """Return strategy-specific validation issues for an entity."""
+        _ = project_name, entity_name
         return []
 
 
@@ -49,9 +64,25 @@ class PreviewDataFetchStrategy(DataFetchStrategy):
     def __init__(self, preview_service: ShapeShiftService, limit: int = 1000) -> None:
         self.preview_service: ShapeShiftService = preview_service
         self.limit: int = limit
+        self._table_store: dict[str, pd.DataFrame] = {}
+
+    async def prepare(self, project_name: str, entity_names: list[str]) -> None:
+        """Run one shared preview normalization for all entities.
+
+        The result is stored in the shared preview cache like any batch preview; `warm=False` only keeps the
+        preview service from also pinning it as its warm table store.
+        """
+        try:
+            self._table_store = await self.preview_service.preview_entities_batch(project_name, entity_names, warm=False)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.warning(f"Shared preview normalization failed for '{project_name}', falling back to per-entity previews: {e}")
+            self._table_store = {}
 
     async def fetch(self, project_name: str, entity_name: str) -> pd.DataFrame:
         """Fetch preview sample data."""
+        if entity_name in self._table_store:
+            return self._table_store[entity_name].head(self.limit)
+
         preview_result: api.PreviewResult = await self.preview_service.preview_entity(
             project_name=project_name,
             entity_name=entity_name,
@@ -65,23 +96,43 @@ class PreviewDataFetchStrategy(DataFetchStrategy):
 
 
 class FullDataFetchStrategy(DataFetchStrategy):
-    """Strategy for fetching full normalized datasets."""
+    """Strategy for fetching full normalized datasets.
 
-    def __init__(self, project_service: ProjectService) -> None:
-        self.project_service: ProjectService = project_service
-        self._normalizer_cache: dict[str, ShapeShifter] = {}
+    Normalization runs are shared via a bounded cache keyed by project version,
+    so an edited project is re-normalized and old runs are released.
+    """
 
-    async def fetch(self, project_name: str, entity_name: str) -> pd.DataFrame:
-        """Fetch full normalized dataset."""
-        # Get or create normalizer for this project
-        if project_name not in self._normalizer_cache:
+    def __init__(self, project_service: ProjectService, run_cache: NormalizedRunCache | None = None) -> None:
+        self.project_service: ProjectService = project_service
+        self.run_cache: NormalizedRunCache = run_cache if run_cache is not None else FULL_RUN_CACHE
+
+    def get_project_version(self, project_name: str) -> Hashable:
+        """Version key combining ApplicationState version and project file modification time."""
+        version: int = 0
+        with contextlib.suppress(RuntimeError):
+            version = get_app_state().get_version(project_name)
+        mtime: int | None = None
+        with contextlib.suppress(Exception):
+            mtime = self.project_service._resolve_project_file_path(project_name).stat().st_mtime_ns
+        return (version, mtime)
+
+    async def _get_normalizer(self, project_name: str) -> ShapeShifter:
+        async def normalize() -> ShapeShifter:
             project: api.Project = self.project_service.load_project(project_name)
             core_project: ShapeShiftProject = ProjectMapper.to_core(project)
             normalizer = ShapeShifter(core_project)
             await normalizer.normalize()
-            self._normalizer_cache[project_name] = normalizer
+            return normalizer
+
+        return await self.run_cache.get_or_create(project_name, self.get_project_version(project_name), normalize)
 
-        normalizer: ShapeShifter = self._normalizer_cache[project_name]
+    async def prepare(self, project_name: str, entity_names: list[str]) -> None:
+        """Run (or reuse) the shared full normalization for the current project version."""
+        await self._get_normalizer(project_name)
+
+    async def fetch(self, project_name: str, entity_name: str) -> pd.DataFrame:
+        """Fetch full normalized dataset."""
+        normalizer: ShapeShifter = await self._get_normalizer(project_name)
 
         if entity_name not in normalizer.table_store:
             return pd.DataFrame()
@@ -90,7 +141,7 @@ class FullDataFetchStrategy(DataFetchStrategy):
 
     async def get_additional_issues(self, project_name: str, entity_name: str) -> list[ValidationIssue]:
         """Return validation issues discovered only after full normalization."""
-        normalizer = self._normalizer_cache.get(project_name)
+        normalizer: ShapeShifter | None = self.run_cache.get(project_name, self.get_project_version(project_name))
         if normalizer is None:
             return []
 
@@ -119,14 +170,58 @@ class DataValidationOrchestrator:
     - Return domain ValidationIssues (consumer transforms as needed)
     """
 
-    def __init__(self, fetch_strategy: DataFetchStrategy) -> None:
+    def __init__(self, fetch_strategy: DataFetchStrategy, max_workers: int = 4) -> None:
         """
         Initialize orchestrator with data fetch strategy.
 
         Args:
             fetch_strategy: Strategy for fetching entity data (preview, full, or table_store)
+            max_workers: Maximum number of entities validated concurrently
         """
         self.fetch_strategy: DataFetchStrategy = fetch_strategy
+        self.max_workers: int = max(1, max_workers)
+
+    def _select_entities(self, core_project: ShapeShiftProject, entity_names: list[str] | None) -> dict[str, Any]:
+        """Get resolved entity configurations, optionally filtered by name."""
+        resolved_entities: dict[str, Any] = core_project.cfg.get("entities", {})
+        if entity_names:
+            resolved_entities = {name: cfg for name, cfg in resolved_entities.items() if name in entity_names}
+        return resolved_entities
+
+    async def iter_validate_entities(
+        self,
+        core_project: ShapeShiftProject,
+        project_name: str,
+        entity_names: list[str] | None = None,
+    ) -> AsyncIterator[tuple[str, list[ValidationIssue]]]:
+        """
+        Validate all or specified entities, yielding (entity_name, issues) as each entity finishes.
+
+        Data is prepared once for all entities, then entities are validated concurrently
+        (at most `max_workers` at a time), so results arrive in completion order.
+        """
+        resolved_entities: dict[str, Any] = self._select_entities(core_project, entity_names)
+        if not resolved_entities:
+            return
+
+        try:
+            await self.fetch_strategy.prepare(project_name, list(resolved_entities))
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.warning(f"Could not prepare data for validation of '{project_name}': {e}")
+
+        semaphore = asyncio.Semaphore(self.max_workers)
+
+        async def validate(entity_name: str, entity_cfg: dict[str, Any]) -> tuple[str, list[ValidationIssue]]:
+            async with semaphore:
+                return entity_name, await self._validate_entity(project_name, entity_name, entity_cfg)
+
+        tasks: list[asyncio.Task] = [asyncio.ensure_future(validate(name, cfg)) for name, cfg in resolved_entities.items()]
+        try:
+            for next_completed in asyncio.as_completed(tasks):
+                yield await next_completed
+        finally:
+            for task in tasks:
+                task.cancel()
 
     async def validate_all_entities(
         self,
@@ -143,27 +238,13 @@ class DataValidationOrchestrator:
             entity_names: Optional list of entities to validate (None = all)
 
         Returns:
-            List of domain validation issues (consumer converts to API models if needed)
+            List of domain validation issues (consumer converts to API models if needed), in entity order
         """
-        issues: list[ValidationIssue] = []
+        results: dict[str, list[ValidationIssue]] = {}
+        async for entity_name, entity_issues in self.iter_validate_entities(core_project, project_name, entity_names):
+            results[entity_name] = entity_issues
 
-        # Get resolved entity configurations from core project
-        resolved_entities: dict[str, Any] = core_project.cfg.get("entities", {})
-
-        # Filter entities if specified
-        if entity_names:
-            resolved_entities = {name: cfg for name, cfg in resolved_entities.items() if name in entity_names}
-
-        # Run data validation for each entity
-        for entity_name, entity_cfg in resolved_entities.items():
-            entity_issues: list[ValidationIssue] = await self._validate_entity(
-                project_name=project_name,
-                entity_name=entity_name,
-                entity_cfg=entity_cfg,
-            )
-            issues.extend(entity_issues)
-
-        return issues
+        return [issue for entity_name in self._select_entities(core_project, entity_names) for issue in results.get(entity_name, [])]
 
     async def _validate_entity(
         self,
@@ -174,6 +255,8 @@ class DataValidationOrchestrator:
         """
         Validate a single entity.
 
+        Data is fetched on the event loop; the validators run in a worker thread.
+
         Args:
             project_name: Project name
             entity_name: Entity name
@@ -190,38 +273,18 @@ class DataValidationOrchestrator:
 
             issues.extend(await self.fetch_strategy.get_additional_issues(project_name, entity_name))
 
-            # Run basic validators
-            issues.extend(NonEmptyResultValidator.validate(df, entity_name))
-
-            if df.empty:
-                return issues  # Skip further validation if no data to validate
-
-            # Validate columns
-            columns: list[str] = entity_cfg.get("columns", [])
-            if columns:
-                issues.extend(ColumnExistsValidator.validate(df, columns, entity_name, entity_cfg))
-
-            # Validate natural keys
-            keys: list[str] = entity_cfg.get("keys", [])
-            if keys:
-                issues.extend(NaturalKeyUniquenessValidator.validate(df, keys, entity_name))
+            # Fetch remote data for FK integrity checks (a failed fetch only skips that FK's integrity check)
+            remote_data: dict[str, pd.DataFrame | Exception] = {}
+            if not df.empty:
+                for fk_config in entity_cfg.get("foreign_keys", []):
+                    remote_entity: str | None = fk_config.get("entity")
+                    if remote_entity and remote_entity not in remote_data:
+                        try:
+                            remote_data[remote_entity] = await self.fetch_strategy.fetch(project_name, remote_entity)
+                        except Exception as e:  # pylint: disable=broad-exception-caught
+                            remote_data[remote_entity] = e
 
-            # Validate foreign keys
-            fk_configs: list[dict[str, Any]] = entity_cfg.get("foreign_keys", [])
-            for fk_config in fk_configs:
-                # Validate FK columns exist
-                issues.extend(ForeignKeyDataValidator.validate(df, fk_config, entity_name))
-
-                # Validate FK integrity (requires remote data)
-                remote_entity: str | None = fk_config.get("entity")
-                if remote_entity:
-                    try:
-                        remote_df: pd.DataFrame = await self.fetch_strategy.fetch(project_name, remote_entity)
-
-                        issues.extend(ForeignKeyIntegrityValidator.validate(df, remote_df, fk_config, entity_name))
-                        issues.extend(DataTypeCompatibilityValidator.validate(df, remote_df, fk_config, entity_name))
-                    except Exception as e:
-                        logger.warning(f"Could not validate FK integrity for {entity_name} -> {remote_entity}: {e}")
+            issues.extend(await asyncio.to_thread(self._run_validators, df, entity_name, entity_cfg, remote_data))
 
         except Exception as e:
             logger.warning(f"Could not validate entity {entity_name}: {e}")
@@ -239,3 +302,50 @@ class DataValidationOrchestrator:
             )
 
         return issues
+
+    @staticmethod
+    def _run_validators(
+        df: pd.DataFrame,
+        entity_name: str,
+        entity_cfg: dict[str, Any],
+        remote_data: dict[str, pd.DataFrame | Exception],
+    ) -> list[ValidationIssue]:
+        """Run the domain validators for an entity on already fetched data."""
+        issues: list[ValidationIssue] = []
+
+        # Run basic validators
+        issues.extend(NonEmptyResultValidator.validate(df, entity_name))
+
+        if df.empty:
+            return issues  # Skip further validation if no data to validate
+
+        # Validate columns
+        columns: list[str] = entity_cfg.get("columns", [])
+        if columns:
+            issues.extend(ColumnExistsValidator.validate(df, columns, entity_name, entity_cfg))
+
+        # Validate natural keys
+        keys: list[str] = entity_cfg.get("keys", [])
+        if keys:
+            issues.extend(NaturalKeyUniquenessValidator.validate(df, keys, entity_name))
+
+        # Validate foreign keys
+        fk_configs: list[dict[str, Any]] = entity_cfg.get("foreign_keys", [])
+        for fk_config in fk_configs:
+            # Validate FK columns exist
+            issues.extend(ForeignKeyDataValidator.validate(df, fk_config, entity_name))
+
+            # Validate FK integrity (requires remote data)
+            remote_entity: str | None = fk_config.get("entity")
+            if remote_entity:
+                try:
+                    remote_df: pd.DataFrame | Exception = remote_data.get(remote_entity, pd.DataFrame())
+                    if isinstance(remote_df, Exception):
+                        raise remote_df
+
+                    issues.extend(ForeignKeyIntegrityValidator.validate(df, remote_df, fk_config, entity_name))
+                    issues.extend(DataTypeCompatibilityValidator.validate(df, remote_df, fk_config, entity_name))
+                except Exception as e:
+                    logger.warning(f"Could not validate FK integrity for {entity_name} -> {remote_entity}: {e}")
+
+        return issues
@@ -5,6 +5,7 @@ from pathlib import Path
 from unittest.mock import Mock
 
 import pandas as pd
+import pyarrow.parquet as pq
 import pytest
 
 from backend.app.services.entity_values_service import EntityValuesService, get_entity_values_service
@@ -51,50 +52,48 @@ class TestEntityValuesService:
         assert result == Path("/projects/test_project/materialized/feature_type.parquet")
         mock_project_service.load_project.assert_called_once_with("test_project")
 
-    def test_read_values_file_parquet(self, service, tmp_path):
+    def test_read_values_frame_parquet(self, service, tmp_path):
         """Test reading parquet file."""
         # Create test parquet file
         df = pd.DataFrame({"col1": [1, 2, 3], "col2": ["a", "b", "c"]})
         file_path = tmp_path / "test.parquet"
         df.to_parquet(file_path, index=False)
 
-        columns, values, format_type, etag = service._read_values_file(file_path)
+        frame, format_type, row_count = service._read_values_frame(file_path)
 
-        assert columns == ["col1", "col2"]
-        assert values == [[1, "a"], [2, "b"], [3, "c"]]
+        assert frame.columns.tolist() == ["col1", "col2"]
+        assert frame.values.tolist() == [[1, "a"], [2, "b"], [3, "c"]]
         assert format_type == "parquet"
-        assert isinstance(etag, str)
-        assert len(etag) == 32  # MD5 hex
+        assert row_count == 3
 
-    def test_read_values_file_csv(self, service, tmp_path):
+    def test_read_values_frame_csv(self, service, tmp_path):
         """Test reading CSV file."""
         # Create test CSV file
         df = pd.DataFrame({"col1": [1, 2, 3], "col2": ["a", "b", "c"]})
         file_path = tmp_path / "test.csv"
         df.to_csv(file_path, index=False)
 
-        columns, values, format_type, etag = service._read_values_file(file_path)
+        frame, format_type, row_count = service._read_values_frame(file_path)
 
-        assert columns == ["col1", "col2"]
-        assert values == [[1, "a"], [2, "b"], [3, "c"]]
+        assert frame.columns.tolist() == ["col1", "col2"]
+        assert frame.values.tolist() == [[1, "a"], [2, "b"], [3, "c"]]
         assert format_type == "csv"
-        assert isinstance(etag, str)
-        assert len(etag) == 32  # MD5 hex
+        assert row_count == 3
 
-    def test_read_values_file_not_found(self, service, tmp_path):
+    def test_read_values_frame_not_found(self, service, tmp_path):
         """Test reading non-existent file raises FileNotFoundError."""
         file_path = tmp_path / "nonexistent.parquet"
 
         with pytest.raises(FileNotFoundError, match="Values file not found"):
-            service._read_values_file(file_path)
+            service._read_values_frame(file_path)
 
-    def test_read_values_file_unsupported_format(self, service, tmp_path):
+    def test_read_values_frame_unsupported_format(self, service, tmp_path):
         """Test reading unsupported file format raises ValueError."""
         file_path = tmp_path / "test.txt"
         file_path.touch()
 
         with pytest.raises(ValueError, match="Unsupported file format"):
-            service._read_values_file(file_path)
+            service._read_values_frame(file_path)
 
     def test_write_values_file_parquet(self, service, tmp_path):
         """Test writing parquet file."""
@@ -194,6 +193,66 @@ class TestEntityValuesService:
         assert result.row_count == 2
         mock_project_service.get_entity_by_name.assert_called_once_with("test_project", "test_entity")
 
+    def test_get_values_pages_parquet_by_row_groups(self, service, mock_project_service, tmp_path, monkeypatch):
+        """Test that a page spanning row groups is read and its missing values are returned as None."""
+        monkeypatch.setattr("backend.app.services.entity_values_service.PARQUET_ROW_GROUP_SIZE", 4)
+        mock_project = Mock()
+        mock_project.folder = tmp_path
+        mock_project_service.load_project.return_value = mock_project
+        mock_project_service.get_entity_by_name.return_value = {"values": "@load:materialized/test.parquet"}
+
+        df = pd.DataFrame({"id": range(10), "value": [float(i) if i % 3 else None for i in range(10)]})
+        service._write_values_frame(tmp_path / "materialized" / "test.parquet", df, "parquet")
+
+        result = service.get_values("test_project", "test_entity", offset=3, limit=4)
+
+        assert (result.offset, result.row_count) == (3, 10)
+        assert result.values == [[3, None], [4, 4.0], [5, 5.0], [6, None]]
+        assert service.get_values("test_project", "test_entity", offset=8, limit=5).values == [[8, 8.0], [9, None]]
+        assert not service.get_values("test_project", "test_entity", offset=12, limit=5).values
+
+    def test_get_values_pages_csv(self, service, mock_project_service, tmp_path):
+        """Test that a CSV page holds only its rows while the row count covers the whole file."""
+        mock_project = Mock()
+        mock_project.folder = tmp_path
+        mock_project_service.load_project.return_value = mock_project
+        mock_project_service.get_entity_by_name.return_value = {"values": "@load:materialized/test.csv"}
+
+        df = pd.DataFrame({"id": range(10), "name": [f"line {i}\nnext" if i == 4 else f"n{i}" for i in range(10)]})
+        service._write_values_frame(tmp_path / "materialized" / "test.csv", df, "csv")
+
+        result = service.get_values("test_project", "test_entity", offset=3, limit=3)
+
+        assert (result.offset, result.row_count) == (3, 10)
+        assert result.values == [[3, "n3"], [4, "line 4\nnext"], [5, "n5"]]
+        assert service.get_values("test_project", "test_entity", offset=8, limit=5).values == [[8, "n8"], [9, "n9"]]
+        assert not service.get_values("test_project", "test_entity", offset=12, limit=5).values
+
+        service._write_values_frame(tmp_path / "materialized" / "test.csv", df.head(2), "csv")
+        assert service.get_values("test_project", "test_entity", offset=0, limit=5).row_count == 2
+
+    def test_write_frame_preserves_dtypes_and_statistics(self, service, mock_project_service, tmp_path):
+        """Test that frames are written without a round trip through lists."""
+        mock_project = Mock()
+        mock_project.folder = tmp_path
+        mock_project_service.load_project.return_value = mock_project
+        mock_project_service.get_entity_by_name.return_value = {"values": "@load:materialized/test.parquet"}
+
+        df = pd.DataFrame(
+            {
+                "id": pd.array([1, 2, None], dtype="Int64"),
+                "created": pd.to_datetime(["2024-01-01", "2024-01-02", "2024-01-03"]),
+                "name": ["a", "b", "c"],
+            }
+        )
+
+        result = service.write_frame("test_project", "test_entity", df, "parquet")
+
+        assert (result.row_count, result.values) == (3, [])
+        file_path = tmp_path / "materialized" / "test.parquet"
+        pd.testing.assert_frame_equal(pd.read_parquet(file_path), df)
+        assert pq.ParquetFile(file_path).metadata.row_group(0).column(0).statistics.has_min_max
+
     def test_get_values_no_load_directive(self, service, mock_project_service):
         """Test getting values for entity without @load: directive raises ValueError."""
         entity_data = {"values": [[1, 2], [3, 4]]}
@@ -0,0 +1,160 @@
+"""Tests for background workflow jobs in ExecuteService."""
+
+import asyncio
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from backend.app.core.operation_manager import OperationStatus, operation_manager
+from backend.app.models.execute import ExecuteRequest, ExecuteResult
+from backend.app.services.execute_service import ExecuteService
+from src.exceptions import WorkflowCancelledError
+from src.progress import ProgressReporter
+
+# pylint: disable=redefined-outer-name, protected-access, unused-argument
+
+
+@pytest.fixture
+def request_model() -> ExecuteRequest:
+    return ExecuteRequest(dispatcher_key="csv", target="/tmp/output", run_validation=False)
+
+
+@pytest.fixture
+def service() -> ExecuteService:
+    return ExecuteService(state=MagicMock(), project_service=MagicMock(), validation_service=MagicMock())
+
+
+def _result(success: bool = True) -> ExecuteResult:
+    return ExecuteResult(
+        success=success,
+        message="done" if success else "failed",
+        target="/tmp/output",
+        dispatcher_key="csv",
+        target_type="folder",
+        entity_count=2,
+        error_details=None if success else "boom",
+    )
+
+
+async def _wait_for_jobs(service: ExecuteService) -> None:
+    await asyncio.wait_for(asyncio.gather(*service._jobs), timeout=10)
+
+
+@pytest.mark.asyncio
+async def test_job_reports_progress_and_result(service: ExecuteService, request_model: ExecuteRequest):
+    seen_threads: list[int] = []
+
+    async def fake_execute(project_name, request, profile=False, progress: ProgressReporter | None = None):
+        seen_threads.append(threading.get_ident())
+        for index, entity in enumerate(["site", "sample"], start=1):
+            progress.check_cancelled()
+            progress.report("normalize", index, 2, entity=entity)
+        return _result()
+
+    with patch.object(service, "execute_workflow", side_effect=fake_execute):
+        operation_id = service.submit_workflow("demo", request_model)
+        await _wait_for_jobs(service)
+
+    job = operation_manager.get_progress(operation_id)
+    assert job.status == OperationStatus.COMPLETED
+    assert (job.current, job.total) == (2, 2)
+    assert job.metadata["phase"] == "normalize" and job.metadata["entity"] == "sample"
+    assert job.metadata["result"]["success"] is True
+    assert seen_threads and seen_threads[0] != threading.get_ident()
+    operation_manager.cleanup_operation(operation_id)
+
+
+@pytest.mark.asyncio
+async def test_failed_result_fails_job(service: ExecuteService, request_model: ExecuteRequest):
+    async def fake_execute(project_name, request, profile=False, progress=None):
+        return _result(success=False)
+
+    with patch.object(service, "execute_workflow", side_effect=fake_execute):
+        operation_id = service.submit_workflow("demo", request_model)
+        await _wait_for_jobs(service)
+
+    job = operation_manager.get_progress(operation_id)
+    assert job.status == OperationStatus.FAILED
+    assert job.error == "boom"
+    operation_manager.cleanup_operation(operation_id)
+
+
+@pytest.mark.asyncio
+async def test_job_is_cancelled_between_entities(service: ExecuteService, request_model: ExecuteRequest):
+    started = threading.Event()
+    resume = threading.Event()
+    cancelled: list[str] = []
+
+    async def fake_execute(project_name, request, profile=False, progress: ProgressReporter | None = None):
+        progress.report("normalize", 1, 2, entity="site")
+        started.set()
+        resume.wait(timeout=5)
+        try:
+            progress.check_cancelled()
+        except WorkflowCancelledError:
+            cancelled.append("sample")
+            raise
+        return _result()
+
+    with patch.object(service, "execute_workflow", side_effect=fake_execute):
+        operation_id = service.submit_workflow("demo", request_model)
+        await asyncio.to_thread(started.wait, 5)
+        operation_manager.cancel_operation(operation_id)
+        operation_manager.cleanup_operation(operation_id)  # e.g. the SSE stream ended; the job must still see the flag
+        resume.set()
+        await _wait_for_jobs(service)
+
+    assert cancelled == ["sample"]
+
+
+@pytest.mark.asyncio
+async def test_job_cancelled_during_its_last_stage_stays_cancelled(service: ExecuteService, request_model: ExecuteRequest):
+    operation_ids: list[str] = []
+
+    async def fake_execute(project_name, request, profile=False, progress=None):
+        operation_manager.cancel_operation(operation_ids[0])  # e.g. while the dispatcher writes the target
+        return _result()
+
+    with patch.object(service, "execute_workflow", side_effect=fake_execute):
+        operation_ids.append(service.submit_workflow("demo", request_model))
+        await _wait_for_jobs(service)
+
+    job = operation_manager.get_progress(operation_ids[0])
+    assert job.status == OperationStatus.CANCELLED
+    assert job.metadata["result"]["success"] is True
+    operation_manager.cleanup_operation(operation_ids[0])
+
+
+@pytest.mark.asyncio
+async def test_concurrency_cap_queues_jobs(request_model: ExecuteRequest):
+    with patch("backend.app.services.execute_service.settings") as settings:
+        settings.WORKFLOW_MAX_CONCURRENT_JOBS = 1
+        service = ExecuteService(state=MagicMock(), project_service=MagicMock(), validation_service=MagicMock())
+    started = threading.Event()
+    release = threading.Event()
+
+    async def fake_execute(project_name, request, profile=False, progress=None):
+        started.set()
+        release.wait(timeout=5)
+        return _result()
+
+    with patch.object(service, "execute_workflow", side_effect=fake_execute):
+        first = service.submit_workflow("demo", request_model)
+        second = service.submit_workflow("demo", request_model)
+        await asyncio.to_thread(started.wait, 5)
+
+        assert operation_manager.get_progress(first).status == OperationStatus.RUNNING
+        assert operation_manager.get_progress(second).status == OperationStatus.PENDING
+
+        release.set()
+        await _wait_for_jobs(service)
+
+    assert operation_manager.get_progress(second).status == OperationStatus.COMPLETED
+    for operation_id in (first, second):
+        operation_manager.cleanup_operation(operation_id)
+
+
+def test_submit_rejects_unknown_dispatcher(service: ExecuteService):
+    with pytest.raises(ValueError, match="Invalid dispatcher key"):
+        service.submit_workflow("demo", ExecuteRequest(dispatcher_key="nope", target="x"))
@@ -206,7 +206,7 @@ class TestMaterializeEntity:
         mock_shapeshifter.table_store = {"location": large_df}
 
         mock_entity_values_service = MagicMock(spec=EntityValuesService)
-        mock_entity_values_service.update_values.return_value = "test-project/materialized/location.parquet"
+        mock_entity_values_service.write_frame.return_value = "test-project/materialized/location.parquet"
 
         with patch.object(ProjectMapper, "to_core", return_value=mock_core_project):
             with patch("backend.app.services.materialization_service.CanMaterializeSpecification", return_value=mock_spec):
@@ -231,7 +231,7 @@ class TestMaterializeEntity:
         mock_shapeshifter.table_store = {"location": large_df}
 
         mock_entity_values_service = MagicMock(spec=EntityValuesService)
-        mock_entity_values_service.update_values.return_value = "test-project/materialized/location.csv"
+        mock_entity_values_service.write_frame.return_value = "test-project/materialized/location.csv"
 
         with patch.object(ProjectMapper, "to_core", return_value=mock_core_project):
             with patch("backend.app.services.materialization_service.CanMaterializeSpecification", return_value=mock_spec):
@@ -241,7 +241,8 @@ class TestMaterializeEntity:
 
                         assert result.success
                         assert result.storage_format == "csv"
-                        mock_entity_values_service.update_values.assert_called_once()
+                        mock_entity_values_service.write_frame.assert_called_once()
+                        assert isinstance(mock_entity_values_service.write_frame.call_args.kwargs["df"], pd.DataFrame)
 
     @pytest.mark.asyncio
     async def test_materialize_entity_not_in_results(
@@ -302,7 +303,7 @@ class TestMaterializeEntity:
         mock_shapeshifter.table_store = {"location": large_df}
 
         mock_entity_values_service = MagicMock(spec=EntityValuesService)
-        mock_entity_values_service.update_values.side_effect = Exception("Storage failure")
+        mock_entity_values_service.write_frame.side_effect = Exception("Storage failure")
 
         with patch.object(ProjectMapper, "to_core", return_value=mock_core_project):
             with patch("backend.app.services.materialization_service.CanMaterializeSpecification", return_value=mock_spec):
@@ -10,7 +10,7 @@ import pandas as pd
 import pytest
 import sqlparse
 
-from backend.app.exceptions import QueryExecutionError, QuerySecurityError
+from backend.app.exceptions import QueryExecutionError, QuerySecurityError, ResourceNotFoundError
 from backend.app.models.data_source import DataSourceConfig
 from backend.app.models.query import QueryResult, QueryValidation
 from backend.app.services.query_service import QueryService
@@ -728,6 +728,37 @@ class TestQueryService:
         has_where = service._has_where_clause(parsed)
         assert has_where is False
 
+    @pytest.mark.asyncio
+    async def test_execute_query_with_page_size_returns_cursor_pages(self, service: QueryService):
+        """Paged execution caches the result and serves further pages by cursor."""
+        df = pd.DataFrame({"id": range(5), "value": [1.0, None, 3.0, None, 5.0]})
+        page_loader = AsyncMock()
+        page_loader.read_sql = AsyncMock(return_value=df)
+
+        with (
+            patch("backend.app.services.query_service.DataLoaders.get") as mock_get_loader,
+            patch("backend.app.services.query_service.DataSourceMapper") as mock_mapper,
+        ):
+            mock_get_loader.return_value = lambda data_source: page_loader
+            mock_mapper.to_core_config = MagicMock(return_value=MagicMock())
+
+            first = await service.execute_query(data_source_name="test_source", query="SELECT * FROM t", limit=100, page_size=2)
+
+        assert first.cursor is not None
+        assert [row["id"] for row in first.rows] == [0, 1]
+        assert first.rows[1]["value"] is None
+        assert first.total_rows == 5 and first.next_offset == 2
+
+        last = service.get_result_page(first.cursor, offset=4, limit=2)
+        assert [row["id"] for row in last.rows] == [4]
+        assert last.next_offset is None
+        assert page_loader.read_sql.await_count == 1
+
+    def test_get_result_page_unknown_cursor_raises(self, service: QueryService):
+        """Unknown or expired cursors raise ResourceNotFoundError."""
+        with pytest.raises(ResourceNotFoundError):
+            service.get_result_page("missing")
+
 
 class TestColumnIntrospection:
     """Test column introspection functionality."""
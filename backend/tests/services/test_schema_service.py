@@ -275,6 +275,35 @@ class TestSchemaIntrospectionService:
         assert first is second  # cached result reused
         assert first.table_name == "users"
 
+    @pytest.mark.asyncio
+    async def test_get_table_schemas_fetches_only_uncached_tables(
+        self, service: SchemaIntrospectionService, postgres_config: DataSourceConfig
+    ):
+        """Bulk retrieval introspects missing tables in one loader call; its estimated counts are not served to single lookups."""
+
+        def core_schema(table_name: str) -> CoreSchema.TableSchema:
+            return CoreSchema.TableSchema(
+                table_name=table_name, schema_name="public", columns=[], primary_keys=[], indexes=[], row_count=None, foreign_keys=[]
+            )
+
+        loader = AsyncMock(
+            get_table_schemas=AsyncMock(side_effect=lambda names, schema: {name: core_schema(name) for name in names}),
+            get_table_schema=AsyncMock(side_effect=lambda name, schema: core_schema(name)),
+        )
+        service.data_source_service.load_data_source = Mock(return_value=postgres_config)
+
+        with patch.object(service, "create_loader_for_data_source", return_value=loader):
+            first = await service.get_table_schemas("ds1", table_names=["users", "orders"])
+            second = await service.get_table_schemas("ds1", table_names=["users", "items"])
+            single = await service.get_table_schema("ds1", "orders")
+
+        assert set(first) == {"users", "orders"}
+        assert set(second) == {"users", "items"}
+        assert second["users"] is first["users"]
+        assert single is not first["orders"]
+        assert [call.args[0] for call in loader.get_table_schemas.await_args_list] == [["users", "orders"], ["items"]]
+        loader.get_table_schema.assert_awaited_once_with("orders", schema=None)
+
     def test_create_loader_for_data_source_rejects_non_sql_loader(
         self, service: SchemaIntrospectionService, postgres_config: DataSourceConfig
     ):
@@ -554,6 +554,36 @@ class TestShapeShiftService:
             # Verify shapeshifter was only called once
             assert mock_normalizer.normalize.call_count == 1
 
+    @pytest.mark.asyncio
+    async def test_preview_pushes_limit_and_skips_caching_truncated_entities(
+        self, shapeshift_service: ShapeShiftService, sample_project: ShapeShiftProject, sample_dataframe: pd.DataFrame
+    ):
+        """Preview pushes its row limit upstream, reports truncated entities and does not cache them."""
+        mock_app_state = MagicMock()
+        mock_app_state.get_version.return_value = 1
+
+        with (
+            patch("backend.app.services.shapeshift_service.get_app_state", return_value=mock_app_state),
+            patch("backend.app.utils.caches.ProjectMapper.to_core_dict", return_value=sample_project.cfg),
+            patch("backend.app.services.shapeshift_service.ShapeShifter") as mock_normalizer_class,
+        ):
+            mock_normalizer = MagicMock()
+            mock_normalizer.normalize = AsyncMock()
+            mock_normalizer.table_store = {"users": sample_dataframe.head(2)}
+            mock_normalizer.truncated_entities = {"users"}
+            mock_normalizer_class.return_value = mock_normalizer
+
+            result = await shapeshift_service.preview_entity("test_project", "users", 2)
+
+            assert mock_normalizer_class.call_args.kwargs["row_limits"] == {"users": 2}
+            assert result.truncated_entities == ["users"]
+            assert result.estimated_total_rows is None
+
+            result = await shapeshift_service.preview_entity("test_project", "users", 2)
+
+            assert result.cache_hit is False
+            assert mock_normalizer.normalize.call_count == 2
+
     @pytest.mark.asyncio
     async def test_get_entity_sample(
         self, shapeshift_service: ShapeShiftService, sample_project: ShapeShiftProject, sample_dataframe: pd.DataFrame
@@ -114,10 +114,10 @@ async def test_get_table_schemas_matches_tables_case_insensitive() -> None:
         TableMetadata(name="users", schema_name="public", **{}),
         TableMetadata(name="Orders", schema_name=None, **{}),
     ]
-    schema_service.get_table_schema.side_effect = lambda ds, table: build_schema(
-        table,
-        [ColumnMetadata(name="id", data_type="INTEGER", nullable=False, is_primary_key=True, **{})],
-    )
+    schema_service.get_table_schemas.side_effect = lambda ds, table_names: {
+        table: build_schema(table, [ColumnMetadata(name="id", data_type="INTEGER", nullable=False, is_primary_key=True, **{})])
+        for table in table_names
+    }
 
     service = SuggestionService(schema_service=schema_service)
     entities = [{"name": "Users", "columns": ["id"]}, {"name": "orders", "columns": ["id"]}, {"name": "skipped", "columns": ["id"]}]
@@ -126,7 +126,8 @@ async def test_get_table_schemas_matches_tables_case_insensitive() -> None:
 
     assert set(schemas.keys()) == {"Users", "orders"}
     assert schemas["Users"].table_name.lower() == "users"
-    assert schema_service.get_table_schema.await_count == 2
+    schema_service.get_table_schemas.assert_awaited_once_with("ds1", table_names=["Orders", "users"])
+    schema_service.get_table_schema.assert_not_awaited()
 
 
 @pytest.mark.asyncio
@@ -135,13 +136,13 @@ async def test_get_table_schemas_handles_listing_failure() -> None:
     settings.enable_fk_suggestions()
     schema_service = AsyncMock()
     schema_service.get_tables.side_effect = Exception("boom")
-    schema_service.get_table_schema = AsyncMock()
+    schema_service.get_table_schemas = AsyncMock()
 
     service = SuggestionService(schema_service=schema_service)
     schemas = await service._get_table_schemas("ds1", [{"name": "users", "columns": ["id"]}])  # pylint: disable=protected-access
 
     assert schemas == {}
-    assert schema_service.get_table_schema.await_count == 0
+    assert schema_service.get_table_schemas.await_count == 0
 
 
 def test_find_column_matches_runs_all_strategies() -> None:
@@ -1,18 +1,20 @@
 """Tests for task service."""
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pandas as pd
 import pytest
 
+from backend.app.core.operation_manager import OperationStatus, operation_manager
 from backend.app.mappers.project_mapper import ProjectMapper
 from backend.app.models.project import Project
 from backend.app.models.task import TaskPriority, TaskStatus
 from backend.app.models.validation import ValidationError, ValidationResult
 from backend.app.services.task_service import TaskService
-from src.model import ShapeShiftProject, TaskList
+from src.model import DataSourceConfig, ShapeShiftProject, TableConfig, TaskList
 
-# pylint: disable=redefined-outer-name, unused-argument
+# pylint: disable=redefined-outer-name, unused-argument, protected-access
 
 
 @pytest.fixture
@@ -299,6 +301,111 @@ class TestTaskServicePriority:
             assert result.entities["site"].priority == TaskPriority.OPTIONAL
 
 
+class TestTaskServiceValidationCache:
+    """Tests for cached, incremental validation in compute_status."""
+
+    @pytest.fixture
+    def tables(self, mock_core_project, tmp_path):
+        """Real table configs: location is read from a CSV file, site references location, sample is independent."""
+        location_file = tmp_path / "location.csv"
+        location_file.write_text("location_name\nUppsala\n")
+        entities = {
+            "location": {"type": "csv", "keys": ["location_name"], "options": {"filename": str(location_file)}},
+            "site": {"type": "fixed", "keys": ["site_name"], "foreign_keys": [{"entity": "location", "local_keys": ["location_name"]}]},
+            "sample": {"type": "fixed", "keys": ["sample_name"]},
+        }
+        mock_core_project.cfg["entities"] = entities
+        mock_core_project.data_sources = {"sead": {"driver": "postgresql", "options": {"database": "sead"}}}
+        mock_core_project.get_table.side_effect = lambda name: TableConfig(entity_name=name, entities_cfg=entities)
+        mock_core_project.get_data_source.side_effect = lambda name: DataSourceConfig(cfg=mock_core_project.data_sources[name], name=name)
+        return entities
+
+    @pytest.mark.asyncio
+    async def test_compute_status_revalidates_only_changed_lineage(
+        self, task_service: TaskService, mock_api_project, mock_core_project, mock_validation_result, tables
+    ):
+        """Cached results are reused; a changed entity is revalidated together with its downstream entities."""
+        task_service.project_service.load_project = Mock(return_value=mock_api_project)
+        task_service.validation_service.validate_project_data = AsyncMock(return_value=mock_validation_result)
+
+        with patch.object(ProjectMapper, "to_core", return_value=mock_core_project):
+            await task_service.compute_status("test-project")
+            task_service.validation_service.validate_project_data.assert_awaited_once_with("test-project")
+
+            await task_service.compute_status("test-project")
+            assert task_service.validation_service.validate_project_data.await_count == 1
+
+            tables["location"]["columns"] = ["location_name"]
+            await task_service.compute_status("test-project")
+            task_service.validation_service.validate_project_data.assert_awaited_with("test-project", entity_names=["location", "site"])
+
+            await task_service.compute_status("test-project", refresh=True)
+            task_service.validation_service.validate_project_data.assert_awaited_with("test-project")
+
+    @pytest.mark.asyncio
+    async def test_compute_status_revalidates_entities_reading_changed_files(
+        self, task_service: TaskService, mock_api_project, mock_core_project, mock_validation_result, tables
+    ):
+        """Editing an entity's source file invalidates it and its downstream entities, with the configuration unchanged."""
+        task_service.project_service.load_project = Mock(return_value=mock_api_project)
+        task_service.validation_service.validate_project_data = AsyncMock(return_value=mock_validation_result)
+
+        with patch.object(ProjectMapper, "to_core", return_value=mock_core_project):
+            await task_service.compute_status("test-project")
+
+            with open(tables["location"]["options"]["filename"], "a", encoding="utf-8") as fp:
+                fp.write("Umeå\n")
+            await task_service.compute_status("test-project")
+            task_service.validation_service.validate_project_data.assert_awaited_with("test-project", entity_names=["location", "site"])
+
+    @pytest.mark.asyncio
+    async def test_compute_status_always_revalidates_database_entities(
+        self, task_service: TaskService, mock_api_project, mock_core_project, mock_validation_result, tables
+    ):
+        """Entities reading from a database (and their downstream entities) are never served from the cache."""
+        task_service.project_service.load_project = Mock(return_value=mock_api_project)
+        task_service.validation_service.validate_project_data = AsyncMock(return_value=mock_validation_result)
+        tables["location"] = {"type": "sql", "keys": ["location_name"], "data_source": "sead", "query": "select * from location"}
+
+        with patch.object(ProjectMapper, "to_core", return_value=mock_core_project):
+            await task_service.compute_status("test-project")
+            await task_service.compute_status("test-project")
+            task_service.validation_service.validate_project_data.assert_awaited_with("test-project", entity_names=["location", "site"])
+
+    @pytest.mark.asyncio
+    async def test_compute_status_in_background_pushes_entity_status(
+        self, task_service: TaskService, mock_api_project, mock_core_project, tables
+    ):
+        """Background validation returns at once and pushes each validated entity's status into the operation."""
+        task_service.project_service.load_project = Mock(return_value=mock_api_project)
+
+        async def iter_validate(project_name, entity_names=None):
+            for entity_name in entity_names:
+                errors = [ValidationError(entity="site", message="Missing column", severity="error")] if entity_name == "site" else []
+                yield entity_name, ValidationResult(is_valid=not errors, errors=errors)
+
+        task_service.validation_service.iter_validate_project_data = iter_validate
+
+        with patch.object(ProjectMapper, "to_core", return_value=mock_core_project):
+            result = await task_service.compute_status("test-project", background=True)
+
+            assert result.validation_operation_id is not None
+            assert all(status.validation_pending for status in result.entities.values())
+
+            await asyncio.gather(*task_service._jobs)
+
+            job = operation_manager.get_progress(result.validation_operation_id)
+            assert job.status == OperationStatus.COMPLETED and job.current == 3
+            assert job.metadata["entities"]["site"]["validation_passed"] is False
+            assert job.metadata["entities"]["location"]["validation_passed"] is True
+
+            result = await task_service.compute_status("test-project", background=True)
+
+            assert result.validation_operation_id is None
+            assert result.entities["site"].issues == ["Missing column"]
+            assert not any(status.validation_pending for status in result.entities.values())
+
+
 class TestTaskServiceMarkComplete:
     """Tests for marking entities as complete."""
 
@@ -2,6 +2,7 @@
 Tests for Type Mapping Service
 """
 
+from backend.app.models.data_source import ColumnMetadata, TableSchema
 from backend.app.services.type_mapping_service import TypeMappingService
 
 
@@ -162,3 +163,22 @@ class TestTypeMappingService:
         # Low confidence - unknown
         low = self.service.get_type_mapping("unknown_type")
         assert low.confidence <= 0.5
+
+    def test_mappings_for_schemas(self):
+        """Should map every column of every introspected table."""
+        users = TableSchema(
+            table_name="users",
+            schema_name=None,
+            columns=[
+                ColumnMetadata(name="id", data_type="integer", nullable=False, is_primary_key=True, **{}),
+                ColumnMetadata(name="email", data_type="character varying", nullable=True, max_length=255, **{}),
+            ],
+            primary_keys=["id"],
+            **{},
+        )
+
+        mappings = self.service.get_mappings_for_schemas({"users": users})
+
+        assert set(mappings) == {"users"}
+        assert mappings["users"]["id"].suggested_type == "integer"
+        assert mappings["users"]["email"].sql_type == "character varying"
@@ -432,6 +432,43 @@ class TestCircularDependencyDetection:
         assert order.index("base") > order.index("middle")
         assert order.index("middle") > order.index("top")
 
+    def test_entity_edit_updates_cached_graph_incrementally(self):
+        """Editing one entity patches the cached graph; the result matches a fresh analysis."""
+        entities = {
+            "base": {"type": "fixed", "values": []},
+            "middle": {"type": "entity", "source": "base"},
+            "top": {"type": "entity", "source": "middle"},
+        }
+        service = DependencyService()
+        service.analyze_dependencies(Project(entities=entities, options={}))
+
+        entities = {**entities, "base": {"type": "entity", "source": "top"}}
+        graph = service.analyze_dependencies(Project(entities=entities, options={}))
+
+        assert graph["has_cycles"]
+        assert set(graph["cycles"][0]) == {"base", "middle", "top"}
+
+        entities = {**entities, "base": {"type": "fixed", "values": []}}
+        graph = service.analyze_dependencies(Project(entities=entities, options={}))
+        fresh = DependencyService().analyze_dependencies(Project(entities=entities, options={}))
+
+        assert not graph["has_cycles"]
+        assert graph["topological_order"] == fresh["topological_order"] == ["top", "middle", "base"]
+        assert graph["nodes"] == fresh["nodes"]
+
+    def test_data_source_edit_rebuilds_cached_graph(self):
+        """Changing the project's data sources discards the cached graph, even with all entities unchanged."""
+        entities = {"site": {"type": "sql", "data_source": "sead", "query": "select * from tbl_sites"}}
+        options = {"data_sources": {"sead": {"driver": "postgresql", "options": {"database": "sead"}}}}
+        service = DependencyService()
+        service.analyze_dependencies(Project(entities=entities, options=options))
+        cached = service._models[""]  # pylint: disable=protected-access
+
+        options = {"data_sources": {"sead": {"driver": "postgresql", "options": {"database": "sead_staging"}}}}
+        service.analyze_dependencies(Project(entities=entities, options=options))
+
+        assert service._models[""] is not cached  # pylint: disable=protected-access
+
 
 class TestMaterializedEntitySourceExtraction:
     """Tests for source node extraction from materialized fixed entities."""
@@ -130,6 +130,7 @@ class TestClassBasedSchemas:
             "xls": "xlsx",
             "postgres": "postgresql",
             "ucanaccess": "access",
+            "arrow": "feather",
         }
 
         for driver, schema in schemas.items():
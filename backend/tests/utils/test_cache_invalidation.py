@@ -1,4 +1,4 @@
-"""Tests for ShapeShiftCache.invalidate_project and ShapeShiftProjectCache.invalidate_project."""
+"""Tests for invalidation and eviction of the backend caches."""
 
 from unittest.mock import MagicMock
 
@@ -7,6 +7,7 @@ import pytest
 
 # Import via shapeshift_service to avoid circular import
 from backend.app.services.shapeshift_service import ShapeShiftCache, ShapeShiftProjectCache
+from backend.app.utils.caches import EntityDataValidationCache
 
 # pylint: disable=redefined-outer-name
 
@@ -142,3 +143,26 @@ class TestShapeShiftProjectCacheInvalidateProject:
 
         assert len(project_cache._cache) == 0
         assert len(project_cache._versions) == 0
+
+
+class TestEntityDataValidationCache:
+    """Tests for EntityDataValidationCache eviction and staleness."""
+
+    def test_least_recently_used_entries_are_evicted(self):
+        cache = EntityDataValidationCache(max_entries=2)
+        cache.put("project", "a", "fp", [])
+        cache.put("project", "b", "fp", [])
+        cache.get("project", "a")
+        cache.put("project", "c", "fp", [])
+
+        assert len(cache) == 2
+        assert cache.get("project", "b") is None
+        assert cache.get("project", "a") is not None
+
+    def test_entities_without_fingerprint_are_always_stale(self):
+        cache = EntityDataValidationCache()
+        cache.put("project", "a", "fp", [])
+        cache.put("project", "b", None, [])
+
+        assert cache.stale("project", {"a": "fp", "b": None}) == ["b"]
+        assert cache.get("project", "b") is not None
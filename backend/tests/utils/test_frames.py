@@ -0,0 +1,71 @@
+"""Tests for vectorized DataFrame serialization helpers."""
+
+import io
+import json
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from backend.app.utils.frames import arrow_ipc, columnar_json, iter_columnar_pages, json_safe_records
+
+
+def _sample_frame() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "id": [1, 2, 3],
+            "value": [1.5, np.nan, 3.0],
+            "name": ["a", None, "c"],
+            "created": pd.to_datetime(["2024-01-01 12:00:00", None, "2024-01-02 01:02:03.5"], format="ISO8601"),
+        }
+    )
+
+
+class TestJsonSafeRecords:
+    """Tests for json_safe_records."""
+
+    def test_nulls_and_timestamps_match_per_cell_conversion(self):
+        """Missing values become None and timestamps ISO strings, as with Timestamp.isoformat()."""
+        records = json_safe_records(_sample_frame())
+
+        assert records[0] == {"id": 1, "value": 1.5, "name": "a", "created": "2024-01-01T12:00:00"}
+        assert records[1]["value"] is None and records[1]["name"] is None and records[1]["created"] is None
+        assert records[2]["created"] == pd.Timestamp("2024-01-02 01:02:03.5").isoformat()
+
+    def test_timezone_aware_timestamps(self):
+        """Timezone-aware columns keep their offset."""
+        df = pd.DataFrame({"ts": pd.to_datetime(["2024-01-01 12:00:00"]).tz_localize("UTC")})
+        assert json_safe_records(df) == [{"ts": "2024-01-01T12:00:00+00:00"}]
+
+    def test_empty_frame(self):
+        """Empty frames produce no records."""
+        assert not json_safe_records(pd.DataFrame(columns=["a"]))
+
+
+class TestColumnarJson:
+    """Tests for column-oriented JSON encoding."""
+
+    def test_columnar_payload(self):
+        """Payload holds one value list per column plus metadata."""
+        payload = json.loads(columnar_json(_sample_frame(), cursor="abc"))
+
+        assert payload["columns"] == ["id", "value", "name", "created"]
+        assert payload["row_count"] == 3
+        assert payload["cursor"] == "abc"
+        assert payload["data"][0] == [1, 2, 3]
+        assert payload["data"][1] == [1.5, None, 3.0]
+        assert payload["data"][3] == ["2024-01-01T12:00:00", None, "2024-01-02T01:02:03.500000"]
+
+    def test_iter_columnar_pages(self):
+        """Pages are newline-delimited and carry their offset."""
+        pages = [json.loads(line) for line in iter_columnar_pages(_sample_frame(), page_size=2)]
+
+        assert [page["offset"] for page in pages] == [0, 2]
+        assert [page["row_count"] for page in pages] == [2, 1]
+
+
+def test_arrow_ipc_roundtrip():
+    """Arrow IPC bytes read back into the same frame."""
+    df = _sample_frame()
+    table = pa.ipc.open_stream(io.BytesIO(arrow_ipc(df))).read_all()
+    pd.testing.assert_frame_equal(table.to_pandas(), df, check_dtype=False)
@@ -6,6 +6,7 @@ import pandas as pd
 import pytest
 
 from backend.app.services.shapeshift_service import ShapeShiftService
+from backend.app.utils.caches import NormalizedRunCache
 from backend.app.validators.data_validation_orchestrator import (
     DataValidationOrchestrator,
     FullDataFetchStrategy,
@@ -13,6 +14,7 @@ from backend.app.validators.data_validation_orchestrator import (
     TableStoreDataFetchStrategy,
 )
 from src.model import ShapeShiftProject
+from src.normalizer import ShapeShifter
 
 
 @pytest.mark.asyncio
@@ -165,3 +167,114 @@ async def test_orchestrator_surfaces_unresolved_extra_columns_in_full_data_mode(
     assert "Entity 'sample', field 'extra_columns.sample_label':" in unresolved_issues[0].message
     assert "country_name" in unresolved_issues[0].message
     assert "=concat(sample_name, ' / ', country_name)" in unresolved_issues[0].message
+
+
+def _fixed_project(values: list[list[str]]) -> ShapeShiftProject:
+    return ShapeShiftProject(
+        cfg={
+            "entities": {
+                "site": {"type": "fixed", "public_id": "site_id", "keys": ["site_name"], "columns": ["site_name"], "values": values},
+                "sample": {
+                    "type": "fixed",
+                    "public_id": "sample_id",
+                    "keys": ["sample_name"],
+                    "columns": ["sample_name"],
+                    "values": [["Soil"], ["Clay"]],
+                },
+            }
+        }
+    )
+
+
+@pytest.mark.asyncio
+async def test_full_strategy_shares_one_normalization_per_project_version():
+    """Full-data validation should normalize once per project version and re-normalize after edits."""
+    run_cache = NormalizedRunCache(max_entries=2)
+    mock_project_service = Mock()
+    versions = iter([1, 1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 2])
+
+    with (
+        patch("backend.app.validators.data_validation_orchestrator.ProjectMapper.to_core", return_value=_fixed_project([["A"]])),
+        patch.object(FullDataFetchStrategy, "get_project_version", side_effect=lambda _: next(versions)),
+        patch("backend.app.validators.data_validation_orchestrator.ShapeShifter", wraps=ShapeShifter) as shapeshifter_cls,
+    ):
+        strategy = FullDataFetchStrategy(mock_project_service, run_cache=run_cache)
+        orchestrator = DataValidationOrchestrator(fetch_strategy=strategy, max_workers=2)
+        core_project = _fixed_project([["A"]])
+
+        await orchestrator.validate_all_entities(core_project=core_project, project_name="versioned_project")
+        assert shapeshifter_cls.call_count == 1
+
+        await orchestrator.validate_all_entities(core_project=core_project, project_name="versioned_project")
+        assert shapeshifter_cls.call_count == 2
+
+    assert len(run_cache) == 1
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_streams_results_per_entity():
+    """iter_validate_entities should yield one result per entity and validate_all_entities should keep entity order."""
+    table_store = {
+        "site": pd.DataFrame({"site_name": ["A", "A"]}),
+        "sample": pd.DataFrame({"sample_name": ["Soil", "Clay"]}),
+    }
+    core_project = _fixed_project([["A"]])
+    orchestrator = DataValidationOrchestrator(fetch_strategy=TableStoreDataFetchStrategy(table_store), max_workers=2)
+
+    streamed = [name async for name, _ in orchestrator.iter_validate_entities(core_project=core_project, project_name="p")]
+    assert sorted(streamed) == ["sample", "site"]
+
+    issues = await orchestrator.validate_all_entities(core_project=core_project, project_name="p")
+    assert all(issue.entity == "site" for issue in issues)
+
+
+@pytest.mark.asyncio
+async def test_preview_strategy_prepares_shared_batch():
+    """PreviewDataFetchStrategy.prepare should run one batch normalization and serve fetches from it."""
+    mock_service = Mock(spec=ShapeShiftService)
+    mock_service.preview_entities_batch = AsyncMock(return_value={"entity": pd.DataFrame({"a": range(10)})})
+    mock_service.preview_entity = AsyncMock()
+
+    strategy = PreviewDataFetchStrategy(mock_service, limit=3)
+    await strategy.prepare("test_project", ["entity"])
+
+    df = await strategy.fetch("test_project", "entity")
+
+    mock_service.preview_entities_batch.assert_called_once_with("test_project", ["entity"], warm=False)
+    mock_service.preview_entity.assert_not_called()
+    assert len(df) == 3
+
+
+@pytest.mark.asyncio
+async def test_normalized_run_cache_is_bounded():
+    """NormalizedRunCache keeps at most max_entries runs and one version per project."""
+    run_cache = NormalizedRunCache(max_entries=2)
+
+    async def factory():
+        return Mock()
+
+    await run_cache.get_or_create("a", 1, factory)
+    await run_cache.get_or_create("a", 2, factory)
+    assert run_cache.get("a", 1) is None and run_cache.get("a", 2) is not None
+
+    await run_cache.get_or_create("b", 1, factory)
+    await run_cache.get_or_create("c", 1, factory)
+    assert len(run_cache) == 2 and run_cache.get("a", 2) is None
+
+    run_cache.invalidate("b")
+    assert run_cache.get("b", 1) is None
+
+
+@pytest.mark.asyncio
+async def test_normalized_run_cache_releases_lock_when_factory_fails():
+    """A failing normalization is not cached and does not leave its lock behind."""
+    run_cache = NormalizedRunCache(max_entries=2)
+
+    async def failing_factory():
+        raise RuntimeError("normalization failed")
+
+    with pytest.raises(RuntimeError):
+        await run_cache.get_or_create("a", 1, failing_factory)
+
+    assert run_cache.get("a", 1) is None
+    assert not run_cache._locks  # pylint: disable=protected-access
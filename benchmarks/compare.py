@@ -0,0 +1,103 @@
+"""
+Compare pytest-benchmark results against the stored baseline.
+
+Absolute timings depend on the machine, so every timing is divided by the timing of the
+`test_calibration` benchmark (a fixed pandas workload) before it is compared. The fastest round
+(`min`) is used rather than the median: it is the least affected by other load on the machine.
+A benchmark regresses when its relative timing exceeds the baseline by more than the threshold;
+the baseline file holds a default `threshold` and optional per-benchmark `thresholds`.
+
+    pytest benchmarks --benchmark-only --benchmark-json=.benchmarks/results.json
+    python -m benchmarks.compare .benchmarks/results.json            # check
+    python -m benchmarks.compare .benchmarks/results.json --update   # store as new baseline
+"""
+
+import argparse
+import json
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+BASELINE_PATH: Path = Path(__file__).parent / "baseline.json"
+CALIBRATION: str = "test_calibration"
+DEFAULT_THRESHOLD: float = 0.5
+STATISTIC: str = "min"
+
+
+@dataclass
+class Comparison:
+    name: str
+    baseline: float | None
+    current: float
+
+    @property
+    def change(self) -> float | None:
+        return None if not self.baseline else self.current / self.baseline - 1.0
+
+
+def load_results(path: str | Path) -> tuple[str, dict[str, float]]:
+    """Return the scale and the relative timing of each benchmark in a pytest-benchmark JSON file."""
+    results: dict[str, Any] = json.loads(Path(path).read_text(encoding="utf-8"))
+    timings: dict[str, float] = {item["name"]: item["stats"][STATISTIC] for item in results["benchmarks"]}
+    if CALIBRATION not in timings:
+        raise ValueError(f"{path}: '{CALIBRATION}' is missing; run the whole suite")
+    calibration: float = timings.pop(CALIBRATION)
+    return results.get("scale", "small"), {name: timing / calibration for name, timing in timings.items()}
+
+
+def compare(current: dict[str, float], baseline: dict[str, float]) -> list[Comparison]:
+    return [Comparison(name=name, baseline=baseline.get(name), current=value) for name, value in sorted(current.items())]
+
+
+def report(comparisons: list[Comparison], threshold: float, thresholds: dict[str, float] | None = None) -> list[Comparison]:
+    """Print a comparison table and return the regressions (`thresholds` overrides `threshold` per benchmark)."""
+    regressions: list[Comparison] = []
+    width: int = max((len(item.name) for item in comparisons), default=10)
+    print(f"{'benchmark':<{width}}  {'baseline':>10}  {'current':>10}  {'change':>8}")
+    for item in comparisons:
+        change: float | None = item.change
+        status: str = ""
+        if change is not None and change > (thresholds or {}).get(item.name, threshold):
+            regressions.append(item)
+            status = "  REGRESSION"
+        baseline: str = f"{item.baseline:10.3f}" if item.baseline is not None else f"{'new':>10}"
+        change_text: str = f"{change:+8.1%}" if change is not None else f"{'':>8}"
+        print(f"{item.name:<{width}}  {baseline}  {item.current:10.3f}  {change_text}{status}")
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("results", help="pytest-benchmark JSON output (--benchmark-json)")
+    parser.add_argument("--baseline", default=str(BASELINE_PATH), help="Baseline file")
+    parser.add_argument("--threshold", type=float, default=None, help="Allowed relative slowdown (default: from the baseline file)")
+    parser.add_argument("--update", action="store_true", help="Store the results as the baseline for their scale")
+    args: argparse.Namespace = parser.parse_args(argv)
+
+    scale, current = load_results(args.results)
+    baseline_path: Path = Path(args.baseline)
+    stored: dict[str, Any] = json.loads(baseline_path.read_text(encoding="utf-8")) if baseline_path.exists() else {}
+    threshold: float = args.threshold if args.threshold is not None else stored.get("threshold", DEFAULT_THRESHOLD)
+
+    if args.update:
+        stored["threshold"] = threshold
+        stored.setdefault("scales", {})[scale] = {name: round(value, 6) for name, value in sorted(current.items())}
+        baseline_path.write_text(json.dumps(stored, indent=2) + "\n", encoding="utf-8")
+        print(f"Stored {len(current)} benchmarks as the '{scale}' baseline in {baseline_path}")
+        return 0
+
+    baseline: dict[str, float] | None = stored.get("scales", {}).get(scale)
+    if baseline is None:
+        print(f"No '{scale}' baseline in {baseline_path}; run with --update to create one", file=sys.stderr)
+        return 2
+
+    regressions: list[Comparison] = report(compare(current, baseline), threshold, stored.get("thresholds"))
+    if regressions:
+        print(f"\n{len(regressions)} benchmark(s) regressed by more than their threshold (default {threshold:.0%})", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,82 @@
+"""
+Fixtures for the normalizer benchmarks.
+
+The size of the synthetic projects is selected with `SHAPESHIFT_BENCH_SCALE` (small, medium, large;
+default small). The same scale sets the row count of the single-frame benchmarks (`frame_spec`), so
+every benchmark is sized from here. Logging is reduced to warnings so that log formatting does not dominate timings.
+"""
+
+import asyncio
+import os
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+from loguru import logger
+
+from benchmarks.generator import SyntheticProject, SyntheticSpec, generate_project
+from src.normalizer import ShapeShifter
+
+# pylint: disable=redefined-outer-name
+
+SCALES: dict[str, dict[str, int]] = {
+    "small": {"entities": 8, "rows": 5_000, "cardinality": 50},
+    "medium": {"entities": 20, "rows": 50_000, "cardinality": 200},
+    "large": {"entities": 40, "rows": 500_000, "cardinality": 1_000},
+}
+
+# Rows of the single-frame benchmarks (filters, row hashes, unions, GIS, unnesting, entity values)
+FRAME_ROWS: dict[str, int] = {"small": 100_000, "medium": 1_000_000, "large": 10_000_000}
+
+
+def bench_scale() -> str:
+    scale: str = os.environ.get("SHAPESHIFT_BENCH_SCALE", "small")
+    if scale not in SCALES:
+        raise ValueError(f"Unknown SHAPESHIFT_BENCH_SCALE '{scale}' (expected one of {', '.join(SCALES)})")
+    return scale
+
+
+def bench_spec(**overrides) -> SyntheticSpec:
+    """Return the spec for the selected scale with `overrides` applied."""
+    return SyntheticSpec(**(SCALES[bench_scale()] | overrides))
+
+
+def frame_spec(**overrides) -> SyntheticSpec:
+    """Return the spec of a single-frame benchmark: `FRAME_ROWS` rows for the selected scale, with `overrides` applied."""
+    return bench_spec(**({"rows": FRAME_ROWS[bench_scale()]} | overrides))
+
+
+def normalize(synthetic: SyntheticProject) -> ShapeShifter:
+    """Run a full normalization of `synthetic` on a fresh table store."""
+    shapeshifter: ShapeShifter = ShapeShifter(
+        project=synthetic.project, default_entity=synthetic.default_entity, table_store=synthetic.fresh_table_store()
+    )
+    asyncio.run(shapeshifter.normalize())
+    return shapeshifter
+
+
+@pytest.fixture(scope="session", autouse=True)
+def quiet_logging():
+    logger.remove()
+    handler_id: int = logger.add(sys.stderr, level="WARNING")
+    yield
+    logger.remove(handler_id)
+
+
+@pytest.fixture(scope="session")
+def synthetic(tmp_path_factory: pytest.TempPathFactory) -> SyntheticProject:
+    """A project exercising every feature (replacements, append, merged, unnest) on an in-memory source."""
+    folder: Path = tmp_path_factory.mktemp("synthetic")
+    return generate_project(bench_spec(append_ratio=0.2, merged=1, unnest=1, replacements=True), folder)
+
+
+@pytest.fixture(scope="session")
+def normalized(synthetic: SyntheticProject) -> dict[str, pd.DataFrame]:
+    """The table store of `synthetic` after a full normalization."""
+    return normalize(synthetic).table_store
+
+
+def pytest_benchmark_update_json(config, benchmarks, output_json):  # pylint: disable=unused-argument
+    """Record the scale in the results so that `benchmarks.compare` only compares like with like."""
+    output_json["scale"] = bench_scale()
@@ -0,0 +1,237 @@
+"""
+Generator for synthetic ShapeShift projects used by the benchmark suite.
+
+A synthetic project has one wide source table (`survey`) and `entities` entities (`e0`, `e1`, ...)
+extracted from it. Every entity has a code column (`e<i>_code`) plus `value_columns` columns that
+are functionally dependent on the code, and foreign keys to up to `fan_out` earlier entities (whose
+code columns it also carries). Codes are derived from a hidden row-level id so that an entity's
+code determines the codes of all earlier entities, i.e. the entities form a proper hierarchy and
+every foreign key resolves to exactly one remote row. Options add append branches, merged entities, unnesting and
+replacements, and choose where the source table comes from: the table store, a fixed entity, a CSV
+file or a SQLite database. Everything is written to a local folder; no external services are used.
+"""
+
+import sqlite3
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Literal
+
+import numpy as np
+import pandas as pd
+
+from src.model import ShapeShiftProject
+
+SourceKind = Literal["store", "fixed", "csv", "sqlite"]
+
+SOURCE_ENTITY: str = "survey"
+DATA_SOURCE_NAME: str = "bench_sqlite"
+
+
+@dataclass(frozen=True)
+class SyntheticSpec:
+    """Shape of a synthetic project."""
+
+    entities: int = 10
+    rows: int = 10_000
+    fan_out: int = 2
+    cardinality: int = 100
+    value_columns: int = 2
+    append_ratio: float = 0.0
+    merged: int = 0
+    unnest: int = 0
+    replacements: bool = False
+    source: SourceKind = "store"
+    seed: int = 42
+
+    def entity_names(self) -> list[str]:
+        return [f"e{i}" for i in range(self.entities)]
+
+    def entity_cardinality(self, index: int) -> int:
+        """Distinct codes of entity `index`: `cardinality` doubled per level, capped near `rows`.
+
+        Each cardinality divides all later ones, which is what makes parent codes functions of child codes.
+        """
+        cardinality: int = max(self.cardinality, 1)
+        for _ in range(index):
+            if cardinality * 2 > max(self.rows, self.cardinality):
+                break
+            cardinality *= 2
+        return cardinality
+
+
+@dataclass
+class SyntheticProject:
+    """A generated project together with the data it reads."""
+
+    spec: SyntheticSpec
+    project: ShapeShiftProject
+    source: pd.DataFrame
+    folder: Path | None = None
+    table_store: dict[str, pd.DataFrame] = field(default_factory=dict)
+
+    @property
+    def default_entity(self) -> str | None:
+        return SOURCE_ENTITY if self.spec.source == "store" else None
+
+    def fresh_table_store(self) -> dict[str, pd.DataFrame]:
+        """Return a new table store for a run (the source table only, when it is held in memory)."""
+        return dict(self.table_store)
+
+
+def code_column(entity: str) -> str:
+    return f"{entity}_code"
+
+
+def value_column(entity: str, index: int) -> str:
+    return f"{entity}_v{index}"
+
+
+def parents_of(spec: SyntheticSpec, index: int) -> list[int]:
+    """Indices of the entities that entity `index` references (deterministic for a given seed)."""
+    if index == 0 or spec.fan_out <= 0:
+        return []
+    rng: np.random.Generator = np.random.default_rng(spec.seed + index)
+    candidates: np.ndarray = np.arange(index)
+    return sorted(int(parent) for parent in rng.choice(candidates, size=min(spec.fan_out, index), replace=False))
+
+
+def generate_source(spec: SyntheticSpec) -> pd.DataFrame:
+    """Generate the wide source table."""
+    rng: np.random.Generator = np.random.default_rng(spec.seed)
+    finest: int = max((spec.entity_cardinality(index) for index in range(spec.entities)), default=1)
+    row_ids: np.ndarray = rng.integers(0, finest, size=spec.rows)
+    columns: dict[str, Any] = {}
+    for index, entity in enumerate(spec.entity_names()):
+        cardinality: int = spec.entity_cardinality(index)
+        codes: np.ndarray = row_ids % cardinality
+        labels: np.ndarray = np.array([f"{entity}-{code:06d}" for code in rng.permutation(cardinality)], dtype=object)
+        columns[code_column(entity)] = labels[codes]
+        for value_index in range(spec.value_columns):
+            # Values depend on the code only, so deduplicating an entity keeps one row per code
+            columns[value_column(entity, value_index)] = (codes * (value_index + 7)) % 997 if value_index % 2 else codes.astype(str)
+    return pd.DataFrame(columns)
+
+
+def entity_config(spec: SyntheticSpec, index: int, source: str | None) -> dict[str, Any]:
+    entity: str = f"e{index}"
+    parents: list[int] = parents_of(spec, index)
+    parent_codes: list[str] = [code_column(f"e{parent}") for parent in parents]
+    values: list[str] = [value_column(entity, value_index) for value_index in range(spec.value_columns)]
+    columns: list[str] = [code_column(entity), *values, *parent_codes]
+
+    cfg: dict[str, Any] = {
+        "public_id": f"{entity}_id",
+        "keys": [code_column(entity)],
+        "columns": columns,
+        "drop_duplicates": True,
+        "depends_on": [source] if source else [],
+    }
+    if source:
+        cfg["source"] = source
+    if parents:
+        cfg["foreign_keys"] = [
+            {"entity": f"e{parent}", "local_keys": [code_column(f"e{parent}")], "remote_keys": [code_column(f"e{parent}")]}
+            for parent in parents
+        ]
+    if spec.replacements and values:
+        cfg["replacements"] = {values[0]: {str(code): f"code-{code}" for code in range(0, spec.entity_cardinality(index), 3)}}
+    return cfg
+
+
+def build_config(spec: SyntheticSpec, folder: Path | None, source: pd.DataFrame) -> dict[str, Any]:
+    """Build the project configuration dict for `spec`."""
+    rng: np.random.Generator = np.random.default_rng(spec.seed)
+    entities: dict[str, dict[str, Any]] = {}
+    options: dict[str, Any] = {}
+
+    source_entity: str | None = SOURCE_ENTITY
+    if spec.source == "fixed":
+        entities[SOURCE_ENTITY] = {
+            "type": "fixed",
+            "public_id": f"{SOURCE_ENTITY}_id",
+            "keys": [code_column(f"e{spec.entities - 1}")],
+            "columns": list(source.columns),
+            "values": source.values.tolist(),
+        }
+    elif spec.source == "csv":
+        assert folder is not None
+        entities[SOURCE_ENTITY] = {
+            "type": "csv",
+            "columns": list(source.columns),
+            "options": {"filename": str(folder / f"{SOURCE_ENTITY}.csv"), "sep": ","},
+        }
+    elif spec.source == "sqlite":
+        assert folder is not None
+        options["data_sources"] = {DATA_SOURCE_NAME: {"driver": "sqlite", "options": {"filename": str(folder / "bench.db")}}}
+        entities[SOURCE_ENTITY] = {
+            "type": "sql",
+            "data_source": DATA_SOURCE_NAME,
+            "query": f"select * from {SOURCE_ENTITY}",
+            "columns": list(source.columns),
+        }
+    else:
+        source_entity = None  # read from the table store via default_entity
+
+    for index in range(spec.entities):
+        entities[f"e{index}"] = entity_config(spec, index, source_entity)
+
+    # Append a fixed row to a share of the entities
+    append_count: int = int(round(spec.append_ratio * spec.entities))
+    for index in sorted(rng.choice(spec.entities, size=append_count, replace=False)) if append_count else []:
+        cfg: dict[str, Any] = entities[f"e{index}"]
+        # The appended row gets a new code but references existing parents
+        row: list[Any] = [f"e{index}-appended"] + [
+            source[column].iloc[0] if column.endswith("_code") else f"appended-{column}" for column in cfg["columns"][1:]
+        ]
+        cfg["append"] = [{"type": "fixed", "values": [row]}]
+        cfg["append_mode"] = "all"
+
+    # Unnest the value columns of the last `unnest` entities
+    for index in range(max(spec.entities - spec.unnest, 0), spec.entities):
+        cfg = entities[f"e{index}"]
+        values: list[str] = [value_column(f"e{index}", value_index) for value_index in range(spec.value_columns)]
+        if not values:
+            continue
+        cfg["unnest"] = {
+            "id_vars": [column for column in cfg["columns"] if column not in values],
+            "value_vars": values,
+            "var_name": "attribute",
+            "value_name": "value",
+        }
+
+    # Merge pairs of entities into merged entities
+    for merged_index in range(min(spec.merged, spec.entities // 2)):
+        left, right = f"e{2 * merged_index}", f"e{2 * merged_index + 1}"
+        entities[f"m{merged_index}"] = {
+            "type": "merged",
+            "public_id": f"m{merged_index}_id",
+            "columns": [code_column(left), code_column(right)],
+            "branches": [
+                {"name": left, "source": left, "keys": [code_column(left)]},
+                {"name": right, "source": right, "keys": [code_column(right)]},
+            ],
+        }
+
+    return {"metadata": {"name": "synthetic", "version": "1.0.0", "spec": asdict(spec)}, "options": options, "entities": entities}
+
+
+def generate_project(spec: SyntheticSpec, folder: str | Path | None = None) -> SyntheticProject:
+    """Generate a synthetic project (and, for file/database sources, its data files in `folder`)."""
+    target: Path | None = Path(folder) if folder is not None else None
+    if spec.source in ("csv", "sqlite"):
+        if target is None:
+            raise ValueError(f"A folder is required for '{spec.source}' sources")
+        target.mkdir(parents=True, exist_ok=True)
+
+    source: pd.DataFrame = generate_source(spec)
+    if spec.source == "csv":
+        source.to_csv(target / f"{SOURCE_ENTITY}.csv", index=False)  # type: ignore[operator]
+    elif spec.source == "sqlite":
+        with sqlite3.connect(target / "bench.db") as connection:  # type: ignore[operator]
+            source.to_sql(SOURCE_ENTITY, connection, index=False, if_exists="replace")
+
+    project: ShapeShiftProject = ShapeShiftProject(
+        cfg=build_config(spec, target, source), filename=str(target / "synthetic.yml") if target else None
+    )
+    table_store: dict[str, pd.DataFrame] = {SOURCE_ENTITY: source} if spec.source == "store" else {}
+    return SyntheticProject(spec=spec, project=project, source=source, folder=target, table_store=table_store)
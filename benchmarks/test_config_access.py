@@ -0,0 +1,46 @@
+"""Micro-benchmark of entity-config access overhead on a project with many entities (1000 at the small scale)."""
+
+from typing import Any
+
+import pytest
+
+from benchmarks.conftest import bench_spec
+from benchmarks.generator import SyntheticProject, generate_project
+from src.model import ShapeShiftProject
+
+# pylint: disable=redefined-outer-name
+
+ENTITIES: int = 125 * bench_spec().entities
+PASSES: int = 5
+
+
+@pytest.fixture(scope="module")
+def wide_project() -> SyntheticProject:
+    return generate_project(bench_spec(entities=ENTITIES, rows=200, cardinality=10, fan_out=3, append_ratio=0.2, unnest=50))
+
+
+def access_configs(project: ShapeShiftProject) -> int:
+    """Touch the derived config properties the way normalize, linking and the specifications do."""
+    touched: int = 0
+    for _ in range(PASSES):
+        for table in project.tables.values():
+            touched += len(table.keys_columns_and_fks) + len(table.fk_columns) + len(table.unnest_columns)
+            touched += len(table.safe_columns) + len(table.extra_column_names) + len(table.hash())
+            touched += sum(1 for _ in table.get_sub_table_configs())
+    return touched
+
+
+def test_config_access(benchmark, wide_project: SyntheticProject):
+    project: ShapeShiftProject = wide_project.project
+
+    touched: int = benchmark(access_configs, project)
+
+    assert touched > ENTITIES * PASSES
+
+
+def test_config_access_cold(benchmark, wide_project: SyntheticProject):
+    cfg: dict[str, Any] = wide_project.project.cfg
+
+    touched: int = benchmark(lambda: access_configs(ShapeShiftProject(cfg=cfg)))
+
+    assert touched > ENTITIES * PASSES
@@ -0,0 +1,37 @@
+"""End-to-end benchmarks: normalize a synthetic project and dispatch the result."""
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from benchmarks.conftest import bench_spec, normalize
+from benchmarks.generator import SyntheticProject, generate_project
+from src.dispatch import Dispatcher, Dispatchers
+
+# pylint: disable=redefined-outer-name
+
+
+@pytest.mark.parametrize("source", ["store", "fixed", "csv", "sqlite"])
+def test_normalize(benchmark, tmp_path: Path, source: str):
+    synthetic: SyntheticProject = generate_project(bench_spec(source=source), tmp_path)
+
+    table_store: dict[str, pd.DataFrame] = benchmark.pedantic(lambda: normalize(synthetic).table_store, rounds=3, iterations=1)
+
+    assert all(f"e{index}" in table_store for index in range(synthetic.spec.entities))
+
+
+def test_normalize_all_features(benchmark, synthetic: SyntheticProject):
+    table_store: dict[str, pd.DataFrame] = benchmark.pedantic(lambda: normalize(synthetic).table_store, rounds=3, iterations=1)
+
+    assert "m0" in table_store
+
+
+@pytest.mark.parametrize("dispatcher", ["csv", "parquet"])
+def test_dispatch(benchmark, tmp_path: Path, synthetic: SyntheticProject, normalized: dict[str, pd.DataFrame], dispatcher: str):
+    target: Path = tmp_path / "output"
+    dispatcher_cls: type[Dispatcher] = Dispatchers.get(dispatcher)
+
+    benchmark.pedantic(lambda: dispatcher_cls(synthetic.project).dispatch(str(target), normalized), rounds=3, iterations=1)
+
+    assert any(target.iterdir())
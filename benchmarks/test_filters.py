@@ -0,0 +1,56 @@
+"""Benchmarks for entity filters: `exists_in` lookups shared across entities and stages, and compiled query filters."""
+
+from dataclasses import replace
+
+import pandas as pd
+import pytest
+
+from benchmarks.conftest import frame_spec
+from benchmarks.generator import SyntheticSpec, generate_source
+from src.transforms.filter import ExistsInFilter, FilterCache, QueryFilter
+
+# pylint: disable=redefined-outer-name
+
+ENTITIES: int = 5
+
+
+@pytest.fixture(scope="module")
+def frames() -> tuple[pd.DataFrame, dict[str, pd.DataFrame]]:
+    """A synthetic source with two entity levels and a lookup entity of a fifth of its rows keyed on both codes."""
+    spec: SyntheticSpec = frame_spec(entities=2, value_columns=2, fan_out=0)
+    df: pd.DataFrame = generate_source(replace(spec, cardinality=spec.rows // 10))
+    lookup: pd.DataFrame = df.sample(n=spec.rows // 5, random_state=spec.seed)[["e0_code", "e1_code"]]
+    return df, {"lookup": lookup}
+
+
+def test_exists_in_shared_lookup(benchmark, frames: tuple[pd.DataFrame, dict[str, pd.DataFrame]]):
+    """`ENTITIES` entities filtering against the same lookup column, as within one run."""
+    df, data_store = frames
+    filter_cfg: dict[str, str] = {"type": "exists_in", "column": "e1_code", "other_entity": "lookup"}
+
+    def run() -> int:
+        cache: FilterCache = FilterCache()
+        return sum(len(ExistsInFilter().apply(df, filter_cfg, data_store, cache=cache)) for _ in range(ENTITIES))
+
+    kept: int = benchmark.pedantic(run, rounds=3, iterations=1)
+
+    assert 0 < kept < len(df) * ENTITIES
+
+
+def test_exists_in_multi_column(benchmark, frames: tuple[pd.DataFrame, dict[str, pd.DataFrame]]):
+    df, data_store = frames
+    filter_cfg: dict[str, object] = {"type": "exists_in", "column": ["e0_code", "e1_code"], "other_entity": "lookup"}
+
+    result: pd.DataFrame = benchmark.pedantic(lambda: ExistsInFilter().apply(df, filter_cfg, data_store), rounds=3, iterations=1)
+
+    assert len(data_store["lookup"]) <= len(result) < len(df)
+
+
+def test_query_filter(benchmark, frames: tuple[pd.DataFrame, dict[str, pd.DataFrame]]):
+    df, _ = frames
+    filter_cfg: dict[str, str] = {"type": "query", "query": "e0_v1 > 250 and e1_v1 * 2 < 1500 and e0_v1 not in [1, 2, 3]"}
+    cache: FilterCache = FilterCache()
+
+    result: pd.DataFrame = benchmark.pedantic(lambda: QueryFilter().apply(df, filter_cfg, {}, cache=cache), rounds=5, iterations=1)
+
+    assert 0 < len(result) < len(df)
@@ -0,0 +1,63 @@
+"""Benchmarks for the GIS transforms: coordinates in 10 source CRSs converted to WGS84, and lat/long splitting."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from benchmarks.conftest import frame_spec
+from benchmarks.generator import SyntheticSpec
+from src.transforms.gis import WGS84, ConvertCRS, TransformSplitLatLong, get_transformer
+
+# pylint: disable=redefined-outer-name
+
+# SWEREF 99 (national and local zones), RT90 and DHDN / ETRS89 zones used by the SEAD sources
+SOURCE_CRS: dict[str, tuple[float, float, float, float]] = {
+    "EPSG:3006": (11.0, 24.0, 55.5, 68.5),
+    "EPSG:3007": (11.5, 13.0, 55.5, 59.5),
+    "EPSG:3008": (12.5, 14.0, 55.5, 63.0),
+    "EPSG:3009": (14.0, 15.5, 56.0, 62.5),
+    "EPSG:3010": (15.0, 16.5, 56.0, 63.0),
+    "EPSG:3021": (11.0, 24.0, 55.5, 68.5),
+    "EPSG:31466": (5.9, 7.5, 49.0, 52.0),
+    "EPSG:31467": (7.5, 10.5, 47.5, 55.0),
+    "EPSG:31468": (10.5, 13.5, 47.5, 54.5),
+    "EPSG:25832": (6.0, 12.0, 47.5, 55.0),
+}
+
+
+@pytest.fixture(scope="module")
+def coordinates() -> pd.DataFrame:
+    """Projected points, shuffled across 10 source CRSs (generated from WGS84 points inside each CRS's area)."""
+    spec: SyntheticSpec = frame_spec()
+    rng: np.random.Generator = np.random.default_rng(spec.seed)
+    crs_codes: np.ndarray = rng.integers(0, len(SOURCE_CRS), size=spec.rows)
+    labels: np.ndarray = np.array(list(SOURCE_CRS), dtype=object)
+    x: np.ndarray = np.empty(spec.rows)
+    y: np.ndarray = np.empty(spec.rows)
+    for code, (crs, (min_lon, max_lon, min_lat, max_lat)) in enumerate(SOURCE_CRS.items()):
+        rows: np.ndarray = np.flatnonzero(crs_codes == code)
+        lon: np.ndarray = rng.uniform(min_lon, max_lon, size=len(rows))
+        lat: np.ndarray = rng.uniform(min_lat, max_lat, size=len(rows))
+        x[rows], y[rows] = get_transformer(WGS84, crs).transform(lon, lat)
+    return pd.DataFrame({"x": x, "y": y, "crs": labels[crs_codes]})
+
+
+def test_convert_crs_by_row(benchmark, coordinates: pd.DataFrame):
+    result: pd.DataFrame = benchmark.pedantic(
+        lambda: ConvertCRS().apply(coordinates, ["x", "y"], src_crs_label_column="crs", dst_crs=WGS84), rounds=3, iterations=1
+    )
+
+    assert result["lat"].between(47.0, 69.0).all()
+
+
+def test_geo_split(benchmark):
+    spec: SyntheticSpec = frame_spec()
+    rows: int = spec.rows // 5
+    rng: np.random.Generator = np.random.default_rng(spec.seed)
+    points: pd.DataFrame = pd.DataFrame(
+        {"point": [f"{lat:.5f}, {lon:.5f}" for lat, lon in zip(rng.uniform(55, 69, rows), rng.uniform(11, 24, rows))]}
+    )
+
+    result: pd.DataFrame = benchmark.pedantic(lambda: TransformSplitLatLong().apply(points, "point"), rounds=3, iterations=1)
+
+    assert result["point_lat"].notna().all()
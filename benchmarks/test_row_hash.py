@@ -0,0 +1,44 @@
+"""Benchmarks for the row-hash engine on a wide synthetic source: deduplication, duplicate-key checks and empty-row drops."""
+
+from dataclasses import replace
+
+import pandas as pd
+import pytest
+
+from benchmarks.conftest import frame_spec
+from benchmarks.generator import SyntheticSpec, generate_source
+from src.transforms.drop import RowHashCache, drop_duplicate_rows, drop_empty_rows, has_duplicate_rows
+
+# pylint: disable=redefined-outer-name
+
+
+@pytest.fixture(scope="module")
+def wide() -> pd.DataFrame:
+    """Three entity levels with string and integer values; codes determine their values and about half the rows repeat."""
+    spec: SyntheticSpec = frame_spec(entities=3, value_columns=2, fan_out=0)
+    return generate_source(replace(spec, cardinality=spec.rows // 8))
+
+
+def test_drop_duplicates_all_columns(benchmark, wide: pd.DataFrame):
+    result: pd.DataFrame = benchmark.pedantic(lambda: drop_duplicate_rows(wide, columns=True), rounds=2, iterations=1)
+
+    assert 0 < len(result) < len(wide)
+
+
+def test_drop_duplicates_and_key_check(benchmark, wide: pd.DataFrame):
+    """Dedup on the key with a functional dependency check, then the duplicate-key check on the result, as in normalize."""
+
+    def run() -> bool:
+        cache: RowHashCache = RowHashCache()
+        result: pd.DataFrame = drop_duplicate_rows(wide, columns=["e2_code"], fd_check=True, strict_fd_check=False, cache=cache)
+        return has_duplicate_rows(result, ["e2_code"], cache=cache)
+
+    assert benchmark.pedantic(run, rounds=2, iterations=1) is False
+
+
+def test_drop_empty_rows(benchmark, wide: pd.DataFrame):
+    result: pd.DataFrame = benchmark.pedantic(
+        lambda: drop_empty_rows(data=wide, entity_name="wide", subset=["e0_v0", "e1_v0"]), rounds=2, iterations=1
+    )
+
+    assert len(result) == len(wide)
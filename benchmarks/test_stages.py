@@ -0,0 +1,93 @@
+"""Benchmarks of the individual normalization stages on a synthetic project."""
+
+import pandas as pd
+import pytest
+
+from benchmarks.generator import SOURCE_ENTITY, SyntheticProject
+from src.extract import SubsetService
+from src.model import ForeignKeyConfig, TableConfig
+from src.transforms.drop import drop_duplicate_rows, drop_empty_rows
+from src.transforms.link import ForeignKeyLinker
+from src.transforms.replace import apply_replacements
+from src.transforms.unnest import unnest
+
+# pylint: disable=redefined-outer-name
+
+
+@pytest.fixture(scope="module")
+def linked_entity(synthetic: SyntheticProject) -> TableConfig:
+    """The entity with the most foreign keys (ties broken by the largest cardinality)."""
+    tables: list[TableConfig] = [synthetic.project.get_table(entity_name=f"e{index}") for index in range(synthetic.spec.entities)]
+    return max((table for table in tables if not table.unnest), key=lambda table: (len(table.foreign_keys), table.entity_name))
+
+
+@pytest.fixture(scope="module")
+def source(synthetic: SyntheticProject) -> pd.DataFrame:
+    return synthetic.source
+
+
+def test_calibration(benchmark):
+    """Fixed pandas workload used to normalize timings across machines (see benchmarks/compare.py)."""
+    frame: pd.DataFrame = pd.DataFrame({"key": [f"k{index % 5_000}" for index in range(100_000)], "value": range(100_000)})
+
+    result: pd.DataFrame = benchmark(lambda: frame.drop_duplicates(subset=["key"]).merge(frame, on="key", how="inner"))
+
+    assert len(result) == 100_000
+
+
+def test_subset(benchmark, source: pd.DataFrame, linked_entity: TableConfig):
+    service: SubsetService = SubsetService()
+
+    result: pd.DataFrame = benchmark(service.get_subset, source=source, table_cfg=linked_entity, drop_empty=False, raise_if_missing=False)
+
+    assert 0 < len(result) <= len(source)
+
+
+def test_replacements(benchmark, source: pd.DataFrame, synthetic: SyntheticProject):
+    table_cfg: TableConfig = synthetic.project.get_table(entity_name="e0")
+    assert table_cfg.replacements
+
+    result: pd.DataFrame = benchmark(apply_replacements, source, replacements=table_cfg.replacements, entity_name=table_cfg.entity_name)
+
+    assert len(result) == len(source)
+
+
+@pytest.mark.parametrize("columns", [True, ["e0_code"]], ids=["all_columns", "key_columns"])
+def test_drop_duplicates(benchmark, source: pd.DataFrame, columns: bool | list[str]):
+    result: pd.DataFrame = benchmark(drop_duplicate_rows, source, columns=columns, entity_name=SOURCE_ENTITY)
+
+    assert len(result) <= len(source)
+
+
+def test_drop_empty_rows(benchmark, source: pd.DataFrame):
+    result: pd.DataFrame = benchmark(drop_empty_rows, data=source, entity_name=SOURCE_ENTITY, subset=True)
+
+    assert len(result) == len(source)
+
+
+def test_link_foreign_keys(benchmark, synthetic: SyntheticProject, normalized: dict[str, pd.DataFrame], linked_entity: TableConfig):
+    foreign_keys: list[ForeignKeyConfig] = linked_entity.foreign_keys
+    remote_ids: list[str] = [synthetic.project.get_table(entity_name=fk.remote_entity).public_id for fk in foreign_keys]
+    local_df: pd.DataFrame = normalized[linked_entity.entity_name].drop(columns=remote_ids)
+
+    def link_all() -> pd.DataFrame:
+        linker: ForeignKeyLinker = ForeignKeyLinker(project=synthetic.project, table_store=normalized)
+        linked: pd.DataFrame = local_df
+        for fk in foreign_keys:
+            linked = linker.link_foreign_key(linked, fk, normalized[fk.remote_entity])
+        return linked
+
+    result: pd.DataFrame = benchmark(link_all)
+
+    assert len(result) == len(local_df)
+    assert set(remote_ids) <= set(result.columns)
+
+
+def test_unnest(benchmark, synthetic: SyntheticProject, source: pd.DataFrame):
+    table_cfg: TableConfig = synthetic.project.get_table(entity_name=f"e{synthetic.spec.entities - 1}")
+    assert table_cfg.unnest is not None
+    data: pd.DataFrame = SubsetService().get_subset(source=source, table_cfg=table_cfg, drop_empty=False)
+
+    result: pd.DataFrame = benchmark(unnest, table_cfg.entity_name, data, table_cfg)
+
+    assert len(result) == len(data) * len(table_cfg.unnest.value_vars)
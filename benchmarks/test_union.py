@@ -0,0 +1,41 @@
+"""Benchmark of the streaming union of 40 append branches (yearly extracts of a synthetic source) into one entity."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from benchmarks.conftest import frame_spec
+from benchmarks.generator import generate_source
+from src.transforms.union import StreamingUnion
+
+# pylint: disable=redefined-outer-name
+
+BRANCHES: int = 40
+
+
+@pytest.fixture(scope="module")
+def branches() -> list[pd.DataFrame]:
+    """Yearly extracts whose schema drifts: a column added half-way and a column that is all-NA in early years."""
+    source: pd.DataFrame = generate_source(frame_spec(entities=2, value_columns=2, fan_out=0))
+    dfs: list[pd.DataFrame] = []
+    for year, rows in enumerate(np.array_split(np.arange(len(source)), BRANCHES)):
+        df: pd.DataFrame = source.iloc[rows].reset_index(drop=True).assign(year=1980 + year)
+        if year < BRANCHES // 4:
+            df["e1_v0"] = None
+        if year < BRANCHES // 2:
+            df = df.drop(columns=["e1_v1"])
+        dfs.append(df)
+    return dfs
+
+
+def test_streaming_union(benchmark, branches: list[pd.DataFrame]):
+    def run() -> pd.DataFrame:
+        union: StreamingUnion = StreamingUnion()
+        for df in branches:
+            union.append(df)
+        return union.result()
+
+    result: pd.DataFrame = benchmark.pedantic(run, rounds=3, iterations=1)
+
+    assert len(result) == sum(len(df) for df in branches)
+    assert result["e1_v1"].dtype == np.float64 and result["e1_v0"].dtype == object
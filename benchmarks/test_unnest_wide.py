@@ -0,0 +1,44 @@
+"""Benchmarks for unnesting a wide measurement sheet: a tenth of the scale's rows x 200 mostly-null value columns."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from benchmarks.conftest import frame_spec
+from benchmarks.generator import SyntheticSpec
+from src.transforms.unnest import melt_frame
+
+# pylint: disable=redefined-outer-name
+
+VALUE_VARS: int = 200
+FILLED: float = 0.1
+
+
+@pytest.fixture(scope="module")
+def sheet() -> pd.DataFrame:
+    """Two id columns and 200 float measurement columns where about 10% of the cells hold a value."""
+    spec: SyntheticSpec = frame_spec()
+    rows: int = spec.rows // 10
+    rng: np.random.Generator = np.random.default_rng(spec.seed)
+    data: dict[str, np.ndarray] = {
+        "sample_id": np.arange(rows),
+        "sample_name": np.array([f"sample-{value:07d}" for value in range(rows)], dtype=object),
+    }
+    for index in range(VALUE_VARS):
+        data[f"m{index:03d}"] = np.where(rng.random(rows) < FILLED, rng.random(rows), np.nan)
+    return pd.DataFrame(data)
+
+
+@pytest.mark.parametrize("drop_na", [False, True])
+def test_unnest_wide(benchmark, sheet: pd.DataFrame, drop_na: bool):
+    value_vars: list[str] = [column for column in sheet.columns if column.startswith("m")]
+
+    result: pd.DataFrame = benchmark.pedantic(
+        lambda: melt_frame(
+            sheet, id_vars=["sample_id", "sample_name"], value_vars=value_vars, var_name="method", value_name="value", drop_na=drop_na
+        ),
+        rounds=2,
+        iterations=1,
+    )
+
+    assert len(result) < len(sheet) * VALUE_VARS * (FILLED * 1.1) if drop_na else len(result) == len(sheet) * VALUE_VARS
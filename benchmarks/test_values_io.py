@@ -0,0 +1,56 @@
+"""Benchmarks for materialized entity values: writing a synthetic entity and serving it to the editor."""
+
+from pathlib import Path
+from unittest.mock import Mock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from backend.app.services.entity_values_service import EntityValuesService
+from benchmarks.conftest import frame_spec
+from benchmarks.generator import SyntheticSpec, generate_source
+
+# pylint: disable=redefined-outer-name, protected-access
+
+PAGE_SIZE: int = 10_000
+
+
+@pytest.fixture(scope="module")
+def materialized() -> pd.DataFrame:
+    """A synthetic entity shaped like a materialized fixed entity (system id, nullable public id, code and values)."""
+    spec: SyntheticSpec = frame_spec(entities=1, value_columns=2, fan_out=0)
+    rng: np.random.Generator = np.random.default_rng(spec.seed)
+    source: pd.DataFrame = generate_source(spec)
+    ids: np.ndarray = np.arange(spec.rows)
+    return source.assign(
+        system_id=ids + 1, entity_id=pd.array(np.where(rng.random(spec.rows) < 0.1, None, ids), dtype="Int64"), value=rng.random(spec.rows)
+    )
+
+
+@pytest.fixture
+def service() -> EntityValuesService:
+    return EntityValuesService(project_service=Mock())
+
+
+@pytest.mark.parametrize("format_type", ["parquet", "csv"])
+def test_write_values(benchmark, tmp_path: Path, service: EntityValuesService, materialized: pd.DataFrame, format_type: str):
+    file_path: Path = tmp_path / f"entity.{format_type}"
+
+    benchmark.pedantic(lambda: service._write_values_frame(file_path, materialized, format_type), rounds=3, iterations=1)
+
+    assert file_path.stat().st_size > 0
+
+
+@pytest.mark.parametrize("format_type", ["parquet", "csv"])
+def test_read_values_page(benchmark, tmp_path: Path, service: EntityValuesService, materialized: pd.DataFrame, format_type: str):
+    """A page from the middle of the file, as the editor requests it (the CSV row count is memoized per file version)."""
+    file_path: Path = tmp_path / f"entity.{format_type}"
+    service._write_values_frame(file_path, materialized, format_type)
+
+    page, _, row_count = benchmark.pedantic(
+        lambda: service._read_values_frame(file_path, offset=len(materialized) // 2, limit=PAGE_SIZE), rounds=5, iterations=1
+    )
+
+    assert len(page.columns) == len(materialized.columns) and len(page) == PAGE_SIZE
+    assert row_count == len(materialized)
@@ -46,8 +46,9 @@ export interface EntityValuesResponse {
   columns: string[]
   values: unknown[][]
   format: string
-  row_count: number
+  row_count: number // Total number of rows (values may hold a page)
   etag: string
+  offset?: number
 }
 
 export interface EntityValuesUpdateRequest {
@@ -133,13 +134,15 @@ export const entitiesApi = {
    * Get external values for entity with @load: directive
    * 
    * @param format - Optional format negotiation (parquet/csv)
+   * @param page - Optional page of rows (offset/limit); all rows when omitted
    */
   getValues: async (
     projectName: string,
     entityName: string,
-    format?: string
+    format?: string,
+    page?: { offset: number; limit: number }
   ): Promise<EntityValuesResponse> => {
-    const params = format ? { format } : undefined
+    const params = format || page ? { ...(format ? { format } : {}), ...page } : undefined
     return apiRequest<EntityValuesResponse>({
       method: 'GET',
       url: `/projects/${projectName}/entities/${entityName}/values`,
@@ -28,6 +28,11 @@ export interface ExecuteResult {
   download_path: string | null
 }
 
+export interface WorkflowJob {
+  operation_id: string
+  message: string
+}
+
 export const executeApi = {
   /**
    * Get list of available dispatchers
@@ -46,5 +51,15 @@ export const executeApi = {
       request
     )
     return response.data
+  },
+
+  /**
+   * Start workflow execution as a background job.
+   * Follow progress with the operation endpoints (`/operations/{operation_id}/stream`, `.../cancel`);
+   * the final ExecuteResult is delivered in the progress `metadata.result`.
+   */
+  async submitWorkflowJob(projectName: string, request: ExecuteRequest): Promise<WorkflowJob> {
+    const response = await apiClient.post<WorkflowJob>(`/projects/${projectName}/execute/jobs`, request)
+    return response.data
   }
 }
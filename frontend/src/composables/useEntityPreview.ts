@@ -34,6 +34,7 @@ export interface PreviewResult {
   dependencies_loaded: string[]
   cache_hit: boolean
   validation_issues: PreviewValidationIssue[]
+  truncated_entities?: string[]
 }
 
 export function useEntityPreview() {
@@ -45,6 +45,7 @@ export interface EntityTaskStatus {
   has_note: boolean
   blocked_by: string[]
   issues: string[]
+  validation_pending?: boolean // Being (re)validated in the background
 }
 
 /**
@@ -66,6 +67,7 @@ export interface ProjectTaskStatus {
     required_todo: number
     completion_percentage: number
   }
+  validation_operation_id?: string | null
 }
 
 /**
@@ -92,10 +94,46 @@ export function useTaskStatus(projectName?: Ref<string> | string) {
     typeof projectName === 'string' ? projectName : projectName?.value ?? ''
   )
 
+  let validationStream: EventSource | null = null
+
+  /**
+   * Apply entity statuses pushed by a background validation operation
+   */
+  function followValidation(operationId?: string | null): void {
+    validationStream?.close()
+    validationStream = null
+    if (!operationId) return
+
+    validationStream = new EventSource(`${apiClient.defaults.baseURL}/operations/${operationId}/stream`)
+    validationStream.onmessage = (event) => {
+      const operation = JSON.parse(event.data)
+      const entities: Record<string, EntityTaskStatus> = operation.metadata?.entities ?? {}
+      if (taskStatus.value) {
+        for (const [name, status] of Object.entries(entities)) {
+          taskStatus.value.entities[name] = { ...taskStatus.value.entities[name], ...status }
+        }
+      }
+      if (['completed', 'failed', 'cancelled'].includes(operation.status)) {
+        validationStream?.close()
+        validationStream = null
+        if (operation.status === 'completed') {
+          // Pick up updated completion stats (served from the validation cache)
+          void fetchTaskStatus()
+        }
+      }
+    }
+    validationStream.onerror = () => {
+      validationStream?.close()
+      validationStream = null
+    }
+  }
+
   /**
    * Fetch task status for the project
+   *
+   * @param refresh - Discard the backend's cached validation results and validate all entities again
    */
-  async function fetchTaskStatus(): Promise<void> {
+  async function fetchTaskStatus(refresh = false): Promise<void> {
     if (!project.value) {
       error.value = 'No project specified'
       return
@@ -105,10 +143,13 @@ export function useTaskStatus(projectName?: Ref<string> | string) {
     error.value = null
 
     try {
+      // Changed entities are validated in the background; their statuses are pushed as they finish
       const response = await apiClient.get<ProjectTaskStatus>(
-        `/projects/${project.value}/tasks`
+        `/projects/${project.value}/tasks`,
+        { params: { background: true, refresh } }
       )
       taskStatus.value = response.data
+      followValidation(response.data.validation_operation_id)
     } catch (err: any) {
       error.value = err.response?.data?.detail || err.message || 'Failed to fetch task status'
       console.error('Failed to fetch task status:', err)
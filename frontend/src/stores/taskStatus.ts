@@ -37,14 +37,16 @@ export const useTaskStatusStore = defineStore('taskStatus', () => {
 
   /**
    * Refresh task status from API
+   *
+   * @param revalidate - Discard cached validation results (e.g. after an explicit validation run)
    */
-  async function refresh(): Promise<void> {
+  async function refresh(revalidate = false): Promise<void> {
     if (!currentProjectName.value) return
 
     loading.value = true
     error.value = null
 
-    await taskComposable.fetchTaskStatus()
+    await taskComposable.fetchTaskStatus(revalidate)
 
     // Sync state from composable
     taskStatus.value = taskComposable.taskStatus.value
@@ -4,7 +4,7 @@
 
 export type Cardinality = 'one_to_one' | 'many_to_one' | 'one_to_many' | 'many_to_many'
 export type JoinType = 'left' | 'inner' | 'outer' | 'right' | 'cross'
-export type EntityType = 'entity' | 'sql' | 'fixed' | 'csv' | 'xlsx' | 'openpyxl' | 'merged'
+export type EntityType = 'entity' | 'sql' | 'fixed' | 'csv' | 'xlsx' | 'openpyxl' | 'parquet' | 'feather' | 'merged'
 export type FilterStage = 'extract' | 'after_link' | 'after_unnest'
 
 export interface EntityFileOptions {
@@ -41,6 +41,7 @@ export interface UnnestConfig {
   value_vars: string[]
   var_name: string
   value_name: string
+  drop_na?: boolean
 }
 
 export interface FilterConfig {
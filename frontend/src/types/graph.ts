@@ -5,7 +5,7 @@
 export interface GraphNode {
   id: string
   label: string
-  type?: 'entity' | 'sql' | 'fixed' | 'csv' | 'xlsx' | 'openpyxl' | 'merged'
+  type?: 'entity' | 'sql' | 'fixed' | 'csv' | 'xlsx' | 'openpyxl' | 'parquet' | 'feather' | 'merged'
   status?: 'valid' | 'warning' | 'error'
   topological_order?: number
   data?: any
@@ -31,7 +31,7 @@ export interface DependencyNode {
   name: string
   depends_on: string[]
   depth: number
-  type?: 'entity' | 'sql' | 'fixed' | 'csv' | 'xlsx' | 'openpyxl' | 'merged'
+  type?: 'entity' | 'sql' | 'fixed' | 'csv' | 'xlsx' | 'openpyxl' | 'parquet' | 'feather' | 'merged'
   materialized?: boolean
 }
 
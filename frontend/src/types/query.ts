@@ -9,6 +9,9 @@ export interface QueryResult {
   execution_time_ms: number
   is_truncated: boolean
   total_rows: number | null
+  cursor?: string | null
+  offset?: number
+  next_offset?: number | null
 }
 
 export interface QueryValidation {
@@ -24,4 +27,5 @@ export interface QueryExecution {
   query: string
   limit?: number
   timeout?: number
+  page_size?: number
 }
@@ -57,6 +57,7 @@ class SeadIngester:
         self.schema_service = SchemaService(
             db_uri=self.db_uri,
             ignore_columns=self.config.extra.get("ignore_columns") if self.config.extra else None,
+            snapshot_folder=self.config.extra.get("schema_snapshot_folder") if self.config.extra else None,
         )
         self.schema: SeadSchema | None = None
 
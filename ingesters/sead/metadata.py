@@ -1,11 +1,17 @@
+import contextlib
+import hashlib
+import os
+import pickle
 from collections.abc import ItemsView, Iterator, KeysView, ValuesView
 from dataclasses import asdict, dataclass, field
 from fnmatch import fnmatch
 from functools import cached_property
+from pathlib import Path
 from typing import Any, cast
 
 # pylint: disable=no-member
 import pandas as pd
+from loguru import logger
 from pandas._typing import Dtype
 
 from src.configuration.resolve import ConfigValue
@@ -196,9 +202,14 @@ class SeadSchema:
         """Returns foreign key columns from SEAD columns (performance only)."""
         return self.source_columns[self.source_columns.is_fk][["table_name", "column_name", "fk_table_name", "class_name"]]
 
+    @cached_property
+    def _referencing_tables(self) -> dict[str, list[str]]:
+        """Reverse foreign key index: referenced table name -> names of tables referencing it."""
+        return {str(k): list(v) for k, v in self._foreign_keys.groupby("fk_table_name", sort=False)["table_name"]}
+
     def get_tablenames_referencing(self, table_name: str) -> list[str]:
         """Returns a list of tablenames referencing the given table"""
-        return self._foreign_keys.loc[(self._foreign_keys.fk_table_name == table_name)]["table_name"].tolist()
+        return list(self._referencing_tables.get(table_name, []))
 
     def is_fk(self, table_name: str, column_name: str) -> bool:
         if column_name in self.foreign_key_aliases:
@@ -243,16 +254,107 @@ class SeadSchemaFactory:
         return SeadSchema(tables=tables, source_tables=sead_tables, source_columns=sead_columns)
 
 
+SCHEMA_SNAPSHOT_VERSION: int = 1
+
+
+@dataclass
+class SchemaSnapshot:
+    """On-disk snapshot of the clearinghouse schema metadata (`sead_tables` and `sead_columns`).
+
+    The snapshot records the checksum of the source tables it was taken from and the
+    ignored column patterns applied, so that it can be reused until either changes.
+    """
+
+    sead_tables: pd.DataFrame
+    sead_columns: pd.DataFrame
+    checksum: str
+    ignore_columns: list[str] = field(default_factory=list)
+    version: int = SCHEMA_SNAPSHOT_VERSION
+
+    def is_valid_for(self, checksum: str, ignore_columns: list[str]) -> bool:
+        return self.version == SCHEMA_SNAPSHOT_VERSION and self.checksum == checksum and self.ignore_columns == list(ignore_columns)
+
+    def create_schema(self) -> SeadSchema:
+        return SeadSchemaFactory().create(self.sead_tables, self.sead_columns)
+
+    def save(self, filename: str | Path) -> None:
+        """Write the snapshot atomically (concurrent readers never see a partial file)."""
+        path: Path = Path(filename)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path: Path = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "wb") as fp:
+            pickle.dump(dict(vars(self)), fp, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def load(filename: str | Path) -> "SchemaSnapshot | None":
+        """Read a snapshot, or return None if it is missing, unreadable or of another format version."""
+        path: Path = Path(filename)
+        if not path.is_file():
+            return None
+        try:
+            with open(path, "rb") as fp:
+                data: dict[str, Any] = pickle.load(fp)
+            if data.get("version") != SCHEMA_SNAPSHOT_VERSION:
+                return None
+            return SchemaSnapshot(**data)
+        except Exception as ex:  # pylint: disable=broad-except
+            logger.warning(f"Ignoring unreadable schema snapshot {path}: {ex}")
+            return None
+
+
+def frame_checksum(*frames: pd.DataFrame) -> str:
+    """Content checksum of one or more dataframes."""
+    digest = hashlib.md5(usedforsecurity=False)
+    for frame in frames:
+        digest.update(pd.util.hash_pandas_object(frame.reset_index(drop=True), index=False).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
 class SchemaService:
-    """Service class to access metadata information"""
+    """Service class to access metadata information
+
+    If a snapshot folder is configured (`snapshot_folder` or `options.schema_snapshot_folder`), `load`
+    keeps a snapshot of the schema metadata on disk and only queries the metadata tables when their
+    checksum has changed. Loaded schemas are also kept in memory for the lifetime of the process.
+    """
 
-    def __init__(self, db_uri: str, ignore_columns: list[str] | None = None) -> None:
+    # (snapshot filename, checksum, ignored columns) -> schema, shared by all service instances
+    _schemas: dict[tuple[str, str, tuple[str, ...]], SeadSchema] = {}
+
+    def __init__(self, db_uri: str, ignore_columns: list[str] | None = None, snapshot_folder: str | Path | None = None) -> None:
         self.db_uri: str = db_uri
         # Only fall back to ConfigValue if ignore_columns is None (not just empty)
         if ignore_columns is not None:
             self.ignore_columns: list[str] = ignore_columns
         else:
             self.ignore_columns = ConfigValue("options.ignore_columns", default=[]).resolve() or []
+        folder: str | Path | None = snapshot_folder
+        if folder is None:
+            # Snapshots are opt-in; a service created outside a configured context simply runs without one
+            with contextlib.suppress(ValueError):
+                folder = ConfigValue("options.schema_snapshot_folder", default=None).resolve()
+        self.snapshot_folder: Path | None = Path(folder) if folder else None
+
+    @property
+    def snapshot_filename(self) -> Path | None:
+        """Snapshot file for this service's database (one file per database URI)."""
+        if self.snapshot_folder is None:
+            return None
+        key: str = hashlib.sha1(self.db_uri.encode("utf-8"), usedforsecurity=False).hexdigest()[:16]
+        return self.snapshot_folder / f"sead_schema_{key}.pkl"
+
+    def get_checksum(self) -> str:
+        """Returns a checksum of the clearinghouse metadata tables, computed in the database (single-row probe)."""
+        sql: str = """
+            select md5(
+                coalesce((select string_agg(t::text, '|' order by t.table_name)
+                          from clearing_house.clearinghouse_import_tables t), '') || '#' ||
+                coalesce((select string_agg(c::text, '|' order by c.table_name, c.column_name)
+                          from clearing_house.clearinghouse_import_columns c), '')
+            ) as checksum
+        """
+        return str(self._resolve_source(sql)["checksum"].iloc[0])
 
     def get_sead_tables(self) -> pd.DataFrame:
         """Returns a dataframe of tables from SEAD with attributes."""
@@ -322,10 +424,36 @@ class SchemaService:
         return load_dataframe_from_postgres(source, self.db_uri, index_col=None)
 
     def load(self) -> SeadSchema:
-        """Loads the SEAD schema from the database."""
-        sead_tables: pd.DataFrame = self.get_sead_tables()
-        sead_columns: pd.DataFrame = self.get_sead_columns()
-        return SeadSchemaFactory().create(sead_tables, sead_columns)
+        """Loads the SEAD schema, from the snapshot if the metadata tables are unchanged since it was taken."""
+        filename: Path | None = self.snapshot_filename
+        if filename is None:
+            return self.create_snapshot(checksum="").create_schema()
+
+        checksum: str = self.get_checksum()
+        key: tuple[str, str, tuple[str, ...]] = (str(filename), checksum, tuple(sorted(self.ignore_columns)))
+        if key in self._schemas:
+            return self._schemas[key]
+
+        snapshot: SchemaSnapshot | None = SchemaSnapshot.load(filename)
+        if snapshot is None or not snapshot.is_valid_for(checksum, self.ignore_columns):
+            logger.info(f"SEAD schema snapshot {filename} is missing or stale, loading metadata from database")
+            snapshot = self.create_snapshot(checksum)
+            snapshot.save(filename)
+
+        schema: SeadSchema = snapshot.create_schema()
+        for stale_key in [k for k in self._schemas if k[0] == key[0] and k[2] == key[2]]:
+            del self._schemas[stale_key]
+        self._schemas[key] = schema
+        return schema
+
+    def create_snapshot(self, checksum: str) -> SchemaSnapshot:
+        """Reads the metadata tables into a snapshot."""
+        return SchemaSnapshot(
+            sead_tables=self.get_sead_tables(),
+            sead_columns=self.get_sead_columns(),
+            checksum=checksum,
+            ignore_columns=list(self.ignore_columns),
+        )
 
 
 class MockSchemaService(SchemaService):
@@ -337,6 +465,19 @@ class MockSchemaService(SchemaService):
         self._sead_columns: pd.DataFrame = self._load_sead_data(sead_columns, ["table_name", "column_name"], ["table_name", "position"])
         self.ignore_columns = ["date_updated", "*_uuid", "(*"]
 
+    @staticmethod
+    def from_snapshot(filename: str | Path) -> "MockSchemaService":
+        """Create an offline service from a schema snapshot file."""
+        snapshot: SchemaSnapshot | None = SchemaSnapshot.load(filename)
+        if snapshot is None:
+            raise FileNotFoundError(f"No valid schema snapshot found at {filename}")
+        service: MockSchemaService = MockSchemaService(sead_tables=snapshot.sead_tables, sead_columns=snapshot.sead_columns)
+        service.ignore_columns = list(snapshot.ignore_columns)
+        return service
+
+    def get_checksum(self) -> str:
+        return frame_checksum(self._sead_tables, self._sead_columns)
+
     def get_sead_tables(self) -> pd.DataFrame:
         return self._sead_tables
 
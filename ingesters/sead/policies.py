@@ -11,7 +11,7 @@ from pandas._typing import Dtype
 from src.configuration.resolve import ConfigValue
 
 from .metadata import SchemaService, SeadSchema, Table
-from .utility import Registry, pascal_to_snake_case, snake_to_pascal_case
+from .utility import Registry, pascal_to_snake_case, snake_to_pascal_case, to_int_keys
 
 if TYPE_CHECKING:
     from ingesters.sead.submission import Submission
@@ -138,21 +138,24 @@ class AddIdentityMappingSystemIdToPublicIdPolicy(PolicyBase):
             if table_name in self.submission:
                 continue
 
-            referenced_keys: list[int] = sorted(self.submission.get_referenced_keyset(self.schema, table_name))
+            referenced_keys: np.ndarray = self.submission.get_referenced_keys(self.schema, table_name)
 
-            if not referenced_keys:
+            if len(referenced_keys) == 0:
                 continue
 
             table: Table = self.schema.get_table(table_name)
 
             public_primary_keys: set[int] = self.service.get_primary_key_values(table_name, table.pk_name)
-            if set(referenced_keys) - public_primary_keys:
+            unknown_keys: np.ndarray = np.setdiff1d(
+                referenced_keys, np.fromiter(public_primary_keys, dtype=np.int64, count=len(public_primary_keys))
+            )
+            if len(unknown_keys) > 0:
                 logger.warning(
                     f"Table '{table_name}' has referenced keys that are not primary keys: {', '
-                        .join(map(str, referenced_keys))}"
+                        .join(map(str, unknown_keys.tolist()))}"
                 )
 
-            self.submission.data_tables[table_name] = pd.DataFrame({"system_id": referenced_keys, table.pk_name: list(referenced_keys)})
+            self.submission.data_tables[table_name] = pd.DataFrame({"system_id": referenced_keys, table.pk_name: referenced_keys.copy()})
 
             self.log(
                 table_name,
@@ -269,42 +272,39 @@ class IfForeignKeyValueIsMissingAddIdentityMappingToForeignKeyTable(PolicyBase):
 
             table_name: str = table.table_name
 
-            referenced_keys: list[int] = sorted(self.submission.get_referenced_keyset(self.schema, table_name))
-
-            if not referenced_keys:
-                continue
-
             if table_name not in self.submission:
                 # This case is handled by another policy
                 continue
 
+            referenced_keys: np.ndarray = self.submission.get_referenced_keys(self.schema, table_name)
+
+            if len(referenced_keys) == 0:
+                continue
+
             data_table: pd.DataFrame = self.submission.data_tables[table_name]
             pk_name: str = self.schema.get_table(table_name).pk_name
 
-            missing_keys: list[int] = [k for k in referenced_keys if k not in data_table["system_id"].values]
+            missing_keys: np.ndarray = np.setdiff1d(referenced_keys, to_int_keys(data_table["system_id"]), assume_unique=False)
 
-            if not missing_keys:
+            if len(missing_keys) == 0:
                 continue
 
-            template: dict[str, int | None] = {c: None for c in data_table.columns}
-            rows_to_add: list[dict[str, int | None]] = [
-                template | {"system_id": system_id, pk_name: system_id} for system_id in missing_keys
-            ]
-
-            if len(rows_to_add) > 0:
-                new_rows: pd.DataFrame = pd.DataFrame(rows_to_add)
-                data_table = self.fix_dtypes(data_table)
-                new_rows = self.fix_dtypes(new_rows)
-                data_table = pd.DataFrame(rows_to_add) if len(data_table) == 0 else pd.concat([data_table, new_rows], ignore_index=True)
+            new_rows: pd.DataFrame = self.identity_rows(data_table.columns, pk_name, missing_keys)
+            data_table = new_rows if len(data_table) == 0 else pd.concat([self.fix_dtypes(data_table), new_rows], ignore_index=True)
 
             self.submission.data_tables[table_name] = data_table
 
             self.log(
                 table_name,
                 f"Added missing PK keys to '{table_name}' with identity system_id/{pk_name} mapping: ({', '
-                                    .join(map(str, missing_keys))})",
+                                    .join(map(str, missing_keys.tolist()))})",
             )
 
+    def identity_rows(self, columns: pd.Index, pk_name: str, keys: np.ndarray) -> pd.DataFrame:
+        """Rows with system_id and `pk_name` set to `keys` and all other columns empty, typed as in SEAD."""
+        empty: np.ndarray = np.full(len(keys), None, dtype=object)
+        return self.fix_dtypes(pd.DataFrame({column: empty for column in columns} | {"system_id": keys, pk_name: keys}))
+
 
 @UpdatePolicies.register(key="drop_ignored_columns")
 class DropIgnoredColumns(PolicyBase):
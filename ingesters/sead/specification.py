@@ -1,4 +1,5 @@
 import abc
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from fnmatch import fnmatch
 from functools import cached_property
@@ -48,6 +49,54 @@ class SpecificationMessages:
         self.infos.extend(other.infos)
 
 
+class TableStatistics:
+    """Column statistics of one submission table, computed once and shared by all specifications.
+
+    "New" rows are rows without a public primary key value (all rows if the PK column is missing),
+    "unstored" rows are new rows or rows with a non-positive public primary key.
+    """
+
+    def __init__(self, data: pd.DataFrame, table: Table) -> None:
+        self.data: pd.DataFrame = data
+        self.table: Table = table
+        self.row_count: int = len(data)
+        self.columns: set[str] = set(data.columns)
+        self.dtypes: dict[str, str] = {str(name): dtype.name for name, dtype in data.dtypes.items()}
+        self.null_mask: pd.DataFrame = data.isna()
+        self.null_counts: dict[str, int] = self.null_mask.sum().to_dict()
+        self.is_lookup: bool = table.is_lookup
+
+        pk_values: pd.Series | None = data[table.pk_name] if table.pk_name in self.columns else None
+        self.new_row_mask: np.ndarray = pk_values.isna().to_numpy() if pk_values is not None else np.ones(self.row_count, dtype=bool)
+        self.new_row_count: int = int(self.new_row_mask.sum())
+        self.has_new_rows: bool = self.new_row_count > 0
+        self._distinct_counts: dict[str, int] = {}
+
+    @cached_property
+    def new_row_null_counts(self) -> dict[str, int]:
+        return self.null_mask[self.new_row_mask].sum().to_dict()
+
+    @cached_property
+    def unstored_row_mask(self) -> np.ndarray:
+        if self.table.pk_name not in self.columns:
+            return self.new_row_mask
+        pk_values: pd.Series = self.data[self.table.pk_name]
+        return (~(pk_values > 0) | pk_values.isnull()).to_numpy()
+
+    @cached_property
+    def unstored_row_null_counts(self) -> dict[str, int]:
+        return self.null_mask[self.unstored_row_mask].sum().to_dict()
+
+    def distinct_count(self, column_name: str) -> int:
+        """Number of distinct non-null values in a column (computed on first use)."""
+        if column_name not in self._distinct_counts:
+            self._distinct_counts[column_name] = int(self.data[column_name].nunique(dropna=True))
+        return self._distinct_counts[column_name]
+
+    def is_all_null(self, column_name: str) -> bool:
+        return self.null_counts.get(column_name, self.row_count) == self.row_count
+
+
 class SpecificationError(Exception):
     def __init__(self, messages: SpecificationMessages | str) -> None:
         super().__init__("Submission specification failed")
@@ -94,6 +143,10 @@ class SpecificationBase(abc.ABC):
     def get_columns(self, table_name: str) -> list[Column]:
         return [column for column in self.schema[table_name].columns.values() if not self.is_ignored(column.column_name)]
 
+    def get_statistics(self, submission: Submission, table_name: str, statistics: TableStatistics | None = None) -> TableStatistics:
+        """Returns the shared statistics passed by the engine, or computes them when a specification is used on its own."""
+        return statistics or TableStatistics(submission.data_tables[table_name], self.schema.get_table(table_name))
+
     @abc.abstractmethod
     def is_satisfied_by(self, submission: Submission, **kwargs) -> bool: ...
 
@@ -116,15 +169,20 @@ class SubmissionSpecification(SpecificationBase):
         *,
         ignore_columns: list[str] | None = None,
         raise_errors: bool = True,
+        max_workers: int | None = None,
     ) -> None:
         super().__init__(schema, ignore_columns)
         self.raise_errors: bool = raise_errors
+        self.max_workers: int = max_workers or ConfigValue("options:validation_workers").resolve() or 4
 
     @log_decorator(enter_message=" ---> checking submission...", exit_message=" ---> submission checked", level="DEBUG")
     def is_satisfied_by(self, submission: Submission, **kwargs) -> bool:  # pylint: disable=unused-argument
         """
         Check if the given submission satisfies all the specifications defined in the SpecificationRegistry.
 
+        Column statistics are computed once per table and shared by all specifications,
+        and tables are validated concurrently on a thread pool.
+
         Parameters:
             submission (SubmissionData): The submission data to be checked.
             _ (str, optional): Ignored argument. Defaults to None.
@@ -133,12 +191,10 @@ class SubmissionSpecification(SpecificationBase):
             bool: True if all the specifications are satisfied, False otherwise.
         """
         self.clear()
-        ignore_columns = self.ignore_columns or ConfigValue("options:ignore_columns").resolve() or []
-        for cls in SpecificationRegistry.items.values():
-            specification: SpecificationBase = cls(self.schema, ignore_columns=self.ignore_columns)
-            for table_name in submission.data_tables.keys():
-                specification.is_satisfied_by(submission, table_name=table_name, ignore_columns=ignore_columns)
-            self.merge(specification)
+        table_names: list[str] = list(submission.data_tables.keys())
+        with ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, len(table_names)))) as executor:
+            for messages in executor.map(lambda table_name: self.check_table(submission, table_name), table_names):
+                self.messages.merge(messages)
 
         self.messages.uniqify()
 
@@ -149,6 +205,18 @@ class SubmissionSpecification(SpecificationBase):
 
         return not self.has_errors()
 
+    def check_table(self, submission: Submission, table_name: str) -> SpecificationMessages:
+        """Evaluates all registered specifications for one table against shared column statistics."""
+        messages: SpecificationMessages = SpecificationMessages()
+        statistics: TableStatistics | None = (
+            TableStatistics(submission.data_tables[table_name], self.schema[table_name]) if table_name in self.schema else None
+        )
+        for cls in SpecificationRegistry.items.values():
+            specification: SpecificationBase = cls(self.schema, ignore_columns=self.ignore_columns)
+            specification.is_satisfied_by(submission, table_name=table_name, ignore_columns=self.ignore_columns, statistics=statistics)
+            messages.merge(specification.messages)
+        return messages
+
     def log_messages(self) -> None:
         for message in self.errors:
             logger.error(message)
@@ -189,17 +257,17 @@ class ColumnTypesSpecification(SpecificationBase):
         #  ('character varying', 'datetime64[ns]')
     }
 
-    def is_satisfied_by(self, submission: Submission, *, table_name: str, **kwargs) -> bool:
-        data_table: pd.DataFrame = submission.data_tables[table_name]
-        if len(data_table) == 0:
+    def is_satisfied_by(self, submission: Submission, *, table_name: str, statistics: TableStatistics | None = None, **kwargs) -> bool:
+        stats: TableStatistics = self.get_statistics(submission, table_name, statistics)
+        if stats.row_count == 0:
             # Cannot determine type if table is empty
             return not self.has_errors()
 
         for column in self.get_columns(table_name):
-            if column.column_name not in data_table.columns:
+            if column.column_name not in stats.columns:
                 continue
-            data_column_type: str = data_table.dtypes[column.column_name].name
-            if all(data_table[column.column_name].isna()):
+            data_column_type: str = stats.dtypes[column.column_name]
+            if stats.is_all_null(column.column_name):
                 continue
             if (column.data_type.lower(), data_column_type.lower()) not in self.TYPE_COMPATIBILITY_MATRIX:
                 self.warn(
@@ -213,21 +281,24 @@ class ColumnTypesSpecification(SpecificationBase):
 class SubmissionTableTypesSpecification(SpecificationBase):
     NUMERIC_TYPES: list[str] = ["numeric", "integer", "smallint"]
 
-    def is_satisfied_by(self, submission: Submission, *, table_name: str, **kwargs) -> bool:
-        data_table: pd.DataFrame = submission.data_tables[table_name]
+    def is_satisfied_by(self, submission: Submission, *, table_name: str, statistics: TableStatistics | None = None, **kwargs) -> bool:
+        stats: TableStatistics = self.get_statistics(submission, table_name, statistics)
         for column in self.get_columns(table_name):
-            if column.column_name not in data_table.columns:
+            if column.column_name not in stats.columns:
                 continue
 
             if column.data_type not in self.NUMERIC_TYPES:
                 continue
 
-            series: pd.Series = data_table[column.column_name]
+            if stats.null_counts[column.column_name] == 0 and pd.api.types.is_numeric_dtype(stats.data[column.column_name].dtype):
+                continue
+
+            series: pd.Series = stats.data[column.column_name]
             is_real = pd.Series(np.isreal(series.to_numpy()), index=series.index)
             ok_mask = series.notna() & is_real
 
             if not ok_mask.all():
-                error_values = " ".join(list(set(series[~ok_mask])))[:200]
+                error_values = " ".join(map(str, set(series[~ok_mask])))[:200]
                 self.error(
                     f"Column '{table_name}.{
                     column.column_name}' has non-numeric values: '{error_values}'"
@@ -237,9 +308,9 @@ class SubmissionTableTypesSpecification(SpecificationBase):
 
 @SpecificationRegistry.register(key="has_primary_key")
 class HasPrimaryKeySpecification(SpecificationBase):
-    def is_satisfied_by(self, submission: Submission, *, table_name: str, **kwargs) -> bool:
-        data_table: pd.DataFrame = submission.data_tables[table_name]
-        if self.schema[table_name].pk_name not in data_table.columns:
+    def is_satisfied_by(self, submission: Submission, *, table_name: str, statistics: TableStatistics | None = None, **kwargs) -> bool:
+        stats: TableStatistics = self.get_statistics(submission, table_name, statistics)
+        if self.schema[table_name].pk_name not in stats.columns:
             self.error(
                 f"Primary key column '{table_name}.{
                     self.schema[table_name].pk_name}' (table metadata) not in data columns."
@@ -253,18 +324,22 @@ class HasPrimaryKeySpecification(SpecificationBase):
 
 @SpecificationRegistry.register(key="has_system_id")
 class HasSystemIdSpecification(SpecificationBase):
-    def is_satisfied_by(self, submission: Submission, *, table_name: str, **kwargs) -> bool:
+    def is_satisfied_by(self, submission: Submission, *, table_name: str, statistics: TableStatistics | None = None, **kwargs) -> bool:
         # Must have a system identity
-        # if not submission.has_system_id(table_name):
-        data_table: pd.DataFrame = submission.data_tables[table_name]
+        stats: TableStatistics = self.get_statistics(submission, table_name, statistics)
+        data_table: pd.DataFrame = stats.data
 
-        if "system_id" not in data_table.columns:
+        if "system_id" not in stats.columns:
             self.error(f"Table {table_name} has no system id data column")
             return not self.has_errors()
 
-        if data_table["system_id"].isna().any():
+        if stats.null_counts["system_id"] > 0:
             self.error(f"Table {table_name} has missing system id values")
 
+        if stats.null_counts["system_id"] <= 1 and stats.distinct_count("system_id") + stats.null_counts["system_id"] == stats.row_count:
+            # All values distinct, no duplicates to report
+            return not self.has_errors()
+
         try:
             # duplicate_mask = data_table[~data_table.system_id.isna()].duplicated('system_id')
             duplicate_mask: pd.Series = data_table.duplicated("system_id")
@@ -290,36 +365,32 @@ class IdColumnHasConstraintSpecification(SpecificationBase):
 
 @SpecificationRegistry.register(key="foreign_key_columns_has_values")
 class ForeignKeyColumnsHasValuesSpecification(SpecificationBase):
-    def is_satisfied_by(self, submission: Submission, *, table_name: str, **kwargs) -> bool:
+    def is_satisfied_by(self, submission: Submission, *, table_name: str, statistics: TableStatistics | None = None, **kwargs) -> bool:
         """Foreign key columns must have values"""
-        data_table: pd.DataFrame = submission.data_tables[table_name]
+        stats: TableStatistics = self.get_statistics(submission, table_name, statistics)
 
-        if len(data_table) == 0:
+        if stats.row_count == 0:
             return not self.has_errors()
 
-        if submission.is_lookup(table_name):
-            if not submission.has_new_rows(table_name):
-                return not self.has_errors()
+        if stats.is_lookup and not stats.has_new_rows:
+            return not self.has_errors()
 
         # Only check new rows (otherwise it's just a system id to public id mapping)
-        pk_name: str = submission.schema.get_table(table_name).pk_name
-        is_new_rows: pd.Series = data_table[pk_name].isnull()
-
         for column in self.get_columns(table_name):
 
             if not column.is_fk:
                 continue
 
-            if column.column_name not in data_table.columns:
+            if column.column_name not in stats.columns:
                 if not column.is_nullable:
                     self.error(f"Foreign key column '{table_name}.{column.column_name}' not in data")
                 else:
                     self.info(f"Foreign key column '{table_name}.{column.column_name}' not in data (but is nullable)")
                 continue
 
-            s = data_table.loc[is_new_rows, column.column_name]
-            has_nan: bool = bool(s.isna().any())
-            all_nan: bool = bool(s.isna().all())
+            new_row_nulls: int = stats.new_row_null_counts[column.column_name]
+            has_nan: bool = new_row_nulls > 0
+            all_nan: bool = new_row_nulls == stats.new_row_count
 
             if all_nan and not column.is_nullable:
                 self.error(f"Foreign key column '{table_name}.{column.column_name}' has no values")
@@ -332,28 +403,27 @@ class ForeignKeyColumnsHasValuesSpecification(SpecificationBase):
 
 @SpecificationRegistry.register(key="foreign_key_exists_as_primary_key")
 class ForeignKeyExistsAsPrimaryKeySpecification(SpecificationBase):
-    def is_satisfied_by(self, submission: Submission, *, table_name: str, **kwargs) -> bool:
+    def is_satisfied_by(self, submission: Submission, *, table_name: str, statistics: TableStatistics | None = None, **kwargs) -> bool:
         """All submission tables MUST have a non null "system_id" """
-        data_table: pd.DataFrame = submission.data_tables[table_name]
-        if len(data_table) == 0:
+        stats: TableStatistics = self.get_statistics(submission, table_name, statistics)
+        if stats.row_count == 0:
             return not self.has_errors()
 
-        if submission.is_lookup(table_name):
-            if not submission.has_new_rows(table_name):
-                return not self.has_errors()
+        if stats.is_lookup and not stats.has_new_rows:
+            return not self.has_errors()
         for column in self.get_columns(table_name):
 
             if not column.is_fk:
                 continue
 
-            if column.column_name not in data_table.columns:
+            if column.column_name not in stats.columns:
                 if column.is_nullable:
                     self.warn(f"Foreign key column '{table_name}.{column.column_name}' not in data (but is nullable)")
                 else:
                     self.error(f"Foreign key column '{table_name}.{column.column_name}' not in data")
                 continue
 
-            fk_has_data: bool = not data_table[column.column_name].isnull().all()
+            fk_has_data: bool = not stats.is_all_null(column.column_name)
 
             fk_table_name: str | None = column.fk_table_name
 
@@ -389,14 +459,15 @@ class ForeignKeyExistsAsPrimaryKeySpecification(SpecificationBase):
 
 @SpecificationRegistry.register(key="no_missing_column")
 class NoMissingColumnSpecification(SpecificationBase):
-    def is_satisfied_by(self, submission: Submission, *, table_name: str, **kwargs) -> bool:
+    def is_satisfied_by(self, submission: Submission, *, table_name: str, statistics: TableStatistics | None = None, **kwargs) -> bool:
         """All fields in metadata.Table.Fields MUST exist in DataTable.columns"""
 
-        data_table: pd.DataFrame | None = submission.data_tables[table_name] if table_name in submission else None
         meta_table: Table = self.schema[table_name]
 
         data_column_names: list[str] = (
-            sorted(data_table.columns.values.tolist()) if data_table is not None and table_name in self.schema else []
+            sorted(self.get_statistics(submission, table_name, statistics).columns)
+            if table_name in submission and table_name in self.schema
+            else []
         )
 
         if set(data_column_names) == {"system_id", meta_table.pk_name}:
@@ -431,7 +502,7 @@ class NoMissingColumnSpecification(SpecificationBase):
 
 @SpecificationRegistry.register(key="non_nullable_column_has_value")
 class NonNullableColumnHasValueSpecification(SpecificationBase):
-    def is_satisfied_by(self, submission: Submission, *, table_name: str, **kwargs) -> bool:
+    def is_satisfied_by(self, submission: Submission, *, table_name: str, statistics: TableStatistics | None = None, **kwargs) -> bool:
         """
         Checks that non-nullable columns have values.
         Records that has a public_id value greater than 0 are ignored since they already exists in the database.
@@ -440,12 +511,12 @@ class NonNullableColumnHasValueSpecification(SpecificationBase):
         if table_name not in submission or table_name not in self.schema:
             return not self.has_errors()
 
-        data: pd.DataFrame = submission.data_tables[table_name]
+        stats: TableStatistics = self.get_statistics(submission, table_name, statistics)
         table: Table = self.schema[table_name]
 
         non_nullable_columns: set[str] = {
             x
-            for x in data.columns
+            for x in stats.columns
             if x in table.column_names(skip_nullable=True)
             and not self.is_ignored(x)
             and not table.columns[x].is_pk
@@ -453,13 +524,11 @@ class NonNullableColumnHasValueSpecification(SpecificationBase):
             and x != "system_id"
         }
 
-        new_records: pd.DataFrame = data[~(data[table.pk_name] > 0) | data[table.pk_name].isnull()]
-
-        if len(new_records) == 0:
+        if not stats.unstored_row_mask.any():
             return not self.has_errors()
 
         for column_name in non_nullable_columns:
-            if new_records[column_name].isnull().any():
+            if stats.unstored_row_null_counts[column_name] > 0:
                 self.error(f"Table {table_name} has NULL values in non-nullable column {column_name}")
         return not self.has_errors()
 
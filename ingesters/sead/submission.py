@@ -1,15 +1,15 @@
 from __future__ import annotations
 
 import contextlib
-import functools
 import os
 
+import numpy as np
 import pandas as pd
 from loguru import logger
 
 from .metadata import SchemaService, SeadSchema, Table
 from .policies import UpdatePolicies
-from .utility import flatten_sets, log_decorator, to_lookups_sql
+from .utility import log_decorator, to_int_keys, to_lookups_sql
 
 
 def load_excel_sheet(reader: pd.ExcelFile, sheet_name: str) -> pd.DataFrame:
@@ -66,12 +66,12 @@ class Submission:
         """Returns a list of all table names included in the submission"""
         return list(self.data_tables.keys())
 
-    def get_referenced_keyset(self, schema: SeadSchema, table_name: str) -> set[int]:
-        """Returns all unique system ids in `table_name` that are referenced by any foreign key in any other table.
+    def get_referenced_keys(self, schema: SeadSchema, table_name: str) -> np.ndarray:
+        """Returns the sorted unique system ids in `table_name` that are referenced by any foreign key in any other table.
         NOTE: This function assumes PK and FK names are the same."""
         pk_name: str = schema.get_table(table_name).pk_name
         if pk_name is None:
-            return set()
+            return np.empty(0, dtype=np.int64)
 
         # Find all tables that reference the given table, and have the PK column i the referencing table's data
         fk_tables: list[str] = [
@@ -79,11 +79,14 @@ class Submission:
             for fk_table in schema.get_tablenames_referencing(table_name)
             if fk_table in self.data_tables and pk_name in self.data_tables[fk_table].columns
         ]
-        # logger.debug(f"   {table_name} is referenced by: {','.join(fk_tables)}")
-        referenced_pk_ids: list[set] = [
-            set(series.loc[~series.isnull()].tolist()) for series in (self.data_tables[fk_table][pk_name] for fk_table in fk_tables)
-        ]
-        return set(int(x) for x in functools.reduce(flatten_sets, referenced_pk_ids or [], []))
+        referenced_pk_ids: list[np.ndarray] = [to_int_keys(self.data_tables[fk_table][pk_name]) for fk_table in fk_tables]
+        if not referenced_pk_ids:
+            return np.empty(0, dtype=np.int64)
+        return np.unique(np.concatenate(referenced_pk_ids))
+
+    def get_referenced_keyset(self, schema: SeadSchema, table_name: str) -> set[int]:
+        """Returns all unique system ids in `table_name` that are referenced by any foreign key in any other table."""
+        return set(self.get_referenced_keys(schema, table_name).tolist())
 
     @log_decorator(enter_message=" --> loading excel...", exit_message=" --> done loading excel", level="DEBUG")
     @staticmethod
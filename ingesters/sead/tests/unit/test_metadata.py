@@ -1,5 +1,10 @@
+from pathlib import Path
+from unittest.mock import patch
+
+import pandas as pd
 import pytest
 
+from ingesters.sead.metadata import MockSchemaService, SchemaService, SchemaSnapshot
 from ingesters.sead.tests.builders import build_column, build_schema, build_table
 
 # pylint: disable=redefined-outer-name,no-member
@@ -185,3 +190,65 @@ def test_foreign_keys(table_name: str, fk_column: str, fk_table: str, fk_class:
     assert len(fk_row) > 0
     assert fk_row.iloc[0]["fk_table_name"] == fk_table
     assert fk_row.iloc[0]["class_name"] == fk_class
+
+
+class TestSchemaSnapshot:
+    """Schema snapshots: reuse while the metadata is unchanged, reload when it changes."""
+
+    @pytest.fixture
+    def service(self, tmp_path: Path) -> MockSchemaService:
+        sead_tables = pd.read_csv("ingesters/sead/tests/test_data/sead_tables.csv")
+        sead_columns = pd.read_csv("ingesters/sead/tests/test_data/sead_columns.csv")
+        service = MockSchemaService(sead_tables=sead_tables, sead_columns=sead_columns)
+        service.db_uri = f"mock://{tmp_path}"
+        service.snapshot_folder = tmp_path
+        return service
+
+    def test_load_writes_snapshot_and_reuses_it(self, service: MockSchemaService):
+        """The first load writes a snapshot, later loads do not read the metadata tables again."""
+        schema = service.load()
+
+        assert service.snapshot_filename is not None and service.snapshot_filename.exists()
+        snapshot = SchemaSnapshot.load(service.snapshot_filename)
+        assert snapshot is not None and snapshot.checksum == service.get_checksum()
+
+        SchemaService._schemas.clear()
+        with patch.object(MockSchemaService, "get_sead_tables", side_effect=AssertionError("metadata re-read")):
+            reloaded = service.load()
+        assert set(reloaded.keys()) == set(schema.keys())
+
+    def test_changed_metadata_invalidates_snapshot(self, service: MockSchemaService):
+        """A changed checksum reloads the metadata and rewrites the snapshot."""
+        service.load()
+        service._sead_tables = service._sead_tables.iloc[1:]
+
+        schema = service.load()
+
+        assert len(schema) == len(service._sead_tables)
+        snapshot = SchemaSnapshot.load(service.snapshot_filename)  # type: ignore[arg-type]
+        assert snapshot is not None and snapshot.checksum == service.get_checksum()
+
+    def test_changed_ignore_columns_are_not_served_from_memory(self, service: MockSchemaService):
+        """A service ignoring other columns does not get the schema loaded for the first one."""
+        service.load()
+        service.ignore_columns = [*service.ignore_columns, "date_created"]
+
+        with patch.object(MockSchemaService, "get_sead_columns", wraps=service.get_sead_columns) as get_sead_columns:
+            service.load()
+
+        get_sead_columns.assert_called_once()
+
+    def test_offline_service_from_snapshot(self, service: MockSchemaService):
+        """A snapshot can be loaded offline by a mock service."""
+        schema = service.load()
+
+        offline = MockSchemaService.from_snapshot(service.snapshot_filename)  # type: ignore[arg-type]
+
+        assert set(offline.load().keys()) == set(schema.keys())
+
+    def test_snapshot_of_other_version_is_ignored(self, tmp_path: Path):
+        """Snapshots written by another format version are not used."""
+        filename = tmp_path / "snapshot.pkl"
+        SchemaSnapshot(sead_tables=pd.DataFrame(), sead_columns=pd.DataFrame(), checksum="x", version=0).save(filename)
+
+        assert SchemaSnapshot.load(filename) is None
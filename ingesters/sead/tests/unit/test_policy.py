@@ -90,7 +90,7 @@ def test_if_lookup_table_is_missing_add_table_using_system_id_as_public_id(mock_
     )
 
     submission = MagicMock(spec=Submission)
-    submission.get_referenced_keyset.return_value = [1, 2, 3]
+    submission.get_referenced_keys.return_value = np.array([1, 2, 3])
     submission.data_tables = {}
 
     # Mock ConfigValue to return enabled status and table inclusion
@@ -201,7 +201,7 @@ def test_if_foreign_key_value_is_missing_add_identity_mapping_to_foreign_key_tab
     )
 
     submission = MagicMock(spec=Submission)
-    submission.get_referenced_keyset.return_value = [1, 2, 3]
+    submission.get_referenced_keys.return_value = np.array([1, 2, 3])
     submission.data_tables = {"tbl_table": pd.DataFrame({"system_id": [1], "public_id": [1], "value": [None]})}
     submission.__contains__.side_effect = lambda x: x in submission.data_tables
     submission.schema = schema
@@ -217,6 +217,25 @@ def test_if_foreign_key_value_is_missing_add_identity_mapping_to_foreign_key_tab
     assert set(submission.data_tables["tbl_table"]["system_id"]) == {1, 2, 3}
 
 
+def test_identity_mapping_policy_adds_only_unreferenced_keys(mock_service, two_table_schema: SeadSchema):
+    """Test that only referenced keys missing from the lookup table are added, typed like the SEAD columns."""
+    data_tables = {
+        "tbl_main": pd.DataFrame({"system_id": [1, 2, 3], "main_id": [None, None, None], "lookup_id": [100.0, 102.0, None]}),
+        "tbl_lookup": pd.DataFrame({"system_id": [100.0, 101.0], "lookup_id": [100, 101], "value": ["A", "B"]}),
+    }
+    submission = Submission(data_tables=data_tables, schema=two_table_schema)
+
+    policy = IfForeignKeyValueIsMissingAddIdentityMappingToForeignKeyTable(
+        schema=two_table_schema, submission=submission, service=mock_service
+    )
+    policy.apply()
+
+    lookup = submission.data_tables["tbl_lookup"]
+    assert lookup["system_id"].tolist() == [100, 101, 102]
+    assert lookup["lookup_id"].tolist() == [100, 101, 102]
+    assert lookup["value"].tolist()[:2] == ["A", "B"] and pd.isna(lookup["value"].iloc[2])
+
+
 def test_if_lookup_with_no_new_data_then_keep_only_system_id_public_id__not_lookup(mock_service):
     """Test that non-lookup tables are not modified by this policy."""
     schema = MagicMock(spec=SeadSchema)
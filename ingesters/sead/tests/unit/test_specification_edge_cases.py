@@ -1,5 +1,7 @@
 """Additional tests for specification edge cases."""
 
+from unittest.mock import patch
+
 import pandas as pd
 import pytest
 
@@ -12,6 +14,7 @@ from ingesters.sead.specification import (
     NonNullableColumnHasValueSpecification,
     SpecificationError,
     SubmissionSpecification,
+    TableStatistics,
 )
 from ingesters.sead.submission import Submission
 from ingesters.sead.tests.builders import build_column, build_schema, build_table
@@ -230,3 +233,42 @@ class TestSpecificationEdgeCases:
 
         assert len(exc_info.value.messages.errors) == 1
         assert "Simple error message" in exc_info.value.messages.errors[0]
+
+
+class TestTableStatistics:
+    """Test shared per-table statistics and the concurrent specification engine."""
+
+    def test_statistics_are_computed_in_one_pass(self):
+        """Test null counts and new/unstored row masks."""
+        table = build_table("tbl_test", "test_id")
+        data = pd.DataFrame({"system_id": [1, 2, 3, 4], "test_id": [10, None, -1, None], "value": ["a", None, None, "d"]})
+
+        stats = TableStatistics(data, table)
+
+        assert stats.row_count == 4
+        assert stats.null_counts == {"system_id": 0, "test_id": 2, "value": 2}
+        assert stats.new_row_count == 2 and stats.has_new_rows
+        assert stats.new_row_null_counts["value"] == 1
+        assert stats.unstored_row_mask.tolist() == [False, True, True, True]
+        assert stats.unstored_row_null_counts["value"] == 2
+        assert stats.distinct_count("value") == 2
+        assert stats.is_all_null("missing_column")
+
+    def test_submission_specification_computes_statistics_once_per_table(self):
+        """Test that all specifications of a table share one statistics object, and messages of all tables are merged."""
+        schema = build_schema([build_table("tbl_a", "a_id"), build_table("tbl_b", "b_id")])
+        submission = Submission(
+            data_tables={
+                "tbl_a": pd.DataFrame({"system_id": [1, 1], "a_id": [None, None]}),
+                "tbl_b": pd.DataFrame({"system_id": [1, None], "b_id": [None, None]}),
+            },
+            schema=schema,
+        )
+
+        spec = SubmissionSpecification(schema=schema, raise_errors=False, max_workers=2)
+        with patch("ingesters.sead.specification.TableStatistics", wraps=TableStatistics) as statistics_cls:
+            assert spec.is_satisfied_by(submission) is False
+
+        assert statistics_cls.call_count == 2
+        assert any("tbl_a has DUPLICATE system ids" in err for err in spec.errors)
+        assert any("tbl_b has missing system id values" in err for err in spec.errors)
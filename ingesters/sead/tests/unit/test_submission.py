@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 
 from ingesters.sead.metadata import SeadSchema
@@ -60,6 +61,16 @@ class TestSubmission:
         key_set: set[int] = submission.get_referenced_keyset(two_table_schema, "tbl_lookup")
         assert key_set == {100, 101}
 
+    def test_referenced_keys_are_sorted_unique_integers(self, two_table_schema: SeadSchema):
+        """Test that referenced keys skip nulls and come back as a sorted int64 array."""
+        data_tables = {"tbl_main": pd.DataFrame({"system_id": [1, 2, 3, 4], "lookup_id": [101.0, None, 100.0, 101.0]})}
+        submission = Submission(data_tables=data_tables, schema=two_table_schema)
+
+        keys = submission.get_referenced_keys(two_table_schema, "tbl_lookup")
+        assert keys.dtype == np.int64
+        assert keys.tolist() == [100, 101]
+        assert not submission.get_referenced_keys(two_table_schema, "tbl_main").size
+
     def test_tables_specifications(self, minimal_schema: SeadSchema):
         # Use compatible dtype (object matches 'varchar' better than string)
         data_tables = {"tbl_test": pd.DataFrame({"system_id": [1], "test_id": [1], "name": ["A"]}, dtype=object)}
@@ -12,6 +12,7 @@ from datetime import datetime
 from os.path import abspath, basename, dirname, join, splitext
 from typing import TYPE_CHECKING, Any, Callable, Generic, Literal, Self, TypeVar, overload
 
+import numpy as np
 import pandas as pd
 import yaml
 from jinja2 import Environment, Template
@@ -324,6 +325,11 @@ def flatten_sets(x, y) -> set:
     return set(list(x) + list(y))
 
 
+def to_int_keys(series: pd.Series) -> np.ndarray:
+    """Returns the non-null values of a key column as an int64 array."""
+    return pd.to_numeric(series.dropna()).to_numpy(dtype=np.int64)
+
+
 def camel_case_name(undescore_name: str) -> str:
     first, *rest = undescore_name.split("_")
     return first + "".join(word.capitalize() for word in rest)
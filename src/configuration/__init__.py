@@ -1,6 +1,6 @@
 # type: ignore
 
-from .config import Config, ConfigFactory
+from .config import Config, ConfigFactory, ExternalTable
 from .interface import ConfigFactoryLike, ConfigLike
 from .provider import (
     ConfigProvider,
@@ -18,6 +18,7 @@ __all__ = [
     # config
     "Config",
     "ConfigFactory",
+    "ExternalTable",
     # interface
     "ConfigLike",
     "ConfigFactoryLike",
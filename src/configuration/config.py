@@ -3,14 +3,21 @@ from __future__ import annotations
 import contextlib
 import copy
 import io
+import os
+import threading
+import time
 from abc import abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
 from datetime import datetime
 from inspect import isclass
 from os.path import join, normpath
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 import pandas as pd
+import pyarrow.parquet as pq
+import xxhash
 import yaml
 from dotenv import load_dotenv
 from loguru import logger
@@ -197,13 +204,14 @@ class Config(ConfigLike):
         """Resolve configuration directives in the provided data dictionary.
 
         Note: This method does NOT mutate the input data parameter.
-        It creates a deep copy to ensure the original remains unchanged.
+        The resolvers rebuild every dict and list they traverse, so the result never
+        shares containers with the input (scalars are shared). The `inplace` flag is
+        kept for backward compatibility.
 
         Environment variables are expected to already be loaded in os.environ.
         The env_filename parameter is kept for backward compatibility but not used.
         """
-        if not inplace:
-            data = copy.deepcopy(data)
+        _ = inplace
 
         for resolver_cls in [SubConfigResolver, LoadResolver]:
             data = resolver_cls(
@@ -307,6 +315,162 @@ class ConfigFactory:
         )
 
 
+@dataclass
+class DirectiveTiming:
+    """Timing record for a single @include/@load directive resolution."""
+
+    directive: str
+    path: str
+    elapsed_ms: float
+    cache_hit: bool
+
+
+class DirectiveCache:
+    """Memoizes parsed @include/@load targets keyed by absolute path and file stamp.
+
+    A cache entry is keyed by (directive, absolute path, mtime_ns, size, *extra), where
+    `extra` holds arguments that affect the parsed result (e.g. delimiter, context).
+    Editing a referenced file changes its stamp and thus misses the cache. Files loaded
+    through the cache while an entry is built (an @include inside an included file) are
+    recorded as its dependencies, and a hit is only served while their stamps are unchanged.
+
+    Cached values are shared, never deep-copied: callers must treat them as read-only
+    and rebuild containers before mutating (the resolvers do this as part of their walk).
+    """
+
+    def __init__(self, max_entries: int = 256, max_timings: int = 1000) -> None:
+        self.max_entries: int = max_entries
+        self.max_timings: int = max_timings
+        # Key -> (value, stamps of the files the value was built from, including nested directives)
+        self._entries: OrderedDict[tuple[Any, ...], tuple[Any, frozenset[tuple[str, int, int]]]] = OrderedDict()
+        # Dependency collectors of the entries being loaded on this thread (innermost last)
+        self._loading: threading.local = threading.local()
+        # Guards entries, timings and counters: workflows resolve configs on worker threads alongside API requests
+        self._lock: threading.Lock = threading.Lock()
+        self.timings: list[DirectiveTiming] = []
+        self.hits: int = 0
+        self.misses: int = 0
+
+    @staticmethod
+    def file_stamp(filename: str) -> tuple[str, int, int] | None:
+        """Return (absolute path, mtime_ns, size) for an existing file, else None."""
+        try:
+            path: Path = Path(filename).resolve()
+            stat: os.stat_result = path.stat()
+        except (OSError, TypeError):
+            return None
+        return str(path), stat.st_mtime_ns, stat.st_size
+
+    def get_or_load(self, directive: str, filename: str, loader: Callable[[], Any], *extra: Any) -> Any:
+        """Return the cached result for `filename`, calling `loader` on a miss.
+
+        Results of `None` are not cached so that failed loads are retried.
+        """
+        start: float = time.perf_counter()
+        stamp: tuple[str, int, int] | None = self.file_stamp(filename)
+
+        if stamp is None:
+            return loader()
+
+        key: tuple[Any, ...] = (directive, *stamp, *extra)
+        with self._lock:
+            entry: tuple[Any, frozenset[tuple[str, int, int]]] | None = self._entries.get(key)
+            if entry is not None and not self._is_current(entry[1]):
+                self._entries.pop(key, None)
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+            else:
+                self.misses += 1
+        cache_hit: bool = entry is not None
+
+        if entry is not None:
+            value, dependencies = entry
+        else:
+            # Loaded outside the lock: loaders may resolve nested directives through this cache
+            value, dependencies = self._load(stamp, loader)
+            if value is not None:
+                with self._lock:
+                    self._entries[key] = (value, dependencies)
+                    while len(self._entries) > self.max_entries:
+                        self._entries.popitem(last=False)
+
+        # The entry being loaded by an enclosing directive depends on this file and everything it depends on
+        collectors: list[set[tuple[str, int, int]]] = getattr(self._loading, "collectors", [])
+        if collectors:
+            collectors[-1].update(dependencies)
+
+        self._record(DirectiveTiming(directive, stamp[0], (time.perf_counter() - start) * 1000.0, cache_hit))
+        return value
+
+    def _load(self, stamp: tuple[str, int, int], loader: Callable[[], Any]) -> tuple[Any, frozenset[tuple[str, int, int]]]:
+        """Call `loader`, collecting the stamps of the files it loads through the cache."""
+        collectors: list[set[tuple[str, int, int]]] = self._loading.__dict__.setdefault("collectors", [])
+        dependencies: set[tuple[str, int, int]] = {stamp}
+        collectors.append(dependencies)
+        try:
+            value: Any = loader()
+        finally:
+            collectors.pop()
+        return value, frozenset(dependencies)
+
+    def _is_current(self, dependencies: frozenset[tuple[str, int, int]]) -> bool:
+        return all(self.file_stamp(path) == (path, mtime_ns, size) for path, mtime_ns, size in dependencies)
+
+    def _record(self, timing: DirectiveTiming) -> None:
+        with self._lock:
+            self.timings.append(timing)
+            if len(self.timings) > self.max_timings:
+                del self.timings[: len(self.timings) - self.max_timings]
+        logger.trace(
+            f"{timing.directive} {timing.path} resolved in {timing.elapsed_ms:.2f} ms ({'cache hit' if timing.cache_hit else 'loaded'})"
+        )
+
+    def report(self) -> list[dict[str, Any]]:
+        """Summarize recorded timings per directive target (count, hits, total/max ms)."""
+        summary: dict[tuple[str, str], dict[str, Any]] = {}
+        with self._lock:
+            timings: list[DirectiveTiming] = list(self.timings)
+        for timing in timings:
+            item: dict[str, Any] = summary.setdefault(
+                (timing.directive, timing.path),
+                {"directive": timing.directive, "path": timing.path, "count": 0, "hits": 0, "total_ms": 0.0, "max_ms": 0.0},
+            )
+            item["count"] += 1
+            item["hits"] += int(timing.cache_hit)
+            item["total_ms"] += timing.elapsed_ms
+            item["max_ms"] = max(item["max_ms"], timing.elapsed_ms)
+        return sorted(summary.values(), key=lambda x: x["total_ms"], reverse=True)
+
+    def invalidate(self, filename: str | None = None) -> None:
+        """Drop all entries, or only entries for the given file."""
+        path: str | None = None if filename is None else str(Path(filename).resolve())
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+                return
+            for key in [k for k in self._entries if k[1] == path]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.timings.clear()
+            self.hits = self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+DIRECTIVE_CACHE: DirectiveCache = DirectiveCache()
+
+
+def _environment_fingerprint() -> int:
+    """Hash of the current environment; included sub-configs embed resolved ${VAR} values."""
+    return hash(frozenset(os.environ.items()))
+
+
 class BaseResolver:
     """Base class for configuration resolvers.
 
@@ -433,12 +597,89 @@ class SubConfigResolver(BaseResolver):
         # Resolve environment variables and paths
         filename: str = self._resolve_path(directive_argument, base_path=base_path, raise_if_missing=False)
 
-        loaded_data: dict[str, Any] = (
-            ConfigFactory().load(source=filename, context=self.context, env_filename=self.env_filename, env_prefix=self.env_prefix).data
+        # The cached tree is shared; `_resolve` rebuilds its containers for this caller.
+        loaded_data: dict[str, Any] = DIRECTIVE_CACHE.get_or_load(
+            self.directive,
+            filename,
+            lambda: ConfigFactory()
+            .load(source=filename, context=self.context, env_filename=self.env_filename, env_prefix=self.env_prefix)
+            .data,
+            self.context,
+            self.env_prefix,
+            _environment_fingerprint(),
         )
         return self._resolve(loaded_data, Path(filename).parent)
 
 
+@dataclass(frozen=True)
+class ExternalTable:
+    """Lazy handle to the tabular file referenced by an `@load:` directive.
+
+    `@load:` resolves to this handle instead of the file's rows, so the data stays out of the config
+    tree: `clone()` shares the handle, and its `fingerprint` (and hence `TableConfig.hash()`) is
+    derived from the file's path, size and mtime rather than from its contents. `FixedLoader` reads
+    the file straight into a DataFrame each time it loads the entity; the frames are not cached.
+    """
+
+    path: str
+    format: str = "csv"
+    sep: str = ","
+    mtime_ns: int = 0
+    size: int = 0
+
+    @classmethod
+    def from_file(cls, filename: str, sep: str = ",") -> ExternalTable | None:
+        """Return a handle for an existing file, else None."""
+        stamp: tuple[str, int, int] | None = DirectiveCache.file_stamp(filename)
+        if stamp is None:
+            return None
+        path, mtime_ns, size = stamp
+        file_format: str = "parquet" if path.lower().endswith(".parquet") else "csv"
+        return cls(path=path, format=file_format, sep=sep, mtime_ns=mtime_ns, size=size)
+
+    @property
+    def fingerprint(self) -> str:
+        return xxhash.xxh64(f"{self.path}|{self.size}|{self.mtime_ns}|{self.sep}".encode()).hexdigest()
+
+    @property
+    def directive(self) -> str:
+        return f"{LoadResolver.directive}:{self.path}"
+
+    def __str__(self) -> str:
+        return self.directive
+
+    def __repr__(self) -> str:
+        return f"ExternalTable({self.path!r}, fingerprint={self.fingerprint})"
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> ExternalTable:
+        return self  # Immutable
+
+    def columns(self) -> list[str]:
+        """Column names, read from the Parquet schema or the CSV header only."""
+        if self.format == "parquet":
+            return list(pq.read_schema(self.path).names)
+        return list(pd.read_csv(self.path, sep=self.sep, nrows=0).columns)
+
+    def read(self, columns: list[str] | None = None, memory_map: bool = False) -> pd.DataFrame:
+        """Read the file into a new DataFrame (CSV columns as strings, Parquet columns keep their types).
+
+        Frames are not cached, so the caller owns the result. With `columns`, only those columns are
+        read. `memory_map` maps the file instead of reading it into memory.
+        """
+        if self.format == "parquet":
+            return pd.read_parquet(self.path, columns=columns, memory_map=memory_map)
+        frame: pd.DataFrame = pd.read_csv(self.path, sep=self.sep, dtype=str, usecols=columns, memory_map=memory_map)
+        return frame[columns] if columns is not None else frame
+
+    def to_records(self) -> list[dict[Any, Any]]:
+        """Return the rows as a list of dicts (what `@load:` used to resolve to)."""
+        return self.read().to_dict(orient="records")
+
+
+# Saving a resolved configuration writes the directive back instead of a Python object tag
+yaml.add_representer(ExternalTable, lambda dumper, table: dumper.represent_str(table.directive))
+
+
 class LoadResolver(BaseResolver):
 
     directive: str = "@load"
@@ -460,7 +701,7 @@ class LoadResolver(BaseResolver):
             base_path: Directory of current file for resolving relative paths
 
         Returns:
-            Loaded data as list of dicts, or directive_argument if load fails
+            An `ExternalTable` handle to the file, or directive_argument if the file is missing or unreadable
         """
 
         filename: str
@@ -485,25 +726,26 @@ class LoadResolver(BaseResolver):
         # Resolve environment variables and relative paths
         filename = self._resolve_path(filename, base_path=base_path, raise_if_missing=False)
 
-        return self.load_file(filename, sep) or directive_argument
+        table: ExternalTable | None = DIRECTIVE_CACHE.get_or_load(self.directive, filename, lambda: self.load_file(filename, sep), sep)
+
+        # The handle is immutable, so the cached instance can be shared
+        return table if table is not None else directive_argument
 
-    def load_file(self, filename: str, sep: str) -> list[dict[Any, Any]] | None:
-        """Load CSV/TSV file into a list of dictionaries."""
-        loaded_data: list[dict[Any, Any]] | None = None
+    def load_file(self, filename: str, sep: str) -> ExternalTable | None:
+        """Return a lazy handle to a CSV/TSV/Parquet file after checking that its header can be read."""
         if not is_path_to_existing_file(filename):
             logger.warning(f"file '{filename}' referenced in load directive does not exist")
             return None
 
+        table: ExternalTable | None = ExternalTable.from_file(filename, sep=sep)
         try:
-            if filename.lower().endswith(".parquet"):
-                loaded_data = pd.read_parquet(filename).to_dict(orient="records")
-            else:
-                loaded_data = pd.read_csv(filename, sep=sep, dtype=str).to_dict(orient="records")
+            if table is None or not table.columns():
+                return None
         except Exception as e:  # pylint: disable=broad-exception-caught
             logger.warning(f"file '{filename}' referenced in load directive could not be parsed: {e}")
             return None
 
-        return loaded_data
+        return table
 
     def is_load_directive(self, value: Any) -> bool:
         """Check if the value is a load directive string."""
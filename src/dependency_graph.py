@@ -0,0 +1,282 @@
+"""
+Entity dependency graph with memoized analysis and incremental updates.
+
+`EntityDependencyGraph` holds the `depends_on` edges of a project (entity -> entities it needs) and
+answers the questions the normalizer, the validators and the graph view ask of it: cycles, a
+topological order, depths and the transitive set of entities required by an entity. Results are
+memoized, and replacing the dependencies of a single entity updates the graph in place: the edges
+and reverse edges of that entity are swapped, its strongly connected component is re-checked with
+a Tarjan search seeded at the entity, and depth changes are propagated to its dependencies only.
+"""
+
+from collections import deque
+from typing import TYPE_CHECKING, Iterable, Iterator, Mapping
+
+if TYPE_CHECKING:
+    from src.model import ShapeShiftProject
+
+
+class EntityDependencyGraph:
+    """Dependency graph of entities (edges point from an entity to the entities it depends on).
+
+    Dependencies may name entities that are not nodes of the graph (e.g. a default source table held in
+    the table store); such names are kept as edges but are never part of a cycle, an order or a depth.
+    """
+
+    def __init__(self, dependencies: Mapping[str, Iterable[str]] | None = None) -> None:
+        self._dependencies: dict[str, tuple[str, ...]] = {}
+        self._dependents: dict[str, set[str]] = {}
+        self._components: dict[str, frozenset[str]] = {}
+        self._depths: dict[str, int] | None = None
+        self._order: list[str] | None = None
+        self._required: dict[str, frozenset[str]] = {}
+
+        for name, deps in (dependencies or {}).items():
+            self._link(name, tuple(dict.fromkeys(deps)))
+        self._update_components(list(self._dependencies))
+
+    @classmethod
+    def from_project(cls, project: "ShapeShiftProject") -> "EntityDependencyGraph":
+        """Build the graph from the `depends_on` sets of a project's entities."""
+        return cls({name: sorted(table.depends_on) for name, table in project.tables.items()})
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._dependencies
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._dependencies)
+
+    def __len__(self) -> int:
+        return len(self._dependencies)
+
+    def dependencies(self, name: str) -> tuple[str, ...]:
+        """Direct dependencies of `name` (empty if `name` is not in the graph)."""
+        return self._dependencies.get(name, ())
+
+    def dependents(self, name: str) -> set[str]:
+        """Entities in the graph that directly depend on `name`."""
+        return set(self._dependents.get(name, ()))
+
+    def set_dependencies(self, name: str, dependencies: Iterable[str]) -> None:
+        """Add `name` or replace its dependencies, updating cycles and depths incrementally."""
+        new: tuple[str, ...] = tuple(dict.fromkeys(dependencies))
+        old: tuple[str, ...] | None = self._dependencies.get(name)
+        if old == new:
+            return
+
+        if old is not None:
+            self._unlink(name)
+        self._link(name, new)
+        self._update_components([name])
+        self._invalidate()
+        self._propagate_depths({name, *(old or ()), *new})
+
+    def remove(self, name: str) -> None:
+        """Remove `name` (and its outgoing edges) from the graph. Edges pointing at `name` are kept."""
+        old: tuple[str, ...] | None = self._dependencies.get(name)
+        if old is None:
+            return
+
+        self._unlink(name)
+        del self._dependencies[name]
+        if self._depths is not None:
+            self._depths.pop(name, None)
+        self._update_components([name])
+        self._invalidate()
+        self._propagate_depths(set(old))
+
+    def reorder(self, names: Iterable[str]) -> None:
+        """Order the nodes as in `names` (unknown names are ignored, unlisted nodes keep their relative order last)."""
+        ordered: list[str] = list(dict.fromkeys(name for name in names if name in self._dependencies))
+        listed: set[str] = set(ordered)
+        ordered += [name for name in self._dependencies if name not in listed]
+        if ordered == list(self._dependencies):
+            return
+        self._dependencies = {name: self._dependencies[name] for name in ordered}
+        self._order = None
+        if self._depths is not None:
+            self._depths = {name: self._depths[name] for name in ordered}
+
+    @property
+    def has_cycles(self) -> bool:
+        return bool(self._components)
+
+    @property
+    def cycles(self) -> list[list[str]]:
+        """One closed path (first node repeated last) per cyclic strongly connected component."""
+        cycles: list[list[str]] = []
+        seen: set[frozenset[str]] = set()
+        for name in self._dependencies:
+            component: frozenset[str] | None = self._components.get(name)
+            if component is None or component in seen:
+                continue
+            seen.add(component)
+            cycles.append(self._cycle_path(name, component))
+        return cycles
+
+    def topological_order(self) -> list[str] | None:
+        """Nodes with dependents before their dependencies, or None if the graph has cycles.
+
+        This is the order of the dependency graph view; reverse it to get a processing order.
+        """
+        if self.has_cycles:
+            return None
+        if self._order is None:
+            in_degree: dict[str, int] = {name: 0 for name in self._dependencies}
+            for deps in self._dependencies.values():
+                for dep in deps:
+                    if dep in in_degree:
+                        in_degree[dep] += 1
+
+            queue: deque[str] = deque(name for name, degree in in_degree.items() if degree == 0)
+            order: list[str] = []
+            while queue:
+                name: str = queue.popleft()
+                order.append(name)
+                for dep in self._dependencies[name]:
+                    if dep in in_degree:
+                        in_degree[dep] -= 1
+                        if in_degree[dep] == 0:
+                            queue.append(dep)
+            self._order = order
+        return list(self._order)
+
+    @property
+    def depths(self) -> dict[str, int]:
+        """Longest path from any dependent down to each node (0 for nodes nothing depends on).
+
+        With cycles there is no such path, and nodes with dependencies get depth 1.
+        """
+        if self.has_cycles:
+            return {name: 1 if deps else 0 for name, deps in self._dependencies.items()}
+        if self._depths is None:
+            depths: dict[str, int] = {name: 0 for name in self._dependencies}
+            for name in self.topological_order() or []:
+                for dep in self._dependencies[name]:
+                    if dep in depths:
+                        depths[dep] = max(depths[dep], depths[name] + 1)
+            self._depths = depths
+        return dict(self._depths)
+
+    def required(self, name: str) -> set[str]:
+        """`name` and every entity it transitively depends on (dependencies outside the graph are included but not expanded)."""
+        if name not in self._required:
+            required: set[str] = {name}
+            unvisited: list[str] = [name]
+            while unvisited:
+                for dep in self._dependencies.get(unvisited.pop(), ()):
+                    if dep not in required:
+                        required.add(dep)
+                        unvisited.append(dep)
+            self._required[name] = frozenset(required)
+        return set(self._required[name])
+
+    def _link(self, name: str, dependencies: tuple[str, ...]) -> None:
+        self._dependencies[name] = dependencies
+        for dep in dependencies:
+            self._dependents.setdefault(dep, set()).add(name)
+
+    def _unlink(self, name: str) -> None:
+        for dep in self._dependencies.get(name, ()):
+            dependents: set[str] = self._dependents.get(dep, set())
+            dependents.discard(name)
+            if not dependents:
+                self._dependents.pop(dep, None)
+
+    def _invalidate(self) -> None:
+        self._order = None
+        self._required.clear()
+
+    def _update_components(self, seeds: list[str]) -> None:
+        """Recompute the components of `seeds` (and of the components they belonged to).
+
+        Only the component of an entity whose edges changed can be created, grown or split, and every
+        node of the new component is reachable from that entity, so a Tarjan search seeded there suffices.
+        """
+        affected: set[str] = set(seeds)
+        for seed in seeds:
+            affected |= self._components.get(seed, frozenset())
+        for name in affected:
+            self._components.pop(name, None)
+
+        roots: list[str] = [name for name in affected if name in self._dependencies]
+        for component in self._strongly_connected(roots):
+            if affected.isdisjoint(component):
+                continue
+            if len(component) > 1 or component[0] in self._dependencies.get(component[0], ()):
+                members: frozenset[str] = frozenset(component)
+                for member in members:
+                    self._components[member] = members
+
+    def _strongly_connected(self, roots: list[str]) -> list[list[str]]:
+        """Tarjan's algorithm (iterative) over the nodes reachable from `roots`."""
+        index: dict[str, int] = {}
+        low: dict[str, int] = {}
+        stack: list[str] = []
+        on_stack: set[str] = set()
+        components: list[list[str]] = []
+
+        def visit(name: str) -> Iterator[str]:
+            index[name] = low[name] = len(index)
+            stack.append(name)
+            on_stack.add(name)
+            return iter(self._dependencies.get(name, ()))
+
+        for root in roots:
+            if root in index:
+                continue
+            work: list[tuple[str, Iterator[str]]] = [(root, visit(root))]
+            while work:
+                name, neighbours = work[-1]
+                for neighbour in neighbours:
+                    if neighbour not in index:
+                        work.append((neighbour, visit(neighbour)))
+                        break
+                    if neighbour in on_stack:
+                        low[name] = min(low[name], index[neighbour])
+                else:
+                    work.pop()
+                    if work:
+                        parent: str = work[-1][0]
+                        low[parent] = min(low[parent], low[name])
+                    if low[name] == index[name]:
+                        component: list[str] = []
+                        while True:
+                            member: str = stack.pop()
+                            on_stack.discard(member)
+                            component.append(member)
+                            if member == name:
+                                break
+                        components.append(component)
+        return components
+
+    def _cycle_path(self, start: str, component: frozenset[str]) -> list[str]:
+        """Follow edges inside `component` from `start` until a node repeats."""
+        path: list[str] = [start]
+        position: dict[str, int] = {start: 0}
+        current: str = start
+        while True:
+            current = next(dep for dep in self._dependencies[current] if dep in component)
+            if current in position:
+                return path[position[current] :] + [current]
+            position[current] = len(path)
+            path.append(current)
+
+    def _propagate_depths(self, seeds: set[str]) -> None:
+        """Update memoized depths after the dependents of `seeds` changed (dropped if the graph has cycles)."""
+        if self._depths is None:
+            return
+        if self.has_cycles:
+            self._depths = None
+            return
+
+        pending: deque[str] = deque(name for name in seeds if name in self._dependencies)
+        while pending:
+            name: str = pending.popleft()
+            depth: int = max(
+                (self._depths[dependent] + 1 for dependent in self._dependents.get(name, ()) if dependent in self._depths), default=0
+            )
+            if self._depths.get(name) == depth:
+                continue
+            self._depths[name] = depth
+            pending.extend(dep for dep in self._dependencies[name] if dep in self._dependencies)
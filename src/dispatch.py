@@ -1,15 +1,41 @@
-import shutil
-import tempfile
+import io
+import json
+import time
+import uuid
+import zipfile
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from itertools import islice
 from pathlib import Path
-from typing import Any, Protocol
+from typing import Any, Callable, Iterable, Iterator, Protocol
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
+from loguru import logger
 from openpyxl import Workbook
 from openpyxl.styles import PatternFill
 from openpyxl.utils.dataframe import dataframe_to_rows
-from sqlalchemy import create_engine
+from sqlalchemy import (
+    BigInteger,
+    Boolean,
+    Column,
+    Connection,
+    DateTime,
+    Engine,
+    Float,
+    Integer,
+    MetaData,
+    Table,
+    Text,
+    create_engine,
+    inspect,
+    text,
+)
 
 from src.model import ShapeShiftProject, TableConfig
+from src.progress import ProgressReporter
 from src.utility import Registry, create_db_uri, dotget
 
 
@@ -30,8 +56,18 @@ class IDispatcher(Protocol):
 class Dispatcher(IDispatcher):
     """Base class for data dispatchers."""
 
-    def __init__(self, cfg: ShapeShiftProject | dict[str, Any]) -> None:
+    # Whether the dispatcher writes `table_shapes.tsv` itself (see `write_table_shapes`)
+    writes_shapes: bool = False
+
+    def __init__(self, cfg: ShapeShiftProject | dict[str, Any], progress: ProgressReporter | None = None) -> None:
         self.cfg: ShapeShiftProject = cfg if isinstance(cfg, ShapeShiftProject) else ShapeShiftProject(cfg=cfg)
+        self.progress: ProgressReporter = progress or ProgressReporter.disabled()
+        self.dispatched_count: int = 0
+
+    def entity_dispatched(self, entity_name: str, data: dict[str, pd.DataFrame]) -> None:
+        """Report that `entity_name` (one of the entities in `data`) has been written."""
+        self.dispatched_count += 1
+        self.progress.report("dispatch", self.dispatched_count, len(data), entity=entity_name)
 
     @property
     def target_type(self) -> str | None:
@@ -42,27 +78,195 @@ class Dispatcher(IDispatcher):
         return getattr(self, "_registry_opts", {}).get("description", "")
 
 
+SHAPES_FILENAME: str = "table_shapes.tsv"
+
+
+def write_table_shapes(folder: str | Path, shapes: dict[str, tuple[int, int]]) -> Path:
+    """Write the (rows, columns) shape of each entity as a TSV file in `folder`."""
+    tsv_filename: Path = Path(folder) / SHAPES_FILENAME
+    with open(tsv_filename, "w", encoding="utf-8") as f:
+        f.write("entity\tnum_rows\tnum_columns\n")
+        for name, (num_rows, num_columns) in shapes.items():
+            f.write(f"{name}\t{num_rows}\t{num_columns}\n")
+    return tsv_filename
+
+
 @Dispatchers.register(key="csv", target_type="folder", description="Dispatch data as CSV files to a folder", extension=None)
 class CsvDispatcher(Dispatcher):
-    """Dispatcher for CSV data."""
+    """Dispatcher for CSV data.
+
+    Entities are written concurrently on a bounded thread pool, and `table_shapes.tsv` is written in the same pass.
+
+    Options under `dispatch.csv`:
+        max_workers: Number of writer threads (default 4)
+        compression: "gzip", "zstd" or "bz2" to write compressed `.csv.gz`/`.csv.zst`/`.csv.bz2` files (default: none)
+        writer: "pandas" (default), "pyarrow", or "auto" (pyarrow for integer/text-only tables, pandas otherwise).
+            pyarrow is faster but quotes every text value, so its output differs from the pandas writer's.
+    """
+
+    writes_shapes: bool = True
+    chunk_rows: int = 100_000
+    compression_suffixes: dict[str, str] = {"gzip": ".gz", "zstd": ".zst", "bz2": ".bz2"}
+
+    @property
+    def csv_opts(self) -> dict[str, Any]:
+        return dotget(self.cfg.options, "dispatch.csv", {}) or {}
 
     def dispatch(self, target: str, data: dict[str, pd.DataFrame]) -> None:
         output_dir = Path(target)
         output_dir.mkdir(parents=True, exist_ok=True)
-        for entity_name, table in data.items():
-            table.to_csv(output_dir / f"{entity_name}.csv", index=False)
+
+        compression: str | None = self.csv_opts.get("compression")
+        if compression and compression not in self.compression_suffixes:
+            raise ValueError(f"Unsupported CSV compression '{compression}', expected one of {sorted(self.compression_suffixes)}")
+        suffix: str = ".csv" + (self.compression_suffixes[compression] if compression else "")
+
+        def write(entity_name: str, table: pd.DataFrame) -> None:
+            filename: str = str(output_dir / f"{entity_name}{suffix}")
+            with pa.CompressedOutputStream(filename, compression) if compression else open(filename, "wb") as stream:
+                self.write_csv(table, stream)
+
+        for entity_name, _ in self.map_entities(write, data):
+            self.entity_dispatched(entity_name, data)
+
+        write_table_shapes(output_dir, {name: table.shape for name, table in data.items()})
+
+    def map_entities(self, fn: Callable[[str, pd.DataFrame], Any], data: dict[str, pd.DataFrame]) -> Iterator[tuple[str, Any]]:
+        """Apply `fn` to each entity on a bounded thread pool, yielding `(entity_name, result)` as they complete.
+
+        At most `max_workers` entities are in flight: the next one is submitted only when a result has been
+        consumed by the caller, and the result is released then, so rendered payloads do not pile up.
+        """
+        max_workers: int = max(1, min(int(self.csv_opts.get("max_workers", 4)), len(data)))
+        entities: Iterator[tuple[str, pd.DataFrame]] = iter(data.items())
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending: dict[Future, str] = {executor.submit(fn, name, table): name for name, table in islice(entities, max_workers)}
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                while done:
+                    future: Future = done.pop()
+                    entity_name: str = pending.pop(future)
+                    yield entity_name, future.result()
+                    del future
+                    for name, table in islice(entities, 1):
+                        pending[executor.submit(fn, name, table)] = name
+
+    def write_csv(self, table: pd.DataFrame, stream: Any) -> None:
+        """Write `table` as UTF-8 CSV (no index) to a binary stream."""
+        arrow_table: pa.Table | None = self.to_arrow_table(table)
+        stream.write(table.head(0).to_csv(index=False).encode("utf-8"))  # header exactly as pandas writes it
+        if arrow_table is not None:
+            pa_csv.write_csv(arrow_table, stream, pa_csv.WriteOptions(include_header=False, quoting_style="needed"))
+            return
+        for offset in range(0, len(table), self.chunk_rows):
+            stream.write(table.iloc[offset : offset + self.chunk_rows].to_csv(index=False, header=False).encode("utf-8"))
+
+    def to_arrow_table(self, table: pd.DataFrame) -> pa.Table | None:
+        """Arrow table for the fast writer, or None when `table` should be written by pandas.
+
+        In "auto" mode only integer and text columns qualify, since pyarrow formats floats,
+        booleans and timestamps differently from pandas. Text values are always quoted by pyarrow.
+        """
+        writer: str = self.csv_opts.get("writer", "pandas")
+        if writer == "pandas" or table.empty or not table.columns.is_unique:
+            return None
+        if writer == "auto" and not all(self._is_plain_column(table[column]) for column in table.columns):
+            return None
+        try:
+            return pa.Table.from_pandas(table, preserve_index=False)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            return None
+
+    @staticmethod
+    def _is_plain_column(series: pd.Series) -> bool:
+        if pd.api.types.is_integer_dtype(series.dtype) and not pd.api.types.is_bool_dtype(series.dtype):
+            return True
+        return pd.api.types.infer_dtype(series, skipna=True) in ("string", "empty")
 
 
 @Dispatchers.register(key="zipcsv", target_type="file", description="Dispatch data as CSV files inside a ZIP archive", extension=".zip")
 class ZipCsvDispatcher(CsvDispatcher):
-    """Dispatcher for CSV data."""
+    """Dispatcher for CSV data, streamed into a ZIP archive.
+
+    Entities are rendered concurrently and added to the archive as they complete, without temporary files.
+    """
 
     def dispatch(self, target: str, data: dict[str, pd.DataFrame]) -> None:
-        with tempfile.TemporaryDirectory() as temp_dir:
-            super().dispatch(temp_dir, data)
-            filename: Path = Path(target)
-            filename.parent.mkdir(parents=True, exist_ok=True)
-            shutil.make_archive(base_name=str(filename.with_suffix("")), format="zip", root_dir=str(temp_dir))
+        filename: Path = Path(target).with_suffix(".zip")
+        filename.parent.mkdir(parents=True, exist_ok=True)
+
+        def render(_: str, table: pd.DataFrame) -> bytes:
+            buffer = io.BytesIO()
+            self.write_csv(table, buffer)
+            return buffer.getvalue()
+
+        with zipfile.ZipFile(filename, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+            for entity_name, content in self.map_entities(render, data):
+                archive.writestr(f"{entity_name}.csv", content)
+                self.entity_dispatched(entity_name, data)
+
+        write_table_shapes(filename.parent, {name: table.shape for name, table in data.items()})
+
+
+@Dispatchers.register(key="parquet", target_type="folder", description="Dispatch data as Parquet files to a folder", extension=None)
+class ParquetDispatcher(Dispatcher):
+    """Dispatcher that writes each entity as a compressed Parquet file, plus a `manifest.json`.
+
+    Options under `dispatch.parquet`:
+        compression: Parquet compression codec (default "zstd")
+        row_group_size: Maximum rows per row group (default: pyarrow's default)
+        dictionary_ratio: Dictionary-encode columns whose distinct/total ratio is at most this (default 0.5)
+    """
+
+    manifest_name: str = "manifest.json"
+
+    def dispatch(self, target: str, data: dict[str, pd.DataFrame]) -> None:
+        opts: dict[str, Any] = dotget(self.cfg.options, "dispatch.parquet", {}) or {}
+        compression: str = opts.get("compression", "zstd")
+        row_group_size: int | None = opts.get("row_group_size")
+        dictionary_ratio: float = float(opts.get("dictionary_ratio", 0.5))
+
+        output_dir = Path(target)
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        entities: dict[str, Any] = {}
+        for entity_name, table in data.items():
+            arrow_table: pa.Table = self.to_arrow(table)
+            filename: Path = output_dir / f"{entity_name}.parquet"
+            pq.write_table(
+                arrow_table,
+                filename,
+                compression=compression,
+                row_group_size=row_group_size,
+                use_dictionary=self.dictionary_columns(table, dictionary_ratio),
+            )
+            entities[entity_name] = {
+                "filename": filename.name,
+                "rows": arrow_table.num_rows,
+                "bytes": filename.stat().st_size,
+                "columns": [{"name": field.name, "type": str(field.type)} for field in arrow_table.schema],
+            }
+            self.entity_dispatched(entity_name, data)
+
+        manifest: dict[str, Any] = {"format": "parquet", "compression": compression, "entities": entities}
+        (output_dir / self.manifest_name).write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+
+    @staticmethod
+    def to_arrow(table: pd.DataFrame) -> pa.Table:
+        """Convert a frame to an Arrow table, storing mixed-type object columns as strings."""
+        try:
+            return pa.Table.from_pandas(table, preserve_index=False)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            mixed: list[str] = [column for column in table.columns if table[column].dtype == object]
+            return pa.Table.from_pandas(table.astype({column: "string" for column in mixed}), preserve_index=False)
+
+    @staticmethod
+    def dictionary_columns(table: pd.DataFrame, ratio: float) -> list[str]:
+        """Text and categorical columns with few distinct values, which benefit from dictionary encoding."""
+        if table.empty:
+            return []
+        candidates = table.select_dtypes(include=["object", "string", "category", "bool"])
+        return [str(column) for column in candidates.columns if candidates[column].nunique(dropna=True) <= ratio * len(table)]
 
 
 @Dispatchers.register(key="xlsx", target_type="file", description="Dispatch data as Excel file", extension=".xlsx")
@@ -77,6 +281,7 @@ class ExcelDispatcher(Dispatcher):
                 # Sanitize timezone-aware datetimes for Excel compatibility
                 sanitized_df = self._sanitize_timezones(data[entity_name])
                 sanitized_df.to_excel(writer, sheet_name=entity_name, index=False)
+                self.entity_dispatched(entity_name, data)
 
     @staticmethod
     def _sanitize_timezones(df: pd.DataFrame) -> pd.DataFrame:
@@ -146,6 +351,7 @@ class OpenpyxlExcelDispatcher(Dispatcher):
 
             self.style_sheet_columns(entity_name, table, ws)
             self.auto_size_columns(ws)
+            self.entity_dispatched(entity_name, data)
 
         wb.save(target)
         wb.close()  # Properly close the workbook to avoid resource leaks
@@ -271,3 +477,275 @@ class DatabaseDispatcher(Dispatcher):
         with engine.begin() as connection:
             for entity_name, table in data.items():
                 table.to_sql(entity_name, con=connection, if_exists="replace", index=False)
+                self.entity_dispatched(entity_name, data)
+
+
+@dataclass
+class TableLoadStats:
+    """Timing of a single table load."""
+
+    table: str
+    rows: int
+    seconds: float
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds > 0 else float(self.rows)
+
+
+@Dispatchers.register(
+    key="db_bulk",
+    target_type="database",
+    description="Bulk-load typed tables into a database (COPY, parallel, atomic swap)",
+    extension=None,
+)
+class BulkDatabaseDispatcher(DatabaseDispatcher):
+    """Dispatcher that bulk-loads typed tables into a staging area and swaps them in atomically.
+
+    Tables are loaded level by level in foreign key order, and only replace the target data once all
+    loads succeeded. A target table that already exists keeps its definition (column types, constraints,
+    dependent views and foreign keys): its rows are deleted and the new rows inserted in the swap, and
+    the entity's columns must exist in it. A missing target table is created with column types derived
+    from the data (and `system_id` as primary key when it is unique).
+
+    PostgreSQL: staging tables are created in a temporary staging schema (`LIKE` the target table when
+    it exists) and loaded with `COPY` over up to `max_workers` parallel connections; the swap runs in one
+    transaction. Other databases (SQLite): everything runs in a single transaction over one connection,
+    with `executemany` inserts; new tables are created with a staging prefix and renamed.
+
+    Options under `dispatch.database`, in addition to the connection settings:
+        url: SQLAlchemy URL, overrides the connection settings (e.g. `sqlite:///output.db`)
+        schema: Target schema (PostgreSQL only, default "public")
+        max_workers: Parallel connections per dependency level (PostgreSQL only, default 4)
+    """
+
+    staging_prefix: str = "_staging_"
+    copy_chunk_rows: int = 100_000
+
+    def __init__(self, cfg: ShapeShiftProject | dict[str, Any], progress: ProgressReporter | None = None) -> None:
+        super().__init__(cfg, progress=progress)
+        self.load_stats: list[TableLoadStats] = []
+
+    def dispatch(self, target: str, data: dict[str, pd.DataFrame]) -> None:
+
+        db_opts: dict[str, Any] = dict(dotget(self.cfg.options, "dispatch.database", {}) or {})
+
+        if not db_opts:
+            raise ValueError("Database dispatch requires 'dispatch.database' configuration options")
+
+        db_url: str | None = db_opts.pop("url", None)
+        schema: str = db_opts.pop("schema", None) or "public"
+        max_workers: int = int(db_opts.pop("max_workers", 4))
+
+        self.load_stats = []
+        engine: Engine = create_engine(url=db_url or create_db_uri(**db_opts))
+        try:
+            if engine.dialect.name == "postgresql":
+                self._dispatch_postgres(engine, data, schema=schema, max_workers=max_workers)
+            else:
+                self._dispatch_single_connection(engine, data)
+        finally:
+            engine.dispose()
+
+        for stats in self.load_stats:
+            logger.info(f"{stats.table}[dispatch]: loaded {stats.rows} rows in {stats.seconds:.2f}s ({stats.rows_per_second:,.0f} rows/s)")
+
+    def load_levels(self, entity_names: Iterable[str]) -> list[list[str]]:
+        """Group entities into levels such that every entity comes after the entities it references by foreign key.
+
+        Entities within a level are independent and can be loaded in parallel. Entities in a
+        foreign key cycle are placed together in the last level.
+        """
+        names: set[str] = set(entity_names)
+        pending: dict[str, set[str]] = {
+            name: (
+                ({fk.remote_entity for fk in self.cfg.get_table(name).foreign_keys} & names) - {name} if name in self.cfg.tables else set()
+            )
+            for name in names
+        }
+        levels: list[list[str]] = []
+        while pending:
+            ready: list[str] = sorted(name for name, remotes in pending.items() if not remotes) or sorted(pending)
+            levels.append(ready)
+            for name in ready:
+                del pending[name]
+            for remotes in pending.values():
+                remotes.difference_update(ready)
+        return levels
+
+    def build_table(self, metadata: MetaData, entity_name: str, frame: pd.DataFrame, *, name: str, schema: str | None = None) -> Table:
+        """Build a typed table definition for an entity from its data and configuration."""
+        primary_key: str | None = self.cfg.get_table(entity_name).system_id if entity_name in self.cfg.tables else None
+        if primary_key not in frame.columns or frame[primary_key].isna().any() or not frame[primary_key].is_unique:
+            primary_key = None
+        columns: list[Column] = [
+            Column(str(column), self._sql_type(frame[column]), primary_key=column == primary_key, nullable=column != primary_key)
+            for column in frame.columns
+        ]
+        return Table(name, metadata, *columns, schema=schema)
+
+    @staticmethod
+    def _sql_type(series: pd.Series) -> Any:
+        """Map a pandas column to a SQLAlchemy column type."""
+        if pd.api.types.is_bool_dtype(series.dtype):
+            return Boolean()
+        if pd.api.types.is_integer_dtype(series.dtype):
+            return BigInteger()
+        if pd.api.types.is_float_dtype(series.dtype):
+            return Float(precision=53)
+        if isinstance(series.dtype, pd.DatetimeTZDtype):
+            return DateTime(timezone=True)
+        if pd.api.types.is_datetime64_any_dtype(series.dtype):
+            return DateTime()
+        return Text()
+
+    @staticmethod
+    def existing_tables(connection: Connection, names: Iterable[str], schema: str | None = None) -> dict[str, Table]:
+        """Reflect the target tables that already exist."""
+        existing: set[str] = set(inspect(connection).get_table_names(schema=schema)) & set(names)
+        metadata = MetaData()
+        if existing:
+            metadata.reflect(bind=connection, schema=schema, only=sorted(existing))
+        return {name: metadata.tables[f"{schema}.{name}" if schema else name] for name in existing}
+
+    @staticmethod
+    def conform(entity_name: str, frame: pd.DataFrame, table: Table) -> pd.DataFrame:
+        """Check that the entity's columns exist in an existing table and cast floats holding integers to its integer columns."""
+        missing: list[str] = [str(column) for column in frame.columns if column not in table.columns]
+        if missing:
+            raise ValueError(f"{entity_name}[dispatch]: columns {missing} do not exist in target table '{table.fullname}'")
+        casts: dict[str, str] = {
+            column: "Int64"
+            for column in frame.columns
+            if isinstance(table.columns[column].type, Integer) and pd.api.types.is_float_dtype(frame[column].dtype)
+        }
+        return frame.astype(casts) if casts else frame
+
+    def _dispatch_postgres(self, engine: Engine, data: dict[str, pd.DataFrame], *, schema: str, max_workers: int) -> None:
+        preparer = engine.dialect.identifier_preparer
+        staging: str = f"{schema}{self.staging_prefix}{uuid.uuid4().hex[:8]}"
+        levels: list[list[str]] = self.load_levels(data)
+
+        with engine.begin() as connection:
+            existing: dict[str, Table] = self.existing_tables(connection, data, schema=schema)
+
+        data = {name: self.conform(name, frame, existing[name]) if name in existing else frame for name, frame in data.items()}
+        metadata = MetaData()
+        tables: dict[str, Table] = {
+            name: (
+                Table(name, metadata, *[Column(column.name, column.type) for column in existing[name].columns], schema=staging)
+                if name in existing
+                else self.build_table(metadata, name, frame, name=name, schema=staging)
+            )
+            for name, frame in data.items()
+        }
+
+        with engine.begin() as connection:
+            connection.execute(text(f"create schema {preparer.quote(staging)}"))
+            for name, target in existing.items():
+                like: str = f"like {preparer.format_table(target)} including defaults"
+                connection.execute(text(f"create table {preparer.format_table(tables[name])} ({like})"))
+            metadata.create_all(connection, tables=[table for name, table in tables.items() if name not in existing])
+
+        try:
+            for level in levels:
+                with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(level)))) as executor:
+                    for name, stats in zip(level, executor.map(lambda name: self._copy_table(engine, tables[name], data[name]), level)):
+                        self.load_stats.append(stats)
+                        self.entity_dispatched(name, data)
+
+            with engine.begin() as connection:
+                connection.execute(text(f"create schema if not exists {preparer.quote(schema)}"))
+                # Referencing tables are emptied before the tables they reference, and filled after them
+                for name in [name for level in reversed(levels) for name in level if name in existing]:
+                    connection.execute(text(f"delete from {preparer.format_table(existing[name])}"))
+                for name in [name for level in levels for name in level]:
+                    if name in existing:
+                        columns: str = ", ".join(preparer.quote(str(column)) for column in data[name].columns)
+                        connection.execute(
+                            text(
+                                f"insert into {preparer.format_table(existing[name])} ({columns}) "
+                                f"select {columns} from {preparer.format_table(tables[name])}"
+                            )
+                        )
+                    else:
+                        connection.execute(text(f"alter table {preparer.format_table(tables[name])} set schema {preparer.quote(schema)}"))
+        finally:
+            with engine.begin() as connection:
+                for table in tables.values():
+                    connection.execute(text(f"drop table if exists {preparer.format_table(table)}"))
+                connection.execute(text(f"drop schema if exists {preparer.quote(staging)}"))
+
+    def _copy_table(self, engine: Engine, table: Table, frame: pd.DataFrame) -> TableLoadStats:
+        """Load a frame into a table with PostgreSQL COPY over a dedicated connection."""
+        start: float = time.perf_counter()
+        preparer = engine.dialect.identifier_preparer
+        column_list: str = ", ".join(preparer.quote(str(column)) for column in frame.columns)
+        sql: str = f"copy {preparer.format_table(table)} ({column_list}) from stdin with (format csv, null '\\N')"
+
+        raw_connection = engine.raw_connection()
+        try:
+            cursor = raw_connection.cursor()
+            try:
+                if hasattr(cursor, "copy"):  # psycopg 3
+                    with cursor.copy(sql) as copy:
+                        for offset in range(0, len(frame), self.copy_chunk_rows):
+                            copy.write(frame.iloc[offset : offset + self.copy_chunk_rows].to_csv(index=False, header=False, na_rep="\\N"))
+                else:  # psycopg2
+                    cursor.copy_expert(sql, io.StringIO(frame.to_csv(index=False, header=False, na_rep="\\N")))
+            finally:
+                cursor.close()
+            raw_connection.commit()
+        finally:
+            raw_connection.close()
+
+        return TableLoadStats(table=table.name, rows=len(frame), seconds=time.perf_counter() - start)
+
+    def _dispatch_single_connection(self, engine: Engine, data: dict[str, pd.DataFrame]) -> None:
+        preparer = engine.dialect.identifier_preparer
+        levels: list[list[str]] = self.load_levels(data)
+
+        with engine.begin() as connection:
+            existing: dict[str, Table] = self.existing_tables(connection, data)
+            data = {name: self.conform(name, frame, existing[name]) if name in existing else frame for name, frame in data.items()}
+            metadata = MetaData()
+            tables: dict[str, Table] = {
+                name: existing[name] if name in existing else self.build_table(metadata, name, frame, name=f"{self.staging_prefix}{name}")
+                for name, frame in data.items()
+            }
+
+            metadata.drop_all(connection)
+            metadata.create_all(connection)
+            for name in [name for level in reversed(levels) for name in level if name in existing]:
+                connection.execute(existing[name].delete())
+            for level in levels:
+                for name in level:
+                    self.load_stats.append(self._insert_table(connection, tables[name], data[name]))
+                    self.entity_dispatched(name, data)
+            for name in data:
+                if name not in existing:
+                    connection.execute(text(f"alter table {preparer.quote(tables[name].name)} rename to {preparer.quote(name)}"))
+
+    @staticmethod
+    def _insert_table(connection: Connection, table: Table, frame: pd.DataFrame) -> TableLoadStats:
+        """Load a frame into a table with a single executemany call."""
+        start: float = time.perf_counter()
+        dialect = connection.dialect
+        columns: list[Column] = [table.columns[column] for column in frame.columns]
+        values: list[list[Any]] = []
+        for column in columns:
+            series: pd.Series = frame[column.name]
+            cells: list[Any] = [None if missing else cell for cell, missing in zip(series.astype(object).tolist(), series.isna().tolist())]
+            # Raw driver execution skips SQLAlchemy's type conversion (e.g. datetimes to SQLite strings)
+            processor = column.type.dialect_impl(dialect).bind_processor(dialect) if dialect.paramstyle == "qmark" else None
+            values.append([processor(cell) for cell in cells] if processor else cells)
+        rows: list[tuple[Any, ...]] = list(zip(*values))
+        if rows:
+            if dialect.paramstyle == "qmark":
+                preparer = dialect.identifier_preparer
+                column_list: str = ", ".join(preparer.quote(column.name) for column in columns)
+                placeholders: str = ", ".join("?" for _ in columns)
+                connection.exec_driver_sql(f"insert into {preparer.format_table(table)} ({column_list}) values ({placeholders})", rows)
+            else:
+                connection.execute(table.insert(), [dict(zip([column.name for column in columns], row)) for row in rows])
+        return TableLoadStats(table=table.name, rows=len(rows), seconds=time.perf_counter() - start)
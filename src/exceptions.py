@@ -27,3 +27,7 @@ class FunctionalDependencyError(ValueError, ShapeShifterCoreError):
         self.entity_name = entity_name
         self.determinant_columns = determinant_columns or []
         self.details = details or {}
+
+
+class WorkflowCancelledError(ShapeShifterCoreError):
+    """Raised when a workflow run is cancelled at an entity boundary."""
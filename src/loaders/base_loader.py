@@ -73,8 +73,8 @@ class DataLoader(abc.ABC):
         return cls.schema
 
     @abc.abstractmethod
-    async def load(self, entity_name: str, table_cfg: "TableConfig") -> pd.DataFrame:
-        pass
+    async def load(self, entity_name: str, table_cfg: "TableConfig", limit: int | None = None) -> pd.DataFrame:
+        """Load entity data. If `limit` is given, the loader may return only the first `limit` rows."""
 
     @abc.abstractmethod
     async def test_connection(self) -> ConnectTestResult:
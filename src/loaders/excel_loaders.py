@@ -1,3 +1,4 @@
+import itertools
 import re
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, ClassVar
@@ -191,6 +192,8 @@ class OpenPyxlLoader(ExcelLoader):
 
         header_opt: bool | list[str] = opts.get("header", True)
         data_header: list[str] | None = next(data) if header_opt else None
+        if opts.get("nrows"):
+            data = itertools.islice(data, int(opts["nrows"]))
         sanitize_header: bool = opts.get("sanitize_header", True)
 
         df = pd.DataFrame(data, columns=data_header)
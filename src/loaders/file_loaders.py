@@ -24,11 +24,13 @@ class FileLoader(DataLoader):
         """Get the loader type."""
         return LoaderType.FILE
 
-    async def load(self, entity_name: str, table_cfg: "TableConfig") -> pd.DataFrame:
-        """Load data from a CSV file into a DataFrame."""
-        options: dict[str, str] = self.get_loader_opts(table_cfg)
+    async def load(self, entity_name: str, table_cfg: "TableConfig", limit: int | None = None) -> pd.DataFrame:
+        """Load data from a CSV file into a DataFrame. A `limit` is passed on to the reader as `nrows`."""
+        options: dict[str, Any] = self.get_loader_opts(table_cfg)
         if not options:
             raise ValueError(f"TableConfig for entity '{entity_name}' has no load options defined")
+        if limit:
+            options = options | {"nrows": limit}
         return await self.load_file(opts=options)
 
     async def load_file(self, opts: dict[str, str]) -> pd.DataFrame:  # type: ignore[unused-argument]
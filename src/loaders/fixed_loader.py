@@ -3,6 +3,7 @@ from typing import TYPE_CHECKING, Any
 import pandas as pd
 from loguru import logger
 
+from src.configuration import ExternalTable
 from src.loaders.base_loader import ConnectTestResult
 from src.transforms.utility import add_system_id
 
@@ -21,7 +22,7 @@ class FixedLoader(DataLoader):
         """Get the loader type."""
         return LoaderType.VALUE
 
-    async def load(self, entity_name: str, table_cfg: "TableConfig") -> pd.DataFrame:
+    async def load(self, entity_name: str, table_cfg: "TableConfig", limit: int | None = None) -> pd.DataFrame:
         """Create a fixed data entity based on configuration."""
 
         self.validate(entity_name, table_cfg)
@@ -29,8 +30,11 @@ class FixedLoader(DataLoader):
         data: pd.DataFrame
         raw_values: list[Any] | None = table_cfg.values if isinstance(table_cfg.values, list) else None
 
-        if raw_values and isinstance(raw_values[0], dict):
-            # Values came from @load: directive - columns are embedded as dict keys
+        if isinstance(table_cfg.values, ExternalTable):
+            # Values come from an @load: directive - read the file directly, columns are in its header/schema
+            data = table_cfg.values.read(memory_map=bool(table_cfg.options.get("memory_map", False)))
+        elif raw_values and isinstance(raw_values[0], dict):
+            # Rows given as dicts - columns are embedded as dict keys
             data = pd.DataFrame(raw_values)
         else:
             values: list[list[Any]] = table_cfg.safe_values
@@ -47,6 +51,9 @@ class FixedLoader(DataLoader):
             except ValueError as exc:
                 raise ValueError(f"Fixed data entity '{entity_name}' failed to build DataFrame: {exc}") from exc
 
+        if limit:
+            data = data.head(limit)
+
         # Add system_id if configured (always "system_id" column name)
         if table_cfg.system_id and table_cfg.system_id not in data.columns:
             data = add_system_id(data, table_cfg.system_id)
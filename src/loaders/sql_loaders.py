@@ -99,6 +99,69 @@ class CoreSchema:
         row_count: Optional[int]
         foreign_keys: list["CoreSchema.ForeignKeyMetadata"]
 
+        @staticmethod
+        def from_catalog(
+            schema_name: str | None,
+            columns: pd.DataFrame,
+            primary_keys: pd.DataFrame,
+            foreign_keys: pd.DataFrame,
+            row_counts: dict[str, int | None] | None = None,
+        ) -> dict[str, "CoreSchema.TableSchema"]:
+            """Assemble table schemas from bulk catalog query results covering many tables.
+
+            Every frame has a `table_name` column. `columns` also has column_name, data_type, is_nullable ("YES"/"NO"),
+            column_default and character_maximum_length; `primary_keys` has column_name (in key order); `foreign_keys`
+            has column_name, referenced_schema, referenced_table, referenced_column and constraint_name.
+            """
+            row_counts = row_counts or {}
+            key_columns: dict[str, list[str]] = (
+                primary_keys.groupby("table_name", sort=False)["column_name"].agg(list).to_dict() if not primary_keys.empty else {}
+            )
+
+            references: dict[str, list[CoreSchema.ForeignKeyMetadata]] = {}
+            for fk in foreign_keys.astype(object).where(foreign_keys.notna(), None).itertuples(index=False):
+                references.setdefault(fk.table_name, []).append(
+                    CoreSchema.ForeignKeyMetadata(
+                        column=fk.column_name,
+                        referenced_schema=fk.referenced_schema,
+                        referenced_table=fk.referenced_table,
+                        referenced_column=fk.referenced_column,
+                        constraint_name=fk.constraint_name,
+                    )
+                )
+
+            schemas: dict[str, CoreSchema.TableSchema] = {}
+            for table_name, group in columns.astype(object).where(columns.notna(), None).groupby("table_name", sort=False):
+                keys: list[str] = key_columns.get(table_name, [])
+                schemas[table_name] = CoreSchema.TableSchema(
+                    table_name=table_name,
+                    schema_name=schema_name,
+                    columns=[
+                        CoreSchema.ColumnMetadata(
+                            name=column.column_name,
+                            data_type=column.data_type,
+                            nullable=column.is_nullable == "YES",
+                            default=column.column_default,
+                            is_primary_key=column.column_name in keys,
+                            max_length=int(column.character_maximum_length) if column.character_maximum_length is not None else None,
+                        )
+                        for column in group.itertuples(index=False)
+                    ],
+                    primary_keys=keys,
+                    indexes=[],
+                    row_count=row_counts.get(table_name),
+                    foreign_keys=references.get(table_name, []),
+                )
+            return schemas
+
+
+def sql_in_filter(column: str, values: list[str] | None) -> str:
+    """Return an `and <column> in (...)` clause restricting a catalog query to `values` (empty when None)."""
+    if values is None:
+        return ""
+    literals: str = ", ".join("'" + value.replace("'", "''") + "'" for value in values)
+    return f"and {column} in ({literals})"
+
 
 class SqlLoader(DataLoader):
     """Loader for fixed data entities."""
@@ -189,16 +252,21 @@ class SqlLoader(DataLoader):
         # Note: In manual mode we rename by position (data.columns = table_cfg.columns).
         # We only need to ensure counts match here. Config-only checks live in EntitySpecification.
 
-    async def load(self, entity_name: str, table_cfg: "TableConfig") -> pd.DataFrame:
+    async def load(self, entity_name: str, table_cfg: "TableConfig", limit: int | None = None) -> pd.DataFrame:
         """Load SQL data entity based on configuration.
         Note: Columns are auto-detected from the query result if not specified in configuration.
               The returned column order will be as defined in columns.
+              If `limit` is given, it is pushed into the query (see `inject_limit`).
         """
 
         if table_cfg.type != "sql":
             raise ValueError(f"Entity '{entity_name}' is not configured as fixed SQL data")
 
-        data: pd.DataFrame = await self.read_sql(sql=table_cfg.query)  # type: ignore[arg-type]
+        sql: str = table_cfg.query  # type: ignore[assignment]
+        if limit:
+            sql = self.inject_limit(sql, limit)
+
+        data: pd.DataFrame = await self.read_sql(sql=sql)
 
         auto_detect_columns: bool = True
         if table_cfg.auto_detect_columns is not None:
@@ -263,6 +331,16 @@ class SqlLoader(DataLoader):
     async def get_table_schema(self, table_name: str, **kwargs) -> CoreSchema.TableSchema:
         pass
 
+    async def get_table_schemas(self, table_names: list[str] | None = None, **kwargs) -> dict[str, CoreSchema.TableSchema]:
+        """Get schemas for all tables (or only `table_names`), keyed by table name.
+
+        This fallback introspects one table at a time. Drivers with a queryable catalog override it
+        to fetch columns, keys and row estimates for every requested table in a few bulk queries.
+        """
+        if table_names is None:
+            table_names = list((await self.get_tables(**kwargs)).keys())
+        return {table_name: await self.get_table_schema(table_name, **kwargs) for table_name in table_names}
+
     def get_test_query(self, table_name: str, limit: int) -> str:
         """Get a test query for the data source, if applicable."""
         return f"select * from {table_name} limit {limit} ;"
@@ -379,8 +457,8 @@ class SqliteLoader(SqlLoader):
             raise ValueError("Data source configuration is required for SqliteLoader")
 
         filename: str = (
-            dotget(self.data_source.data_source_cfg or {}, "database,filename,dbname", ":memory:")
-            or dotget(self.data_source.options or {}, "database,filename,dbname", ":memory:")
+            dotget(self.data_source.data_source_cfg or {}, "database,filename,dbname")
+            or dotget(self.data_source.options or {}, "database,filename,dbname")
             or ":memory:"
         )
 
@@ -438,6 +516,50 @@ class SqliteLoader(SqlLoader):
             indexes=[],
         )
 
+    async def get_table_schemas(self, table_names: list[str] | None = None, **kwargs) -> dict[str, CoreSchema.TableSchema]:
+        """Get schemas for all (or the named) SQLite tables with two catalog queries.
+
+        Columns and foreign keys are read through the `pragma_table_info` and `pragma_foreign_key_list`
+        table-valued functions joined to `sqlite_master`. SQLite keeps no row estimates, so `row_count` is None.
+        """
+        if table_names is not None and not table_names:
+            return {}
+
+        table_filter: str = sql_in_filter("m.name", table_names)
+        columns_query: str = f"""
+            select
+                m.name as table_name,
+                p.name as column_name,
+                p.type as data_type,
+                case when p."notnull" = 1 then 'NO' else 'YES' end as is_nullable,
+                p.dflt_value as column_default,
+                null as character_maximum_length,
+                p.pk as key_position
+            from sqlite_master m
+            join pragma_table_info(m.name) p
+            where m.type = 'table' and m.name not like 'sqlite_%' {table_filter}
+            order by m.name, p.cid
+        """
+        fk_query: str = f"""
+            select
+                m.name as table_name,
+                f."from" as column_name,
+                null as referenced_schema,
+                f."table" as referenced_table,
+                f."to" as referenced_column,
+                null as constraint_name
+            from sqlite_master m
+            join pragma_foreign_key_list(m.name) f
+            where m.type = 'table' and m.name not like 'sqlite_%' {table_filter}
+            order by m.name, f.id, f.seq
+        """
+
+        columns_data: pd.DataFrame = await self.read_sql(columns_query)
+        fk_data: pd.DataFrame = await self.read_sql(fk_query)
+        pk_data: pd.DataFrame = columns_data[columns_data["key_position"] > 0].sort_values(["table_name", "key_position"])
+
+        return CoreSchema.TableSchema.from_catalog(None, columns_data, pk_data, fk_data)
+
     async def get_tables(self, **kwargs) -> dict[str, CoreSchema.TableMetadata]:
         """Get tables from SQLite database."""
         query = """
@@ -659,6 +781,77 @@ class PostgresSqlLoader(SqlLoader):
             indexes=[],
         )
 
+    async def get_table_schemas(self, table_names: list[str] | None = None, **kwargs) -> dict[str, CoreSchema.TableSchema]:
+        """Get schemas for all (or the named) tables in a PostgreSQL schema with four catalog queries.
+
+        Unlike `get_table_schema`, row counts are the planner estimates in `pg_class.reltuples`
+        (None for tables that have never been analyzed) rather than exact counts.
+        """
+        if table_names is not None and not table_names:
+            return {}
+
+        schema: str = kwargs.get("schema") or "public"
+        schema_literal: str = schema.replace("'", "''")
+
+        columns_query: str = f"""
+            select table_name, column_name, data_type, is_nullable, column_default, character_maximum_length
+            from information_schema.columns
+            where table_schema = '{schema_literal}' {sql_in_filter("table_name", table_names)}
+            order by table_name, ordinal_position
+        """
+
+        pk_query: str = f"""
+            select c.relname as table_name, a.attname as column_name
+            from pg_index i
+            join pg_class c on c.oid = i.indrelid
+            join pg_namespace n on n.oid = c.relnamespace
+            join pg_attribute a on a.attrelid = i.indrelid and a.attnum = any(i.indkey)
+            where i.indisprimary
+              and n.nspname = '{schema_literal}' {sql_in_filter("c.relname", table_names)}
+            order by c.relname, array_position(i.indkey::int2[], a.attnum)
+        """
+
+        fk_query: str = f"""
+            select
+                c.relname as table_name,
+                a.attname as column_name,
+                rn.nspname as referenced_schema,
+                rc.relname as referenced_table,
+                ra.attname as referenced_column,
+                con.conname as constraint_name
+            from pg_constraint con
+            join pg_class c on c.oid = con.conrelid
+            join pg_namespace n on n.oid = c.relnamespace
+            join pg_class rc on rc.oid = con.confrelid
+            join pg_namespace rn on rn.oid = rc.relnamespace
+            cross join lateral unnest(con.conkey, con.confkey) with ordinality as k(attnum, ref_attnum, position)
+            join pg_attribute a on a.attrelid = con.conrelid and a.attnum = k.attnum
+            join pg_attribute ra on ra.attrelid = con.confrelid and ra.attnum = k.ref_attnum
+            where con.contype = 'f'
+              and n.nspname = '{schema_literal}' {sql_in_filter("c.relname", table_names)}
+            order by c.relname, con.conname, k.position
+        """
+
+        row_count_query: str = f"""
+            select c.relname as table_name, c.reltuples::bigint as row_count
+            from pg_class c
+            join pg_namespace n on n.oid = c.relnamespace
+            where c.relkind in ('r', 'p')
+              and n.nspname = '{schema_literal}' {sql_in_filter("c.relname", table_names)}
+        """
+
+        columns_data: pd.DataFrame = await self.read_sql(columns_query)
+        pk_data: pd.DataFrame = await self.read_sql(pk_query)
+        fk_data: pd.DataFrame = await self.read_sql(fk_query)
+        count_data: pd.DataFrame = await self.read_sql(row_count_query)
+
+        row_counts: dict[str, int | None] = {
+            table_name: int(row_count) if row_count >= 0 else None
+            for table_name, row_count in zip(count_data["table_name"], count_data["row_count"])
+        }
+
+        return CoreSchema.TableSchema.from_catalog(schema, columns_data, pk_data, fk_data, row_counts)
+
 
 @DataLoaders.register(key=["ucanaccess", "access"])
 class UCanAccessSqlLoader(SqlLoader):
@@ -1,5 +1,5 @@
 import copy
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from functools import cached_property
 from typing import Any, Generator, Literal, Self
 
@@ -9,6 +9,7 @@ from loguru import logger
 
 from src.configuration import ConfigFactory, ConfigLike
 from src.configuration.config import Config, is_config_path
+from src.dependency_graph import EntityDependencyGraph
 from src.utility import dotget, unique
 
 
@@ -38,6 +39,11 @@ class UnnestConfig:
     def value_name(self) -> str:
         return self.data.get("value_name", "") or ""
 
+    @property
+    def drop_na(self) -> bool:
+        """Leave out melted rows whose value is null."""
+        return bool(self.data.get("drop_na", False))
+
 
 class ForeignKeyConstraints:
     """Constraints for foreign key relationships. Read-Only. Wraps constraints setting from foreign key config."""
@@ -279,6 +285,55 @@ class MaterializationConfig:
         return self.data.get("materialized_at")
 
 
+@dataclass(frozen=True)
+class EntityPlan:
+    """Derived column lists of an entity, compiled once from its configuration. Read-Only.
+
+    `TableConfig` serves its derived properties (`columns`, `fk_columns`, `keys_columns_and_fks`, ...)
+    from the plan instead of re-deriving them from the raw dict on every access. Values that may fail
+    on an invalid configuration (unnest) or are expensive (the content hash, which stringifies a
+    possibly large `values` block) are computed on first use.
+    """
+
+    columns: tuple[str, ...]
+    keys: frozenset[str]
+    keys_and_columns: tuple[str, ...]
+    fk_columns: frozenset[str]
+    extra_column_names: tuple[str, ...]
+    entity_cfg: dict[str, Any] = field(repr=False, compare=False)
+
+    @classmethod
+    def compile(cls, table_cfg: "TableConfig") -> "EntityPlan":
+        entity_cfg: dict[str, Any] = table_cfg.entity_cfg
+        columns: list[str] = unique(entity_cfg.get("columns"))
+        keys: set[str] = set(entity_cfg.get("keys", []) or [])
+        return cls(
+            columns=tuple(columns),
+            keys=frozenset(keys),
+            keys_and_columns=tuple(list(keys) + [col for col in columns if col not in keys]),
+            fk_columns=frozenset(col for fk in table_cfg.foreign_keys or [] for col in fk.local_keys),
+            extra_column_names=tuple((entity_cfg.get("extra_columns", {}) or {}).keys()),
+            entity_cfg=entity_cfg,
+        )
+
+    @cached_property
+    def unnest_columns(self) -> frozenset[str]:
+        if not self.entity_cfg.get("unnest"):
+            return frozenset()
+        unnest: UnnestConfig = UnnestConfig(data=self.entity_cfg)
+        return frozenset({unnest.var_name, unnest.value_name})
+
+    @cached_property
+    def keys_columns_and_fks(self) -> tuple[str, ...]:
+        excluded: set[str] = set(self.keys_and_columns) | self.unnest_columns
+        return self.keys_and_columns + tuple(unique([col for col in self.fk_columns if col not in excluded]))
+
+    @cached_property
+    def content_hash(self) -> str:
+        """Hash of the entity configuration for change detection."""
+        return xxhash.xxh64(str(sorted(self.entity_cfg.items())).encode()).hexdigest()
+
+
 class TableConfig:
     """Configuration for a database table. Read-Only. Wraps table setting from entities config."""
 
@@ -287,11 +342,25 @@ class TableConfig:
         self.entities_cfg: dict[str, dict[str, Any]] = entities_cfg
         self.entity_name: str = entity_name
         self.entity_cfg: dict[str, Any] = entities_cfg[entity_name]
+        self._plan: EntityPlan | None = None
+        self._sub_table_configs: list[TableConfig] | None = None
 
         assert self.entity_cfg, f"No configuration found for entity '{entity_name}'"
 
     @property
-    def type(self) -> Literal["entity", "sql", "fixed", "csv", "xlsx", "openpyxl", "merged"] | None:
+    def plan(self) -> EntityPlan:
+        """Compiled derived column lists (compiled on first access)."""
+        if self._plan is None:
+            self._plan = EntityPlan.compile(self)
+        return self._plan
+
+    def invalidate(self) -> None:
+        """Drop the compiled plan and sub-table configs after the entity config has been changed in place."""
+        self._plan = None
+        self._sub_table_configs = None
+
+    @property
+    def type(self) -> Literal["entity", "sql", "fixed", "csv", "xlsx", "openpyxl", "parquet", "feather", "merged"] | None:
         return self.entity_cfg.get("type", None)
 
     @property
@@ -357,7 +426,7 @@ class TableConfig:
 
     @property
     def keys(self) -> set[str]:
-        return set(self.entity_cfg.get("keys", []) or [])
+        return set(self.plan.keys)
 
     @property
     def safe_keys(self) -> list[str]:
@@ -369,20 +438,18 @@ class TableConfig:
 
     @property
     def columns(self) -> list[str]:
-        return unique(self.entity_cfg.get("columns"))
+        return list(self.plan.columns)
 
     @property
     def safe_columns(self) -> list[str]:
         """Return the list of columns converting to a list if necessary."""
-        columns: str | list[Any] = self.columns or []
-        if isinstance(columns, str):
-            columns = [columns]
-        return columns
+        return list(self.plan.columns)
 
     @columns.setter
     def columns(self, value: list[str]) -> None:
         """Set columns list. Used to update columns after auto-detection. Not persistent."""
         self.entity_cfg["columns"] = value
+        self.invalidate()
 
     @property
     def extra_columns(self) -> dict[str, Any]:
@@ -390,7 +457,7 @@ class TableConfig:
 
     @property
     def extra_column_names(self) -> list[str]:
-        return list(self.extra_columns.keys())
+        return list(self.plan.extra_column_names)
 
     @property
     def drop_duplicates(self) -> bool | list[str]:
@@ -444,6 +511,31 @@ class TableConfig:
             | filter_dependencies
         )
 
+    @property
+    def preserves_row_prefix(self) -> bool:
+        """True if the first N output rows can be produced from the first N source rows.
+
+        Filters (including `exists_in`), deduplication, empty-row drops, unnesting with `drop_na`, merged
+        branches and foreign keys not linked with `how: left` (the default is an inner join) may discard or
+        reorder rows, so a row limit must not be pushed past them.
+        """
+        if self.type == "merged" or self.filters or self.drop_duplicates or self.drop_empty_rows:
+            return False
+        if self.unnest and self.unnest.drop_na:
+            return False
+        return all(fk.how == "left" for fk in self.foreign_keys)
+
+    @property
+    def row_source_entities(self) -> set[str]:
+        """Entities whose rows this entity is built from (`source` and append sources, not lookups)."""
+        row_sources: set[str] = set()
+        if self.type in (None, "entity") and not self.data_source and isinstance(self.source, str):
+            row_sources.add(self.source)
+        for append_cfg in self.append_configs:
+            if isinstance(append_cfg.get("source"), str) and append_cfg.get("type") in (None, "entity"):
+                row_sources.add(append_cfg["source"])
+        return row_sources
+
     @cached_property
     def foreign_keys(self) -> list[ForeignKeyConfig]:
         return [
@@ -541,7 +633,7 @@ class TableConfig:
     @property
     def keys_and_columns(self) -> list[str]:
         """Get columns with keys first, followed by other columns."""
-        return list(self.keys) + [col for col in self.columns if col not in self.keys]
+        return list(self.plan.keys_and_columns)
 
     @property
     def identity_columns(self) -> list[str]:
@@ -592,10 +684,7 @@ class TableConfig:
     @property
     def unnest_columns(self) -> set[str]:
         """Get set of columns that are pending (e.g., from unnesting)."""
-        if not self.unnest:
-            return set()
-
-        return {self.unnest.var_name, self.unnest.value_name}
+        return set(self.plan.unnest_columns)
 
     @property
     def surviving_unnest_columns(self) -> set[str]:
@@ -622,6 +711,12 @@ class TableConfig:
     def options(self) -> dict[str, Any]:
         return self.entity_cfg.get("options", {}) or {}
 
+    @options.setter
+    def options(self, value: dict[str, Any]) -> None:
+        """Set loader options (e.g. resolved file paths). Not persistent."""
+        self.entity_cfg["options"] = value
+        self.invalidate()
+
     def is_unnested(self, table: pd.DataFrame) -> bool:
         """Check if the table has been unnested based on the presence of unnest columns."""
         if not self.unnest:
@@ -631,7 +726,7 @@ class TableConfig:
     @property
     def fk_columns(self) -> set[str]:
         """Get set of all foreign key columns."""
-        return {col for fk in self.foreign_keys or [] for col in fk.local_keys}
+        return set(self.plan.fk_columns)
 
     @cached_property
     def extra_fk_columns(self) -> set[str]:
@@ -644,10 +739,7 @@ class TableConfig:
     @property
     def keys_columns_and_fks(self) -> list[str]:
         """Get set of all columns used in keys, columns, and foreign keys, pending unnesting columns excluded)."""
-        keys_and_data_columns: list[str] = self.keys_and_columns
-        return keys_and_data_columns + unique(
-            list(x for x in self.fk_columns if x not in keys_and_data_columns and x not in self.unnest_columns)
-        )
+        return list(self.plan.keys_columns_and_fks)
 
     def get_columns(
         self, include_keys: bool = True, include_fks: bool = True, include_extra: bool = True, include_unnest: bool = True
@@ -942,12 +1034,21 @@ class TableConfig:
             for FK propagation and branch discriminator.
 
         This allows the shapeshifter to treat the base table and append items
-        (or branch sources) uniformly through the same processing pipeline.
+        (or branch sources) uniformly through the same processing pipeline. The configs
+        are compiled on first use and reused until the entity is invalidated.
 
         Yields:
             TableConfig: For standard entities: base config first, then one per append item.
                         For merged entities: one per branch source.
         """
+        if self._sub_table_configs is None:
+            self._sub_table_configs = list(self._compile_sub_table_configs())
+        yield from self._sub_table_configs
+
+    def _compile_sub_table_configs(self) -> Generator[Self | "TableConfig", Any, None]:
+        # Sub-table configs are registered in a copy of the entities config so the project's own
+        # entities dict is never modified.
+
         # Handle merged entities differently - they have no base data, only branch sources
         if self.type == "merged":
             for idx, branch_data in enumerate(self.branches):
@@ -982,18 +1083,15 @@ class TableConfig:
                     "_merged_entity": self.entity_name,  # Back-reference to merged entity
                 }
 
-                self.entities_cfg[branch_entity_name] = branch_cfg
-                yield TableConfig(entities_cfg=self.entities_cfg, entity_name=branch_entity_name)
-                del self.entities_cfg[branch_entity_name]
+                yield TableConfig(entities_cfg=self.entities_cfg | {branch_entity_name: branch_cfg}, entity_name=branch_entity_name)
         else:
             # Standard/append entity processing
             yield self
 
             for idx, append_data in enumerate(self.append_configs):
                 append_entity_name: str = f"{self.entity_name}__append_{idx}"
-                self.entities_cfg[append_entity_name] = self.create_append_config(append_data)
-                yield TableConfig(entities_cfg=self.entities_cfg, entity_name=append_entity_name)
-                del self.entities_cfg[append_entity_name]
+                append_cfg: dict[str, Any] = self.create_append_config(append_data)
+                yield TableConfig(entities_cfg=self.entities_cfg | {append_entity_name: append_cfg}, entity_name=append_entity_name)
 
     def get_key_columns(self) -> set[str]:
         """Get all key columns including system_id and public_id."""
@@ -1006,8 +1104,7 @@ class TableConfig:
 
     def hash(self) -> str:
         """Compute a hash of the metadata for change detection."""
-        metadata_str = str(sorted(self.entity_cfg.items()))
-        return xxhash.xxh64(metadata_str.encode()).hexdigest()
+        return self.plan.content_hash
 
 
 class Metadata:
@@ -1454,6 +1551,7 @@ class ShapeShiftProject:
 
         self.cfg: dict[str, dict[str, Any]] = cfg
         self.filename: str = filename or "in-memory-config.yml"
+        self._reorder_fronts: dict[str, list[str]] = {}
 
     @cached_property
     def tables(self) -> dict[str, TableConfig]:
@@ -1489,6 +1587,11 @@ class ShapeShiftProject:
         """Get ingester configurations from project options."""
         return self.options.get("ingesters", {}) or {}
 
+    @cached_property
+    def dependency_graph(self) -> EntityDependencyGraph:
+        """Dependency graph of the project's entities (built once, the project is read-only)."""
+        return EntityDependencyGraph.from_project(self)
+
     @cached_property
     def layout_options(self) -> LayoutOptions:
         """Get layout options for dependency graph visualization."""
@@ -1565,6 +1668,19 @@ class ShapeShiftProject:
         new_column_order: list[str] = existing_cols_to_move + other_cols
         return unique(new_column_order)
 
+    def _reorder_front(self, table_cfg: TableConfig) -> list[str]:
+        """Columns moved to the front by `reorder_columns` (memoized for the project's own entities)."""
+        own: bool = self.tables.get(table_cfg.entity_name) is table_cfg
+        if own and table_cfg.entity_name in self._reorder_fronts:
+            return self._reorder_fronts[table_cfg.entity_name]
+
+        front: list[str] = [table_cfg.public_id] if table_cfg.public_id else []
+        front.extend(sorted([self.get_table(fk.remote_entity).public_id for fk in table_cfg.foreign_keys]))
+        front.extend(sorted(table_cfg.extra_column_names))
+        if own:
+            self._reorder_fronts[table_cfg.entity_name] = front
+        return front
+
     def reorder_columns(self, table_cfg: str | TableConfig, table: pd.DataFrame) -> pd.DataFrame:
         """Reorder columns in the DataFrame to have system_id, public_id, FK columns, extra columns, then others.
 
@@ -1577,21 +1693,7 @@ class ShapeShiftProject:
             table_cfg = self.get_table(entity_name=table_cfg)
 
         # Build ordered list: system_id (if present), public_id, FK columns (parent's public_id), extra columns
-        cols_to_move: list[str] = []
-
-        # Add system_id if present in dataframe
-        if "system_id" in table.columns:
-            cols_to_move.append("system_id")
-
-        # Add entity's own public_id
-        if table_cfg.public_id:
-            cols_to_move.append(table_cfg.public_id)
-
-        # Add FK columns (use parent's public_id)
-        cols_to_move.extend(sorted([self.get_table(fk.remote_entity).public_id for fk in table_cfg.foreign_keys]))
-
-        # Add extra columns
-        cols_to_move.extend(sorted(table_cfg.extra_column_names))
+        cols_to_move: list[str] = (["system_id"] if "system_id" in table.columns else []) + self._reorder_front(table_cfg)
 
         # Remove duplicates while preserving order
         existing_cols_to_move: list[str] = []
@@ -1601,7 +1703,7 @@ class ShapeShiftProject:
                 existing_cols_to_move.append(col)
                 seen.add(col)
 
-        other_cols: list[str] = [col for col in table.columns if col not in existing_cols_to_move]
+        other_cols: list[str] = [col for col in table.columns if col not in seen]
         new_column_order: list[str] = existing_cols_to_move + sorted(other_cols)
         table = table[new_column_order]
         return table
@@ -1664,20 +1766,54 @@ class ShapeShiftProject:
 
     def get_required_entities(self, entity_name: str) -> set[str]:
         """Get all entities required to process the given entity (including the entity itself)."""
-        required_entities: set[str] = {entity_name}
+        return self.dependency_graph.required(entity_name)
+
+    def get_row_limit_entities(self, entity_name: str) -> set[str]:
+        """Get entities whose source rows may be limited when only the head of `entity_name` is needed.
+
+        Starting at `entity_name`, the limit is pushed up through `source`/append edges as long as each
+        entity preserves its row prefix (see `TableConfig.preserves_row_prefix`). An upstream entity is
+        only included if every consumer within the required subgraph reads it as a row source and is
+        itself limited, so foreign key lookups and `exists_in` targets are always loaded in full.
+        """
+        if entity_name not in self.tables:
+            return set()
+
+        required: set[str] = self.get_required_entities(entity_name)
+        consumers: dict[str, set[str]] = {}
+        for name in required:
+            if name not in self.tables:
+                continue
+            for dep in self.get_table(name).depends_on:
+                consumers.setdefault(dep, set()).add(name)
+
+        limited: set[str] = set()
         unprocessed: list[str] = [entity_name]
 
         while unprocessed:
             current: str = unprocessed.pop()
-            if current not in self.tables:
+            table_cfg: TableConfig = self.get_table(current)
+            if not table_cfg.preserves_row_prefix:
                 continue
-            for dep in self.get_table(entity_name=current).depends_on:
-                if dep in required_entities:
+            limited.add(current)
+            for upstream in table_cfg.row_source_entities:
+                if upstream in limited or upstream not in self.tables:
                     continue
-                required_entities.add(dep)
-                unprocessed.append(dep)
+                readers: set[str] = consumers.get(upstream, set())
+                if all(reader in limited and self._reads_rows_only(reader, upstream) for reader in readers):
+                    unprocessed.append(upstream)
+
+        return limited
 
-        return required_entities
+    def _reads_rows_only(self, entity_name: str, upstream: str) -> bool:
+        """True if `entity_name` depends on `upstream` only as a row source."""
+        table_cfg: TableConfig = self.get_table(entity_name)
+        if upstream not in table_cfg.row_source_entities:
+            return False
+        lookups: set[str] = {fk.remote_entity for fk in table_cfg.foreign_keys}
+        lookups |= {f["other_entity"] for f in table_cfg.filters if isinstance(f.get("other_entity"), str)}
+        lookups |= set(table_cfg.entity_cfg.get("depends_on", []) or [])
+        return upstream not in lookups
 
 
 class DataSourceConfig:
@@ -10,7 +10,7 @@ from typing import Any, Self
 import pandas as pd
 from loguru import logger
 
-from src.dispatch import Dispatcher, Dispatchers
+from src.dispatch import Dispatcher, Dispatchers, write_table_shapes
 from src.extract import SubsetService
 from src.loaders import DataLoader
 from src.loaders.base_loader import DataLoaders, LoaderType
@@ -18,11 +18,14 @@ from src.mapping import LinkToRemoteService
 from src.model import DataSourceConfig, ShapeShiftProject, TableConfig
 from src.path_resolution import resolve_managed_file_path
 from src.process_state import ProcessState
-from src.transforms.drop import drop_duplicate_rows, drop_empty_rows
+from src.profiling import PipelineProfiler
+from src.progress import ProgressReporter
+from src.transforms.drop import RowHashCache, drop_duplicate_rows, drop_empty_rows, has_duplicate_rows
 from src.transforms.extra_columns import ExtraColumnEvaluator
-from src.transforms.filter import apply_filters
+from src.transforms.filter import FilterCache, apply_filters
 from src.transforms.link import ForeignKeyLinker
 from src.transforms.translate import translate
+from src.transforms.union import StreamingUnion
 from src.transforms.unnest import unnest
 from src.transforms.utility import add_system_id  # Renamed from add_surrogate_id
 
@@ -35,6 +38,9 @@ class ShapeShifter:
         default_entity: str | None = None,
         table_store: dict[str, pd.DataFrame] | None = None,
         target_entities: set[str] | None = None,
+        row_limits: dict[str, int] | None = None,
+        profiler: PipelineProfiler | None = None,
+        progress: ProgressReporter | None = None,
     ) -> None:
 
         if not project or not isinstance(project, (ShapeShiftProject, str)):
@@ -44,9 +50,22 @@ class ShapeShifter:
         self.table_store: dict[str, pd.DataFrame] = table_store or {}
         self.project: ShapeShiftProject = ShapeShiftProject.from_source(project)
         self.state: ProcessState = ProcessState(project=self.project, table_store=self.table_store, target_entities=target_entities)
-        self.linker: ForeignKeyLinker = ForeignKeyLinker(table_store=self.table_store, project=self.project)
+        # Per-entity, per-stage instrumentation (records nothing unless an enabled profiler is given)
+        self.profiler: PipelineProfiler = profiler or PipelineProfiler.disabled()
+        # Per-entity progress events and cooperative cancellation (no-ops unless a reporter is given)
+        self.progress: ProgressReporter = progress or ProgressReporter.disabled()
+        self.linker: ForeignKeyLinker = ForeignKeyLinker(table_store=self.table_store, project=self.project, profiler=self.profiler)
         self.extra_col_evaluator: ExtraColumnEvaluator = ExtraColumnEvaluator()
+        # Lookup indexes and compiled queries shared by the filters of all entities and stages in this run
+        self.filter_cache: FilterCache = FilterCache()
+        # Column hashes of recently deduplicated frames, reused by the duplicate-key check
+        self.row_hashes: RowHashCache = RowHashCache()
         self.unresolved_extra_columns: dict[str, dict[str, dict[str, Any]]] = {}
+        # Per-entity source row limits (preview mode), see ShapeShiftProject.get_row_limit_entities
+        self.row_limits: dict[str, int] = row_limits or {}
+        self.truncated_entities: set[str] = set()
+        # Target whose table shapes were already written by the dispatcher
+        self.shapes_written_for: str | None = None
 
     def resolve_loader(self, table_cfg: TableConfig) -> DataLoader | None:
         """Resolve the DataLoader, if any, for the given TableConfig."""
@@ -81,37 +100,49 @@ class ShapeShifter:
 
         project_dir = Path(project_filename).resolve().parent
         options["filename"] = str(resolve_managed_file_path(filename, location="local", local_root=project_dir))
-        table_cfg.entity_cfg["options"] = options
+        table_cfg.options = options
 
-    async def resolve_source(self, table_cfg: TableConfig) -> pd.DataFrame:
-        """Resolve the source DataFrame for the given entity based on its configuration."""
+    async def resolve_source(self, table_cfg: TableConfig, limit: int | None = None) -> pd.DataFrame:
+        """Resolve the source DataFrame for the given entity based on its configuration.
+
+        If `limit` is given, only the first `limit` source rows are loaded (or taken from the table store).
+        """
         logger.trace(f"Resolving source for entity '{table_cfg.entity_name}'")
         loader: DataLoader | None = self.resolve_loader(table_cfg=table_cfg)
         if loader:
             self._resolve_project_local_file_options(table_cfg, loader)
             logger.trace(f"{table_cfg.entity_name}[source]: Loading data using loader '{loader.__class__.__name__}'...")
-            return await loader.load(entity_name=table_cfg.entity_name, table_cfg=table_cfg)
+            return await loader.load(entity_name=table_cfg.entity_name, table_cfg=table_cfg, limit=limit)
 
         source_table: str | None = table_cfg.source or self.default_entity
         if source_table and source_table in self.table_store:
             logger.trace(f"{table_cfg.entity_name}[source]: Using source table '{source_table}' from table_store...")
-            return self.table_store[source_table]
+            return self.table_store[source_table].head(limit) if limit else self.table_store[source_table]
 
         raise ValueError(f"Unable to resolve source for entity '{table_cfg.entity_name}'")
 
     async def get_subset(self, subset_service: SubsetService, entity: str, table_cfg: TableConfig) -> pd.DataFrame:
 
-        dfs: list[pd.DataFrame] = []
+        limit: int | None = self.row_limits.get(entity)
+        # Sub-tables are loaded, subset and appended one at a time, so only one is held besides the union buffers
+        union: StreamingUnion = StreamingUnion(distinct=table_cfg.append_mode == "distinct")
 
         for sub_table_cfg in table_cfg.get_sub_table_configs():
             # logger.debug(f"{entity}[normalizing]: Processing sub-table '{sub_table_cfg.entity_name}'...")
-            sub_source: pd.DataFrame = await self.resolve_source(table_cfg=sub_table_cfg)
-            sub_data: pd.DataFrame = subset_service.get_subset(
-                source=sub_source,
-                table_cfg=sub_table_cfg,
-                drop_empty=False,
-                raise_if_missing=False,
-            )
+            with self.profiler.stage(entity, "load", source=sub_table_cfg.entity_name) as record:
+                sub_source: pd.DataFrame = await self.resolve_source(table_cfg=sub_table_cfg, limit=limit)
+                record.rows_out = len(sub_source)
+            if limit and len(sub_source) >= limit:
+                self.truncated_entities.add(entity)
+            with self.profiler.stage(entity, "subset", sub_source) as record:
+                sub_data: pd.DataFrame = subset_service.get_subset(
+                    source=sub_source,
+                    table_cfg=sub_table_cfg,
+                    drop_empty=False,
+                    raise_if_missing=False,
+                )
+                record.rows_out = len(sub_data)
+            del sub_source
             # Apply column renaming for append items (align_by_position or column_mapping)
             # Pass parent's columns for align_by_position
             sub_data = sub_table_cfg.apply_column_renaming(sub_data, parent_columns=table_cfg.columns)
@@ -120,24 +151,17 @@ class ShapeShifter:
             if table_cfg.type == "merged":
                 sub_data = self._process_merged_branch(entity, table_cfg, sub_table_cfg, sub_data)
 
-            dfs.append(sub_data)
+            union.append(sub_data)
+            del sub_data
 
-        # Concatenate all dataframes while excluding all-NA columns from dtype inference.
-        # The dropped columns are restored afterward to preserve the expected schema.
-        non_empty_dfs: list[pd.DataFrame] = [df for df in dfs if not df.empty]
-        if not non_empty_dfs:
+        if union.empty:
             logger.warning(f"{entity}[normalizing]: All sub-tables are empty after processing.")
 
-        concat_columns: list[str] = list(dict.fromkeys(col for df in non_empty_dfs for col in df.columns))
-        sanitized_dfs: list[pd.DataFrame] = [df.dropna(axis=1, how="all") for df in non_empty_dfs]
+        if union.appended == 0:
+            return pd.DataFrame(columns=table_cfg.keys_columns_and_fks)
 
-        data: pd.DataFrame = (
-            pd.concat(sanitized_dfs, ignore_index=True).reindex(columns=concat_columns)
-            if non_empty_dfs
-            else pd.DataFrame(columns=table_cfg.keys_columns_and_fks) if len(dfs) == 0 else dfs[0]
-        )
-
-        return data
+        # Columns that are all-NA in a sub-table are excluded from dtype inference, missing columns are NA-filled
+        return union.result()
 
     def _process_merged_branch(
         self, entity: str, table_cfg: TableConfig, sub_table_cfg: TableConfig, sub_data: pd.DataFrame
@@ -197,9 +221,12 @@ class ShapeShifter:
     async def normalize(self) -> Self:
         """Extract all configured entities and store them."""
         subset_service: SubsetService = SubsetService()
+        total: int = len(self.state.unprocessed_entities)
 
         while len(self.state.unprocessed_entities) > 0:
 
+            self.progress.check_cancelled()
+
             entity: str | None = self.state.get_next_entity_to_process()
 
             if entity is None:
@@ -217,74 +244,105 @@ class ShapeShifter:
             # Evaluate extra_columns immediately after loading (before FK linking)
             # This ensures columns added via extra_columns (including key columns) are available for FK validation
             if table_cfg.extra_columns:
-                data, deferred = self.extra_col_evaluator.evaluate_extra_columns(
-                    df=data,
-                    extra_columns=table_cfg.extra_columns,
-                    entity_name=entity,
-                    defer_missing=True,  # Defer columns that reference FK-added columns
-                )
+                with self.profiler.stage(entity, "extra_columns", data) as record:
+                    data, deferred = self.extra_col_evaluator.evaluate_extra_columns(
+                        df=data,
+                        extra_columns=table_cfg.extra_columns,
+                        entity_name=entity,
+                        defer_missing=True,  # Defer columns that reference FK-added columns
+                    )
+                    record.rows_out = len(data)
                 if deferred:
                     logger.trace(f"{entity}[extra_columns]: Deferred {len(deferred)} columns until after FK linking")
 
             if table_cfg.filters:
-                data = apply_filters(name=entity, df=data, cfg=table_cfg, data_store=self.table_store, stage="extract")
+                with self.profiler.stage(entity, "filters", data, filter_stage="extract") as record:
+                    data = apply_filters(
+                        name=entity, df=data, cfg=table_cfg, data_store=self.table_store, stage="extract", cache=self.filter_cache
+                    )
+                    record.rows_out = len(data)
 
             delay_drop_duplicates: bool = table_cfg.is_drop_duplicate_dependent_on_unnesting()
             # Apply post-concatenation deduplication if append_mode is "distinct"
             # if table_cfg.has_append and table_cfg.append_mode == "distinct" and not delay_drop_duplicates:
             if table_cfg.drop_duplicates and not delay_drop_duplicates:
-                data = self.drop_duplicates(entity, table_cfg, data)
+                with self.profiler.stage(entity, "dedup", data) as record:
+                    data = self.drop_duplicates(entity, table_cfg, data)
+                    record.rows_out = len(data)
                 # logger.info(f"{entity}[append]: Applied UNION DISTINCT, rows after dedup: {len(data)}")
 
             self.table_store[entity] = data
 
-            self.linker.link_entity(entity_name=entity)
-
-            # Re-evaluate deferred extra_columns after FK linking (in case they reference FK-added columns)
-            self._evaluate_deferred_extra_columns(entity)
-
-            if table_cfg.filters:
-                self.table_store[entity] = apply_filters(
-                    name=entity,
-                    df=self.table_store[entity],
-                    cfg=table_cfg,
-                    data_store=self.table_store,
-                    stage="after_link",
-                )
-
-            if table_cfg.unnest:
-                self.unnest_entity(entity=entity)
+            with self.profiler.stage(entity, "linking", data) as record:
                 self.linker.link_entity(entity_name=entity)
-                # Re-evaluate deferred extra_columns after unnesting (in case unnest added new columns)
+
+                # Re-evaluate deferred extra_columns after FK linking (in case they reference FK-added columns)
                 self._evaluate_deferred_extra_columns(entity)
+                record.rows_out = len(self.table_store[entity])
 
-                if table_cfg.filters:
+            if table_cfg.filters:
+                with self.profiler.stage(entity, "filters", self.table_store[entity], filter_stage="after_link") as record:
                     self.table_store[entity] = apply_filters(
                         name=entity,
                         df=self.table_store[entity],
                         cfg=table_cfg,
                         data_store=self.table_store,
-                        stage="after_unnest",
+                        stage="after_link",
+                        cache=self.filter_cache,
                     )
+                    record.rows_out = len(self.table_store[entity])
+
+            if table_cfg.unnest:
+                with self.profiler.stage(entity, "unnest", self.table_store[entity]) as record:
+                    self.unnest_entity(entity=entity)
+                    record.rows_out = len(self.table_store[entity])
+
+                with self.profiler.stage(entity, "linking", self.table_store[entity], after="unnest") as record:
+                    self.linker.link_entity(entity_name=entity)
+                    # Re-evaluate deferred extra_columns after unnesting (in case unnest added new columns)
+                    self._evaluate_deferred_extra_columns(entity)
+                    record.rows_out = len(self.table_store[entity])
+
+                if table_cfg.filters:
+                    with self.profiler.stage(entity, "filters", self.table_store[entity], filter_stage="after_unnest") as record:
+                        self.table_store[entity] = apply_filters(
+                            name=entity,
+                            df=self.table_store[entity],
+                            cfg=table_cfg,
+                            data_store=self.table_store,
+                            stage="after_unnest",
+                            cache=self.filter_cache,
+                        )
+                        record.rows_out = len(self.table_store[entity])
 
             if delay_drop_duplicates and table_cfg.drop_duplicates:
-                self.table_store[entity] = self.drop_duplicates(entity, table_cfg, self.table_store[entity])
+                with self.profiler.stage(entity, "dedup", self.table_store[entity], after="unnest") as record:
+                    self.table_store[entity] = self.drop_duplicates(entity, table_cfg, self.table_store[entity])
+                    record.rows_out = len(self.table_store[entity])
 
-            self._check_duplicate_keys(entity, table_cfg)
+            with self.profiler.stage(entity, "key_check", self.table_store[entity]):
+                self._check_duplicate_keys(entity, table_cfg)
+            # The hashed frames are not needed past the key check; drop them instead of holding them until the next entity
+            self.row_hashes.clear()
 
             if table_cfg.drop_empty_rows:
-                self.table_store[entity] = drop_empty_rows(
-                    data=self.table_store[entity], entity_name=entity, subset=table_cfg.drop_empty_rows
-                )
+                with self.profiler.stage(entity, "drop_empty", self.table_store[entity]) as record:
+                    self.table_store[entity] = drop_empty_rows(
+                        data=self.table_store[entity], entity_name=entity, subset=table_cfg.drop_empty_rows
+                    )
+                    record.rows_out = len(self.table_store[entity])
 
-            # Add system_id if requested and not present (always uses "system_id" column name)
-            if table_cfg.system_id and table_cfg.system_id not in self.table_store[entity].columns:
-                self.table_store[entity] = add_system_id(self.table_store[entity], table_cfg.system_id)
+            with self.profiler.stage(entity, "identity", self.table_store[entity]) as record:
+                # Add system_id if requested and not present (always uses "system_id" column name)
+                if table_cfg.system_id and table_cfg.system_id not in self.table_store[entity].columns:
+                    self.table_store[entity] = add_system_id(self.table_store[entity], table_cfg.system_id)
 
-            # Add public_id column immediately so downstream merged entities see a complete source table
-            self.table_store[entity] = table_cfg.add_public_id_column(self.table_store[entity])
+                # Add public_id column immediately so downstream merged entities see a complete source table
+                self.table_store[entity] = table_cfg.add_public_id_column(self.table_store[entity])
+                record.rows_out = len(self.table_store[entity])
 
-            self.retry_linking()
+            with self.profiler.stage(entity, "retry_linking"):
+                self.retry_linking()
 
             # Verify extra_columns were evaluated for this entity
             if table_cfg.extra_columns:
@@ -301,7 +359,11 @@ class ShapeShifter:
                 self.extra_col_evaluator.verify_extra_columns(self.table_store[entity], table_cfg.extra_columns, entity)
 
             # Reorder columns immediately so each entity is fully formed before downstream entities process it
-            self.table_store[entity] = self.project.reorder_columns(entity, self.table_store[entity])
+            with self.profiler.stage(entity, "reorder", self.table_store[entity]) as record:
+                self.table_store[entity] = self.project.reorder_columns(entity, self.table_store[entity])
+                record.rows_out = len(self.table_store[entity])
+
+            self.progress.report("normalize", total - len(self.state.unprocessed_entities), total, entity=entity)
 
         self._link_deferred_foreign_keys()
 
@@ -334,6 +396,7 @@ class ShapeShifter:
             entity_name=entity_name,
             fd_check=table_cfg.check_functional_dependency,
             strict_fd_check=table_cfg.strict_functional_dependency,
+            cache=self.row_hashes,
         )
 
     def _check_duplicate_keys(self, entity: str, table_cfg: TableConfig) -> None:
@@ -349,7 +412,7 @@ class ShapeShifter:
             # We cannot check for duplicates if keys are missing, just return
             return
 
-        has_duplicate_keys: bool = bool(self.table_store[entity].duplicated(subset=list(table_cfg.keys)).any())
+        has_duplicate_keys: bool = has_duplicate_rows(self.table_store[entity], list(table_cfg.keys), cache=self.row_hashes)
         if has_duplicate_keys:
             # raise ValueError(f"{entity}[keys]: Duplicate keys found for keys {table_cfg.keys}.")
             logger.error(f"{entity}[keys]: DUPLICATE KEYS FOUND FOR KEYS {table_cfg.keys}.")
@@ -397,8 +460,11 @@ class ShapeShifter:
         """Write to specified target based on the specified mode."""
         dispatcher_cls: type[Dispatcher] = Dispatchers.get(mode)
         if dispatcher_cls:
-            dispatcher = dispatcher_cls(self.project)  # type: ignore
-            dispatcher.dispatch(target=target, data=self.table_store)
+            self.progress.check_cancelled()
+            dispatcher = dispatcher_cls(self.project, progress=self.progress)  # type: ignore
+            with self.profiler.stage("*", "store", mode=mode):
+                dispatcher.dispatch(target=target, data=self.table_store)
+            self.shapes_written_for = target if dispatcher.writes_shapes else None
         else:
             raise ValueError(f"Unsupported dispatch mode: {mode}")
         return self
@@ -471,13 +537,11 @@ class ShapeShifter:
 
     def log_shapes(self, target: str) -> Self:
         """Log the shape of each table as a TSV in same folder as target."""
+        if self.shapes_written_for == target:
+            return self
         try:
             folder: str = target if Path(target).is_dir() else str(Path(target).parent)
-            tsv_filename: Path = Path(folder) / "table_shapes.tsv"
-            with open(tsv_filename, "w", encoding="utf-8") as f:
-                f.write("entity\tnum_rows\tnum_columns\n")
-                for name, table in self.table_store.items():
-                    f.write(f"{name}\t{table.shape[0]}\t{table.shape[1]}\n")
+            tsv_filename: Path = write_table_shapes(folder, {name: table.shape for name, table in self.table_store.items()})
             logger.info(f"Table shapes written to {tsv_filename}")
         except Exception as e:  # type: ignore ; pylint: disable=broad-except
             logger.error(f"Failed to write table shapes to TSV: {e}")
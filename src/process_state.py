@@ -30,7 +30,7 @@ class ProcessState:
         return None
 
     def get_unmet_dependencies(self, entity: str) -> set[str]:
-        return self.project.get_table(entity_name=entity).depends_on - self.processed_entities
+        return set(self.project.dependency_graph.dependencies(entity)) - self.processed_entities
 
     def get_all_unmet_dependencies(self) -> dict[str, set[str]]:
         unmet_dependencies: dict[str, set[str]] = {
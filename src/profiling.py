@@ -0,0 +1,266 @@
+"""
+Per-entity, per-stage instrumentation of the normalization pipeline.
+
+A `PipelineProfiler` is handed to `ShapeShifter` (and from there to `ForeignKeyLinker`). Every
+pipeline stage of every entity (load, subset, extra_columns, filters, dedup, linking, unnest, ...)
+runs inside `profiler.stage(entity, stage)`, which records wall time, CPU time, rows in/out and the
+peak memory allocated while the stage ran. Stages may nest (each FK link is recorded inside the
+entity's linking stage).
+
+Results can be exported as JSON, as a Chrome trace (open in chrome://tracing or https://ui.perfetto.dev)
+or as a summary table. A disabled profiler (the default) records nothing and costs next to nothing.
+"""
+
+import json
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Iterator
+
+import pandas as pd
+
+PROFILE_FILENAME: str = "profile.json"
+TRACE_FILENAME: str = "profile.trace.json"
+SUMMARY_FILENAME: str = "profile_summary.tsv"
+
+
+@dataclass
+class StageRecord:
+    """Measurements for one stage of one entity."""
+
+    entity: str
+    stage: str
+    start: float = 0.0
+    wall_time: float = 0.0
+    cpu_time: float = 0.0
+    rows_in: int | None = None
+    rows_out: int | None = None
+    peak_memory: int | None = None
+    depth: int = 0
+    thread_id: int = 0
+    metadata: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class _OpenStage:
+    record: StageRecord
+    wall_start: float
+    cpu_start: float
+    memory_start: int = 0
+    memory_peak: int = 0
+
+
+class _TracemallocUsers:
+    """Reference count of the profilers tracing memory, so that one profiler's `stop()` does not end
+    tracing for others running concurrently (e.g. two requests of the backend).
+
+    The peak counter is process-wide: while profilers overlap, each one's peaks include the other's allocations.
+    """
+
+    def __init__(self) -> None:
+        self._lock: threading.Lock = threading.Lock()
+        self._users: int = 0
+        self._started: bool = False
+
+    def acquire(self) -> None:
+        with self._lock:
+            if self._users == 0 and not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started = True
+            self._users += 1
+
+    def release(self) -> None:
+        with self._lock:
+            self._users = max(self._users - 1, 0)
+            if self._users == 0 and self._started:
+                tracemalloc.stop()
+                self._started = False
+
+    def read_and_reset_peak(self) -> tuple[int, int]:
+        """Return (current, peak) traced memory and reset the peak, as one step."""
+        with self._lock:
+            memory: tuple[int, int] = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            return memory
+
+
+_TRACEMALLOC: _TracemallocUsers = _TracemallocUsers()
+
+
+class PipelineProfiler:
+    """Collects `StageRecord`s for the stages of a normalization run.
+
+    Peak memory is measured with `tracemalloc` (numpy and pandas report their buffers to it), which
+    slows allocation-heavy code down noticeably; pass `track_memory=False` for timing-only profiles.
+    """
+
+    def __init__(self, enabled: bool = True, track_memory: bool = True) -> None:
+        self.enabled: bool = enabled
+        self.track_memory: bool = enabled and track_memory
+        self.records: list[StageRecord] = []
+        self._origin: float = time.perf_counter()
+        self._stack: list[_OpenStage] = []
+        self._lock: threading.Lock = threading.Lock()
+        self._tracing: bool = False
+
+    @classmethod
+    def disabled(cls) -> "PipelineProfiler":
+        """Return a profiler that records nothing."""
+        return cls(enabled=False)
+
+    def start(self) -> "PipelineProfiler":
+        """Start memory tracing (if requested) and reset the time origin."""
+        if self.track_memory and not self._tracing:
+            _TRACEMALLOC.acquire()
+            self._tracing = True
+        self._origin = time.perf_counter()
+        return self
+
+    def stop(self) -> "PipelineProfiler":
+        """Stop memory tracing unless other profilers still use it."""
+        if self._tracing:
+            _TRACEMALLOC.release()
+            self._tracing = False
+        return self
+
+    @contextmanager
+    def stage(self, entity: str, stage: str, data: pd.DataFrame | None = None, **metadata: Any) -> Iterator[StageRecord]:
+        """Measure the enclosed block as `stage` of `entity`.
+
+        `data` (if given) sets `rows_in`; the block may set `record.rows_out` on the yielded record.
+        """
+        record: StageRecord = StageRecord(entity=entity, stage=stage, rows_in=len(data) if data is not None else None, metadata=metadata)
+        if not self.enabled:
+            yield record
+            return
+
+        if self.track_memory and not self._tracing:
+            self.start()
+
+        opened: _OpenStage = self._open(record)
+        try:
+            yield record
+        finally:
+            self._close(opened)
+
+    def _open(self, record: StageRecord) -> _OpenStage:
+        with self._lock:
+            record.depth = len(self._stack)
+            record.thread_id = threading.get_ident()
+            opened: _OpenStage = _OpenStage(record=record, wall_start=time.perf_counter(), cpu_start=time.process_time())
+            if self.track_memory:
+                current, peak = _TRACEMALLOC.read_and_reset_peak()
+                if self._stack:
+                    # The peak counter is reset per stage, so hand the parent what it has seen so far
+                    self._stack[-1].memory_peak = max(self._stack[-1].memory_peak, peak)
+                opened.memory_start = opened.memory_peak = current
+            self._stack.append(opened)
+            return opened
+
+    def _close(self, opened: _OpenStage) -> None:
+        with self._lock:
+            record: StageRecord = opened.record
+            record.start = opened.wall_start - self._origin
+            record.wall_time = time.perf_counter() - opened.wall_start
+            record.cpu_time = time.process_time() - opened.cpu_start
+            if self.track_memory and tracemalloc.is_tracing():
+                peak: int = max(opened.memory_peak, _TRACEMALLOC.read_and_reset_peak()[1])
+                record.peak_memory = max(peak - opened.memory_start, 0)
+                if len(self._stack) > 1:
+                    self._stack[-2].memory_peak = max(self._stack[-2].memory_peak, peak)
+            if self._stack and self._stack[-1] is opened:
+                self._stack.pop()
+            self.records.append(record)
+
+    def summary(self, by: str = "stage") -> pd.DataFrame:
+        """Aggregate records by `stage` or `entity` into a table sorted by total wall time.
+
+        Nested stages (the FK links inside "linking") are part of their parent's time, so they are
+        left out of the per-entity totals; the per-stage summary lists them as a stage of their own.
+        """
+        columns: list[str] = [by, "count", "wall_time", "cpu_time", "rows_in", "rows_out", "peak_memory"]
+        records: list[StageRecord] = self.records if by == "stage" else [record for record in self.records if record.depth == 0]
+        if not records:
+            return pd.DataFrame(columns=columns)
+        frame: pd.DataFrame = pd.DataFrame([asdict(record) for record in records])
+        if by == "stage":
+            # Aggregate the per-FK link records ("link:<remote>") as a single stage
+            frame["stage"] = frame["stage"].str.split(":", n=1).str[0]
+        summary: pd.DataFrame = (
+            frame.groupby(by, sort=False)
+            .agg(
+                count=("stage", "size"),
+                wall_time=("wall_time", "sum"),
+                cpu_time=("cpu_time", "sum"),
+                rows_in=("rows_in", "sum"),
+                rows_out=("rows_out", "sum"),
+                peak_memory=("peak_memory", "max"),
+            )
+            .reset_index()
+            .sort_values("wall_time", ascending=False, ignore_index=True)
+        )
+        return summary[columns]
+
+    def summary_table(self, by: str = "stage") -> str:
+        """Return the summary as a fixed-width text table."""
+        summary: pd.DataFrame = self.summary(by=by)
+        summary["peak_memory"] = summary["peak_memory"].map(_format_bytes, na_action="ignore")
+        return summary.to_string(index=False, float_format=lambda value: f"{value:.3f}")
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return all records (and the per-stage summary) as a JSON-serializable dict."""
+        return {
+            "total_wall_time": max((record.start + record.wall_time for record in self.records), default=0.0),
+            "stages": [asdict(record) for record in self.records],
+            "summary": json.loads(self.summary().to_json(orient="records")),
+        }
+
+    def to_chrome_trace(self) -> dict[str, Any]:
+        """Return the records in Chrome trace-event format (complete "X" events, times in microseconds)."""
+        events: list[dict[str, Any]] = [
+            {
+                "name": record.stage,
+                "cat": record.entity,
+                "ph": "X",
+                "ts": round(record.start * 1_000_000, 3),
+                "dur": round(record.wall_time * 1_000_000, 3),
+                "pid": os.getpid(),
+                "tid": record.thread_id,
+                "args": {
+                    "entity": record.entity,
+                    "cpu_ms": round(record.cpu_time * 1000, 3),
+                    "rows_in": record.rows_in,
+                    "rows_out": record.rows_out,
+                    "peak_memory": record.peak_memory,
+                }
+                | record.metadata,
+            }
+            for record in self.records
+        ]
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def save(self, folder: str | Path) -> dict[str, Path]:
+        """Write the JSON export, the Chrome trace and the summary table into `folder`."""
+        target: Path = Path(folder)
+        target.mkdir(parents=True, exist_ok=True)
+        paths: dict[str, Path] = {
+            "json": target / PROFILE_FILENAME,
+            "trace": target / TRACE_FILENAME,
+            "summary": target / SUMMARY_FILENAME,
+        }
+        paths["json"].write_text(json.dumps(self.to_dict(), indent=2, default=str), encoding="utf-8")
+        paths["trace"].write_text(json.dumps(self.to_chrome_trace(), default=str), encoding="utf-8")
+        self.summary().to_csv(paths["summary"], sep="\t", index=False)
+        return paths
+
+
+def _format_bytes(value: float) -> str:
+    for unit in ("B", "KB", "MB", "GB"):
+        if abs(value) < 1024 or unit == "GB":
+            return f"{value:.0f} {unit}" if unit == "B" else f"{value:.1f} {unit}"
+        value /= 1024
+    return str(value)
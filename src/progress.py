@@ -0,0 +1,55 @@
+"""
+Progress reporting and cooperative cancellation for workflow runs.
+
+A `ProgressReporter` is handed to `ShapeShifter` (and from there to the dispatcher). Normalization
+reports an event after each entity, the dispatcher after each written entity. Cancellation is
+cooperative: `check_cancelled()` is called before each entity is normalized and before dispatch
+starts, and raises `WorkflowCancelledError` if the run has been cancelled. Dispatch itself is not
+interrupted, so a cancelled run never leaves a half-written target behind.
+
+The default (disabled) reporter reports nothing and is never cancelled.
+"""
+
+from dataclasses import dataclass
+from typing import Callable
+
+from src.exceptions import WorkflowCancelledError
+
+
+@dataclass(frozen=True)
+class ProgressEvent:
+    """Progress of one phase ("normalize" or "dispatch") of a workflow run."""
+
+    phase: str
+    current: int
+    total: int
+    entity: str | None = None
+    message: str = ""
+
+
+ProgressCallback = Callable[[ProgressEvent], None]
+
+
+class ProgressReporter:
+    """Forwards progress events to `callback` and polls `is_cancelled` at entity boundaries.
+
+    Both callables may be invoked from a worker thread; they must not touch an event loop.
+    """
+
+    def __init__(self, callback: ProgressCallback | None = None, is_cancelled: Callable[[], bool] | None = None) -> None:
+        self.callback: ProgressCallback | None = callback
+        self.is_cancelled: Callable[[], bool] | None = is_cancelled
+
+    @classmethod
+    def disabled(cls) -> "ProgressReporter":
+        """Return a reporter that reports nothing and is never cancelled."""
+        return cls()
+
+    def report(self, phase: str, current: int, total: int, *, entity: str | None = None, message: str = "") -> None:
+        if self.callback is not None:
+            self.callback(ProgressEvent(phase=phase, current=current, total=total, entity=entity, message=message))
+
+    def check_cancelled(self) -> None:
+        """Raise `WorkflowCancelledError` if the run has been cancelled."""
+        if self.is_cancelled is not None and self.is_cancelled():
+            raise WorkflowCancelledError("Workflow run was cancelled")
@@ -14,6 +14,7 @@ from pathlib import Path
 
 import click
 
+from src.profiling import PipelineProfiler
 from src.utility import setup_logging
 from src.workflow import validate_project, workflow
 
@@ -29,11 +30,24 @@ from src.workflow import validate_project, workflow
 @click.option("--env-file", "-e", type=click.Path(exists=True, dir_okay=False, readable=True), help="Path to environment variables file.")
 @click.option("--verbose", "-v", is_flag=True, help="Enable verbose output.", default=False)
 @click.option("--translate", "-t", is_flag=True, help="Enable translation.", default=False)
-@click.option("--mode", "-m", type=click.Choice(["xlsx", "csv", "db"]), default="xlsx", show_default=True, help="Output file format.")
+@click.option(
+    "--mode",
+    "-m",
+    type=click.Choice(["xlsx", "csv", "parquet", "db", "db_bulk"]),
+    default="xlsx",
+    show_default=True,
+    help="Output file format.",
+)
 @click.option("--drop-foreign-keys", "-d", is_flag=True, help="Drop foreign key columns after linking.", default=False)
 @click.option("--log-file", "-l", type=click.Path(), help="Path to log file (optional).")
 # @click.option("--regression-file", "-r", type=click.Path(), help="Path to regression file (optional).")
 @click.option("--validate-then-exit", is_flag=True, help="Validate configuration and exit if invalid.", default=False)
+@click.option(
+    "--profile",
+    is_flag=True,
+    help="Profile every pipeline stage and write profile.json, profile.trace.json and profile_summary.tsv next to TARGET.",
+    default=False,
+)
 def main(
     target: str,
     default_entity: str,
@@ -46,6 +60,7 @@ def main(
     log_file: str | None,
     # regression_file: str | None,
     validate_then_exit: bool = False,
+    profile: bool = False,
 ) -> None:
     """
     Normalize data from various data sources into structured tables.
@@ -61,6 +76,8 @@ def main(
         is_valid: bool = validate_project(project_filename)
         sys.exit(0 if is_valid else 1)
 
+    profiler: PipelineProfiler | None = PipelineProfiler().start() if profile else None
+
     asyncio.run(
         workflow(
             project=project_filename,
@@ -70,9 +87,17 @@ def main(
             target_type=mode,
             drop_foreign_keys=drop_foreign_keys,
             env_file=env_file,
+            profiler=profiler,
         )
     )
 
+    if profiler:
+        profiler.stop()
+        folder: Path = Path(target) if Path(target).is_dir() else Path(target).parent
+        paths: dict[str, Path] = profiler.save(folder)
+        click.echo(profiler.summary_table())
+        click.echo(f"Profile written to {paths['json']} (Chrome trace: {paths['trace']})")
+
     click.secho(f"✓ Successfully written normalized workbook to {target}", fg="green")
 
 
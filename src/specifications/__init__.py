@@ -1,7 +1,14 @@
 # type: ignore
 from pathlib import Path
 
-from .base import FIELD_VALIDATORS, ProjectSpecification, Specification, SpecificationIssue
+from .base import (
+    FIELD_VALIDATORS,
+    EntityValidationCache,
+    ProjectSpecification,
+    Specification,
+    SpecificationContext,
+    SpecificationIssue,
+)
 from .entity import EntitySpecification
 from .fd import FunctionalDependencySpecification
 from .foreign_key import ForeignKeyConfigSpecification, ForeignKeyDataSpecification
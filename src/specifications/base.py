@@ -1,10 +1,12 @@
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from typing import Any, Literal
 
+import xxhash
 from loguru import logger
 
 from src.model import TableConfig
-from src.utility import Registry, dotexists, dotget
+from src.utility import Registry, dotexists
 
 # pylint: disable=line-too-long
 
@@ -100,25 +102,211 @@ class Specification(ABC):
 
 ColumnType = Literal["columns", "keys", "extra_columns", "unnest", "foreign_keys"]
 
+ALL_COLUMN_TYPES: frozenset[ColumnType] = frozenset({"columns", "keys", "extra_columns", "unnest", "foreign_keys"})
+
+
+class SpecificationContext:
+    """Shared read-only view of a project configuration used by all specifications in a validation run.
+
+    Builds each entity's TableConfig once and memoizes per-entity column indexes, so that the
+    specifications of a run share lookups instead of re-deriving them. The configuration is
+    assumed not to change during a run; call `invalidate` after editing an entity in place.
+    """
+
+    def __init__(self, project_cfg: dict[str, Any]) -> None:
+        self.project_cfg: dict[str, Any] = project_cfg
+        self._tables: dict[str, TableConfig] = {}
+        self._columns: dict[tuple[str, frozenset[ColumnType]], frozenset[str]] = {}
+        self._fingerprints: dict[str, str] | None = None
+        self._closures: dict[str, frozenset[str]] = {}
+
+    @property
+    def entities_cfg(self) -> dict[str, Any]:
+        entities: Any = self.project_cfg.get("entities")
+        return entities if isinstance(entities, dict) else {}
+
+    def get_entity_cfg(self, entity_name: str) -> dict[str, Any]:
+        entity_cfg: Any = self.entities_cfg.get(entity_name)
+        return {} if entity_cfg is None else entity_cfg
+
+    def get_entity(self, entity_name: str) -> TableConfig:
+        table: TableConfig | None = self._tables.get(entity_name)
+        if table is None or table.entity_cfg is not self.entities_cfg.get(entity_name):
+            table = self._tables[entity_name] = TableConfig(entity_name=entity_name, entities_cfg=self.project_cfg.get("entities", {}))
+        return table
+
+    def get_entity_columns(self, entity_name: str, include_types: frozenset[ColumnType]) -> frozenset[str]:
+        key: tuple[str, frozenset[ColumnType]] = (entity_name, include_types)
+        columns: frozenset[str] | None = self._columns.get(key)
+        if columns is None:
+            columns = self._columns[key] = frozenset(self._compute_entity_columns(entity_name, include_types))
+        return columns
+
+    def _compute_entity_columns(self, entity_name: str, include_types: frozenset[ColumnType]) -> set[str]:
+        all_columns: set[str] = set()
+
+        entity_cfg: dict[str, Any] = self.get_entity_cfg(entity_name)
+
+        all_columns.add("system_id")
+        public_id: str | None = entity_cfg.get("public_id")
+        if public_id:
+            all_columns.add(public_id)
+
+        if "columns" in include_types:
+            columns: list[str] | None = entity_cfg.get("columns")
+            if columns:
+                all_columns.update(columns)
+
+        if "keys" in include_types:
+            keys: list[str] | None = entity_cfg.get("keys")
+            if keys:
+                all_columns.update(keys)
+
+        if "extra_columns" in include_types:
+            extra_columns: dict[str, Any] | None = entity_cfg.get("extra_columns")
+            if extra_columns:
+                all_columns.update(extra_columns.keys())
+
+        if "unnest" in include_types:
+            for column in ["var_name", "value_name"]:
+                col_name: str | None = entity_cfg.get("unnest", {}).get(column)
+                if col_name:
+                    all_columns.add(col_name)
+
+        if "foreign_keys" in include_types:
+            foreign_keys: list[dict[str, Any]] | None = entity_cfg.get("foreign_keys")
+            if foreign_keys:
+                for fk in foreign_keys:
+                    remote_entity_cfg: dict[str, Any] = self.get_entity_cfg(fk.get("entity", "")) or {}
+                    remote_public_id: str | None = remote_entity_cfg.get("public_id")
+                    if remote_public_id:
+                        all_columns.add(remote_public_id)
+                    additional_columns: dict[str, Any] | list[str] | str | None = fk.get("extra_columns")
+                    if isinstance(additional_columns, dict):
+                        all_columns.update(additional_columns.keys())
+                    elif isinstance(additional_columns, list):
+                        all_columns.update(additional_columns)
+                    elif isinstance(additional_columns, str):
+                        all_columns.add(additional_columns)
+
+        return all_columns
+
+    def entity_fingerprint(self, entity_name: str) -> str:
+        """Hash of everything an entity's configuration checks can depend on.
+
+        Combines the entity's own configuration, the configurations of all entities it
+        (transitively) references, the set of entity names and the project options.
+        """
+        if self._fingerprints is None:
+            self._fingerprints = self._compute_fingerprints()
+        return self._fingerprints.get(entity_name, "")
+
+    def referenced_entities(self, entity_name: str) -> frozenset[str]:
+        """Names of all entities the entity (transitively) references, as covered by its fingerprint."""
+        if self._fingerprints is None:
+            self._fingerprints = self._compute_fingerprints()
+        return self._closures.get(entity_name, frozenset())
+
+    def _compute_fingerprints(self) -> dict[str, str]:
+        entities_cfg: dict[str, Any] = self.entities_cfg
+        names: set[str] = set(entities_cfg.keys())
+        own: dict[str, str] = {name: xxhash.xxh64(repr(cfg).encode()).hexdigest() for name, cfg in entities_cfg.items()}
+        references: dict[str, set[str]] = {name: _referenced_names(cfg, names) - {name} for name, cfg in entities_cfg.items()}
+        shared: str = repr((sorted(names), self.project_cfg.get("options")))
+
+        fingerprints: dict[str, str] = {}
+        self._closures = {}
+        for name in entities_cfg:
+            closure: set[str] = set()
+            stack: list[str] = [name]
+            while stack:
+                for ref in references.get(stack.pop(), ()):
+                    if ref not in closure and ref != name:
+                        closure.add(ref)
+                        stack.append(ref)
+            parts: list[str] = [own[name]] + [f"{ref}={own[ref]}" for ref in sorted(closure)] + [shared]
+            fingerprints[name] = xxhash.xxh64("|".join(parts).encode()).hexdigest()
+            self._closures[name] = frozenset(closure)
+        return fingerprints
+
+    def invalidate(self, entity_name: str | None = None) -> None:
+        """Drop memoized lookups for an entity (or for all entities)."""
+        self._fingerprints = None
+        if entity_name is None:
+            self._tables.clear()
+            self._columns.clear()
+            return
+        self._tables.pop(entity_name, None)
+        # Column indexes of other entities may include this entity's public_id via foreign keys
+        self._columns.clear()
+
+
+def _referenced_names(value: Any, names: set[str]) -> set[str]:
+    """Collect all string values in a configuration tree that name an entity."""
+    found: set[str] = set()
+    stack: list[Any] = [value]
+    while stack:
+        item: Any = stack.pop()
+        if isinstance(item, dict):
+            stack.extend(item.values())
+        elif isinstance(item, list):
+            stack.extend(item)
+        elif isinstance(item, str) and item in names:
+            found.add(item)
+    return found
+
+
+class EntityValidationCache:
+    """Bounded cache of per-entity specification results keyed by `SpecificationContext.entity_fingerprint`.
+
+    Lets repeated validations of an edited project re-run checks only for entities whose
+    configuration inputs changed.
+    """
+
+    def __init__(self, max_entries: int = 5000) -> None:
+        self.max_entries: int = max_entries
+        self._entries: OrderedDict[str, tuple[list[SpecificationIssue], list[SpecificationIssue]]] = OrderedDict()
+
+    def get(self, fingerprint: str) -> tuple[list[SpecificationIssue], list[SpecificationIssue]] | None:
+        entry = self._entries.get(fingerprint)
+        if entry is not None:
+            self._entries.move_to_end(fingerprint)
+        return entry
+
+    def set(self, fingerprint: str, errors: list[SpecificationIssue], warnings: list[SpecificationIssue]) -> None:
+        self._entries[fingerprint] = (list(errors), list(warnings))
+        self._entries.move_to_end(fingerprint)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
 
 class ProjectSpecification(Specification):
     """Base specification for project validation."""
 
-    def __init__(self, project_cfg: dict[str, Any]) -> None:
+    def __init__(self, project_cfg: dict[str, Any], *, context: SpecificationContext | None = None) -> None:
         super().__init__()
         self.project_cfg: dict[str, Any] = project_cfg
+        self.context: SpecificationContext = (
+            context if context is not None and context.project_cfg is project_cfg else SpecificationContext(project_cfg)
+        )
 
     def get_entity_cfg(self, entity_name: str) -> dict[str, Any]:
         """Get the configuration for a specific entity."""
-        return dotget(self.project_cfg, f"entities.{entity_name}", {})
+        return self.context.get_entity_cfg(entity_name)
 
     def get_entity(self, entity_name: str) -> TableConfig:
-        """Get the TableConfig for the specified entity."""
-        return TableConfig(entity_name=entity_name, entities_cfg=self.project_cfg.get("entities", {}))
+        """Get the (shared) TableConfig for the specified entity."""
+        return self.context.get_entity(entity_name)
 
     def entity_exists(self, entity_name: str) -> bool:
         """Check if a specific entity exists in the configuration."""
-        return dotget(self.project_cfg, f"entities.{entity_name}", None) is not None
+        return self.context.entities_cfg.get(entity_name) is not None
 
     def field_exists(self, path: str) -> bool:
         """Check if a specific field exists in the entity configuration."""
@@ -147,7 +335,7 @@ class ProjectSpecification(Specification):
             if key not in FIELD_VALIDATORS.items:
                 logger.info(f"Unknown field check type '{key}' specified. Skipping.")
                 continue
-            specification = FIELD_VALIDATORS.get(key.strip())(self.project_cfg, severity=severity)
+            specification = FIELD_VALIDATORS.get(key.strip())(self.project_cfg, severity=severity, context=self.context)
             specification.is_satisfied_by(entity_name=entity_name, fields=fields, message=message, **kwargs)
             self.merge(specification)
 
@@ -161,63 +349,15 @@ class ProjectSpecification(Specification):
         FIXME: consider moving it TableConfig
                Note that columns available at a specific FK's linking includes result columns from previous linked FKs.
         """
-        avaliable_types: set[ColumnType] = {"columns", "keys", "extra_columns", "unnest", "foreign_keys"}
         exclude_types = exclude_types or set()
-        include_types = (include_types or avaliable_types) - exclude_types
-
-        all_columns: set[str] = set()
-
-        entity_cfg: dict[str, Any] = self.get_entity_cfg(entity_name)
-
-        all_columns.add("system_id")
-        public_id: str | None = entity_cfg.get("public_id")
-        if public_id:
-            all_columns.add(public_id)
-
-        if "columns" in include_types:
-            columns: list[str] | None = entity_cfg.get("columns")
-            if columns:
-                all_columns.update(columns)
-
-        if "keys" in include_types:
-            keys: list[str] | None = entity_cfg.get("keys")
-            if keys:
-                all_columns.update(keys)
-
-        if "extra_columns" in include_types:
-            extra_columns: dict[str, Any] | None = entity_cfg.get("extra_columns")
-            if extra_columns:
-                all_columns.update(extra_columns.keys())
-
-        if "unnest" in include_types:
-            for column in ["var_name", "value_name"]:
-                col_name: str | None = entity_cfg.get("unnest", {}).get(column)
-                if col_name:
-                    all_columns.add(col_name)
-
-        if "foreign_keys" in include_types:
-            foreign_keys: list[dict[str, Any]] | None = entity_cfg.get("foreign_keys")
-            if foreign_keys:
-                for fk in foreign_keys:
-                    remote_entity_cfg: dict[str, Any] = self.get_entity_cfg(fk.get("entity", "")) or {}
-                    remote_public_id: str | None = remote_entity_cfg.get("public_id")
-                    if remote_public_id:
-                        all_columns.add(remote_public_id)
-                    additional_columns: dict[str, Any] | list[str] | str | None = fk.get("extra_columns")
-                    if isinstance(additional_columns, dict):
-                        all_columns.update(additional_columns.keys())
-                    elif isinstance(additional_columns, list):
-                        all_columns.update(additional_columns)
-                    elif isinstance(additional_columns, str):
-                        all_columns.add(additional_columns)
-
-        return all_columns
+        selected_types: frozenset[ColumnType] = frozenset(include_types or ALL_COLUMN_TYPES) - exclude_types
+        return set(self.context.get_entity_columns(entity_name, selected_types))
 
 
 class FieldValidator(ProjectSpecification):
 
-    def __init__(self, project_cfg: dict[str, Any], *, severity: str = "E") -> None:
-        super().__init__(project_cfg)
+    def __init__(self, project_cfg: dict[str, Any], *, severity: str = "E", context: SpecificationContext | None = None) -> None:
+        super().__init__(project_cfg, context=context)
         self.severity: str = severity
 
     def is_satisfied_by(self, *, entity_name: str = "", fields: list[str] | None = None, **kwargs) -> bool:
@@ -2,13 +2,14 @@
 
 from typing import Any
 
+from src.configuration import ExternalTable
 from src.model import TableConfig
 from src.transforms.dsl import FormulaEngine, extract_column_references
 from src.transforms.extra_columns import ExtraColumnEvaluator
 from src.transforms.filter import Filters, normalize_filter_stage
-from src.utility import Registry, dotget
+from src.utility import Registry
 
-from .base import ProjectSpecification
+from .base import ProjectSpecification, SpecificationContext
 
 
 class EntitySpecificationRegistry(Registry[type[ProjectSpecification]]):
@@ -95,9 +96,20 @@ class FixedEntityFieldsSpecification(DataEntityFieldsSpecification):
         self.check_fields(entity_name, ["values"], "exists/E,not_empty/W")
         self.check_fields(entity_name, ["type"], "has_value/E", expected_value="fixed")
         self.check_fields(entity_name, ["source", "data_source", "query"], "is_empty/W")
-        self.check_fields(entity_name, ["values"], "of_type/E", expected_types=(list,))
+        self.check_fields(entity_name, ["values"], "of_type/E", expected_types=(list, ExternalTable))
 
         columns: list[str] = table.safe_columns
+
+        if isinstance(table.values, ExternalTable):
+            missing_columns: set[str] = set(columns) - set(table.values.columns())
+            if missing_columns:
+                self.add_error(
+                    f"Fixed data entity '{entity_name}' has externally loaded rows missing columns {sorted(missing_columns)}",
+                    entity=entity_name,
+                    field="values",
+                )
+            return not self.has_errors()
+
         raw_values: list[Any] | None = table.values if isinstance(table.values, list) else None
         dict_rows = raw_values is not None and len(raw_values) > 0 and all(isinstance(row, dict) for row in raw_values)
         values: list[Any] = raw_values if dict_rows and raw_values is not None else table.safe_values
@@ -396,7 +408,11 @@ class FixedEntitySystemIdSpecification(ProjectSpecification):
             # system_id is optional, but if missing it will be auto-generated
             return True
 
-        if dict_rows and raw_values is not None:
+        if isinstance(table.values, ExternalTable):
+            if "system_id" not in table.values.columns():
+                return True
+            system_id_values = table.values.read(columns=["system_id"])["system_id"].tolist()
+        elif dict_rows and raw_values is not None:
             system_id_values = [row.get("system_id") for row in raw_values]
         else:
             system_id_index = columns.index("system_id")
@@ -467,15 +483,22 @@ class FixedEntitySystemIdSpecification(ProjectSpecification):
 class EntityFieldsSpecification(ProjectSpecification):
     """Validates that all required fields are present in all entities."""
 
-    def get_specification(self, *, entity_type: str) -> ProjectSpecification:
-        """Get the appropriate specification based on entity type."""
-        spec_cls: type[ProjectSpecification] = (
-            ENTITY_TYPE_SPECIFICATION.get(entity_type)
-            if ENTITY_TYPE_SPECIFICATION.is_registered(entity_type)
-            else EntityFieldsBaseSpecification
-        )
+    def __init__(self, project_cfg: dict[str, Any], *, context: SpecificationContext | None = None) -> None:
+        super().__init__(project_cfg, context=context)
+        self._type_specifications: dict[str, ProjectSpecification] = {}
 
-        return spec_cls(self.project_cfg)
+    def get_specification(self, *, entity_type: str) -> ProjectSpecification:
+        """Get the appropriate specification based on entity type (one shared instance per type)."""
+        if entity_type not in self._type_specifications:
+            spec_cls: type[ProjectSpecification] = (
+                ENTITY_TYPE_SPECIFICATION.get(entity_type)
+                if ENTITY_TYPE_SPECIFICATION.is_registered(entity_type)
+                else EntityFieldsBaseSpecification
+            )
+            self._type_specifications[entity_type] = spec_cls(self.project_cfg, context=self.context)
+        specification: ProjectSpecification = self._type_specifications[entity_type]
+        specification.clear()
+        return specification
 
     def is_satisfied_by(self, *, entity_name: str = "unknown", **kwargs) -> bool:
         """Check that entity's fields are valid (based on entity type)."""
@@ -657,8 +680,8 @@ class ExtraColumnsExpressionSpecification(ProjectSpecification):
     foreign-key linking, or unnesting.
     """
 
-    def __init__(self, project_cfg: dict[str, Any]) -> None:
-        super().__init__(project_cfg)
+    def __init__(self, project_cfg: dict[str, Any], *, context: SpecificationContext | None = None) -> None:
+        super().__init__(project_cfg, context=context)
         self.formula_engine = FormulaEngine()
 
     def is_satisfied_by(self, *, entity_name: str = "unknown", **kwargs) -> bool:
@@ -816,8 +839,7 @@ class ExtraColumnsConflictsSpecification(ProjectSpecification):
         """
         self.clear()
 
-        entities_cfg: dict[str, Any] = self.project_cfg.get("entities", {})
-        table_cfg = TableConfig(entities_cfg=entities_cfg, entity_name=entity_name)
+        table_cfg: TableConfig = self.get_entity(entity_name)
 
         if not table_cfg.extra_columns:
             return True
@@ -927,7 +949,7 @@ class AppendSpecification(ProjectSpecification):
                 if append_type == "fixed":
                     self.check_fields(entity_name, ["values"], "exists/E", target_cfg=append_cfg, message=append_id)
                     self.check_fields(
-                        entity_name, ["values"], "of_type/E", expected_types=(list,), target_cfg=append_cfg, message=append_id
+                        entity_name, ["values"], "of_type/E", expected_types=(list, ExternalTable), target_cfg=append_cfg, message=append_id
                     )
                     if isinstance(append_cfg.get("values"), list):
                         if len(append_cfg.get("values") or []) == 0:
@@ -1052,7 +1074,7 @@ class EntityReferencesExistSpecification(ProjectSpecification):
     def is_satisfied_by(self, *, entity_name: str = "unknown", **kwargs) -> bool:
         self.clear()
         entity_names: set[str] = set(self.project_cfg.get("entities", {}).keys())
-        entity_cfg: dict[str, Any] = dotget(self.project_cfg, f"entities.{entity_name}", {})
+        entity_cfg: dict[str, Any] = self.get_entity_cfg(entity_name)
 
         self.is_satisfied_by_foreign_keys(entity_name, entity_names, entity_cfg)
         self.is_satisfied_by_dependencies(entity_name, entity_names, entity_cfg)
@@ -1147,7 +1169,8 @@ class FilterSpecification(ProjectSpecification):
         other_entity = filter_cfg.get("other_entity") or filter_cfg.get("entity")
         other_column = filter_cfg.get("other_column") or filter_cfg.get("remote_column") or column
 
-        if not isinstance(column, str) or not column:
+        columns: list[str] = [column] if isinstance(column, str) else column if isinstance(column, list) else []
+        if not columns or not all(isinstance(name, str) and name for name in columns):
             self.add_error(
                 f"{filter_id}: exists_in filter requires 'column'",
                 entity=entity_name,
@@ -1172,19 +1195,31 @@ class FilterSpecification(ProjectSpecification):
             return
 
         available_local_columns = self._get_filter_stage_columns(entity_name, stage)
-        if column not in available_local_columns:
+        for name in columns:
+            if name not in available_local_columns:
+                self.add_error(
+                    f"{filter_id}: column '{name}' is not available at stage '{stage}'. "
+                    f"Available columns: {sorted(available_local_columns)}.",
+                    entity=entity_name,
+                    field=f"filters[{idx}].column",
+                )
+
+        other_columns: list[str] = (
+            [other_column] if isinstance(other_column, str) else other_column if isinstance(other_column, list) else []
+        )
+        if len(other_columns) != len(columns):
             self.add_error(
-                f"{filter_id}: column '{column}' is not available at stage '{stage}'. "
-                f"Available columns: {sorted(available_local_columns)}.",
+                f"{filter_id}: exists_in filter requires one 'other_column' per 'column', got {other_columns} for {columns}",
                 entity=entity_name,
-                field=f"filters[{idx}].column",
+                field=f"filters[{idx}].other_column",
             )
+            return
 
-        if isinstance(other_column, str) and other_column:
-            available_remote_columns = self.get_entity_columns(other_entity)
-            if other_column not in available_remote_columns:
+        available_remote_columns = self.get_entity_columns(other_entity)
+        for name in other_columns:
+            if isinstance(name, str) and name and name not in available_remote_columns:
                 self.add_error(
-                    f"{filter_id}: other_column '{other_column}' not found in entity '{other_entity}'. "
+                    f"{filter_id}: other_column '{name}' not found in entity '{other_entity}'. "
                     f"Available columns: {sorted(available_remote_columns)}.",
                     entity=entity_name,
                     field=f"filters[{idx}].other_column",
@@ -1386,8 +1421,15 @@ class EntitySpecification(ProjectSpecification):
     Composite specification that runs all entity-level validations.
     To extend with custom validators, override get_specifications()
     or add new specifications to the ENTITY_SPECIFICATION registry.
+
+    The specification instances are created once and reused for every entity,
+    all sharing this specification's SpecificationContext.
     """
 
+    def __init__(self, project_cfg: dict[str, Any], *, context: SpecificationContext | None = None) -> None:
+        super().__init__(project_cfg, context=context)
+        self._specifications: list[ProjectSpecification] | None = None
+
     def get_specifications(self) -> list[ProjectSpecification]:
         """Get the list of specifications to run for entity validation.
 
@@ -1396,13 +1438,20 @@ class EntitySpecification(ProjectSpecification):
         Returns:
             List of specification instances to execute
         """
-        return [spec_cls(self.project_cfg) for spec_cls in ENTITY_SPECIFICATION.items.values()]
+        return [spec_cls(self.project_cfg, context=self.context) for spec_cls in ENTITY_SPECIFICATION.items.values()]
+
+    @property
+    def specifications(self) -> list[ProjectSpecification]:
+        if self._specifications is None:
+            self._specifications = self.get_specifications()
+        return self._specifications
 
     def is_satisfied_by(self, *, entity_name: str = "unknown", **kwargs) -> bool:
         """Check that entities are properly configured."""
 
         self.clear()
-        for spec in self.get_specifications():
+        for spec in self.specifications:
+            spec.clear()
             spec.is_satisfied_by(entity_name=entity_name)
             self.merge(spec)
 
@@ -1,8 +1,9 @@
 from typing import Any
 
+from src.dependency_graph import EntityDependencyGraph
 from src.utility import dotget
 
-from .base import ProjectSpecification
+from .base import EntityValidationCache, ProjectSpecification, SpecificationContext
 from .entity import EntitySpecification
 
 # pylint: disable=line-too-long, unused-argument
@@ -19,36 +20,9 @@ class CircularDependencySpecification(ProjectSpecification):
         if not entities_config:
             return True
 
-        dependencies: dict[str, set[str]] = self.build_dependency_graph(entities_config)
-
-        # Check for cycles using DFS
-        visited: set[str] = set()
-        rec_stack: set[str] = set()
-        path: list[str] = []
-
-        def check_if_has_cycle(node: str) -> bool:
-            visited.add(node)
-            rec_stack.add(node)
-            path.append(node)
-
-            for neighbor in dependencies.get(node, set()):
-                if neighbor not in visited:
-                    if check_if_has_cycle(neighbor):
-                        return True
-                elif neighbor in rec_stack:
-                    # Found cycle
-                    cycle_start = path.index(neighbor)
-                    cycle_path = " -> ".join(path[cycle_start:] + [neighbor])
-                    self.add_error(f"Circular dependency detected: {cycle_path}", entity="configuration")
-                    return True
-
-            path.pop()
-            rec_stack.remove(node)
-            return False
-
-        for entity in dependencies:
-            if entity not in visited:
-                check_if_has_cycle(entity)
+        graph: EntityDependencyGraph = EntityDependencyGraph(self.build_dependency_graph(entities_config))
+        for cycle in graph.cycles:
+            self.add_error(f"Circular dependency detected: {' -> '.join(cycle)}", entity="configuration")
 
         return not self.has_errors()
 
@@ -108,18 +82,40 @@ class DataSourceExistsSpecification(ProjectSpecification):
 
 
 class EntitiesSpecification(ProjectSpecification):
-    """Validates individual entities using various specifications."""
+    """Validates individual entities using various specifications.
 
-    def __init__(self, project_cfg: dict[str, Any]) -> None:
-        super().__init__(project_cfg)
-        self.entity_specifications: list[ProjectSpecification] = [EntitySpecification(project_cfg)]
+    If a `result_cache` is given, entities whose fingerprint (own configuration plus the
+    configuration of referenced entities) is unchanged since a previous run reuse the cached
+    issues, so that re-validating an edited project only re-checks the affected entities.
+    """
+
+    def __init__(
+        self,
+        project_cfg: dict[str, Any],
+        *,
+        context: SpecificationContext | None = None,
+        result_cache: EntityValidationCache | None = None,
+    ) -> None:
+        super().__init__(project_cfg, context=context)
+        self.entity_specifications: list[ProjectSpecification] = [EntitySpecification(project_cfg, context=self.context)]
+        self.result_cache: EntityValidationCache | None = result_cache
 
     def is_satisfied_by(self, *, entity_name: str = "unknown", **kwargs) -> bool:
-        """Validate the specified entity using all entity specifications."""
-        for entity_spec in self.entity_specifications:
-            for name in self.project_cfg.get("entities", {}).keys():
+        """Validate all entities using all entity specifications."""
+        self.clear()
+        for name in self.project_cfg.get("entities", {}).keys():
+            fingerprint: str = self.context.entity_fingerprint(name) if self.result_cache is not None else ""
+            cached = self.result_cache.get(fingerprint) if self.result_cache is not None else None
+            if cached is not None:
+                self.errors.extend(cached[0])
+                self.warnings.extend(cached[1])
+                continue
+            errors, warnings = len(self.errors), len(self.warnings)
+            for entity_spec in self.entity_specifications:
                 entity_spec.is_satisfied_by(entity_name=name)
                 self.merge(entity_spec)
+            if self.result_cache is not None:
+                self.result_cache.set(fingerprint, self.errors[errors:], self.warnings[warnings:])
         return not self.has_errors()
 
 
@@ -147,8 +143,15 @@ class CompositeProjectSpecification(ProjectSpecification):
     This is the main entry point for validating entire project configurations.
     """
 
-    def __init__(self, project_cfg: dict[str, Any], specifications: list[ProjectSpecification] | None = None) -> None:
+    def __init__(
+        self,
+        project_cfg: dict[str, Any],
+        specifications: list[ProjectSpecification] | None = None,
+        *,
+        result_cache: EntityValidationCache | None = None,
+    ) -> None:
         super().__init__(project_cfg)
+        self.result_cache: EntityValidationCache | None = result_cache
         self.specifications: list[ProjectSpecification] = specifications or self.get_default_specifications()
 
     def get_default_specifications(self) -> list[ProjectSpecification]:
@@ -160,15 +163,15 @@ class CompositeProjectSpecification(ProjectSpecification):
             List of specification instances to execute
         """
         return [
-            EntitiesSpecification(self.project_cfg),
-            CircularDependencySpecification(self.project_cfg),
-            DataSourceExistsSpecification(self.project_cfg),
+            EntitiesSpecification(self.project_cfg, context=self.context, result_cache=self.result_cache),
+            CircularDependencySpecification(self.project_cfg, context=self.context),
+            DataSourceExistsSpecification(self.project_cfg, context=self.context),
         ]
 
     def is_satisfied_by(self, **kwargs) -> bool:
         """Run all specifications and aggregate results."""
         self.clear()
-        is_project_spec = IsProjectSpecification(self.project_cfg)
+        is_project_spec = IsProjectSpecification(self.project_cfg, context=self.context)
         is_project_valid: bool = is_project_spec.is_satisfied_by()
         self.merge(is_project_spec)
 
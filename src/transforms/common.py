@@ -1,5 +1,4 @@
 import abc
-from pathlib import Path
 from typing import Any
 
 import pandas as pd
@@ -23,7 +22,7 @@ class TransformerRegistry(Registry):
     items: dict[str, type["Transformer"]] = {}
 
 
-Transformers: TransformerRegistry = TransformerRegistry().scan(__name__, str(Path(__file__).parent))  # pylint: disable=invalid-name
+Transformers: TransformerRegistry = TransformerRegistry()  # pylint: disable=invalid-name
 
 
 class TranslateTransformer(abc.ABC):
@@ -1,10 +1,111 @@
+"""
+Row dropping: duplicate rows, duplicate keys and empty rows.
+
+Duplicates are found with a row-key engine: `RowHasher` factorizes each column of a frame at most
+once (a hash-table pass giving exact integer codes) and combines the codes of any column subset
+into one 64-bit key per row, equal for equal rows and distinct otherwise. Mixed-radix combination is
+exact, and the partial key is re-factorized whenever the radix product would overflow 64 bits, so
+no collision check is needed. A `RowHashCache` keeps the hasher of the latest frames so that
+deduplication, the functional dependency check and the duplicate-key check of an entity share
+column codes and row keys. Empty-row masks are computed column by column without copying.
+"""
+
+from collections import OrderedDict
 from typing import Any, Mapping, Sequence
 
+import numpy as np
 import pandas as pd
 from loguru import logger
 
 from src.specifications.fd import FunctionalDependencySpecification
 
+_MAX_KEY: int = 2**63 - 1
+
+
+class RowHasher:
+    """Exact 64-bit row keys of a frame over column subsets, factorizing each column at most once.
+
+    NA values (None, NaN, NaT, pd.NA) are equal to each other, as in `DataFrame.duplicated` on several columns.
+    """
+
+    def __init__(
+        self,
+        data: pd.DataFrame,
+        column_codes: dict[Any, tuple[np.ndarray, int]] | None = None,
+        row_keys: dict[tuple[Any, ...], tuple[np.ndarray, int]] | None = None,
+    ) -> None:
+        self.data: pd.DataFrame = data
+        self._column_codes: dict[Any, tuple[np.ndarray, int]] = column_codes or {}
+        self._row_keys: dict[tuple[Any, ...], tuple[np.ndarray, int]] = row_keys or {}
+
+    def column(self, name: Any) -> tuple[np.ndarray, int]:
+        """Codes of column `name` (NA gets its own code) and an upper bound of the codes."""
+        if name not in self._column_codes:
+            codes, uniques = pd.factorize(self.data[name])
+            size: int = len(uniques)
+            self._column_codes[name] = (np.where(codes < 0, size, codes).astype(np.int64, copy=False), size + 1)
+        return self._column_codes[name]
+
+    def rows(self, columns: Sequence[Any] | None = None) -> np.ndarray:
+        """One int64 key per row over `columns` (all columns if None); rows have equal keys iff their values are equal."""
+        return self._keys(tuple(self.data.columns if columns is None else columns))[0]
+
+    def duplicated(self, columns: Sequence[Any] | None = None) -> np.ndarray:
+        """Mask of rows repeating an earlier row over `columns`, as `DataFrame.duplicated(keep="first")`."""
+        return pd.Series(self.rows(columns)).duplicated().to_numpy()
+
+    def distinct_count(self, columns: Sequence[Any] | None = None) -> int:
+        """Number of distinct rows over `columns`."""
+        return len(pd.unique(self.rows(columns)))
+
+    def take(self, mask: np.ndarray, data: pd.DataFrame) -> "RowHasher":
+        """Hasher for `data`, the rows of this frame selected by `mask`, reusing the codes and keys computed so far."""
+        return RowHasher(
+            data,
+            {name: (codes[mask], size) for name, (codes, size) in self._column_codes.items() if name in data.columns},
+            {names: (keys[mask], size) for names, (keys, size) in self._row_keys.items() if all(name in data.columns for name in names)},
+        )
+
+    def _keys(self, columns: tuple[Any, ...]) -> tuple[np.ndarray, int]:
+        if columns not in self._row_keys:
+            if not columns:
+                self._row_keys[columns] = (np.zeros(len(self.data), dtype=np.int64), 1)
+            elif len(columns) == 1:
+                self._row_keys[columns] = self.column(columns[0])
+            else:
+                keys, size = self._keys(columns[:-1])
+                codes, column_size = self.column(columns[-1])
+                if size * column_size > _MAX_KEY:
+                    # Compress the partial key to its distinct values so that the product fits again
+                    compressed, uniques = pd.factorize(keys)
+                    keys, size = compressed.astype(np.int64, copy=False), len(uniques)
+                self._row_keys[columns] = (keys * column_size + codes, size * column_size)
+        return self._row_keys[columns]
+
+
+class RowHashCache:
+    """Per-run cache of the `RowHasher` of recently processed frames, matched by frame identity."""
+
+    def __init__(self, maxsize: int = 2) -> None:
+        self.maxsize: int = maxsize
+        self._hashers: OrderedDict[int, RowHasher] = OrderedDict()
+
+    def hasher(self, data: pd.DataFrame) -> RowHasher:
+        hasher: RowHasher | None = self._hashers.get(id(data))
+        if hasher is None or hasher.data is not data:
+            hasher = RowHasher(data)
+        self.add(hasher)
+        return hasher
+
+    def add(self, hasher: RowHasher) -> None:
+        self._hashers[id(hasher.data)] = hasher
+        self._hashers.move_to_end(id(hasher.data))
+        while len(self._hashers) > self.maxsize:
+            self._hashers.popitem(last=False)
+
+    def clear(self) -> None:
+        self._hashers.clear()
+
 
 def missing_columns(df: pd.DataFrame, columns: Sequence[str]) -> set[str]:
     """Return the set of requested columns that are missing from df."""
@@ -20,16 +121,22 @@ def drop_duplicate_rows(
     entity_name: str | None = None,
     fd_check: bool = False,
     strict_fd_check: bool = True,
+    cache: RowHashCache | None = None,
 ) -> pd.DataFrame:
-    """Drop duplicate rows from DataFrame."""
+    """Drop duplicate rows from DataFrame.
+
+    Pass the run's `cache` to reuse column hashes already computed for `data` and to register those of the result.
+    """
 
     # Case 1: explicitly disabled
     if columns is False:
         return data
 
+    hasher: RowHasher = cache.hasher(data) if cache else RowHasher(data)
+
     # Case 2: all columns
     if columns is True:
-        return data.drop_duplicates(ignore_index=True)
+        return _keep_rows(hasher, ~hasher.duplicated(), cache)
 
     # Case 3: subset of columns
     columns = list(dict.fromkeys(columns))
@@ -43,16 +150,29 @@ def drop_duplicate_rows(
         logger.error(f"{entity_name}[drop_duplicate_rows]: No columns specified; no duplicates will be dropped.")
         return data
 
-    if fd_check:
+    # Each distinct determinant must have one distinct row; only a failing check needs the full specification report
+    if fd_check and hasher.distinct_count(columns) != hasher.distinct_count(columns + [c for c in data.columns if c not in columns]):
         specification = FunctionalDependencySpecification()
         # Verify that the functional dependency holds before dropping duplicates
         # Will raise an exception if the FD is violated, and log a warning
         specification.is_satisfied_by(df=data, determinant_columns=columns, entity_name=entity_name, strict=strict_fd_check)
 
-    data = data.drop_duplicates(subset=columns).reset_index(drop=True)
+    return _keep_rows(hasher, ~hasher.duplicated(columns), cache)
+
+
+def _keep_rows(hasher: RowHasher, mask: np.ndarray, cache: RowHashCache | None) -> pd.DataFrame:
+    data: pd.DataFrame = hasher.data[mask].reset_index(drop=True)
+    if cache:
+        cache.add(hasher.take(mask, data))
     return data
 
 
+def has_duplicate_rows(data: pd.DataFrame, columns: Sequence[str], cache: RowHashCache | None = None) -> bool:
+    """True if any two rows of `data` have equal values in `columns`."""
+    hasher: RowHasher = cache.hasher(data) if cache else RowHasher(data)
+    return bool(hasher.duplicated(list(columns)).any())
+
+
 def drop_empty_rows_obselete(
     *, data: pd.DataFrame, entity_name: str, subset: bool | list[str] | dict[str, Any] | None = None, treat_empty_strings_as_na: bool = True
 ) -> pd.DataFrame:
@@ -135,25 +255,49 @@ def drop_empty_rows(
         logger.warning(f"{prefix}[drop_empty_rows]: columns missing: {missing}")
         return data
 
-    # ---- Dict case ----
-    if subset_kind == "dict":
-        out = data.copy()
-
-        for col, empty_values in subset.items():  # type: ignore[union-attr]
-            if empty_values:
-                mask: pd.Series = out[col].isin(list(empty_values))
-                if mask.any():
-                    out[col] = out[col].where(~mask, pd.NA)  # type: ignore[arg-type]
-
-        if treat_empty_strings_as_na:
-            out[subset_columns] = out[subset_columns].replace("", pd.NA)
-
-        return out.dropna(subset=subset_columns, how="all")
-
-    # ---- List / all columns case ----
-    out: pd.DataFrame = data
-    if treat_empty_strings_as_na:
-        out = data.copy()
-        out[subset_columns] = out[subset_columns].replace("", pd.NA)
+    # ---- Emptiness mask, computed per column without copying ----
+    empty_values: Mapping[str, Sequence[Any]] = subset if subset_kind == "dict" else {}  # type: ignore[assignment]
+    replace: dict[str, np.ndarray] = {}
+    empty: np.ndarray = np.ones(len(data), dtype=bool)
+    for col in subset_columns:
+        column: pd.Series = data[col]
+        na: np.ndarray = column.isna().to_numpy()
+        as_na: np.ndarray = _empty_values_mask(column, empty_values.get(col), treat_empty_strings_as_na)
+        if as_na.any():
+            replace[col] = as_na
+        empty &= na | as_na
+
+    if not empty.any() and not replace:
+        return data
 
-    return out.dropna(subset=subset_columns, how="all")
+    out: pd.DataFrame = data[~empty] if empty.any() else data
+    if replace:
+        out = out.copy(deep=False)
+
+    # Values treated as empty become NA in the rows that are kept
+    for col, as_na in replace.items():
+        kept: np.ndarray = as_na[~empty]
+        if kept.any():
+            out[col] = out[col].where(~kept, pd.NA)  # type: ignore[arg-type]
+
+    return out
+
+
+def _empty_values_mask(column: pd.Series, empty_values: Sequence[Any] | None, treat_empty_strings_as_na: bool) -> np.ndarray:
+    """Mask of non-NA values that count as empty: `empty_values` and, unless disabled, empty strings."""
+    mask: np.ndarray = np.zeros(len(column), dtype=bool)
+    if empty_values:
+        mask |= column.isin(list(empty_values)).to_numpy(dtype=bool)
+    if treat_empty_strings_as_na and column.dtype.kind not in "biufcmM":
+        mask |= _equals_empty_string(column)
+    return mask
+
+
+def _equals_empty_string(column: pd.Series) -> np.ndarray:
+    if column.dtype == object:
+        try:
+            # NumPy compares object arrays much faster than pandas, but cannot turn pd.NA comparisons into booleans
+            return np.asarray(column.to_numpy() == "", dtype=bool)
+        except TypeError:
+            pass
+    return column.eq("").fillna(False).to_numpy(dtype=bool)
@@ -1,12 +1,21 @@
+import ast
+from dataclasses import dataclass
+from types import CodeType
 from typing import Any, ClassVar
 from venv import logger
 
+import numpy as np
 import pandas as pd
 
 from src.model import TableConfig
 from src.transforms.filter_metadata import FilterFieldMetadata, FilterSchema
 from src.utility import Registry
 
+try:
+    import numexpr  # type: ignore[import-untyped]
+except ImportError:  # optional, pandas treats it the same way
+    numexpr = None  # pylint: disable=invalid-name
+
 
 class FilterRegistry(Registry):
 
@@ -28,14 +37,61 @@ def normalize_filter_stage(filter_cfg: dict[str, Any]) -> str:
     return stage
 
 
+class FilterCache:
+    """Per-run cache shared by the filters of all entities and stages.
+
+    Holds the unique-value index of each (entity, columns) lookup used by `exists_in` filters, and the
+    compiled form of each `query` filter expression. A lookup index is keyed by entity and columns and
+    is valid for the table_store version it was built from: it is rebuilt when the entity's frame in
+    the table_store has been replaced (or has changed length) since.
+    """
+
+    def __init__(self) -> None:
+        self._lookups: dict[tuple[str, tuple[str, ...]], tuple[pd.DataFrame, int, pd.Index]] = {}
+        self._queries: dict[str, "CompiledQuery"] = {}
+
+    def lookup_index(self, entity: str, columns: tuple[str, ...], frame: pd.DataFrame) -> pd.Index:
+        """Unique values (one column) or unique row keys (several columns) of `columns` in `entity`'s `frame`."""
+        key: tuple[str, tuple[str, ...]] = (entity, columns)
+        cached: tuple[pd.DataFrame, int, pd.Index] | None = self._lookups.get(key)
+        if cached is not None and cached[0] is frame and cached[1] == len(frame):
+            return cached[2]
+
+        if len(columns) == 1:
+            # Missing keys never match, as with `isin` against a set of the lookup values
+            index: pd.Index = pd.Index(frame[columns[0]].dropna().unique())
+        else:
+            index = pd.Index(np.unique(row_keys(frame, list(columns))))
+        self._lookups[key] = (frame, len(frame), index)
+        return index
+
+    def compiled_query(self, query: str) -> "CompiledQuery":
+        if query not in self._queries:
+            self._queries[query] = CompiledQuery.compile(query)
+        return self._queries[query]
+
+    def clear(self) -> None:
+        self._lookups.clear()
+        self._queries.clear()
+
+
+def row_keys(frame: pd.DataFrame, columns: list[str]) -> np.ndarray:
+    """Hash each row of `frame[columns]` into a single uint64 key (columns are hashed in the given order)."""
+    return pd.util.hash_pandas_object(frame[columns], index=False).to_numpy()
+
+
 def apply_filters(
     name: str,
     df: pd.DataFrame,
     cfg: TableConfig,
     data_store: dict[str, pd.DataFrame],
     stage: str = "extract",
+    cache: FilterCache | None = None,
 ) -> pd.DataFrame:
-    """Apply filters defined in the entity config for a specific execution stage."""
+    """Apply filters defined in the entity config for a specific execution stage.
+
+    Pass the run's `cache` to share lookup indexes and compiled queries between entities and stages.
+    """
     if stage not in VALID_FILTER_STAGES:
         raise ValueError(f"Invalid filter stage: {stage!r}. Expected one of {VALID_FILTER_STAGES}")
 
@@ -51,7 +107,7 @@ def apply_filters(
         filter_cls = Filters.get(ftype)
         if filter_cls is None:
             raise ValueError(f"Unknown filter type for entity {name!r}: {ftype!r}")
-        df = filter_cls().apply(df, f, data_store)
+        df = filter_cls().apply(df, f, data_store, cache=cache)
 
     return df
 
@@ -99,22 +155,37 @@ class ExistsInFilter:
         ],
     )
 
-    def apply(self, df: pd.DataFrame, filter_cfg: dict[str, Any], data_store: dict[str, pd.DataFrame]) -> pd.DataFrame:
+    def apply(
+        self,
+        df: pd.DataFrame,
+        filter_cfg: dict[str, Any],
+        data_store: dict[str, pd.DataFrame],
+        cache: FilterCache | None = None,
+    ) -> pd.DataFrame:
 
         if any(k not in filter_cfg for k in ("column", "other_entity")):
             raise ValueError("Filter 'exists_in' requires 'column' and 'other_entity' parameters")
 
-        column: str = filter_cfg["column"]
+        columns: list[str] = _as_columns(filter_cfg["column"])
         other_entity: str = filter_cfg["other_entity"]
-        other_column: str = filter_cfg.get("other_column", column)
+        other_columns: list[str] = _as_columns(filter_cfg.get("other_column", filter_cfg["column"]))
+
+        if len(other_columns) != len(columns):
+            raise ValueError(f"Filter 'exists_in' requires as many 'other_column' as 'column' names, got {other_columns} and {columns}")
 
         if other_entity not in data_store:
             raise ValueError(f"Filter 'exists_in' references unknown entity: {other_entity!r}")
 
         other_df: pd.DataFrame = data_store[other_entity]
+        index: pd.Index = (cache or FilterCache()).lookup_index(other_entity, tuple(other_columns), other_df)
 
-        values: set[Any] = set(other_df[other_column].unique())
-        filtered_df = df[df[column].isin(values)]
+        # Probing the cached index reuses its hash table instead of hashing the lookup values per call
+        mask: np.ndarray
+        if len(columns) == 1:
+            mask = index.get_indexer(df[columns[0]]) >= 0
+        else:
+            mask = self._exists_rows(df[columns], other_df[other_columns], index)
+        filtered_df = df[mask]
 
         # Optionally drop duplicates
         drop_duplicates_cols = filter_cfg.get("drop_duplicates")
@@ -123,6 +194,40 @@ class ExistsInFilter:
 
         return filtered_df
 
+    @staticmethod
+    def _exists_rows(local: pd.DataFrame, remote: pd.DataFrame, index: pd.Index) -> np.ndarray:
+        """Match multi-column keys by row hash.
+
+        Equal values only hash equally within a dtype, so mismatched numeric columns are compared in their
+        common dtype: local columns are cast to the remote dtype when that is the common one, else both sides
+        are cast and compared as a MultiIndex. Other dtype mismatches, and object columns (whose values are
+        hashed as strings, so that 3 and "3" collide), are compared value by value instead.
+        """
+        if any(pd.api.types.is_object_dtype(dtype) for dtype in (*local.dtypes, *remote.dtypes)):
+            return pd.MultiIndex.from_frame(local).isin(pd.MultiIndex.from_frame(remote))
+
+        remote_dtypes: dict[str, Any] = {
+            column: remote_dtype for column, remote_dtype in zip(local.columns, remote.dtypes) if local[column].dtype != remote_dtype
+        }
+        try:
+            if not all(local[column].dtype.kind in "biuf" and dtype.kind in "biuf" for column, dtype in remote_dtypes.items()):
+                raise TypeError("non-numeric dtype mismatch")
+            common: dict[str, Any] = {column: np.result_type(local[column].dtype, dtype) for column, dtype in remote_dtypes.items()}
+        except TypeError:
+            return pd.MultiIndex.from_frame(local).isin(pd.MultiIndex.from_frame(remote))
+
+        if any(common[column] != dtype for column, dtype in remote_dtypes.items()):
+            # E.g. float local keys against integer remote keys: casting to the remote dtype would truncate them
+            remote = remote.set_axis(local.columns, axis=1).astype(common)
+            return pd.MultiIndex.from_frame(local.astype(common)).isin(pd.MultiIndex.from_frame(remote))
+
+        local = local.astype(common) if common else local
+        return index.get_indexer(row_keys(local, list(local.columns))) >= 0
+
+
+def _as_columns(columns: str | list[str]) -> list[str]:
+    return [columns] if isinstance(columns, str) else list(columns)
+
 
 @Filters.register(key="query")
 class QueryFilter:
@@ -152,6 +257,7 @@ class QueryFilter:
         df: pd.DataFrame,
         filter_cfg: dict[str, Any],
         data_store: dict[str, pd.DataFrame],  # pylint: disable=unused-argument
+        cache: FilterCache | None = None,
     ) -> pd.DataFrame:
 
         if not filter_cfg.get("query"):
@@ -159,10 +265,138 @@ class QueryFilter:
             return df
 
         query: str = filter_cfg["query"]
+        compiled: CompiledQuery = cache.compiled_query(query) if cache else CompiledQuery.compile(query)
 
         try:
-            filtered_df: pd.DataFrame = df.query(query)
+            filtered_df: pd.DataFrame = compiled.apply(df)
         except Exception as e:
             raise ValueError(f"Invalid query in filter: {query!r}") from e
 
         return filtered_df
+
+
+class _UnsupportedQuery(Exception):
+    """The query uses syntax that only `DataFrame.query` understands."""
+
+
+@dataclass(frozen=True)
+class CompiledQuery:
+    """A `query` filter expression, parsed once per run.
+
+    Expressions over plain column names and literals using arithmetic, comparisons (`in` lists
+    included) and `and`/`or`/`not` are compiled to a vectorized evaluation over the columns: numexpr
+    when it is installed and the columns are numeric, pandas Series operations otherwise. Anything
+    else (method calls, backtick-quoted names, `@` variables) is left to `DataFrame.query`.
+    """
+
+    query: str
+    columns: tuple[str, ...] = ()
+    code: CodeType | None = None
+    numexpr_source: str | None = None
+
+    @classmethod
+    def compile(cls, query: str) -> "CompiledQuery":
+        try:
+            translator: _QueryTranslator = _QueryTranslator()
+            body: ast.expr = translator.visit(ast.parse(query.strip(), mode="eval").body)
+        except (SyntaxError, _UnsupportedQuery):
+            return cls(query=query)
+        return cls(
+            query=query,
+            columns=tuple(translator.columns),
+            code=compile(ast.fix_missing_locations(ast.Expression(body)), "<query filter>", "eval"),
+            numexpr_source=ast.unparse(body) if translator.numexpr_compatible else None,
+        )
+
+    def apply(self, df: pd.DataFrame) -> pd.DataFrame:
+        if self.code is None or not df.columns.is_unique or not set(self.columns).issubset(df.columns):
+            return df.query(self.query)
+
+        values: dict[str, pd.Series] = {_QueryTranslator.variable(i): df[column] for i, column in enumerate(self.columns)}
+        mask: Any
+        if (
+            self.numexpr_source
+            and numexpr is not None
+            and all(isinstance(series.dtype, np.dtype) and series.dtype.kind in "biuf" for series in values.values())
+        ):
+            # Extension dtypes (e.g. Int64) are left to pandas: to_numpy() would turn <NA> into a comparable NaN
+            mask = numexpr.evaluate(self.numexpr_source, local_dict={name: series.to_numpy() for name, series in values.items()})
+        else:
+            mask = eval(self.code, {"__builtins__": {}}, values)  # pylint: disable=eval-used
+
+        if not isinstance(mask, (pd.Series, np.ndarray)) or mask.dtype != bool or len(mask) != len(df):
+            # Scalars, non-boolean results and nullable masks keep DataFrame.query semantics
+            return df.query(self.query)
+        return df[mask]
+
+
+class _QueryTranslator(ast.NodeTransformer):
+    """Rewrite a query expression into vectorized operations on column variables (`_c0`, `_c1`, ...)."""
+
+    def __init__(self) -> None:
+        self.columns: list[str] = []
+        self.numexpr_compatible: bool = True
+
+    @staticmethod
+    def variable(index: int) -> str:
+        return f"_c{index}"
+
+    def generic_visit(self, node: ast.AST) -> ast.AST:
+        raise _UnsupportedQuery(type(node).__name__)
+
+    def visit_Name(self, node: ast.Name) -> ast.Name:  # pylint: disable=invalid-name
+        if node.id not in self.columns:
+            self.columns.append(node.id)
+        return ast.Name(id=self.variable(self.columns.index(node.id)), ctx=ast.Load())
+
+    def visit_Constant(self, node: ast.Constant) -> ast.Constant:  # pylint: disable=invalid-name
+        if isinstance(node.value, str):
+            self.numexpr_compatible = False
+        elif not isinstance(node.value, (bool, int, float)):
+            raise _UnsupportedQuery(repr(node.value))
+        return node
+
+    def visit_BoolOp(self, node: ast.BoolOp) -> ast.expr:  # pylint: disable=invalid-name
+        op: ast.operator = ast.BitAnd() if isinstance(node.op, ast.And) else ast.BitOr()
+        values: list[ast.expr] = [self.visit(value) for value in node.values]
+        result: ast.expr = values[0]
+        for value in values[1:]:
+            result = ast.BinOp(left=result, op=op, right=value)
+        return result
+
+    def visit_UnaryOp(self, node: ast.UnaryOp) -> ast.UnaryOp:  # pylint: disable=invalid-name
+        op: ast.unaryop = ast.Invert() if isinstance(node.op, ast.Not) else node.op
+        return ast.UnaryOp(op=op, operand=self.visit(node.operand))
+
+    def visit_BinOp(self, node: ast.BinOp) -> ast.BinOp:  # pylint: disable=invalid-name
+        # `&` and `|` bind looser than comparisons in pandas queries but tighter in Python, so leave them to pandas
+        if not isinstance(node.op, (ast.Add, ast.Sub, ast.Mult, ast.Div, ast.Mod, ast.Pow)):
+            raise _UnsupportedQuery(type(node.op).__name__)
+        return ast.BinOp(left=self.visit(node.left), op=node.op, right=self.visit(node.right))
+
+    def visit_Compare(self, node: ast.Compare) -> ast.expr:  # pylint: disable=invalid-name
+        """Split chained comparisons into `&`-ed pairs; `in`, `not in` and `==`/`!=` against a list become `isin`."""
+        operands: list[ast.expr] = [node.left, *node.comparators]
+        parts: list[ast.expr] = []
+        for left, op, right in zip(operands, node.ops, operands[1:]):
+            if isinstance(right, (ast.List, ast.Tuple)) or isinstance(op, (ast.In, ast.NotIn)):
+                parts.append(self._isin(left, op, right))
+            else:
+                parts.append(ast.Compare(left=self.visit(left), ops=[op], comparators=[self.visit(right)]))
+        result: ast.expr = parts[0]
+        for part in parts[1:]:
+            result = ast.BinOp(left=result, op=ast.BitAnd(), right=part)
+        return result
+
+    def _isin(self, left: ast.expr, op: ast.cmpop, right: ast.expr) -> ast.expr:
+        if not isinstance(left, ast.Name) or not isinstance(op, (ast.In, ast.NotIn, ast.Eq, ast.NotEq)):
+            raise _UnsupportedQuery("isin")
+        if not isinstance(right, (ast.List, ast.Tuple)) or not all(isinstance(element, ast.Constant) for element in right.elts):
+            raise _UnsupportedQuery("isin")
+        self.numexpr_compatible = False
+        isin: ast.expr = ast.Call(
+            func=ast.Attribute(value=self.visit(left), attr="isin", ctx=ast.Load()),
+            args=[ast.List(elts=[self.visit(element) for element in right.elts], ctx=ast.Load())],
+            keywords=[],
+        )
+        return ast.UnaryOp(op=ast.Invert(), operand=isin) if isinstance(op, (ast.NotIn, ast.NotEq)) else isin
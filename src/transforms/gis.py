@@ -1,32 +1,126 @@
-from collections.abc import Sequence
+"""
+Coordinate transforms: lat/long string splitting and CRS conversion.
+
+`pyproj.Transformer` objects are expensive to create, so they are cached per (source, destination)
+pair and shared across entities and runs. A per-row source CRS (`src_crs_label_column`, e.g. mixed
+SWEREF 99, RT90 and DHDN zones) is handled by grouping the rows by CRS and transforming each group
+as NumPy arrays with the transformer for that pair.
+"""
+
+from collections.abc import Hashable, Sequence
+from functools import lru_cache
 from typing import Any
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 import pyproj
 
 from .common import Transformer, Transformers
 
+WGS84: str = "EPSG:4326"
+
+
+@lru_cache(maxsize=256)
+def get_transformer(src_crs: Hashable, dst_crs: Hashable) -> pyproj.Transformer:
+    """Return a cached (always x/y ordered) transformer from `src_crs` to `dst_crs`."""
+    return pyproj.Transformer.from_crs(src_crs, dst_crs, always_xy=True)
+
 
 def to_wgs84(src_crs: str | pd.Series, x: float | pd.Series, y: float | pd.Series) -> tuple[float | pd.Series, float | pd.Series]:
     """
-    Transform a single (x, y) from the given coordinate system to WGS84 lon/lat.
+    Transform (x, y) from the given coordinate system to WGS84 lon/lat.
     """
-    return to_crs(src_crs, "EPSG:4326", x, y)
+    return to_crs(src_crs, WGS84, x, y)
 
 
 def to_crs(
     src_crs: str | pd.Series, dst_crs: str, x: float | pd.Series, y: float | pd.Series
 ) -> tuple[float | pd.Series, float | pd.Series]:
     """
-    Transform a single (x, y) from the given src system to the given dst system.
+    Transform (x, y) from the given src system to the given dst system.
+
+    `x` and `y` are scalars or Series. `src_crs` is either a single CRS or a Series holding each row's
+    CRS; rows are then transformed per CRS group, and rows without a CRS get NaN.
     """
+    if isinstance(src_crs, pd.Series):
+        return _to_crs_by_row(src_crs, dst_crs, x, y)
 
-    if isinstance(src_crs, str) and isinstance(dst_crs, str) and src_crs == dst_crs:
+    if src_crs == dst_crs:
         return x, y
 
-    transformer: pyproj.Transformer = pyproj.Transformer.from_crs(src_crs, dst_crs, always_xy=True)
-    x_new, y_new = transformer.transform(x, y)
-    return x_new, y_new
+    transformer: pyproj.Transformer = get_transformer(src_crs, dst_crs)
+    if not isinstance(x, pd.Series) and not isinstance(y, pd.Series):
+        return transformer.transform(x, y)
+
+    index: pd.Index = x.index if isinstance(x, pd.Series) else y.index  # type: ignore[union-attr]
+    x_new, y_new = transformer.transform(_as_float_array(x), _as_float_array(y))
+    return pd.Series(x_new, index=index), pd.Series(y_new, index=index)
+
+
+def _to_crs_by_row(src_crs: pd.Series, dst_crs: str, x: float | pd.Series, y: float | pd.Series) -> tuple[pd.Series, pd.Series]:
+    size: int = len(src_crs)
+    xs: np.ndarray = np.broadcast_to(_as_float_array(x), size)
+    ys: np.ndarray = np.broadcast_to(_as_float_array(y), size)
+    x_new: np.ndarray = np.full(size, np.nan)
+    y_new: np.ndarray = np.full(size, np.nan)
+
+    codes, labels = pd.factorize(src_crs)
+    single: bool = len(labels) == 1 and bool((codes == 0).all())
+    for code, label in enumerate(labels):
+        crs: Hashable = label.item() if isinstance(label, np.generic) else label
+        rows: np.ndarray | slice = slice(None) if single else np.flatnonzero(codes == code)
+        if crs == dst_crs:
+            x_new[rows], y_new[rows] = xs[rows], ys[rows]
+            continue
+        x_new[rows], y_new[rows] = get_transformer(crs, dst_crs).transform(xs[rows], ys[rows])
+
+    return pd.Series(x_new, index=src_crs.index), pd.Series(y_new, index=src_crs.index)
+
+
+def _as_float_array(values: float | pd.Series) -> np.ndarray:
+    if isinstance(values, pd.Series):
+        return pd.to_numeric(values, errors="coerce").to_numpy(dtype="float64", na_value=np.nan)
+    return np.asarray(values, dtype="float64")
+
+
+def split_lat_long(values: pd.Series, sep: str = ",") -> tuple[pd.Series, pd.Series]:
+    """Split 'lat{sep}lon' strings into two float Series (split and parsed with Arrow kernels).
+
+    Missing values give NaN in both; values without `sep` give a latitude only. Raises ValueError if no
+    value contains `sep` or if a part is not a number.
+    """
+    strings: pa.Array = pa.array(values.astype("string"), type=pa.string())
+    parts: pa.ListArray = pc.split_pattern(strings, pattern=sep, max_splits=1)  # pylint: disable=no-member
+    lengths: np.ndarray = pc.fill_null(pc.list_value_length(parts), 0).to_numpy()  # pylint: disable=no-member
+    if len(lengths) and not (lengths == 2).any():
+        raise ValueError(f"Expected exactly one '{sep}' in values of column {values.name!r}, but got 1 parts after splitting")
+
+    starts: np.ndarray = parts.offsets.to_numpy()[:-1]
+    flat: pa.Array = parts.flatten()
+    lat_raw: pa.Array = _take_part(flat, starts, lengths > 0)
+    lon_raw: pa.Array = _take_part(flat, starts + 1, lengths == 2)
+    return _parse_floats(lat_raw, values), _parse_floats(lon_raw, values)
+
+
+def _take_part(flat: pa.Array, positions: np.ndarray, present: np.ndarray) -> pa.Array:
+    return pc.utf8_trim_whitespace(pc.take(flat, pa.array(np.where(present, positions, 0), mask=~present)))  # pylint: disable=no-member
+
+
+def _parse_floats(raw: pa.Array, values: pd.Series) -> pd.Series:
+    try:
+        return pd.Series(pc.cast(raw, pa.float64()).to_numpy(zero_copy_only=False), index=values.index)
+    except pa.ArrowInvalid:
+        # Arrow is stricter than pandas about some spellings; only values pandas cannot parse either are errors
+        strings: pd.Series = pd.Series(raw.to_pandas(), index=values.index)
+        parsed: pd.Series = pd.to_numeric(strings, errors="coerce").astype("float64")
+        bad: pd.Series = parsed.isna() & strings.notna() & (strings.str.lower() != "nan")
+        if bad.any():
+            raise ValueError(
+                f"Error parsing lat/lon floats from column {values.name!r}. Example problematic values: {strings[bad].iloc[:5].tolist()}"
+            ) from None
+        return parsed
 
 
 @Transformers.register(key="geo_split")
@@ -81,30 +175,9 @@ class TransformSplitLatLong(Transformer):
         if col not in data.columns:
             raise KeyError(f"Column {col!r} not found in DataFrame")
 
-        df: pd.DataFrame = data.copy()
-
-        s: pd.Series[str] = df[col].astype("string")
-
-        split: pd.DataFrame = s.str.split(sep, n=1, expand=True)
+        df: pd.DataFrame = data.copy(deep=False)
 
-        if split.shape[1] != 2:
-            raise ValueError(
-                f"Expected exactly one '{sep}' in values of column {col!r}, " f"but got {split.shape[1]} parts after splitting"
-            )
-
-        lat_raw: pd.Series[str] = split[0].str.strip()
-        lon_raw: pd.Series[str] = split[1].str.strip()
-
-        try:
-            lat: pd.Series[float] = pd.to_numeric(lat_raw, errors="raise")
-            lon: pd.Series[float] = pd.to_numeric(lon_raw, errors="raise")
-        except Exception as e:
-            # Try to identify a problematic value for a clearer message
-            bad_lat: list[str] = lat_raw[~lat_raw.str.match(r"^[+-]?\d+(\.\d+)?$", na=True)].iloc[:5].tolist()
-            bad_lon: list[str] = lon_raw[~lon_raw.str.match(r"^[+-]?\d+(\.\d+)?$", na=True)].iloc[:5].tolist()
-            raise ValueError(
-                f"Error parsing lat/lon floats from column {col!r}. " f"Example problematic lat values: {bad_lat}, lon values: {bad_lon}"
-            ) from e
+        lat, lon = split_lat_long(df[col], sep=sep)
 
         df[f"{col}{lat_suffix}"] = lat
         df[f"{col}{lon_suffix}"] = lon
@@ -139,7 +212,7 @@ class ConvertCRS(Transformer):
         Returns
         -------
         pd.DataFrame
-            A new DataFrame with additional 'lon' and 'lat' columns in WGS84.
+            A new DataFrame with additional 'lon' and 'lat' columns in the destination CRS.
         """
         src_crs_label_column: str | None = opts.get("src_crs_label_column")
         src_crs: str | pd.Series[str] | None = opts.get("src_crs")
@@ -151,7 +224,7 @@ class ConvertCRS(Transformer):
         if not isinstance(columns, (list, tuple)) or len(columns) != 2:
             raise ValueError("Transform 'geo_convert_crs' requires exactly two column names: x and y")
 
-        df: pd.DataFrame = data.copy()
+        df: pd.DataFrame = data.copy(deep=False)
         lon_source_column, lat_source_column = columns
         resolved_src_crs: pd.Series[str] | str | None = (
             df[src_crs_label_column] if src_crs_label_column and src_crs_label_column in df.columns else src_crs
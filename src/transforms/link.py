@@ -5,6 +5,7 @@ from loguru import logger
 
 from src.model import ForeignKeyConfig, ForeignKeyMergeSetup, ShapeShiftProject, TableConfig
 from src.process_state import DeferredLinkingTracker
+from src.profiling import PipelineProfiler
 from src.specifications import ForeignKeyDataSpecification
 from src.specifications.constraints import ForeignKeyConstraintValidator, ForeignKeyRuntimeOptions
 from src.transforms.utility import merge_with_null_safety
@@ -33,9 +34,10 @@ def _resolve_fk_runtime_options(fk: ForeignKeyConfig, remote_cfg: TableConfig) -
 
 class ForeignKeyLinker:
 
-    def __init__(self, project: ShapeShiftProject, table_store: dict[str, pd.DataFrame]) -> None:
+    def __init__(self, project: ShapeShiftProject, table_store: dict[str, pd.DataFrame], profiler: PipelineProfiler | None = None) -> None:
         self.project: ShapeShiftProject = project
         self.table_store: dict[str, pd.DataFrame] = table_store
+        self.profiler: PipelineProfiler = profiler or PipelineProfiler.disabled()
         self.validators: list[ForeignKeyConstraintValidator] = []
         self.deferred_tracker: DeferredLinkingTracker = DeferredLinkingTracker()
 
@@ -139,7 +141,9 @@ class ForeignKeyLinker:
             if specification.is_already_linked(fk_cfg=fk):
                 continue
 
-            local_df = self.link_foreign_key(local_df, fk, self.table_store[fk.remote_entity])
+            with self.profiler.stage(entity_name, f"link:{fk.remote_entity}", local_df, how=fk.how) as record:
+                local_df = self.link_foreign_key(local_df, fk, self.table_store[fk.remote_entity])
+                record.rows_out = len(local_df)
 
             # Update table_store immediately after each FK link so subsequent FKs can
             # see columns added via extra_columns from previous FKs
@@ -0,0 +1,101 @@
+"""
+Streaming union of the sub-tables (base, append items, merged branches) of an entity.
+
+`StreamingUnion` takes the sub-tables one at a time and keeps one buffer of column chunks per output
+column, so a sub-table frame can be released as soon as it has been appended. The result has the
+same schema, dtypes and values as concatenating all non-empty sub-tables with their all-NA columns
+excluded from dtype inference: a column that is missing or all-NA in a sub-table is a gap, and the
+dtype of a column with gaps is resolved once on one-row samples instead of on the data. Columns are
+concatenated one at a time and their chunks released, so peak memory stays close to the size of the
+result rather than holding every sub-table, their all-NA-dropped copies and the result at once.
+"""
+
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from src.transforms.drop import drop_duplicate_rows
+
+
+class StreamingUnion:
+    """Union of sub-table frames appended one at a time (`distinct` drops duplicate rows, as UNION DISTINCT)."""
+
+    def __init__(self, distinct: bool = False) -> None:
+        self.distinct: bool = distinct
+        self.appended: int = 0
+        self.rows: int = 0
+        # Kept only while all appended sub-tables are empty (it is then the result)
+        self.first: pd.DataFrame | None = None
+        # Output column -> chunks, one per non-empty sub-table; None marks a gap of that many rows
+        self._chunks: dict[Any, list[tuple[int, pd.Series | None]]] = {}
+        self._sizes: list[int] = []
+
+    def append(self, data: pd.DataFrame) -> None:
+        """Append a sub-table; its columns are copied into the buffers so that `data` can be released."""
+        self.appended += 1
+        if self.appended == 1:
+            self.first = data
+        if data.empty:
+            return
+        self.first = None
+
+        if self.distinct:
+            data = drop_duplicate_rows(data, columns=True)
+
+        size: int = len(data)
+        for column in data.columns:
+            if column not in self._chunks:
+                # Columns first seen in a later sub-table are gaps in the earlier ones
+                self._chunks[column] = [(rows, None) for rows in self._sizes]
+
+        for column, chunks in self._chunks.items():
+            values: pd.Series | None = data[column] if column in data.columns else None
+            chunks.append((size, None if values is None or values.isna().all() else values.copy()))
+
+        self._sizes.append(size)
+        self.rows += size
+
+    @property
+    def empty(self) -> bool:
+        return not self._sizes
+
+    def result(self) -> pd.DataFrame:
+        """Concatenate the buffers column by column, releasing the chunks of each column when it is done.
+
+        Returns the first appended frame if all sub-tables were empty, and an empty frame if nothing was appended.
+        """
+        if self.empty:
+            return self.first if self.first is not None else pd.DataFrame()
+
+        columns: dict[Any, pd.Series] = {}
+        for column in list(self._chunks):
+            columns[column] = self._concat(self._chunks.pop(column))
+        self._sizes = []
+
+        data: pd.DataFrame = pd.DataFrame(columns, copy=False)
+        if self.distinct and self.appended > 1:
+            data = drop_duplicate_rows(data, columns=True)
+        return data
+
+    def _concat(self, chunks: list[tuple[int, pd.Series | None]]) -> pd.Series:
+        present: list[pd.Series] = [values for _, values in chunks if values is not None]
+        if not present:
+            return pd.Series(np.nan, index=pd.RangeIndex(self.rows), dtype="float64")
+
+        if len(present) == len(chunks) and all(values.dtype == present[0].dtype for values in present):
+            return pd.concat(present, ignore_index=True)
+
+        # The dtype pandas gives the column when concatenating frames (e.g. int64, not object, for bool and int
+        # chunks, as opposed to concatenating series), with missing rows for the gaps, resolved on one row per chunk
+        samples: list[pd.DataFrame] = [
+            values.iloc[:1].to_frame("value") if values is not None else pd.DataFrame(index=pd.RangeIndex(1)) for _, values in chunks
+        ]
+        dtype: Any = pd.concat(samples, ignore_index=True)["value"].dtype
+        return pd.concat(
+            [
+                values.astype(dtype, copy=False) if values is not None else pd.Series(index=pd.RangeIndex(rows), dtype=dtype)
+                for rows, values in chunks
+            ],
+            ignore_index=True,
+        )
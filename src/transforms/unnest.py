@@ -1,5 +1,16 @@
+"""
+Unnesting (melting) of wide entities into long format.
+
+`melt_frame` produces the same table as `pd.melt` (row order, column order and dtypes) without
+the intermediate frames melt builds: id columns are tiled (or taken at the source rows of the
+output), the variable column repeats the value column names, and the value column is filled into
+a preallocated array one wide column at a time. With `drop_na`, null values are skipped while the
+output is built, so rows that `drop_empty_rows` would only drop later are never created.
+"""
+
 from typing import Any
 
+import numpy as np
 import pandas as pd
 from loguru import logger
 
@@ -25,16 +36,10 @@ def unnest(entity: str, table: pd.DataFrame, table_cfg: TableConfig) -> pd.DataF
     if not var_name or not value_name:
         raise ValueError(f"{entity}[unnesting]: Invalid configuration: {unnest_config}")
 
-    opts: dict[str, Any] = {
-        "var_name": var_name,
-        "value_name": value_name,
-    }
-
     if id_vars:
         if not all(col in table.columns for col in id_vars):
             missing: list[str] = [col for col in id_vars if col not in table.columns]
             raise ValueError(f"{entity}[unnesting]: Cannot unnest entity, missing `id_vars` columns: {missing}")
-        opts["id_vars"] = id_vars
 
     if value_vars:
         missing_value_vars: list[str] = [col for col in value_vars if col not in table.columns]
@@ -46,8 +51,87 @@ def unnest(entity: str, table: pd.DataFrame, table_cfg: TableConfig) -> pd.DataF
                 f"Available columns: {sorted(table.columns.tolist())}. "
                 f"Check that value_vars columns are defined in 'columns', 'keys', 'extra_columns', or added by foreign keys."
             )
-        opts["value_vars"] = value_vars
 
-    table_unnested: pd.DataFrame = pd.melt(table, **opts)
+    table_unnested: pd.DataFrame = melt_frame(
+        table, id_vars=id_vars, value_vars=value_vars, var_name=var_name, value_name=value_name, drop_na=unnest_config.drop_na
+    )
 
     return table_unnested
+
+
+def melt_frame(
+    table: pd.DataFrame,
+    *,
+    id_vars: list[str],
+    value_vars: list[str],
+    var_name: str,
+    value_name: str,
+    drop_na: bool = False,
+) -> pd.DataFrame:
+    """Unpivot `table` like `pd.melt` (all non-id columns are melted if `value_vars` is empty).
+
+    If `drop_na` is set, rows whose value is null are left out, as `pd.melt(...).dropna(subset=[value_name])`
+    with a fresh index would do.
+    """
+    if table.empty or table.columns.has_duplicates or isinstance(table.columns, pd.MultiIndex) or len(set(value_vars)) < len(value_vars):
+        melted: pd.DataFrame = pd.melt(
+            table, id_vars=id_vars or None, value_vars=value_vars or None, var_name=var_name, value_name=value_name
+        )
+        return melted.dropna(subset=[value_name], ignore_index=True) if drop_na else melted
+
+    # As in pd.melt, id columns are never melted (also when listed in `value_vars`)
+    value_vars = [column for column in (value_vars or table.columns) if column not in id_vars]
+    values: list[pd.Series] = [table[column] for column in value_vars]
+    size: int = len(table)
+
+    # Output rows are value column by value column (the row order of pd.melt); with drop_na only the non-null rows of each
+    masks: list[np.ndarray] | None = None
+    positions: np.ndarray | None = None
+    if drop_na:
+        masks = [column.notna().to_numpy() for column in values]
+        counts: np.ndarray = np.array([mask.sum() for mask in masks], dtype=np.intp)
+        positions = np.concatenate([np.flatnonzero(mask) for mask in masks]) if masks else np.empty(0, dtype=np.intp)
+    else:
+        counts = np.full(len(values), size, dtype=np.intp)
+
+    names: np.ndarray = np.empty(len(value_vars), dtype=object)
+    names[:] = value_vars
+
+    data: dict[Any, Any] = {column: _repeat_rows(table[column], len(values), positions) for column in id_vars}
+    data[var_name] = names.repeat(counts)
+    data[value_name] = _melt_values(values, masks, counts)
+
+    return pd.DataFrame(data, index=pd.RangeIndex(int(counts.sum())), copy=False)
+
+
+def _repeat_rows(column: pd.Series, repeats: int, positions: np.ndarray | None) -> Any:
+    """The rows of an id column at `positions`, or all rows `repeats` times over."""
+    if positions is not None:
+        return column.array.take(positions)
+    if isinstance(column.dtype, np.dtype):
+        return np.tile(column.to_numpy(), repeats)
+    return column.array.take(np.tile(np.arange(len(column), dtype=np.intp), repeats))
+
+
+def _melt_values(values: list[pd.Series], masks: list[np.ndarray] | None, counts: np.ndarray) -> Any:
+    """Stack the value columns (the non-null values only if `masks` is given) with the dtype pd.melt would give them."""
+    if not values:
+        return np.empty(0, dtype=np.float64)  # The dtype of pd.melt's value column when there is nothing to melt
+
+    # The dtype pd.melt gets from concatenating the value columns depends on their dtypes only
+    dtype: Any = pd.concat([column.iloc[:1] for column in values], ignore_index=True).dtype
+
+    if not isinstance(dtype, np.dtype):
+        pieces: list[pd.Series] = [
+            column.astype(dtype, copy=False) if masks is None else column.astype(dtype, copy=False)[masks[index]]
+            for index, column in enumerate(values)
+        ]
+        return pd.concat(pieces, ignore_index=True).array
+
+    stacked: np.ndarray = np.empty(int(counts.sum()), dtype=dtype)
+    offset: int = 0
+    for index, column in enumerate(values):
+        block: np.ndarray = column.to_numpy(dtype=dtype, copy=False)
+        stacked[offset : offset + counts[index]] = block if masks is None else block[masks[index]]
+        offset += counts[index]
+    return stacked
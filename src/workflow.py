@@ -14,6 +14,8 @@ from loguru import logger
 
 from src.model import ShapeShiftProject
 from src.normalizer import ShapeShifter
+from src.profiling import PipelineProfiler
+from src.progress import ProgressReporter
 from src.specifications import CompositeProjectSpecification
 from src.transforms.translate import extract_translation_map
 from src.utility import load_shape_file
@@ -50,13 +52,20 @@ async def workflow(
     drop_foreign_keys: bool,
     default_entity: str | None = None,
     env_file: str | None = None,
+    profiler: PipelineProfiler | None = None,
+    progress: ProgressReporter | None = None,
 ) -> None:
-    """Main workflow to normalize data and store the results."""
+    """Main workflow to normalize data and store the results.
+
+    If an enabled `profiler` is given, every pipeline stage of every entity is recorded in it.
+    A `progress` reporter receives per-entity events and can cancel the run between entities and between stages.
+    """
     project = resolve_config(project, env_file=env_file)
 
-    shapeshifter: ShapeShifter = ShapeShifter(project=project, default_entity=default_entity)
+    shapeshifter: ShapeShifter = ShapeShifter(project=project, default_entity=default_entity, profiler=profiler, progress=progress)
 
     await shapeshifter.normalize()
+    shapeshifter.progress.check_cancelled()
 
     if drop_foreign_keys:
         shapeshifter.drop_foreign_key_columns()
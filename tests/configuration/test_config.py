@@ -2,12 +2,22 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import pandas as pd
 import pytest
 import yaml
 
-from src.configuration.config import Config, ConfigFactory, is_config_path, is_path_to_existing_file
+from src.configuration.config import (
+    DIRECTIVE_CACHE,
+    Config,
+    ConfigFactory,
+    DirectiveCache,
+    ExternalTable,
+    is_config_path,
+    is_path_to_existing_file,
+)
 from src.configuration.interface import ConfigLike
 
 
@@ -105,7 +115,8 @@ def test_configfactory_resolves_include_and_load(tmp_path: Path, monkeypatch) ->
     cfg: Config | ConfigLike = ConfigFactory().load(source=str(main_file), context="test_ctx")
 
     assert cfg.data["nested"]["child"]["key"] == "sub"
-    assert cfg.data["values"] == [{"name": "alice", "age": "30"}, {"name": "bob", "age": "40"}]
+    assert isinstance(cfg.data["values"], ExternalTable)
+    assert cfg.data["values"].to_records() == [{"name": "alice", "age": "30"}, {"name": "bob", "age": "40"}]
     assert cfg.data["api"] == "https://example.test"
 
 
@@ -120,3 +131,112 @@ def test_configfactory_applies_env_prefix(tmp_path: Path, monkeypatch) -> None:
 
     assert cfg.data["section"]["key"] == "from_env"
     assert cfg.env_prefix == "MYAPP"
+
+
+def test_directive_cache_reuses_parsed_targets_until_file_changes(tmp_path: Path) -> None:
+    """@include/@load targets are parsed once and re-read only when the file stamp changes."""
+    sub_file: Path = tmp_path / "sub.yml"
+    sub_file.write_text("child:\n  key: sub\n", encoding="utf-8")
+    csv_file: Path = tmp_path / "values.csv"
+    csv_file.write_text("name\nalice\n", encoding="utf-8")
+
+    data: dict = {"nested": f"@include:{sub_file}", "values": f"@load:{csv_file}"}
+    DIRECTIVE_CACHE.clear()
+
+    first: dict = Config.resolve_references(data)
+    second: dict = Config.resolve_references(data)
+
+    assert first == second
+    assert DIRECTIVE_CACHE.misses == 2 and DIRECTIVE_CACHE.hits == 2
+    assert first["values"] is second["values"]  # immutable handles are shared
+    assert first["nested"] is not second["nested"]
+    assert data["values"] == f"@load:{csv_file}"
+
+    frame = first["values"].read()
+    frame.loc[0, "name"] = "mutated"
+    assert Config.resolve_references(data)["values"].to_records() == [{"name": "alice"}]
+
+    csv_file.write_text("name\nbob\ncarol\n", encoding="utf-8")
+    changed: ExternalTable = Config.resolve_references(data)["values"]
+    assert changed.fingerprint != first["values"].fingerprint
+    assert changed.to_records() == [{"name": "bob"}, {"name": "carol"}]
+
+    report: list[dict] = DIRECTIVE_CACHE.report()
+    assert {item["directive"] for item in report} == {"@include", "@load"}
+
+
+def test_directive_cache_reloads_include_when_nested_include_changes(tmp_path: Path) -> None:
+    """An included file is re-resolved when a file it includes itself changes."""
+    (tmp_path / "b.yml").write_text("value: old\n", encoding="utf-8")
+    (tmp_path / "a.yml").write_text("inner: '@include:b.yml'\n", encoding="utf-8")
+    main_file: Path = tmp_path / "main.yml"
+    main_file.write_text("outer: '@include:a.yml'\n", encoding="utf-8")
+    DIRECTIVE_CACHE.clear()
+
+    assert ConfigFactory().load(source=str(main_file)).data["outer"]["inner"] == {"value": "old"}  # type: ignore[union-attr]
+
+    (tmp_path / "b.yml").write_text("value: changed\n", encoding="utf-8")
+
+    assert ConfigFactory().load(source=str(main_file)).data["outer"]["inner"] == {"value": "changed"}  # type: ignore[union-attr]
+
+
+def test_load_directive_resolves_to_lazy_handle(tmp_path: Path) -> None:
+    """@load keeps rows out of the config tree: clones share the handle and hashes use file metadata."""
+    parquet_file: Path = tmp_path / "values.parquet"
+    csv_file: Path = tmp_path / "values.csv"
+    pd.DataFrame({"code": [1, 2], "name": ["a", "b"]}).to_parquet(parquet_file)
+    pd.DataFrame({"code": [1, 2], "name": ["a", "b"]}).to_csv(csv_file, index=False)
+    DIRECTIVE_CACHE.clear()
+
+    cfg: Config = Config(data=Config.resolve_references({"values": f"@load:{parquet_file}"}))
+    table: ExternalTable = cfg.data["values"]
+
+    assert table.format == "parquet" and table.columns() == ["code", "name"]
+    assert table.read()["code"].tolist() == [1, 2]
+    assert table.read(columns=["name"], memory_map=True).columns.tolist() == ["name"]
+
+    csv_table: ExternalTable = Config.resolve_references({"values": f"@load:{csv_file}"})["values"]
+    assert csv_table.read(columns=["name", "code"]).to_dict(orient="list") == {"name": ["a", "b"], "code": ["1", "2"]}
+    assert cfg.clone().data["values"] is table
+    assert table.fingerprint in repr(table)
+    assert yaml.dump({"values": table}).strip() == f"values: '@load:{table.path}'"
+
+    assert Config.resolve_references({"values": f"@load:{tmp_path / 'missing.csv'}"})["values"] == str(tmp_path / "missing.csv")
+
+
+def test_directive_cache_is_bounded_and_invalidates() -> None:
+    """DirectiveCache evicts least recently used entries and supports explicit invalidation."""
+    cache = DirectiveCache(max_entries=1)
+    calls: list[str] = []
+
+    def loader(name: str):
+        return lambda: calls.append(name) or name
+
+    assert cache.get_or_load("@load", __file__, loader("a"), "a") == "a"
+    assert cache.get_or_load("@load", __file__, loader("b"), "b") == "b"
+    assert cache.get_or_load("@load", __file__, loader("a"), "a") == "a"
+    assert calls == ["a", "b", "a"] and len(cache) == 1
+
+    cache.invalidate(__file__)
+    assert len(cache) == 0
+
+    assert cache.get_or_load("@load", "/no/such/file.csv", lambda: None) is None
+    assert len(cache) == 0
+
+
+def test_directive_cache_is_safe_across_threads() -> None:
+    """Concurrent lookups, evictions and invalidations keep DirectiveCache consistent."""
+    cache = DirectiveCache(max_entries=4)
+
+    def worker(offset: int) -> None:
+        for i in range(500):
+            name: str = str((offset + i) % 8)
+            assert cache.get_or_load("@load", __file__, lambda name=name: name, name) == name
+            if i % 50 == 0:
+                cache.invalidate(__file__)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(worker, range(8)))
+
+    assert len(cache) <= 4
+    assert cache.hits + cache.misses == 8 * 500
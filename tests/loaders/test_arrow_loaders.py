@@ -0,0 +1,75 @@
+"""Tests for Parquet/Feather loaders."""
+
+from pathlib import Path
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+
+from src.loaders import DataLoaders
+from src.loaders.arrow_loaders import FeatherLoader, ParquetLoader
+from src.model import DataSourceConfig
+
+# pylint: disable=redefined-outer-name
+
+
+@pytest.fixture
+def frame() -> pd.DataFrame:
+    return pd.DataFrame({"id": [1, 2, 3, 4], "name": ["a", "b", "c", "d"], "year": [1999, 2001, 2005, 2010]})
+
+
+def test_loaders_are_registered():
+    """Columnar loaders are available by entity type."""
+    assert DataLoaders.get(key="parquet") is ParquetLoader
+    assert DataLoaders.get(key="feather") is FeatherLoader
+
+
+@pytest.mark.asyncio
+async def test_parquet_loader_projects_columns_and_pushes_down_filters(tmp_path: Path, frame: pd.DataFrame):
+    """Only requested columns and matching rows are read."""
+    filename = tmp_path / "data.parquet"
+    frame.to_parquet(filename, row_group_size=2)
+
+    df = await ParquetLoader().load_file({"filename": str(filename), "columns": ["id", "year"], "filters": [["year", ">", 2000]]})
+
+    assert df.to_dict("list") == {"id": [2, 3, 4], "year": [2001, 2005, 2010]}
+
+
+@pytest.mark.asyncio
+async def test_feather_loader_applies_limit(tmp_path: Path, frame: pd.DataFrame):
+    """A load limit reads only the first rows."""
+    filename = tmp_path / "data.feather"
+    frame.to_feather(filename)
+    table_cfg = SimpleNamespace(options={"filename": str(filename)}, source=None)
+
+    df = await FeatherLoader().load("entity", table_cfg, limit=2)  # type: ignore
+
+    assert df["id"].tolist() == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_parquet_loader_reads_folder(tmp_path: Path, frame: pd.DataFrame):
+    """A folder of Parquet files is read as one dataset."""
+    frame.iloc[:2].to_parquet(tmp_path / "part-0.parquet")
+    frame.iloc[2:].to_parquet(tmp_path / "part-1.parquet")
+
+    df = await ParquetLoader().load_file({"filename": str(tmp_path)})
+
+    assert sorted(df["id"].tolist()) == [1, 2, 3, 4]
+
+
+@pytest.mark.asyncio
+async def test_parquet_loader_test_connection(tmp_path: Path, frame: pd.DataFrame):
+    """Connection test reports the schema columns, or failure for missing files."""
+    filename = tmp_path / "data.parquet"
+    frame.to_parquet(filename)
+
+    result = await ParquetLoader(
+        data_source=DataSourceConfig(name="ds", cfg={"driver": "parquet", "options": {"filename": str(filename)}})
+    ).test_connection()
+    missing = await ParquetLoader(
+        data_source=DataSourceConfig(name="ds", cfg={"driver": "parquet", "options": {"filename": str(tmp_path / "nope.parquet")}})
+    ).test_connection()
+
+    assert result.success and result.metadata["columns"] == ["id", "name", "year"]
+    assert not missing.success
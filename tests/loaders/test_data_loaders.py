@@ -27,7 +27,7 @@ class TestDataLoader:
         "loader_type,expected_keys",
         [
             (LoaderType.SQL, {"postgres", "sqlite", "ucanaccess"}),
-            (LoaderType.FILE, {"csv", "xlsx", "openpyxl"}),
+            (LoaderType.FILE, {"csv", "xlsx", "openpyxl", "parquet", "feather"}),
             (LoaderType.VALUE, {"fixed"}),
         ],
     )
@@ -62,3 +62,16 @@ async def test_csv_loader_missing_filename_raises():
     loader = CsvLoader()
     with pytest.raises(ValueError, match="Missing 'filename'"):
         await loader.load_file({})
+
+
+@pytest.mark.asyncio
+async def test_csv_loader_load_pushes_limit_as_nrows(tmp_path):
+    """A row limit passed to load is forwarded to the CSV reader as nrows."""
+    path = tmp_path / "data.csv"
+    path.write_text("id\n" + "\n".join(str(i) for i in range(10)) + "\n")
+    table_cfg = SimpleNamespace(options={"filename": str(path)}, source=None)
+
+    df = await CsvLoader().load("entity", table_cfg, limit=3)  # type: ignore
+
+    assert df["id"].tolist() == [0, 1, 2]
+    assert "nrows" not in table_cfg.options
@@ -3,6 +3,7 @@
 import pandas as pd
 import pytest
 
+from src.configuration import ExternalTable
 from src.loaders.fixed_loader import FixedLoader
 from src.model import DataSourceConfig, TableConfig
 
@@ -606,3 +607,26 @@ class TestCreateFixedTable:
         assert set(result.columns) == {"system_id", "dimension_id", "dimension_name"}
         assert result["dimension_id"].tolist() == [1, 2, 3]
         assert result["dimension_name"].tolist() == ["Width", "Height", "Depth"]
+
+    @pytest.mark.asyncio
+    async def test_values_from_load_directive_are_read_from_file(self, tmp_path):
+        """Test that an @load: handle is read directly from the (memory-mapped) Parquet file with its types."""
+        filename = tmp_path / "dimensions.parquet"
+        pd.DataFrame({"dimension_id": [1, 2], "dimension_name": ["Width", "Height"]}).to_parquet(filename)
+        config = {
+            "test_entity": {
+                "type": "fixed",
+                "public_id": "dimension_id",
+                "keys": ["dimension_name"],
+                "columns": ["dimension_name"],
+                "values": ExternalTable.from_file(str(filename)),
+                "options": {"memory_map": True},
+            }
+        }
+        table_cfg = TableConfig(entities_cfg=config, entity_name="test_entity")
+
+        result: pd.DataFrame = await FixedLoader(data_source=None).load("test_entity", table_cfg)
+
+        assert result["dimension_id"].tolist() == [1, 2]
+        assert result["dimension_name"].tolist() == ["Width", "Height"]
+        assert result["system_id"].tolist() == [1, 2]
@@ -4,6 +4,7 @@ Tests for Database Loaders
 Tests the vendor-specific database introspection methods in database loaders.
 """
 
+import sqlite3
 from unittest.mock import AsyncMock, Mock, patch
 
 import pandas as pd
@@ -190,6 +191,66 @@ class TestPostgresSqlLoader:
             assert "public" in call_args
             assert tables is not None
 
+    @pytest.mark.asyncio
+    async def test_get_table_schemas_uses_bulk_catalog_queries(self, loader):
+        """Bulk introspection runs one query per catalog aspect and assembles every table."""
+        columns_data = pd.DataFrame(
+            {
+                "table_name": ["orders", "orders", "users", "users"],
+                "column_name": ["order_id", "user_id", "user_id", "name"],
+                "data_type": ["integer", "integer", "integer", "character varying"],
+                "is_nullable": ["NO", "YES", "NO", "YES"],
+                "column_default": [None, None, None, None],
+                "character_maximum_length": [None, None, None, 100.0],
+            }
+        )
+        pk_data = pd.DataFrame({"table_name": ["orders", "users"], "column_name": ["order_id", "user_id"]})
+        fk_data = pd.DataFrame(
+            {
+                "table_name": ["orders"],
+                "column_name": ["user_id"],
+                "referenced_schema": ["public"],
+                "referenced_table": ["users"],
+                "referenced_column": ["user_id"],
+                "constraint_name": ["orders_user_id_fkey"],
+            }
+        )
+        count_data = pd.DataFrame({"table_name": ["orders", "users"], "row_count": [1200, -1]})
+        queries: list[str] = []
+
+        async def mock_read_sql(query):
+            queries.append(query)
+            if "information_schema.columns" in query:
+                return columns_data
+            if "indisprimary" in query:
+                return pk_data
+            if "contype = 'f'" in query:
+                return fk_data
+            return count_data
+
+        with patch.object(loader, "read_sql", side_effect=mock_read_sql):
+            with patch.object(loader, "get_table_row_count", new_callable=AsyncMock) as mock_count:
+                schemas = await loader.get_table_schemas(["users", "orders"], schema="public")
+
+        assert len(queries) == 4
+        assert all("in ('users', 'orders')" in query for query in queries)
+        mock_count.assert_not_awaited()
+
+        assert set(schemas) == {"users", "orders"}
+        assert schemas["users"].primary_keys == ["user_id"]
+        assert schemas["users"].columns[1].max_length == 100
+        assert schemas["users"].row_count is None
+        assert schemas["orders"].row_count == 1200
+        assert schemas["orders"].foreign_keys[0].referenced_table == "users"
+        assert schemas["orders"].columns[1].nullable is True
+
+    @pytest.mark.asyncio
+    async def test_get_table_schemas_empty_filter_skips_queries(self, loader):
+        """An empty table filter returns nothing without touching the database."""
+        with patch.object(loader, "read_sql", new_callable=AsyncMock) as mock_read_sql:
+            assert await loader.get_table_schemas([]) == {}
+        mock_read_sql.assert_not_awaited()
+
 
 class TestSqliteLoader:
     """Tests for SQLite loader introspection."""
@@ -276,6 +337,34 @@ class TestSqliteLoader:
                 assert "KEY_COLUMN_USAGE" in call_args
                 assert "users" in call_args
 
+    @pytest.mark.asyncio
+    async def test_get_table_schemas_reads_sqlite_catalog(self, tmp_path):
+        """Bulk introspection reads columns, keys and foreign keys for all tables of a real database."""
+        db_file = tmp_path / "catalog.db"
+        with sqlite3.connect(db_file) as connection:
+            connection.executescript(
+                """
+                create table users (user_id integer primary key, name varchar(50) not null);
+                create table orders (
+                    order_id integer, line integer, user_id integer references users(user_id), note text default 'n/a',
+                    primary key (order_id, line)
+                );
+                """
+            )
+        loader = SqliteLoader(data_source=DataSourceConfig(name="catalog", cfg={"driver": "sqlite", "options": {"filename": str(db_file)}}))
+
+        schemas = await loader.get_table_schemas()
+        filtered = await loader.get_table_schemas(["users"])
+
+        assert set(schemas) == {"users", "orders"}
+        assert schemas["orders"].primary_keys == ["order_id", "line"]
+        assert [column.name for column in schemas["orders"].columns] == ["order_id", "line", "user_id", "note"]
+        assert schemas["orders"].columns[3].default == "'n/a'"
+        assert schemas["orders"].foreign_keys[0].column == "user_id"
+        assert schemas["orders"].foreign_keys[0].referenced_table == "users"
+        assert schemas["users"].columns[1].nullable is False
+        assert set(filtered) == {"users"}
+
 
 class TestUCanAccessLoader:
     """Tests for MS Access loader introspection."""
@@ -708,6 +797,22 @@ class TestSqlLoaderCore:
         assert list(result.columns) == ["system_id", "col_a", "col_b"]
         assert result["system_id"].tolist() == [1, 2]
 
+    @pytest.mark.asyncio
+    async def test_load_pushes_limit_into_query(self, monkeypatch: pytest.MonkeyPatch):
+        """A row limit passed to load should be injected into the entity query."""
+        loader = DummySqlLoader(data_source=DataSourceConfig(name="dummy", cfg={"driver": "postgres"}))
+        read_sql = AsyncMock(return_value=pd.DataFrame({"col_a": [1]}))
+        monkeypatch.setattr(loader, "read_sql", read_sql)
+
+        table_cfg = TableConfig(
+            entities_cfg={"sql_entity": {"type": "sql", "query": "select * from t", "keys": [], "columns": [], "public_id": "sql_id"}},
+            entity_name="sql_entity",
+        )
+
+        await loader.load(entity_name="sql_entity", table_cfg=table_cfg, limit=5)
+
+        read_sql.assert_awaited_once_with(sql="select * from t limit 5;")
+
     @pytest.mark.asyncio
     async def test_load_auto_detect_rejects_missing_stored_schema_columns(self, monkeypatch: pytest.MonkeyPatch):
         """Auto-detect mode should fail when the query result no longer satisfies the stored schema."""
@@ -1072,6 +1072,42 @@ class TestTableConfig:
         assert configs[1].entity_name == "site__append_0"
         assert configs[2].entity_name == "site__append_1"
 
+    def test_get_sub_table_configs_are_compiled_once_without_touching_entities(self):
+        """Sub-table configs are registered in a copy of the entities config and reused."""
+        entities: dict[str, dict[str, Any]] = {
+            "site": {"public_id": "site_id", "columns": ["name"], "append": [{"type": "fixed", "values": [["x"]]}]}
+        }
+
+        table = TableConfig(entities_cfg=entities, entity_name="site")
+        configs = list(table.get_sub_table_configs())
+
+        assert set(entities) == {"site"}
+        assert configs[1].entity_cfg["values"] == [["x"]]
+        assert all(a is b for a, b in zip(configs, table.get_sub_table_configs()))
+
+    def test_plan_is_compiled_once_and_invalidated_by_setters(self):
+        """Derived column lists are served from the compiled plan until the entity config is changed."""
+        entities: dict[str, dict[str, Any]] = {
+            "site": {
+                "keys": ["code"],
+                "columns": ["code", "name", "name"],
+                "foreign_keys": [{"entity": "region", "local_keys": ["region_code"], "remote_keys": ["code"]}],
+            }
+        }
+
+        table = TableConfig(entities_cfg=entities, entity_name="site")
+        plan = table.plan
+
+        assert table.columns == ["code", "name"]
+        assert table.keys_columns_and_fks == ["code", "name", "region_code"]
+        assert table.hash() == plan.content_hash and table.plan is plan
+
+        table.columns = ["code", "label"]
+
+        assert table.plan is not plan
+        assert table.keys_columns_and_fks == ["code", "label", "region_code"]
+        assert table.hash() != plan.content_hash
+
     def test_get_sub_table_configs_no_append(self):
         """Test get_sub_table_configs yields only base config when no append."""
         entities: dict[str, dict[str, Any]] = {"site": {"public_id": "site_id", "columns": ["name"]}}
@@ -7,6 +7,7 @@ from unittest.mock import AsyncMock, Mock, patch
 import pandas as pd
 import pytest
 
+from src.dependency_graph import EntityDependencyGraph
 from src.loaders.base_loader import DataLoader
 from src.model import ShapeShiftProject, TableConfig
 from src.normalizer import ProcessState, ShapeShifter
@@ -139,6 +140,58 @@ class TestProcessState:
         state = ProcessState(project=cfg, table_store={}, target_entities={"sample"})
         assert state.target_entities == {"sample", "site", "survey"}
 
+    def test_get_row_limit_entities_stops_at_row_reducing_steps_and_lookups(self):
+        """Row limits are pushed up source edges only through prefix-preserving entities that are not lookups."""
+        cfg = ShapeShiftProject(
+            cfg={
+                "entities": {
+                    "raw": {"type": "csv", "options": {"filename": "raw.csv"}, "columns": ["a", "b"]},
+                    "site": {"type": "entity", "source": "raw", "columns": ["a"], "drop_duplicates": True},
+                    "sample": {
+                        "type": "entity",
+                        "source": "raw",
+                        "columns": ["a", "b"],
+                        "foreign_keys": [{"entity": "site", "local_keys": ["a"], "remote_keys": ["a"], "how": "left"}],
+                    },
+                    "sample_view": {"type": "entity", "source": "sample", "columns": ["b"]},
+                    "inner_linked": {
+                        "type": "entity",
+                        "source": "raw",
+                        "columns": ["a"],
+                        "foreign_keys": [{"entity": "site", "local_keys": ["a"], "remote_keys": ["a"]}],
+                    },
+                    "filtered": {"type": "entity", "source": "raw", "columns": ["a"], "filters": [{"type": "query", "query": "a > 1"}]},
+                }
+            }
+        )
+
+        assert cfg.get_row_limit_entities("sample_view") == {"sample_view", "sample"}
+        assert cfg.get_row_limit_entities("site") == set()
+        assert cfg.get_row_limit_entities("filtered") == set()
+        assert cfg.get_row_limit_entities("raw") == {"raw"}
+        assert cfg.get_row_limit_entities("inner_linked") == set()
+
+    def test_get_row_limit_entities_stops_at_unnest_with_drop_na(self):
+        """Unnesting that drops null values takes its first N rows from more than N source rows."""
+        unnest = {"id_vars": ["a"], "value_vars": ["b", "c"], "var_name": "kind", "value_name": "value"}
+        cfg = ShapeShiftProject(
+            cfg={
+                "entities": {
+                    "raw": {"type": "csv", "options": {"filename": "raw.csv"}, "columns": ["a", "b", "c"]},
+                    "melted": {"type": "entity", "source": "raw", "columns": ["a", "b", "c"], "unnest": unnest},
+                    "melted_non_null": {
+                        "type": "entity",
+                        "source": "raw",
+                        "columns": ["a", "b", "c"],
+                        "unnest": {**unnest, "drop_na": True},
+                    },
+                }
+            }
+        )
+
+        assert cfg.get_row_limit_entities("melted") == {"melted", "raw"}
+        assert cfg.get_row_limit_entities("melted_non_null") == set()
+
     def test_get_unmet_dependencies(self):
         """Test getting unmet dependencies for an entity."""
         config = ShapeShiftProject(
@@ -350,7 +403,7 @@ class TestShapeShifter:
             result = await normalizer.resolve_source(table_cfg)
 
             pd.testing.assert_frame_equal(result, fixed_df)
-            mock_loader.load.assert_called_once_with(entity_name="test_entity", table_cfg=table_cfg)
+            mock_loader.load.assert_called_once_with(entity_name="test_entity", table_cfg=table_cfg, limit=None)
 
     @pytest.mark.asyncio
     async def test_resolve_source_sql_data(self, survey_only_config: ShapeShiftProject):
@@ -373,7 +426,7 @@ class TestShapeShifter:
             result: pd.DataFrame = await normalizer.resolve_source(table_cfg=table_cfg)
 
             pd.testing.assert_frame_equal(result, sql_df)
-            mock_loader.load.assert_called_once_with(entity_name="test_sql_entity", table_cfg=table_cfg)
+            mock_loader.load.assert_called_once_with(entity_name="test_sql_entity", table_cfg=table_cfg, limit=None)
 
     def test_translate(self, survey_and_site_config: ShapeShiftProject):
         """Test translating column names."""
@@ -508,7 +561,7 @@ class TestShapeShifter:
         with patch("src.normalizer.Dispatchers.get", return_value=mock_dispatcher_cls):
             normalizer.store(target="output.xlsx", mode="xlsx")
 
-            mock_dispatcher_cls.assert_called_once_with(survey_only_config)
+            mock_dispatcher_cls.assert_called_once_with(survey_only_config, progress=normalizer.progress)
             mock_dispatcher.dispatch.assert_called_once_with(target="output.xlsx", data=normalizer.table_store)
 
     def test_store_csv(self, survey_only_config: ShapeShiftProject):
@@ -524,7 +577,7 @@ class TestShapeShifter:
         with patch("src.normalizer.Dispatchers.get", return_value=mock_dispatcher_cls):
             normalizer.store(target="output_dir", mode="csv")
 
-            mock_dispatcher_cls.assert_called_once_with(survey_only_config)
+            mock_dispatcher_cls.assert_called_once_with(survey_only_config, progress=normalizer.progress)
             mock_dispatcher.dispatch.assert_called_once_with(target="output_dir", data=normalizer.table_store)
 
     def test_store_unsupported_mode(self, survey_only_config: ShapeShiftProject):
@@ -611,15 +664,9 @@ class TestShapeShifter:
         normalizer.project.table_names = ["site", "sample"]
 
         # Create circular dependency
-        def mock_get_table(entity_name):
-            mock_cfg = Mock()
-            if entity_name == "site":
-                mock_cfg.depends_on = {"sample"}
-            else:
-                mock_cfg.depends_on = {"site"}
-            return mock_cfg
-
-        with patch.object(normalizer.project, "get_table", side_effect=mock_get_table):
+        graph = EntityDependencyGraph({"site": ["sample"], "sample": ["site"], "survey": ["site"]})
+
+        with patch.object(normalizer.project, "dependency_graph", graph):
             with pytest.raises(ValueError, match="Circular or unresolved dependencies"):
                 await normalizer.normalize()
 
@@ -674,6 +721,71 @@ class TestShapeShifter:
         assert "system_id" in normalizer.table_store["site_property"].columns
         assert "site_property_id" in normalizer.table_store["site_property"].columns
 
+    @pytest.mark.asyncio
+    async def test_normalize_with_row_limits_reports_truncated_entities(self):
+        """Row limits cut source rows and only entities that hit the limit are reported as truncated."""
+        survey_df = pd.DataFrame({"name": [f"site_{i}" for i in range(10)]})
+        project = ShapeShiftProject(cfg={"entities": {"site": {"columns": ["name"], "public_id": "site_id"}}})
+
+        normalizer = ShapeShifter(project=project, default_entity="survey", table_store={"survey": survey_df}, row_limits={"site": 3})
+        await normalizer.normalize()
+
+        assert normalizer.table_store["site"]["name"].tolist() == ["site_0", "site_1", "site_2"]
+        assert normalizer.truncated_entities == {"site"}
+
+        normalizer = ShapeShifter(project=project, default_entity="survey", table_store={"survey": survey_df}, row_limits={"site": 20})
+        await normalizer.normalize()
+
+        assert len(normalizer.table_store["site"]) == 10
+        assert not normalizer.truncated_entities
+
+    @pytest.mark.asyncio
+    async def test_normalize_releases_row_hashes_after_key_check(self):
+        """Hashed frames are dropped once an entity's keys are checked rather than kept after the run."""
+        survey_df = pd.DataFrame({"name": ["a", "b", "b"]})
+        project = ShapeShiftProject(
+            cfg={"entities": {"site": {"columns": ["name"], "keys": ["name"], "public_id": "site_id", "drop_duplicates": True}}}
+        )
+
+        normalizer = ShapeShifter(project=project, default_entity="survey", table_store={"survey": survey_df})
+        await normalizer.normalize()
+
+        assert normalizer.table_store["site"]["name"].tolist() == ["a", "b"]
+        assert not normalizer.row_hashes._hashers  # pylint: disable=protected-access
+
+    @pytest.mark.asyncio
+    async def test_normalize_with_row_limits_keeps_rows_of_inner_linked_entity(self):
+        """An inner FK join can drop the first source rows, so the limit is not applied before linking."""
+        survey_df = pd.DataFrame({"site_name": [f"unknown_{i}" for i in range(5)] + ["a", "b", "c"]})
+        project = ShapeShiftProject(
+            cfg={
+                "entities": {
+                    "site": {
+                        "type": "fixed",
+                        "columns": ["site_name"],
+                        "keys": ["site_name"],
+                        "public_id": "site_id",
+                        "values": [["a"], ["b"], ["c"]],
+                    },
+                    "sample": {
+                        "source": "survey",
+                        "columns": ["site_name"],
+                        "public_id": "sample_id",
+                        "foreign_keys": [{"entity": "site", "local_keys": ["site_name"], "remote_keys": ["site_name"]}],
+                    },
+                }
+            }
+        )
+
+        # Limits are planned as for an entity preview
+        row_limits = {name: 3 for name in project.get_row_limit_entities("sample")}
+        assert "sample" not in row_limits
+
+        normalizer = ShapeShifter(project=project, default_entity="survey", table_store={"survey": survey_df}, row_limits=row_limits)
+        await normalizer.normalize()
+
+        assert normalizer.table_store["sample"]["site_name"].tolist() == ["a", "b", "c"]
+
     @pytest.mark.asyncio
     async def test_normalize_applies_after_unnest_filters(self):
         """Filters staged after unnest should see generated var/value columns."""
@@ -910,6 +1022,18 @@ class TestShapeShifter:
         assert content[0] == "entity\tnum_rows\tnum_columns"
         assert len(content) == 3  # header + two entities
 
+    def test_log_shapes_skipped_when_written_by_dispatcher(self, tmp_path: Path, survey_only_config: ShapeShiftProject):
+        """log_shapes should not rewrite shapes already written by the CSV dispatcher for the same target."""
+        normalizer = ShapeShifter(project=survey_only_config, default_entity="survey")
+        normalizer.table_store = {"survey": pd.DataFrame({"a": [1, 2]})}
+
+        normalizer.store(target=str(tmp_path), mode="csv")
+        (tmp_path / "table_shapes.tsv").unlink()
+        normalizer.log_shapes(str(tmp_path))
+
+        assert normalizer.shapes_written_for == str(tmp_path)
+        assert not (tmp_path / "table_shapes.tsv").exists()
+
     def test_resolve_loader_with_data_source(self):
         """Test resolve_loader with data_source configured."""
         entities: dict[str, dict[str, Any]] = {"site": {"public_id": "site_id", "data_source": "postgres_db"}}
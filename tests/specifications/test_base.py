@@ -8,6 +8,7 @@ from src.specifications.base import (
     FieldValidator,
     FieldValidatorRegistry,
     ProjectSpecification,
+    SpecificationContext,
     SpecificationIssue,
 )
 from src.utility import dotget
@@ -225,6 +226,57 @@ class TestProjectSpecification:
 
         spec.check_fields("sample", ["missing"], "exists/E", message="Custom error message")
 
+    def test_specifications_share_context(self, project_cfg):
+        """Test that specifications sharing a context share TableConfig instances and column indexes."""
+        context = SpecificationContext(project_cfg)
+        first = ConcreteSpecification(project_cfg, context=context)
+        second = ConcreteSpecification(project_cfg, context=context)
+
+        assert first.get_entity("sample") is second.get_entity("sample")
+        assert first.get_entity_columns("sample") == {"system_id", "site_id", "sample_name", "sample_id"}
+        assert first.get_entity_columns("sample", include_types={"keys"}) == {"system_id", "sample_id"}
+
+    def test_context_for_other_config_is_ignored(self, project_cfg):
+        """Test that a context built for another configuration is not reused."""
+        context = SpecificationContext({"entities": {}})
+        spec = ConcreteSpecification(project_cfg, context=context)
+
+        assert spec.context is not context
+        assert spec.entity_exists("sample")
+
+    def test_context_rebuilds_table_config_when_entity_is_replaced(self, project_cfg):
+        """Test that replacing an entity's configuration yields a fresh TableConfig."""
+        spec = ConcreteSpecification(project_cfg)
+        table = spec.get_entity("sample")
+
+        project_cfg["entities"]["sample"] = {"type": "sql", "columns": ["other"], "keys": ["sample_id"]}
+
+        assert spec.get_entity("sample") is not table
+        assert spec.get_entity("sample").columns == ["other"]
+
+    def test_entity_fingerprint_tracks_referenced_entities(self, project_cfg):
+        """Test that an entity's fingerprint changes when a referenced entity changes."""
+        project_cfg["entities"]["sample"]["foreign_keys"] = [{"entity": "site", "local_keys": ["site_id"], "remote_keys": ["site_id"]}]
+        before = {name: SpecificationContext(project_cfg).entity_fingerprint(name) for name in ("sample", "site")}
+
+        project_cfg["entities"]["site"]["columns"] = ["site_name", "site_code"]
+        after = SpecificationContext(project_cfg)
+
+        assert after.entity_fingerprint("sample") != before["sample"]
+        assert after.entity_fingerprint("site") != before["site"]
+
+        project_cfg["entities"]["site"]["columns"] = ["site_name"]
+        assert SpecificationContext(project_cfg).entity_fingerprint("sample") == before["sample"]
+
+    def test_referenced_entities_are_the_fingerprinted_closure(self, project_cfg):
+        """Test that referenced_entities returns the entities covered by an entity's fingerprint."""
+        project_cfg["entities"]["sample"]["foreign_keys"] = [{"entity": "site", "local_keys": ["site_id"], "remote_keys": ["site_id"]}]
+        context = SpecificationContext(project_cfg)
+
+        assert "site" in context.referenced_entities("sample")
+        assert "sample" not in context.referenced_entities("sample")
+        assert context.referenced_entities("missing") == frozenset()
+
 
 class ConcreteFieldValidator(FieldValidator):
     """Concrete field validator for testing."""
@@ -1361,6 +1361,23 @@ class TestFilterSpecification:
         assert result is False
         assert any("other_column 'missing_column' not found" in str(error) for error in spec.errors)
 
+    def test_multi_column_exists_in_requires_one_other_column_per_column(self, project_cfg):
+        spec = FilterSpecification(project_cfg)
+        project_cfg["entities"]["measurement"]["filters"] = [
+            {
+                "type": "exists_in",
+                "stage": "after_unnest",
+                "column": ["value_name", "value"],
+                "other_entity": "allowed_measurements",
+                "other_column": "value_name",
+            }
+        ]
+
+        result = spec.is_satisfied_by(entity_name="measurement")
+
+        assert result is False
+        assert any("one 'other_column' per 'column'" in str(error) for error in spec.errors)
+
     def test_query_filter_does_not_parse_query_columns(self, project_cfg):
         spec = FilterSpecification(project_cfg)
         project_cfg["entities"]["measurement"]["filters"] = [{"type": "query", "stage": "after_unnest", "query": "missing_column == 'ph'"}]
@@ -4,7 +4,7 @@ from unittest.mock import Mock
 
 import pytest
 
-from src.specifications.base import SpecificationIssue
+from src.specifications.base import EntityValidationCache, SpecificationIssue
 from src.specifications.project import (
     CircularDependencySpecification,
     CompositeProjectSpecification,
@@ -257,6 +257,71 @@ class TestEntitiesSpecification:
         assert result is False
         assert len(spec.errors) > 0
 
+    def test_repeated_runs_do_not_accumulate_issues(self):
+        """Test that running the specification twice reports the same issues."""
+        project_cfg = {"entities": {"invalid_entity": {"type": "sql"}}}
+
+        spec = EntitiesSpecification(project_cfg)
+        spec.is_satisfied_by()
+        first_count = len(spec.errors)
+        spec.is_satisfied_by()
+
+        assert len(spec.errors) == first_count
+
+    def test_result_cache_revalidates_only_affected_entities(self, monkeypatch):
+        """Test that cached results are reused for entities whose inputs did not change."""
+        project_cfg = {
+            "entities": {
+                "parent": {
+                    "type": "sql",
+                    "data_source": "db1",
+                    "query": "SELECT *",
+                    "columns": ["id"],
+                    "keys": ["id"],
+                    "public_id": "parent_id",
+                },
+                "child": {
+                    "type": "sql",
+                    "data_source": "db1",
+                    "query": "SELECT *",
+                    "columns": ["id", "pid"],
+                    "keys": ["id"],
+                    "foreign_keys": [{"entity": "parent", "local_keys": ["pid"], "remote_keys": ["id"]}],
+                },
+                "other": {"type": "sql", "data_source": "db1", "query": "SELECT *", "columns": ["id"], "keys": ["id"]},
+            },
+            "options": {"data_sources": {"db1": {}}},
+        }
+        cache = EntityValidationCache()
+
+        validated: list[str] = []
+        original = EntitiesSpecification.__init__
+
+        def tracking_init(self, *args, **kwargs):
+            original(self, *args, **kwargs)
+            entity_spec = self.entity_specifications[0]
+            inner = entity_spec.is_satisfied_by
+
+            def tracked(*, entity_name: str = "unknown", **kw):
+                validated.append(entity_name)
+                return inner(entity_name=entity_name, **kw)
+
+            entity_spec.is_satisfied_by = tracked
+
+        monkeypatch.setattr(EntitiesSpecification, "__init__", tracking_init)
+
+        first = EntitiesSpecification(project_cfg, result_cache=cache)
+        first.is_satisfied_by()
+        assert sorted(validated) == ["child", "other", "parent"]
+
+        validated.clear()
+        project_cfg["entities"]["parent"] = {**project_cfg["entities"]["parent"], "columns": ["id", "name"]}
+        second = EntitiesSpecification(project_cfg, result_cache=cache)
+        second.is_satisfied_by()
+
+        assert sorted(validated) == ["child", "parent"]
+        assert [str(e) for e in second.errors] == [str(e) for e in first.errors]
+
 
 class TestCompositeProjectSpecification:
     """Tests for CompositeProjectSpecification."""
@@ -0,0 +1,88 @@
+import random
+
+from src.dependency_graph import EntityDependencyGraph
+from src.model import ShapeShiftProject
+
+
+class TestEntityDependencyGraph:
+
+    def test_order_depths_and_required(self):
+        graph = EntityDependencyGraph({"sample": ["site", "survey"], "site": ["survey"], "taxa": [], "survey": []})
+
+        assert not graph.has_cycles and not graph.cycles
+        assert graph.topological_order() == ["sample", "taxa", "site", "survey"]
+        assert graph.depths == {"sample": 0, "site": 1, "taxa": 0, "survey": 2}
+        assert graph.required("sample") == {"sample", "site", "survey"}
+        assert graph.dependents("survey") == {"sample", "site"}
+
+    def test_dependencies_outside_graph_are_edges_but_not_nodes(self):
+        graph = EntityDependencyGraph({"site": ["survey"]})
+
+        assert "survey" not in graph
+        assert graph.topological_order() == ["site"]
+        assert graph.depths == {"site": 0}
+        assert graph.required("site") == {"site", "survey"}
+
+    def test_cycles_are_reported_once_per_component(self):
+        graph = EntityDependencyGraph({"a": ["b"], "b": ["c"], "c": ["a"], "d": ["d"], "e": ["a"]})
+
+        assert graph.cycles == [["a", "b", "c", "a"], ["d", "d"]]
+        assert graph.topological_order() is None
+        assert graph.depths == {"a": 1, "b": 1, "c": 1, "d": 1, "e": 1}
+
+    def test_incremental_updates_create_and_break_cycles(self):
+        graph = EntityDependencyGraph({"a": ["b"], "b": ["c"], "c": []})
+        assert graph.depths == {"a": 0, "b": 1, "c": 2}
+
+        graph.set_dependencies("c", ["a"])
+        assert graph.has_cycles and graph.cycles == [["a", "b", "c", "a"]]
+
+        graph.set_dependencies("b", [])
+        assert not graph.has_cycles
+        assert graph.depths == {"a": 1, "b": 2, "c": 0}
+
+        graph.remove("c")
+        assert graph.depths == {"a": 0, "b": 1}
+        assert graph.required("a") == {"a", "b"}
+
+    def test_incremental_updates_match_rebuild(self):
+        rng = random.Random(7)
+        names = [f"e{index}" for index in range(25)]
+        dependencies = {name: rng.sample(names[:index], k=min(index, 2)) for index, name in enumerate(names)}
+        graph = EntityDependencyGraph(dependencies)
+        assert graph.depths  # memoize depths so that updates propagate them
+
+        for _ in range(200):
+            name = rng.choice(names)
+            if rng.random() < 0.1:
+                dependencies.pop(name, None)
+                graph.remove(name)
+            else:
+                dependencies[name] = rng.sample(names, k=rng.randint(0, 2))
+                graph.set_dependencies(name, dependencies[name])
+            graph.reorder(dependencies)
+
+            rebuilt = EntityDependencyGraph(dependencies)
+            assert graph.has_cycles == rebuilt.has_cycles
+            assert sorted(map(frozenset, graph.cycles)) == sorted(map(frozenset, rebuilt.cycles))
+            assert graph.topological_order() == rebuilt.topological_order()
+            assert graph.depths == rebuilt.depths
+            assert graph.required(name) == rebuilt.required(name)
+
+
+def test_project_dependency_graph_is_built_from_depends_on():
+    project = ShapeShiftProject(
+        cfg={
+            "entities": {
+                "site": {"columns": ["site_name"], "keys": ["site_name"]},
+                "sample": {
+                    "source": "survey",
+                    "columns": ["site_name"],
+                    "foreign_keys": [{"entity": "site", "local_keys": ["site_name"], "remote_keys": ["site_name"]}],
+                },
+            }
+        }
+    )
+
+    assert set(project.dependency_graph.dependencies("sample")) == {"site", "survey"}
+    assert project.get_required_entities("sample") == {"sample", "site", "survey"}
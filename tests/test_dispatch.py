@@ -1,13 +1,27 @@
 """Unit tests for arbodat dispatch module."""
 
+import json
+import zipfile
 from pathlib import Path
 from typing import Any
 from unittest.mock import Mock, patch
 
 import pandas as pd
+import pyarrow.parquet as pq
 import pytest
-
-from src.dispatch import CsvDispatcher, DatabaseDispatcher, Dispatcher, Dispatchers, DispatchRegistry, ExcelDispatcher
+from sqlalchemy import create_engine, inspect, text
+
+from src.dispatch import (
+    BulkDatabaseDispatcher,
+    CsvDispatcher,
+    DatabaseDispatcher,
+    Dispatcher,
+    Dispatchers,
+    DispatchRegistry,
+    ExcelDispatcher,
+    ParquetDispatcher,
+    ZipCsvDispatcher,
+)
 from src.utility import Registry
 
 # pylint: disable=unused-argument,redefined-outer-name
@@ -222,6 +236,84 @@ class TestCSVDispatcher:
 
         assert (output_dir / "table1.csv").exists()
 
+    def test_csv_dispatcher_writes_table_shapes(self, tmp_path: Path, cfg: dict[str, Any]):
+        """Table shapes are written in the same pass as the CSV files."""
+        data = {"table1": pd.DataFrame({"a": [1, 2]}), "table2": pd.DataFrame({"b": [3], "c": [4]})}
+
+        CsvDispatcher(cfg=cfg).dispatch(str(tmp_path), data)
+
+        assert (tmp_path / "table_shapes.tsv").read_text().splitlines() == ["entity\tnum_rows\tnum_columns", "table1\t2\t1", "table2\t1\t2"]
+
+    @pytest.mark.parametrize("compression,suffix", [("gzip", ".csv.gz"), ("bz2", ".csv.bz2")])
+    def test_csv_dispatcher_compressed_output(self, tmp_path: Path, compression: str, suffix: str):
+        """Compressed files are written directly and read back unchanged."""
+        cfg = {"entities": {}, "options": {"dispatch": {"csv": {"compression": compression, "max_workers": 2}}}}
+        df = pd.DataFrame({"id": [1, 2, 3], "name": ["a", "b,c", "d"], "value": [1.5, None, 2.0]})
+
+        CsvDispatcher(cfg=cfg).dispatch(str(tmp_path), {"t1": df, "t2": df})
+
+        pd.testing.assert_frame_equal(pd.read_csv(tmp_path / f"t1{suffix}"), df)
+        assert (tmp_path / f"t2{suffix}").exists()
+
+    @pytest.mark.parametrize("writer", ["auto", "pyarrow", "pandas"])
+    def test_csv_dispatcher_writers_read_back_identically(self, tmp_path: Path, writer: str):
+        """Integer/text tables read back the same whether written by the fast or the pandas writer."""
+        cfg = {"entities": {}, "options": {"dispatch": {"csv": {"writer": writer}}}}
+        df = pd.DataFrame({"id": [1, 2, 3], "name": ["a", 'say "hi"', "x,y"], "code": pd.array([1, None, 3], dtype="Int64")})
+
+        CsvDispatcher(cfg=cfg).dispatch(str(tmp_path), {"t": df})
+
+        pd.testing.assert_frame_equal(pd.read_csv(tmp_path / "t.csv", dtype={"code": "Int64"}), df)
+        assert (tmp_path / "t.csv").read_text(encoding="utf-8").splitlines()[0] == "id,name,code"
+
+    def test_csv_dispatcher_default_writer_matches_pandas_output(self, tmp_path: Path, cfg: dict[str, Any]):
+        """By default files are written exactly as pandas writes them (text is only quoted when needed)."""
+        df = pd.DataFrame({"id": [1, 2], "name": ["x", "y,z"]})
+
+        CsvDispatcher(cfg=cfg).dispatch(str(tmp_path), {"t": df})
+
+        assert (tmp_path / "t.csv").read_text(encoding="utf-8") == df.to_csv(index=False) == 'id,name\n1,x\n2,"y,z"\n'
+
+    def test_csv_dispatcher_auto_writer_keeps_pandas_formatting_for_floats(self, tmp_path: Path):
+        """Tables with float, boolean or datetime columns are written by pandas in auto mode."""
+        cfg = {"entities": {}, "options": {"dispatch": {"csv": {"writer": "auto"}}}}
+        df = pd.DataFrame({"id": [1, 2], "value": [1.0, 2.5], "flag": [True, False]})
+
+        CsvDispatcher(cfg=cfg).dispatch(str(tmp_path), {"t": df})
+
+        assert (tmp_path / "t.csv").read_text(encoding="utf-8") == df.to_csv(index=False)
+
+    def test_map_entities_bounds_results_in_flight(self, tmp_path: Path):
+        """No more than max_workers entities are rendered before their results have been consumed."""
+        cfg = {"entities": {}, "options": {"dispatch": {"csv": {"max_workers": 2}}}}
+        data = {f"t{index}": pd.DataFrame({"a": [index]}) for index in range(6)}
+        started: list[str] = []
+        consumed: list[str] = []
+
+        def render(name: str, _: pd.DataFrame) -> str:
+            started.append(name)
+            assert len(started) - len(consumed) <= 2
+            return name
+
+        for name, result in CsvDispatcher(cfg=cfg).map_entities(render, data):
+            assert result == name
+            consumed.append(name)
+
+        assert sorted(consumed) == sorted(data)
+
+    def test_zip_csv_dispatcher_streams_into_archive(self, tmp_path: Path, cfg: dict[str, Any]):
+        """All entities end up as CSV entries in the archive, with table shapes next to it."""
+        data = {"table1": pd.DataFrame({"a": [1, 2]}), "table2": pd.DataFrame({"b": [1.5, None]})}
+
+        ZipCsvDispatcher(cfg=cfg).dispatch(str(tmp_path / "output.zip"), data)
+
+        with zipfile.ZipFile(tmp_path / "output.zip") as archive:
+            assert sorted(archive.namelist()) == ["table1.csv", "table2.csv"]
+            with archive.open("table2.csv") as fh:
+                df = pd.read_csv(fh)
+        pd.testing.assert_frame_equal(df, data["table2"])
+        assert (tmp_path / "table_shapes.tsv").exists()
+
 
 class TestExcelDispatcher:
     """Tests for ExcelDispatcher class."""
@@ -514,6 +606,149 @@ class TestDatabaseDispatcher:
             mock_create_uri.assert_called_once()
 
 
+class TestParquetDispatcher:
+    """Tests for ParquetDispatcher."""
+
+    def test_dispatch_writes_files_and_manifest(self, tmp_path: Path):
+        """Each entity becomes a Parquet file listed in the manifest, and reads back unchanged."""
+        cfg = {"entities": {}, "options": {"dispatch": {"parquet": {"compression": "snappy", "row_group_size": 2}}}}
+        data = {
+            "site": pd.DataFrame({"system_id": [1, 2, 3], "kind": ["a", "a", "b"], "created": pd.to_datetime(["2024-01-01"] * 3)}),
+            "mixed": pd.DataFrame({"value": [1, "x", None]}),
+        }
+
+        ParquetDispatcher(cfg=cfg).dispatch(str(tmp_path), data)
+
+        manifest = json.loads((tmp_path / "manifest.json").read_text())
+        assert manifest["compression"] == "snappy"
+        assert manifest["entities"]["site"]["rows"] == 3
+        assert [column["name"] for column in manifest["entities"]["site"]["columns"]] == ["system_id", "kind", "created"]
+        assert pq.ParquetFile(tmp_path / "site.parquet").num_row_groups == 2
+        pd.testing.assert_frame_equal(pd.read_parquet(tmp_path / "site.parquet"), data["site"], check_dtype=False)
+        assert pd.read_parquet(tmp_path / "mixed.parquet")["value"].tolist()[:2] == ["1", "x"]
+
+    def test_dictionary_columns_selects_low_cardinality_text(self):
+        """Only text columns with few distinct values are dictionary-encoded."""
+        df = pd.DataFrame({"id": range(6), "kind": ["a", "b"] * 3, "name": list("abcdef")})
+        assert ParquetDispatcher.dictionary_columns(df, ratio=0.5) == ["kind"]
+
+
+class TestBulkDatabaseDispatcher:
+    """Tests for BulkDatabaseDispatcher using a SQLite target."""
+
+    @pytest.fixture
+    def bulk_cfg(self, tmp_path: Path) -> dict[str, Any]:
+        """Project with a child entity referencing a parent entity."""
+        return {
+            "entities": {
+                "parent": {"keys": ["code"], "columns": ["code"]},
+                "child": {
+                    "keys": ["name"],
+                    "columns": ["name"],
+                    "foreign_keys": [{"entity": "parent", "local_keys": ["code"], "remote_keys": ["code"]}],
+                },
+            },
+            "options": {"dispatch": {"database": {"url": f"sqlite:///{tmp_path / 'out.db'}"}}},
+        }
+
+    @pytest.fixture
+    def data(self) -> dict[str, pd.DataFrame]:
+        return {
+            "child": pd.DataFrame(
+                {
+                    "system_id": [1, 2, 3],
+                    "name": ["a", None, "c"],
+                    "parent_id": pd.array([1, None, 2], dtype="Int64"),
+                    "value": [1.5, float("nan"), 3.0],
+                    "created": pd.to_datetime(["2024-01-01", None, "2024-01-03"]),
+                }
+            ),
+            "parent": pd.DataFrame({"system_id": [1, 2], "code": ["x", "y"], "active": [True, False]}),
+        }
+
+    def test_load_levels_follow_foreign_keys(self, bulk_cfg: dict[str, Any]):
+        """Referenced entities are loaded in an earlier level than the entities referencing them."""
+        dispatcher = BulkDatabaseDispatcher(cfg=bulk_cfg)
+        assert dispatcher.load_levels(["child", "parent", "other"]) == [["other", "parent"], ["child"]]
+
+    def test_dispatch_creates_typed_tables(self, tmp_path: Path, bulk_cfg: dict[str, Any], data: dict[str, pd.DataFrame]):
+        """Tables are created with column types and primary key, and hold all rows."""
+        dispatcher = BulkDatabaseDispatcher(cfg=bulk_cfg)
+        dispatcher.dispatch("ignored", data)
+
+        engine = create_engine(f"sqlite:///{tmp_path / 'out.db'}")
+        try:
+            inspector = inspect(engine)
+            assert sorted(inspector.get_table_names()) == ["child", "parent"]
+            column_types = {column["name"]: type(column["type"]).__name__ for column in inspector.get_columns("child")}
+            assert column_types == {"system_id": "BIGINT", "name": "TEXT", "parent_id": "BIGINT", "value": "FLOAT", "created": "DATETIME"}
+            assert inspector.get_pk_constraint("child")["constrained_columns"] == ["system_id"]
+
+            child = pd.read_sql_table("child", engine)
+        finally:
+            engine.dispose()
+
+        assert len(child) == 3
+        assert child["name"].isna().tolist() == [False, True, False]
+        assert child["created"].tolist()[0] == pd.Timestamp("2024-01-01")
+        assert [stats.table for stats in dispatcher.load_stats] == ["_staging_parent", "_staging_child"]
+        assert [stats.rows for stats in dispatcher.load_stats] == [2, 3]
+
+    def test_dispatch_replaces_existing_tables(self, tmp_path: Path, bulk_cfg: dict[str, Any], data: dict[str, pd.DataFrame]):
+        """A second dispatch replaces previously loaded tables."""
+        dispatcher = BulkDatabaseDispatcher(cfg=bulk_cfg)
+        dispatcher.dispatch("ignored", data)
+        dispatcher.dispatch("ignored", {"parent": data["parent"].head(1), "child": data["child"]})
+
+        engine = create_engine(f"sqlite:///{tmp_path / 'out.db'}")
+        try:
+            assert len(pd.read_sql_table("parent", engine)) == 1
+            assert sorted(inspect(engine).get_table_names()) == ["child", "parent"]
+        finally:
+            engine.dispose()
+
+    def test_dispatch_keeps_existing_table_definition(self, tmp_path: Path, bulk_cfg: dict[str, Any], data: dict[str, pd.DataFrame]):
+        """Existing target tables keep their column types and dependent views; only their rows are replaced."""
+        engine = create_engine(f"sqlite:///{tmp_path / 'out.db'}")
+        try:
+            with engine.begin() as connection:
+                connection.execute(
+                    text("create table parent (system_id integer primary key, code varchar(10), active boolean, note text default 'n/a')")
+                )
+                connection.execute(text("insert into parent (system_id, code, active) values (9, 'old', 1)"))
+                connection.execute(text("create view parent_codes as select code from parent"))
+
+            dispatcher = BulkDatabaseDispatcher(cfg=bulk_cfg)
+            dispatcher.dispatch("ignored", {"parent": data["parent"].astype({"system_id": float}), "child": data["child"]})
+
+            inspector = inspect(engine)
+            column_types = {column["name"]: str(column["type"]) for column in inspector.get_columns("parent")}
+            assert column_types == {"system_id": "INTEGER", "code": "VARCHAR(10)", "active": "BOOLEAN", "note": "TEXT"}
+            assert inspector.get_view_names() == ["parent_codes"]
+            assert pd.read_sql_query("select code from parent_codes", engine)["code"].tolist() == ["x", "y"]
+            assert pd.read_sql_table("parent", engine)["note"].tolist() == ["n/a", "n/a"]
+            assert sorted(inspector.get_table_names()) == ["child", "parent"]
+        finally:
+            engine.dispose()
+
+    def test_dispatch_rejects_columns_missing_in_existing_table(
+        self, tmp_path: Path, bulk_cfg: dict[str, Any], data: dict[str, pd.DataFrame]
+    ):
+        """An entity column that the existing target table lacks is an error, and nothing is replaced."""
+        engine = create_engine(f"sqlite:///{tmp_path / 'out.db'}")
+        try:
+            with engine.begin() as connection:
+                connection.execute(text("create table parent (system_id integer primary key, code varchar(10))"))
+                connection.execute(text("insert into parent values (9, 'old')"))
+
+            with pytest.raises(ValueError, match="columns \\['active'\\] do not exist in target table 'parent'"):
+                BulkDatabaseDispatcher(cfg=bulk_cfg).dispatch("ignored", data)
+
+            assert pd.read_sql_table("parent", engine)["code"].tolist() == ["old"]
+        finally:
+            engine.dispose()
+
+
 class TestIntegration:
     """Integration tests for dispatcher workflow."""
 
@@ -0,0 +1,142 @@
+import json
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.model import ShapeShiftProject
+from src.normalizer import ShapeShifter
+from src.profiling import PROFILE_FILENAME, SUMMARY_FILENAME, TRACE_FILENAME, PipelineProfiler
+
+# pylint: disable=redefined-outer-name
+
+
+class TestPipelineProfiler:
+
+    def test_stage_records_time_rows_and_memory(self):
+        profiler = PipelineProfiler().start()
+        data = pd.DataFrame({"a": range(10)})
+
+        with profiler.stage("site", "filters", data) as record:
+            time.sleep(0.01)
+            block = np.ones(1_000_000)
+            record.rows_out = 4
+        del block
+        profiler.stop()
+
+        assert len(profiler.records) == 1
+        stage = profiler.records[0]
+        assert (stage.entity, stage.stage, stage.rows_in, stage.rows_out) == ("site", "filters", 10, 4)
+        assert stage.wall_time >= 0.01
+        assert stage.peak_memory is not None and stage.peak_memory >= 8_000_000
+
+    def test_nested_stages_propagate_peak_memory_to_parent(self):
+        profiler = PipelineProfiler().start()
+
+        with profiler.stage("sample", "linking"):
+            with profiler.stage("sample", "link:site"):
+                block = np.ones(1_000_000)
+                del block
+            with profiler.stage("sample", "link:survey"):
+                pass
+        profiler.stop()
+
+        records = {record.stage: record for record in profiler.records}
+        assert records["link:site"].depth == 1
+        assert records["linking"].depth == 0
+        assert records["linking"].peak_memory >= records["link:site"].peak_memory >= 8_000_000
+        assert records["link:survey"].peak_memory < 8_000_000
+
+    def test_entity_summary_does_not_count_nested_stages_twice(self):
+        profiler = PipelineProfiler(track_memory=False).start()
+
+        with profiler.stage("sample", "linking"):
+            with profiler.stage("sample", "link:site"):
+                time.sleep(0.01)
+        profiler.stop()
+
+        linking = next(record for record in profiler.records if record.stage == "linking")
+        by_entity = profiler.summary(by="entity").set_index("entity")
+        assert by_entity.loc["sample", "count"] == 1
+        assert by_entity.loc["sample", "wall_time"] == pytest.approx(linking.wall_time)
+        assert set(profiler.summary()["stage"]) == {"linking", "link"}
+
+    def test_stop_keeps_tracing_for_other_profilers(self):
+        first = PipelineProfiler().start()
+        second = PipelineProfiler().start()
+
+        with second.stage("site", "load"):
+            first.stop()
+            block = np.ones(1_000_000)
+            del block
+        second.stop()
+
+        assert second.records[0].peak_memory is not None and second.records[0].peak_memory >= 8_000_000
+        assert not tracemalloc.is_tracing()
+
+    def test_disabled_profiler_records_nothing(self):
+        profiler = PipelineProfiler.disabled()
+
+        with profiler.stage("site", "load") as record:
+            record.rows_out = 3
+
+        assert not profiler.records
+
+    def test_exports(self, tmp_path):
+        profiler = PipelineProfiler(track_memory=False).start()
+        for entity in ("site", "sample"):
+            with profiler.stage(entity, "load") as record:
+                record.rows_out = 5
+            with profiler.stage(entity, f"link:{entity}_type"):
+                pass
+
+        summary = profiler.summary()
+        assert set(summary["stage"]) == {"load", "link"}
+        assert summary.set_index("stage").loc["load", "count"] == 2
+        assert set(profiler.summary(by="entity")["entity"]) == {"site", "sample"}
+        assert "wall_time" in profiler.summary_table()
+
+        trace = profiler.to_chrome_trace()
+        assert len(trace["traceEvents"]) == 4
+        assert {event["ph"] for event in trace["traceEvents"]} == {"X"}
+        assert trace["traceEvents"][0]["args"]["rows_out"] == 5
+
+        paths = profiler.save(tmp_path)
+        assert {path.name for path in paths.values()} == {PROFILE_FILENAME, TRACE_FILENAME, SUMMARY_FILENAME}
+        exported = json.loads(paths["json"].read_text(encoding="utf-8"))
+        assert len(exported["stages"]) == 4
+        assert exported["summary"][0]["stage"] in {"load", "link"}
+
+
+@pytest.mark.asyncio
+async def test_normalize_records_every_stage_and_link():
+    survey = pd.DataFrame({"site_name": ["a", "b", "b"], "sample_name": ["s1", "s2", "s3"]})
+    project = ShapeShiftProject(
+        cfg={
+            "entities": {
+                "site": {"columns": ["site_name"], "keys": ["site_name"], "public_id": "site_id", "drop_duplicates": True},
+                "sample": {
+                    "columns": ["site_name", "sample_name"],
+                    "public_id": "sample_id",
+                    "depends_on": ["site"],
+                    "foreign_keys": [{"entity": "site", "local_keys": ["site_name"], "remote_keys": ["site_name"]}],
+                },
+            }
+        }
+    )
+    profiler = PipelineProfiler().start()
+
+    shapeshifter = ShapeShifter(project=project, default_entity="survey", table_store={"survey": survey}, profiler=profiler)
+    await shapeshifter.normalize()
+    profiler.stop()
+
+    stages = {(record.entity, record.stage) for record in profiler.records}
+    assert {("site", "load"), ("site", "subset"), ("site", "dedup"), ("site", "reorder")} <= stages
+    assert ("sample", "link:site") in stages
+
+    subset = next(record for record in profiler.records if record.entity == "site" and record.stage == "subset")
+    assert (subset.rows_in, subset.rows_out) == (3, 2)
+    link = next(record for record in profiler.records if record.stage == "link:site")
+    assert link.depth == 1 and link.rows_out == 3
@@ -0,0 +1,70 @@
+import pandas as pd
+import pytest
+
+from src.dispatch import CsvDispatcher
+from src.exceptions import WorkflowCancelledError
+from src.model import ShapeShiftProject
+from src.normalizer import ShapeShifter
+from src.progress import ProgressEvent, ProgressReporter
+
+# pylint: disable=redefined-outer-name
+
+
+@pytest.fixture
+def project() -> ShapeShiftProject:
+    return ShapeShiftProject(
+        cfg={
+            "entities": {
+                "site": {"columns": ["site_name"], "keys": ["site_name"], "public_id": "site_id", "drop_duplicates": True},
+                "sample": {
+                    "columns": ["site_name", "sample_name"],
+                    "keys": ["sample_name"],
+                    "public_id": "sample_id",
+                    "depends_on": ["site"],
+                    "foreign_keys": [{"entity": "site", "local_keys": ["site_name"], "remote_keys": ["site_name"]}],
+                },
+            }
+        }
+    )
+
+
+@pytest.fixture
+def survey() -> pd.DataFrame:
+    return pd.DataFrame({"site_name": ["a", "b", "b"], "sample_name": ["s1", "s2", "s3"]})
+
+
+@pytest.mark.asyncio
+async def test_normalize_reports_each_entity(project: ShapeShiftProject, survey: pd.DataFrame):
+    events: list[ProgressEvent] = []
+    shapeshifter = ShapeShifter(
+        project=project, default_entity="survey", table_store={"survey": survey}, progress=ProgressReporter(callback=events.append)
+    )
+
+    await shapeshifter.normalize()
+
+    assert [(event.phase, event.entity, event.current) for event in events] == [("normalize", "site", 1), ("normalize", "sample", 2)]
+    assert {event.total for event in events} == {2}
+
+
+@pytest.mark.asyncio
+async def test_normalize_is_cancelled_between_entities(project: ShapeShiftProject, survey: pd.DataFrame):
+    events: list[ProgressEvent] = []
+    progress = ProgressReporter(callback=events.append, is_cancelled=lambda: len(events) > 0)
+    shapeshifter = ShapeShifter(project=project, default_entity="survey", table_store={"survey": survey}, progress=progress)
+
+    with pytest.raises(WorkflowCancelledError):
+        await shapeshifter.normalize()
+
+    assert [event.entity for event in events] == ["site"]
+    assert "sample" not in shapeshifter.table_store
+
+
+def test_dispatcher_reports_each_written_entity(tmp_path, project: ShapeShiftProject):
+    events: list[ProgressEvent] = []
+    data = {"site": pd.DataFrame({"a": [1]}), "sample": pd.DataFrame({"b": [2]})}
+
+    CsvDispatcher(project, progress=ProgressReporter(callback=events.append)).dispatch(str(tmp_path), data)
+
+    assert sorted(event.entity for event in events) == ["sample", "site"]
+    assert sorted(event.current for event in events) == [1, 2]
+    assert {(event.phase, event.total) for event in events} == {("dispatch", 2)}
@@ -1,10 +1,11 @@
 """Unit tests for arbodat utility functions."""
 
+import numpy as np
 import pandas as pd
 import pytest
 
 from src.specifications.fd import FunctionalDependencySpecification
-from src.transforms.drop import drop_duplicate_rows, drop_empty_rows
+from src.transforms.drop import RowHashCache, RowHasher, drop_duplicate_rows, drop_empty_rows, has_duplicate_rows
 
 
 def test_drop_duplicate_rows_validates_columns_and_fd_check():
@@ -44,6 +45,47 @@ def test_drop_empty_rows_variants():
     assert filtered.iloc[0]["a"] == "keep"
 
 
+class TestRowHasher:
+    """Tests for the row-key engine behind duplicate detection."""
+
+    @pytest.mark.parametrize("columns", [None, ["a", "b"], ["c", "a"], ["a", "b", "c"]])
+    def test_duplicated_matches_pandas(self, columns):
+        rng = np.random.default_rng(7)
+        df = pd.DataFrame(
+            {
+                "a": rng.choice(np.array(["x", "y", "", None], dtype=object), 200),
+                "b": rng.integers(0, 3, 200),
+                "c": pd.array(rng.choice([1, 2, None], 200), dtype="Int64"),
+            }
+        )
+
+        assert (RowHasher(df).duplicated(columns) == df.duplicated(subset=columns).to_numpy()).all()
+
+    def test_keys_are_compressed_instead_of_overflowing(self):
+        """Mixed-radix keys of many high-cardinality columns are re-factorized before exceeding 64 bits."""
+        rng = np.random.default_rng(7)
+        df = pd.DataFrame({f"c{index}": rng.integers(0, 10**6, 2_000) for index in range(6)})
+        df = pd.concat([df, df.iloc[:50]], ignore_index=True)
+
+        assert (RowHasher(df).duplicated() == df.duplicated().to_numpy()).all()
+
+    def test_deduplicated_frame_reuses_keys_for_key_check(self):
+        cache = RowHashCache()
+        df = pd.DataFrame({"key": ["A", "A", "B"], "value": [1, 1, 2]})
+
+        result = drop_duplicate_rows(df, columns=["key"], fd_check=True, cache=cache)
+        hasher = cache.hasher(result)
+
+        assert result["key"].tolist() == ["A", "B"]
+        assert ("key",) in hasher._row_keys  # pylint: disable=protected-access
+        assert has_duplicate_rows(result, ["key"], cache=cache) is False
+
+    def test_drop_empty_rows_returns_same_frame_when_nothing_is_empty(self):
+        df = pd.DataFrame({"a": ["x", None], "b": [None, "y"]})
+
+        assert drop_empty_rows(data=df, entity_name="e", subset=["a", "b"]) is df
+
+
 class TestFunctionalDependencySpecification:
     """Tests for FunctionalDependencySpecification class."""
 
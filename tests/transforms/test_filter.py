@@ -4,7 +4,7 @@ import pandas as pd
 import pytest
 
 from src.model import TableConfig
-from src.transforms.filter import VALID_FILTER_STAGES, ExistsInFilter, Filters, QueryFilter, apply_filters
+from src.transforms.filter import VALID_FILTER_STAGES, CompiledQuery, ExistsInFilter, FilterCache, Filters, QueryFilter, apply_filters
 
 
 class TestQueryFilter:
@@ -307,6 +307,114 @@ class TestExistsInFilter:
         assert len(result) == 0
         assert list(result.columns) == ["id", "name"]
 
+    def test_exists_in_filter_multi_column_key(self):
+        """Test exists_in filter matching on a multi-column key (numeric dtypes are aligned before hashing)."""
+        df = pd.DataFrame({"site": [1, 1, 2, 3], "sample": ["a", "b", "a", "c"]})
+        other_df = pd.DataFrame({"site_id": [1.0, 2.0, 3.0], "sample_name": ["a", "a", "x"]})
+        filter_cfg = {
+            "type": "exists_in",
+            "column": ["site", "sample"],
+            "other_entity": "other",
+            "other_column": ["site_id", "sample_name"],
+        }
+
+        result = ExistsInFilter().apply(df, filter_cfg, {"other": other_df})
+
+        expected = pd.DataFrame({"site": [1, 2], "sample": ["a", "a"]}, index=[0, 2])
+        pd.testing.assert_frame_equal(result, expected)
+
+    def test_exists_in_filter_multi_column_key_does_not_truncate_floats(self):
+        """Test that float local keys are not truncated to match integer remote keys."""
+        df = pd.DataFrame({"a": [1.5, 2.7, 3.0], "b": ["x", "x", "x"]})
+        other_df = pd.DataFrame({"a": pd.array([1, 2, 3], dtype="int64"), "b": ["x", "x", "x"]})
+        filter_cfg = {"type": "exists_in", "column": ["a", "b"], "other_entity": "other"}
+
+        result = ExistsInFilter().apply(df, filter_cfg, {"other": other_df})
+
+        assert result["a"].tolist() == [3.0]
+        assert result.index.tolist() == [2]
+
+    def test_exists_in_filter_missing_key_does_not_match_missing_lookup_value(self):
+        """Test that rows with a missing key are dropped even when the lookup column has nulls."""
+        df = pd.DataFrame({"id": [1.0, None, 3.0]})
+        other_df = pd.DataFrame({"id": [1.0, None]})
+        filter_cfg = {"type": "exists_in", "column": "id", "other_entity": "other"}
+
+        result = ExistsInFilter().apply(df, filter_cfg, {"other": other_df})
+
+        assert result.index.tolist() == [0]
+
+    def test_exists_in_filter_multi_column_object_keys_compare_values(self):
+        """Test that object keys are compared by value, so 3 does not match "3"."""
+        df = pd.DataFrame({"a": pd.Series([3, "x"], dtype=object), "b": [1, 1]})
+        other_df = pd.DataFrame({"a": pd.Series(["3", "x"], dtype=object), "b": [1, 1]})
+        filter_cfg = {"type": "exists_in", "column": ["a", "b"], "other_entity": "other"}
+
+        result = ExistsInFilter().apply(df, filter_cfg, {"other": other_df})
+
+        assert result.index.tolist() == [1]
+
+    def test_exists_in_filter_multi_column_requires_matching_other_columns(self):
+        """Test exists_in filter with a different number of local and other columns."""
+        filter_cfg = {"type": "exists_in", "column": ["a", "b"], "other_entity": "other", "other_column": "a"}
+
+        with pytest.raises(ValueError, match="as many 'other_column'"):
+            ExistsInFilter().apply(pd.DataFrame({"a": [1], "b": [2]}), filter_cfg, {"other": pd.DataFrame({"a": [1]})})
+
+    def test_exists_in_filter_reuses_cached_index_until_entity_changes(self):
+        """Test that the lookup index is shared between filters until the other entity's frame is replaced."""
+        cache = FilterCache()
+        data_store = {"other": pd.DataFrame({"id": [2, 4]})}
+        filter_cfg = {"type": "exists_in", "column": "id", "other_entity": "other"}
+        df = pd.DataFrame({"id": [1, 2, 3, 4]})
+
+        index = cache.lookup_index("other", ("id",), data_store["other"])
+        assert ExistsInFilter().apply(df, filter_cfg, data_store, cache=cache)["id"].tolist() == [2, 4]
+        assert cache.lookup_index("other", ("id",), data_store["other"]) is index
+
+        data_store["other"] = pd.DataFrame({"id": [1]})
+        assert ExistsInFilter().apply(df, filter_cfg, data_store, cache=cache)["id"].tolist() == [1]
+
+
+class TestCompiledQuery:
+    """Tests for query filter compilation."""
+
+    @pytest.mark.parametrize(
+        "query",
+        ["a > 2", "a > 2 and b < 50", "not a > 2", "1 < a <= 4", "s == 'x'", "s in ['x', 'z']", "s != ['x']", "a * 2 + b > 50", "-a < -2"],
+    )
+    def test_compiled_query_matches_dataframe_query(self, query):
+        """Test that compiled expressions select the same rows as DataFrame.query."""
+        df = pd.DataFrame({"a": [1, 2, None, 4, 5], "b": [10, None, 30, 40, 50], "s": ["x", "y", "z", "x", "y"]})
+
+        compiled = CompiledQuery.compile(query)
+
+        assert compiled.code is not None
+        pd.testing.assert_frame_equal(compiled.apply(df), df.query(query))
+
+    @pytest.mark.parametrize("query", ["a.isna()", "`a` > 1", "a > 1 & b < 50"])
+    def test_unsupported_syntax_falls_back_to_dataframe_query(self, query):
+        """Test that method calls, backticks and pandas operator precedence are left to DataFrame.query."""
+        df = pd.DataFrame({"a": [1, None, 3], "b": [10, 20, 30]})
+
+        compiled = CompiledQuery.compile(query)
+
+        assert compiled.code is None
+        pd.testing.assert_frame_equal(compiled.apply(df), df.query(query))
+
+    @pytest.mark.parametrize("query", ["n != 3", "n > 1"])
+    def test_compiled_query_drops_missing_values_of_extension_dtypes(self, query):
+        """Test that <NA> in nullable integer columns is dropped, as DataFrame.query does."""
+        df = pd.DataFrame({"n": pd.array([1, None, 3, 4], dtype="Int64")})
+
+        pd.testing.assert_frame_equal(CompiledQuery.compile(query).apply(df), df.query(query))
+
+    def test_query_is_compiled_once_per_cache(self):
+        """Test that the cache hands out the same compiled query."""
+        cache = FilterCache()
+
+        assert cache.compiled_query("a > 1") is cache.compiled_query("a > 1")
+
 
 class TestApplyFilters:
     """Tests for apply_filters function."""
@@ -0,0 +1,69 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.transforms.gis import ConvertCRS, TransformSplitLatLong, get_transformer, split_lat_long, to_crs
+
+SWEREF99 = (674032.0, 7077960.0)
+RT90 = (1597835.0, 7085040.0)
+
+
+class TestSplitLatLong:
+
+    def test_split_parses_floats_and_keeps_nulls(self):
+        df = pd.DataFrame({"point": ["63.825, 20.263", None, "48.8566,2.3522"]}, index=[10, 11, 12])
+
+        result = TransformSplitLatLong().apply(df, "point")
+
+        assert result.index.tolist() == [10, 11, 12]
+        assert result["point_lat"].dtype == np.float64
+        np.testing.assert_allclose(result["point_lat"], [63.825, np.nan, 48.8566])
+        np.testing.assert_allclose(result["point_lon"], [20.263, np.nan, 2.3522])
+        assert "point_lat" not in df.columns
+
+    def test_split_with_custom_separator(self):
+        lat, lon = split_lat_long(pd.Series(["1.5;2.5", " -3 ; 4e1 "], name="p"), sep=";")
+
+        assert lat.tolist() == [1.5, -3.0] and lon.tolist() == [2.5, 40.0]
+
+    def test_split_raises_without_separator(self):
+        with pytest.raises(ValueError, match="Expected exactly one ','"):
+            TransformSplitLatLong().apply(pd.DataFrame({"point": ["1", "2"]}), "point")
+
+    def test_split_reports_unparsable_values(self):
+        with pytest.raises(ValueError, match=r"column 'point'.*\['north'\]"):
+            TransformSplitLatLong().apply(pd.DataFrame({"point": ["north,1", "2,3"]}), "point")
+
+
+class TestConvertCRS:
+
+    def test_scalar_source_crs(self):
+        df = pd.DataFrame({"x": [SWEREF99[0]], "y": [SWEREF99[1]]})
+
+        result = ConvertCRS().apply(df, ["x", "y"], src_crs="EPSG:3006", dst_crs="EPSG:4326")
+
+        assert result["lon"].iloc[0] == pytest.approx(18.5324, abs=1e-4)
+        assert result["lat"].iloc[0] == pytest.approx(63.7858, abs=1e-4)
+
+    def test_rows_grouped_by_source_crs_match_per_crs_transforms(self):
+        df = pd.DataFrame(
+            {
+                "x": [SWEREF99[0], RT90[0], SWEREF99[0], 1.0, 18.5],
+                "y": [SWEREF99[1], RT90[1], SWEREF99[1], 2.0, 63.8],
+                "crs": ["EPSG:3006", "EPSG:3021", "EPSG:3006", None, "EPSG:4326"],
+            },
+            index=list("abcde"),
+        )
+
+        result = ConvertCRS().apply(df, ["x", "y"], src_crs_label_column="crs", dst_crs="EPSG:4326")
+
+        for crs in ("EPSG:3006", "EPSG:3021"):
+            rows = df["crs"] == crs
+            lon, lat = to_crs(crs, "EPSG:4326", df.loc[rows, "x"], df.loc[rows, "y"])
+            np.testing.assert_allclose(result.loc[rows, "lon"], lon)
+            np.testing.assert_allclose(result.loc[rows, "lat"], lat)
+        assert result.loc["d", ["lon", "lat"]].isna().all()
+        assert result.loc["e", ["lon", "lat"]].tolist() == [18.5, 63.8]
+
+    def test_transformers_are_cached_per_crs_pair(self):
+        assert get_transformer("EPSG:3006", "EPSG:4326") is get_transformer("EPSG:3006", "EPSG:4326")
@@ -0,0 +1,73 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.transforms.union import StreamingUnion
+
+
+def concat_union(dfs: list[pd.DataFrame]) -> pd.DataFrame:
+    """Union by a single concat of the non-empty frames with all-NA columns excluded from dtype inference."""
+    non_empty: list[pd.DataFrame] = [df for df in dfs if not df.empty]
+    columns: list[str] = list(dict.fromkeys(column for df in non_empty for column in df.columns))
+    return pd.concat([df.dropna(axis=1, how="all") for df in non_empty], ignore_index=True).reindex(columns=columns)
+
+
+def stream_union(dfs: list[pd.DataFrame], distinct: bool = False) -> pd.DataFrame:
+    union: StreamingUnion = StreamingUnion(distinct=distinct)
+    for df in dfs:
+        union.append(df)
+    return union.result()
+
+
+class TestStreamingUnion:
+
+    @pytest.mark.parametrize(
+        "dfs",
+        [
+            [pd.DataFrame({"a": [1, 2], "b": ["x", "y"]}), pd.DataFrame({"a": [3], "b": ["z"]})],
+            [pd.DataFrame({"a": [1, 2]}), pd.DataFrame({"b": ["z"]}), pd.DataFrame({"a": [4], "c": [True]})],
+            [pd.DataFrame({"a": [1, 2], "b": [None, None]}), pd.DataFrame({"a": [3], "b": [1.5]})],
+            [
+                pd.DataFrame({"d": pd.to_datetime(["2020-01-01"]), "n": pd.array([1], dtype="Int64")}),
+                pd.DataFrame({"x": ["only"]}),
+                pd.DataFrame({"d": pd.to_datetime(["2021-01-01"]), "n": pd.array([None], dtype="Int64")}),
+            ],
+            [pd.DataFrame({"a": [1], "b": [np.nan]}), pd.DataFrame({"a": ["1"], "b": [np.nan]})],
+            [pd.DataFrame({"a": [1, 2]}), pd.DataFrame(columns=["a", "b"]), pd.DataFrame({"b": [False]})],
+            [pd.DataFrame({"a": [True, False]}), pd.DataFrame({"a": [2]})],
+            [pd.DataFrame({"a": [True, False], "b": [1.5, 2.5]}), pd.DataFrame({"a": [2.5], "b": [True]})],
+            [pd.DataFrame({"a": [True]}), pd.DataFrame({"b": ["x"]}), pd.DataFrame({"a": [2]})],
+        ],
+    )
+    def test_matches_concat_of_non_empty_sub_tables(self, dfs: list[pd.DataFrame]):
+        pd.testing.assert_frame_equal(stream_union(dfs), concat_union(dfs))
+
+    def test_all_empty_returns_first_sub_table(self):
+        first: pd.DataFrame = pd.DataFrame(columns=["a"])
+        union: StreamingUnion = StreamingUnion()
+        union.append(first)
+        union.append(pd.DataFrame(columns=["b"]))
+
+        assert union.empty
+        assert union.result() is first
+
+    def test_nothing_appended_returns_empty_frame(self):
+        assert StreamingUnion().result().empty
+
+    def test_sub_tables_can_be_modified_after_append(self):
+        df: pd.DataFrame = pd.DataFrame({"a": [1, 2]})
+        union: StreamingUnion = StreamingUnion()
+        union.append(df)
+        df.loc[0, "a"] = 99
+
+        assert union.result()["a"].tolist() == [1, 2]
+
+    def test_distinct_drops_duplicates_within_and_across_sub_tables(self):
+        dfs: list[pd.DataFrame] = [
+            pd.DataFrame({"a": [1, 1, 2], "b": ["x", "x", "y"]}),
+            pd.DataFrame({"a": [2, 3], "b": ["y", "z"]}),
+        ]
+
+        result: pd.DataFrame = stream_union(dfs, distinct=True)
+
+        assert result.reset_index(drop=True).to_dict("records") == [{"a": 1, "b": "x"}, {"a": 2, "b": "y"}, {"a": 3, "b": "z"}]
@@ -1,10 +1,11 @@
 """Unit tests for unnest module."""
 
+import numpy as np
 import pandas as pd
 import pytest
 
 from src.model import TableConfig
-from src.transforms.unnest import unnest
+from src.transforms.unnest import melt_frame, unnest
 
 
 class TestUnnest:
@@ -361,3 +362,79 @@ class TestUnnest:
         assert "coordinate_value" in result.columns
         assert len(result) == 10  # 2 rows * 5 coordinates
         assert set(result["coordinate_type"].unique()) == {"KoordX", "KoordY", "KoordZ", "TiefeBis", "TiefeVon"}
+
+
+class TestMeltFrame:
+    """melt_frame builds the same table as pd.melt."""
+
+    @pytest.mark.parametrize(
+        "table",
+        [
+            pd.DataFrame({"id": [1, 2, 3], "a": [1, 2, 3], "b": [4, 5, 6]}),
+            pd.DataFrame({"id": ["x", "y", "z"], "a": [1, None, 3], "b": [4, 5, 6]}),
+            pd.DataFrame({"id": [1, 2, 3], "a": [1, 2, 3], "b": ["u", None, "w"]}),
+            pd.DataFrame({"id": [1, 2, 3], "a": [True, False, True], "b": [1.5, np.nan, 2.5]}),
+            pd.DataFrame(
+                {"id": pd.array([1, None, 3], dtype="Int64"), "a": pd.array([1, None, 3], dtype="Int64"), "b": [1.0, 2.0, np.nan]}
+            ),
+            pd.DataFrame(
+                {"id": [1, 2, 3], "a": pd.to_datetime(["2020-01-01", None, "2021-01-01"]), "b": pd.to_datetime(["2022-01-01"] * 3)}
+            ),
+            pd.DataFrame({"id": [1, 2, 3], "a": pd.Categorical(["p", "q", None]), "b": pd.Categorical(["p", "p", "q"])}),
+            pd.DataFrame({"id": [1, 2, 3], "a": [None, None, None], "b": [np.nan, np.nan, np.nan]}),
+        ],
+    )
+    @pytest.mark.parametrize("drop_na", [False, True])
+    def test_matches_pd_melt(self, table: pd.DataFrame, drop_na: bool):
+        expected: pd.DataFrame = pd.melt(table, id_vars=["id"], value_vars=["a", "b"], var_name="variable", value_name="value")
+        if drop_na:
+            expected = expected.dropna(subset=["value"], ignore_index=True)
+
+        result: pd.DataFrame = melt_frame(
+            table, id_vars=["id"], value_vars=["a", "b"], var_name="variable", value_name="value", drop_na=drop_na
+        )
+
+        pd.testing.assert_frame_equal(result, expected)
+
+    @pytest.mark.parametrize(
+        "id_vars, value_vars",
+        [
+            ([], []),
+            (["id"], []),
+            ([], ["b", "a"]),
+            (["id", "c"], ["a"]),
+            (["id"], ["id", "a"]),
+            (["id", "a", "b", "c"], []),
+            (["id"], ["id"]),
+        ],
+    )
+    def test_defaults_match_pd_melt(self, id_vars: list[str], value_vars: list[str]):
+        table: pd.DataFrame = pd.DataFrame({"id": [1, 2], "a": [1.0, 2.0], "b": ["x", "y"], "c": [True, False]})
+
+        expected: pd.DataFrame = pd.melt(table, id_vars=id_vars or None, value_vars=value_vars or None, var_name="v", value_name="n")
+        result: pd.DataFrame = melt_frame(table, id_vars=id_vars, value_vars=value_vars, var_name="v", value_name="n")
+
+        pd.testing.assert_frame_equal(result, expected)
+
+    def test_unnest_drops_null_values_when_configured(self):
+        table = pd.DataFrame({"site_id": [1, 2], "KoordX": [100.0, None], "KoordY": [None, 250.0]})
+        config = {
+            "site": {
+                "columns": ["site_id", "KoordX", "KoordY"],
+                "unnest": {
+                    "id_vars": ["site_id"],
+                    "value_vars": ["KoordX", "KoordY"],
+                    "var_name": "coordinate_type",
+                    "value_name": "coordinate_value",
+                    "drop_na": True,
+                },
+            }
+        }
+        table_cfg = TableConfig(entities_cfg=config, entity_name="site")
+
+        result = unnest("site", table, table_cfg)
+
+        assert result.to_dict("records") == [
+            {"site_id": 1, "coordinate_type": "KoordX", "coordinate_value": 100.0},
+            {"site_id": 2, "coordinate_type": "KoordY", "coordinate_value": 250.0},
+        ]